@@ -1,17 +1,124 @@
 """감사 로그 관련 엔드포인트"""
-from typing import List, Optional
+from typing import List, Optional, Iterator
 from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-from app.database import get_db
+from app.database import get_db, engine
 from app.models.audit_log import CommonAuditLog
-from app.dependencies import get_current_active_user
+from app.dependencies import get_current_active_user, is_admin_user
 from app.models.user import CommonUser
 from app.schemas.audit_log import AuditLogCreate, AuditLogResponse
+from app.core.audit import audit_log_writer
+import csv
+import io
+import json
 import uuid
 
 router = APIRouter()
 
+# 내보내기 시 서버 사이드 커서에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 1000
+
+# 내보내기 컬럼 (AuditLogResponse 필드 순서와 동일)
+EXPORT_COLUMNS = [
+    "common_audit_log_sn", "audit_log_id", "user_id", "act_typ", "rsrc_typ", "rsrc_id",
+    "old_val", "new_val", "ip_addr", "user_agent", "req_mthd", "req_path",
+    "stts_cd", "err_msg", "crt_dt", "use_yn",
+]
+
+
+def apply_audit_log_filters(
+    query,
+    user_id: Optional[str] = None,
+    act_typ: Optional[str] = None,
+    rsrc_typ: Optional[str] = None,
+    rsrc_id: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+):
+    """
+    감사 로그 공통 필터 적용
+
+    ORM Query와 Core Select 모두 `.filter()`를 지원하므로 목록 조회와 내보내기에서 함께 사용합니다.
+    """
+    query = query.filter(CommonAuditLog.del_yn == False)
+
+    if user_id:
+        query = query.filter(CommonAuditLog.user_id == user_id)
+    if act_typ:
+        query = query.filter(CommonAuditLog.act_typ == act_typ)
+    if rsrc_typ:
+        query = query.filter(CommonAuditLog.rsrc_typ == rsrc_typ)
+    if rsrc_id:
+        query = query.filter(CommonAuditLog.rsrc_id == rsrc_id)
+    # crt_dt(timestamp without time zone)와 같은 타입으로 비교해야 계획 단계에서 파티션 프루닝이 적용됨
+    if start_date:
+        query = query.filter(CommonAuditLog.crt_dt >= _to_naive_local(start_date))
+    if end_date:
+        query = query.filter(CommonAuditLog.crt_dt <= _to_naive_local(end_date))
+
+    return query
+
+
+def _to_naive_local(value: datetime) -> datetime:
+    """타임존 정보가 있는 일시를 서버 로컬 시간(naive)으로 변환"""
+    if value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+def _export_value(value):
+    """내보내기용 값 변환 (datetime, JSONB 처리)"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _format_ndjson_chunk(rows) -> str:
+    """행 묶음을 NDJSON 문자열로 변환"""
+    lines = []
+    for row in rows:
+        record = {col: _export_value(row[idx]) for idx, col in enumerate(EXPORT_COLUMNS)}
+        lines.append(json.dumps(record, ensure_ascii=False, default=str))
+    return "\n".join(lines) + "\n"
+
+
+def _format_csv_chunk(rows) -> str:
+    """행 묶음을 CSV 문자열로 변환 (JSON 컬럼은 JSON 문자열로 기록)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        values = []
+        for value in row:
+            if isinstance(value, (dict, list)):
+                value = json.dumps(value, ensure_ascii=False)
+            values.append(_export_value(value))
+        writer.writerow(values)
+    return buffer.getvalue()
+
+
+def stream_audit_logs(stmt, export_format: str) -> Iterator[str]:
+    """
+    서버 사이드 커서로 감사 로그를 청크 단위로 스트리밍
+
+    요청 세션과 분리된 전용 커넥션을 사용하며, `yield_per`로 EXPORT_CHUNK_SIZE 행씩만
+    메모리에 올리므로 내보내는 행 수와 무관하게 메모리 사용량이 일정합니다.
+    """
+    if export_format == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(EXPORT_COLUMNS)
+        yield header.getvalue()
+
+    with engine.connect() as conn:
+        result = conn.execution_options(yield_per=EXPORT_CHUNK_SIZE).execute(stmt)
+        for rows in result.partitions():
+            if export_format == "csv":
+                yield _format_csv_chunk(rows)
+            else:
+                yield _format_ndjson_chunk(rows)
+
 
 @router.post(
     "",
@@ -115,25 +222,96 @@ async def get_audit_logs(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """감사 로그 목록 조회"""
-    query = db.query(CommonAuditLog).filter(CommonAuditLog.del_yn == False)
-    
-    if user_id:
-        query = query.filter(CommonAuditLog.user_id == user_id)
-    if act_typ:
-        query = query.filter(CommonAuditLog.act_typ == act_typ)
-    if rsrc_typ:
-        query = query.filter(CommonAuditLog.rsrc_typ == rsrc_typ)
-    if rsrc_id:
-        query = query.filter(CommonAuditLog.rsrc_id == rsrc_id)
-    if start_date:
-        query = query.filter(CommonAuditLog.crt_dt >= start_date)
-    if end_date:
-        query = query.filter(CommonAuditLog.crt_dt <= end_date)
+    query = apply_audit_log_filters(
+        db.query(CommonAuditLog),
+        user_id=user_id,
+        act_typ=act_typ,
+        rsrc_typ=rsrc_typ,
+        rsrc_id=rsrc_id,
+        start_date=start_date,
+        end_date=end_date,
+    )
     
     audit_logs = query.order_by(CommonAuditLog.crt_dt.desc()).offset(skip).limit(limit).all()
     return audit_logs
 
 
+@router.get(
+    "/export",
+    summary="감사 로그 내보내기",
+    description="""
+    감사 로그를 NDJSON 또는 CSV 형식으로 스트리밍 내보내기합니다. 관리자 권한이 필요합니다.
+    
+    **쿼리 파라미터:**
+    - `format`: 내보내기 형식 (`ndjson` 또는 `csv`, 기본값: `ndjson`)
+    - `user_id`, `act_typ`, `rsrc_typ`, `rsrc_id`, `start_date`, `end_date`: 목록 조회와 동일한 필터
+    
+    **정렬:**
+    - 생성일시(`crt_dt`) 기준 오름차순으로 정렬됩니다 (`idx_audit_log_crt_dt` 인덱스 사용).
+    
+    **응답:**
+    - 서버 사이드 커서로 청크 단위로 읽어 바로 응답 스트림에 기록하므로
+      행 수와 무관하게 서버 메모리 사용량이 일정합니다.
+    - 삭제된 로그는 제외됩니다.
+    """,
+    response_description="감사 로그 파일 스트림을 반환합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def export_audit_logs(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$", description="내보내기 형식 (ndjson, csv)"),
+    user_id: Optional[str] = Query(None, description="사용자 ID 필터"),
+    act_typ: Optional[str] = Query(None, description="액션 타입 필터 (예: LOGIN, CREATE)"),
+    rsrc_typ: Optional[str] = Query(None, description="리소스 타입 필터 (예: USER, FILE)"),
+    rsrc_id: Optional[str] = Query(None, description="리소스 ID 필터"),
+    start_date: Optional[datetime] = Query(None, description="시작 날짜 (ISO 8601 형식)"),
+    end_date: Optional[datetime] = Query(None, description="종료 날짜 (ISO 8601 형식)"),
+):
+    """감사 로그 스트리밍 내보내기"""
+    columns = [getattr(CommonAuditLog, col) for col in EXPORT_COLUMNS]
+    stmt = apply_audit_log_filters(
+        select(*columns),
+        user_id=user_id,
+        act_typ=act_typ,
+        rsrc_typ=rsrc_typ,
+        rsrc_id=rsrc_id,
+        start_date=start_date,
+        end_date=end_date,
+    ).order_by(CommonAuditLog.crt_dt.asc())
+
+    timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+    if format == "csv":
+        media_type = "text/csv; charset=utf-8"
+        filename = f"audit_logs_{timestamp}.csv"
+    else:
+        media_type = "application/x-ndjson"
+        filename = f"audit_logs_{timestamp}.ndjson"
+
+    return StreamingResponse(
+        stream_audit_logs(stmt, format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
+
+@router.get(
+    "/writer/stats",
+    summary="감사 로그 기록기 상태 조회",
+    description="""
+    감사 로그 미들웨어의 비동기 배치 기록기 상태를 조회합니다. 관리자 권한이 필요합니다.
+    
+    **응답:**
+    - `queue_size`: 현재 큐에 대기 중인 로그 수
+    - `enqueued`, `written`, `batches`: 큐 적재/기록 건수 및 배치 수
+    - `dropped`, `sampled_out`, `failed`: 오버플로 정책으로 버려진 건수 및 기록 실패 건수
+    """,
+    response_description="감사 로그 기록기 상태를 반환합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def get_audit_log_writer_stats():
+    """감사 로그 기록기 상태 조회"""
+    return audit_log_writer.stats()
+
+
 @router.get(
     "/{audit_log_id}",
     response_model=AuditLogResponse,
@@ -21,6 +21,7 @@ from app.core.config import settings
 from app.schemas.auth import Token, LogoutRequest
 from app.schemas.user import UserCreate, UserResponse, UserLogin
 from app.dependencies import get_current_user
+from app.core.rate_limit import rate_limit_by_ip
 import uuid
 
 router = APIRouter()
@@ -170,6 +171,7 @@ async def register(
     "/login",
     response_model=Token,
     summary="사용자 로그인",
+    dependencies=[Depends(rate_limit_by_ip("login"))],
     description="""
     사용자 인증을 수행하고 액세스 토큰과 리프레시 토큰을 발급합니다.
     
@@ -193,6 +195,7 @@ async def register(
     **에러:**
     - 401: 사용자명 또는 비밀번호가 올바르지 않음
     - 400: 비활성화된 사용자 또는 삭제된 사용자
+    - 429: 같은 IP에서 로그인 시도가 너무 많음 (RATE_LIMIT_POLICIES의 login 정책, Retry-After 헤더 참고)
     
     **사용 예시:**
     ```
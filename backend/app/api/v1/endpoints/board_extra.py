@@ -1,21 +1,42 @@
 """게시판 추가 기능 엔드포인트 (신고, 팔로우, 알림 등)"""
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path
+import asyncio
+import json
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Request
+from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.board import (
     BbsReport, BbsNotification, BbsFollow, BbsUserPreference,
     BbsTag, BbsPostTag, ReportTargetType, ReportStatus,
     FollowType, BbsPost, BbsComment, BbsBoard, BbsCategory, PostStatus,
-    BbsPostView, BbsPostLike, BbsCommentLike, CommentStatus
+    BbsPostLike, BbsCommentLike, CommentStatus, BbsUserFollowCount
 )
-from sqlalchemy import func, String
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from app.models.user import CommonUser
+from app.core.config import settings
 from app.dependencies import get_current_active_user, is_admin_user
+from app.core.view_rollup import get_post_view_counts
+from app.core.notifications import (
+    notification_dispatcher, NotificationEvent, EVENT_FOLLOW, EVENT_ADMIN_NOTICE,
+    COUNT_CHANGED_MESSAGE, get_unread_count, read_notification, read_all_notifications
+)
+from app.core.pubsub import notification_hub
+from app.core.rate_limit import rate_limit_by_user
+from app.core.timeline import get_timeline_page
+from app.core.invalidation import invalidation_bus
+from app.core.cache import cached
+from app.core.report_targets import resolve_report_targets, get_report_groups
+from app.core.security import decode_token
+from app.core.trending_tags import get_trending_tags
+from app.database import SessionLocal
 from app.schemas.board import (
     ReportCreate, ReportResponse, NotificationResponse,
     FollowCreate, FollowResponse, UserPreferenceUpdate,
-    UserPreferenceResponse, TagResponse
+    UserPreferenceResponse, TagResponse, AdminNoticeCreate,
+    PostResponse, TimelineResponse, ReportTargetGroupListResponse, TrendingTagResponse
 )
 
 router = APIRouter()
@@ -26,6 +47,7 @@ router = APIRouter()
     "/reports",
     response_model=ReportResponse,
     summary="콘텐츠 신고",
+    dependencies=[Depends(rate_limit_by_user("report"))],
     description="게시글, 댓글, 사용자를 신고합니다."
 )
 async def create_report(
@@ -111,19 +133,17 @@ async def get_reports(
         query = query.filter(BbsReport.stts == status)
 
     reports = query.order_by(BbsReport.crt_dt.desc()).offset(skip).limit(limit).all()
-    
-    # 각 신고에 대해 게시판명 조회 (POST 타입인 경우)
+
+    # 신고 대상 정보를 유형별로 한 번에 조회
+    targets = resolve_report_targets(db, [(report.target_type, report.target_id) for report in reports])
+
     result = []
     for report in reports:
+        # 게시판명 (POST 타입인 경우)
         board_nm = None
         if report.target_type == ReportTargetType.POST:
-            # 게시글의 게시판 정보 조회
-            post = db.query(BbsPost).filter(BbsPost.id == report.target_id).first()
-            if post:
-                board = db.query(BbsBoard).filter(BbsBoard.id == post.board_id).first()
-                if board:
-                    board_nm = board.nm
-        
+            board_nm = targets[(report.target_type, report.target_id)].board_nm
+
         # ReportResponse로 변환
         report_dict = {
             'id': report.id,
@@ -143,6 +163,31 @@ async def get_reports(
     return result
 
 
+@router.get(
+    "/reports/grouped",
+    response_model=ReportTargetGroupListResponse,
+    summary="대상별 신고 집계 조회",
+    description="신고를 대상별로 묶어 신고 수가 많은 순으로 조회합니다. 다음 페이지는 next_cursor로 요청합니다. 관리자 권한이 필요합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def get_report_groups_admin(
+    status_filter: Optional[ReportStatus] = Query(ReportStatus.PENDING, alias="status", description="신고 상태 필터"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(50, ge=1, le=200, description="반환할 최대 대상 수"),
+    db: Session = Depends(get_db)
+):
+    """대상별 신고 집계 조회"""
+    try:
+        items, next_cursor = get_report_groups(db, status_filter, limit, cursor)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return ReportTargetGroupListResponse(items=items, next_cursor=next_cursor)
+
+
 @router.put(
     "/reports/{report_id}/resolve",
     response_model=ReportResponse,
@@ -253,6 +298,9 @@ async def follow(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """팔로우 추가"""
+    following_id = follow_request.following_id
+    board_id = None
+
     # 대상 존재 확인
     if follow_request.typ == FollowType.USER:
         target = db.query(CommonUser).filter(
@@ -272,8 +320,15 @@ async def follow(
                 detail="자기 자신을 팔로우할 수 없습니다"
             )
     elif follow_request.typ == FollowType.BOARD:
+        try:
+            board_id = int(following_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="게시판 ID 형식이 올바르지 않습니다"
+            )
         target = db.query(BbsBoard).filter(
-            BbsBoard.id == int(follow_request.following_id),
+            BbsBoard.id == board_id,
             BbsBoard.actv_yn == True,
             BbsBoard.del_yn == False
         ).first()
@@ -282,12 +337,14 @@ async def follow(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="팔로우 대상 게시판을 찾을 수 없습니다"
             )
+        # 문자열 키를 정규화 ("007" -> "7")해 유니크 제약조건이 같은 게시판을 구분하지 않도록 함
+        following_id = str(board_id)
 
     # 중복 팔로우 확인
     existing_follow = db.query(BbsFollow).filter(
         BbsFollow.follower_id == current_user.user_id,
-        BbsFollow.following_id == follow_request.following_id,
-        BbsFollow.typ == follow_request.typ
+        BbsFollow.typ == follow_request.typ,
+        BbsFollow.following_id == following_id
     ).first()
 
     if existing_follow:
@@ -296,15 +353,34 @@ async def follow(
             detail="이미 팔로우 중입니다"
         )
 
-    # 팔로우 생성 (외래키 제약조건 제거로 인해 단순한 ORM 사용 가능)
+    # 팔로우 생성 (팔로워 수는 bbs_follows 트리거가 갱신)
     follow_obj = BbsFollow(
         follower_id=current_user.user_id,
-        following_id=follow_request.following_id,
+        following_id=following_id,
+        board_id=board_id,
         typ=follow_request.typ
     )
     db.add(follow_obj)
-    db.commit()
+    invalidation_bus.invalidate_on_commit(db, f"timeline:{current_user.user_id}")
+    try:
+        db.commit()
+    except IntegrityError:
+        # 동시 요청으로 유니크 제약조건에 걸린 경우
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 팔로우 중입니다"
+        )
     db.refresh(follow_obj)
+
+    # 사용자 팔로우 알림 (백그라운드에서 병합 후 생성)
+    if follow_request.typ == FollowType.USER:
+        notification_dispatcher.emit(NotificationEvent(
+            kind=EVENT_FOLLOW,
+            actor_id=current_user.user_id,
+            recipient_id=following_id
+        ))
+
     return follow_obj
 
 
@@ -320,10 +396,13 @@ async def unfollow(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """팔로우 취소"""
+    if follow_type == FollowType.BOARD and following_id.isdigit():
+        following_id = str(int(following_id))
+
     follow_obj = db.query(BbsFollow).filter(
         BbsFollow.follower_id == current_user.user_id,
-        BbsFollow.following_id == following_id,
-        BbsFollow.typ == follow_type
+        BbsFollow.typ == follow_type,
+        BbsFollow.following_id == following_id
     ).first()
 
     if not follow_obj:
@@ -333,6 +412,7 @@ async def unfollow(
         )
 
     db.delete(follow_obj)
+    invalidation_bus.invalidate_on_commit(db, f"timeline:{current_user.user_id}")
     db.commit()
 
     return {"message": "팔로우가 취소되었습니다"}
@@ -395,10 +475,10 @@ async def check_board_follow_status(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """게시판 팔로우 상태 조회"""
-    follow = db.query(BbsFollow).filter(
+    follow = db.query(BbsFollow.id).filter(
         BbsFollow.follower_id == current_user.user_id,
-        BbsFollow.following_id == str(board_id),
-        BbsFollow.typ == FollowType.BOARD
+        BbsFollow.typ == FollowType.BOARD,
+        BbsFollow.following_id == str(board_id)
     ).first()
 
     return {"is_following": follow is not None}
@@ -413,13 +493,104 @@ async def get_board_follower_count(
     board_id: int = Path(..., description="게시판 ID"),
     db: Session = Depends(get_db)
 ):
-    """게시판 팔로워 수 조회"""
-    follower_count = db.query(BbsFollow).filter(
-        BbsFollow.following_id == str(board_id),
-        BbsFollow.typ == FollowType.BOARD
-    ).count()
+    """게시판 팔로워 수 조회 (팔로우 트리거가 갱신하는 카운터)"""
+    follower_count = db.query(BbsBoard.follower_cnt).filter(
+        BbsBoard.id == board_id
+    ).scalar()
+
+    return {"follower_count": follower_count or 0}
+
+
+@router.get(
+    "/follow/count/user/{user_id}",
+    summary="사용자 팔로워 수 조회",
+    description="특정 사용자의 팔로워 수를 조회합니다."
+)
+async def get_user_follower_count(
+    user_id: str = Path(..., description="사용자 ID"),
+    db: Session = Depends(get_db)
+):
+    """사용자 팔로워 수 조회 (팔로우 트리거가 갱신하는 카운터)"""
+    follower_count = db.query(BbsUserFollowCount.follower_cnt).filter(
+        BbsUserFollowCount.user_id == user_id
+    ).scalar()
+
+    return {"follower_count": follower_count or 0}
+
+
+@router.get(
+    "/timeline",
+    response_model=TimelineResponse,
+    summary="팔로잉 타임라인 조회",
+    description="팔로우한 게시판과 사용자의 최신 게시글을 하나의 목록으로 조회합니다. 다음 페이지는 next_cursor로 요청합니다."
+)
+async def get_following_timeline(
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    limit: int = Query(20, ge=1, le=50, description="반환할 최대 게시글 수"),
+    db: Session = Depends(get_db),
+    current_user: CommonUser = Depends(get_current_active_user)
+):
+    """팔로잉 타임라인 조회"""
+    try:
+        post_ids, next_cursor = get_timeline_page(db, current_user.user_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    if not post_ids:
+        return TimelineResponse(posts=[], next_cursor=next_cursor, has_more=next_cursor is not None)
+
+    rows = db.query(
+        BbsPost,
+        CommonUser.nickname.label('author_nickname'),
+        BbsCategory.nm.label('category_nm'),
+        BbsBoard.nm.label('board_nm')
+    ).join(
+        CommonUser, BbsPost.user_id == CommonUser.user_id
+    ).join(
+        BbsBoard, BbsPost.board_id == BbsBoard.id
+    ).outerjoin(
+        BbsCategory, BbsPost.category_id == BbsCategory.id
+    ).filter(
+        BbsPost.id.in_(post_ids),
+        BbsPost.stts == PostStatus.PUBLISHED
+    ).all()
+
+    view_counts = get_post_view_counts(db, post_ids)
+
+    tags_by_post = {}
+    for post_id, tag_nm in db.query(BbsPostTag.post_id, BbsTag.nm).join(
+        BbsTag, BbsTag.id == BbsPostTag.tag_id
+    ).filter(BbsPostTag.post_id.in_(post_ids)).all():
+        tags_by_post.setdefault(post_id, []).append(tag_nm)
+
+    # 캐시된 페이지 이후 삭제/비공개 처리된 게시글은 제외하고 병합 순서대로 정렬
+    posts_by_id = {}
+    for post, author_nickname, category_nm, board_nm in rows:
+        post_dict = PostResponse.from_orm(post).dict()
+        post_dict.update({
+            'author_nickname': author_nickname,
+            'category_nm': category_nm,
+            'board_nm': board_nm,
+            'vw_cnt': view_counts.get(post.id, 0),
+            'tags': tags_by_post.get(post.id, [])
+        })
 
-    return {"follower_count": follower_count}
+        # 비밀글 처리: 본인 글이 아니면 제목과 내용 숨기기
+        if post.scr_yn and post.user_id != current_user.user_id:
+            post_dict['ttl'] = '비밀글입니다'
+            post_dict['smmry'] = None
+            post_dict['cn'] = ''
+
+        posts_by_id[post.id] = PostResponse(**post_dict)
+
+    return TimelineResponse(
+        posts=[posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id],
+        next_cursor=next_cursor,
+        has_more=next_cursor is not None
+    )
 
 
 # 알림 기능 엔드포인트
@@ -448,6 +619,139 @@ async def get_notifications(
     return notifications
 
 
+@router.get(
+    "/notifications/unread-count",
+    summary="읽지 않은 알림 수 조회",
+    description="현재 사용자의 읽지 않은 알림 수를 조회합니다. 사용자별 카운터를 조회하므로 알림 수와 관계없이 일정한 비용입니다."
+)
+async def get_unread_notification_count(
+    db: Session = Depends(get_db),
+    current_user: CommonUser = Depends(get_current_active_user)
+):
+    """읽지 않은 알림 수 조회"""
+    return {"unread_cnt": get_unread_count(db, current_user.user_id)}
+
+
+def _authenticate_stream_user(token: Optional[str]) -> str:
+    """
+    SSE 연결 사용자 인증
+
+    스트림이 열려 있는 동안 DB 커넥션을 점유하지 않도록 get_db 의존성 대신
+    짧은 세션으로 사용자만 확인하고 바로 닫습니다.
+    """
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="인증 정보를 확인할 수 없습니다",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    payload = decode_token(token) if token else None
+    user_id = payload.get("sub") if payload else None
+    if not user_id:
+        raise credentials_exception
+
+    db = SessionLocal()
+    try:
+        exists = db.query(CommonUser.user_id).filter(
+            CommonUser.user_id == user_id,
+            CommonUser.del_yn == False,
+            CommonUser.actv_yn == True
+        ).first()
+    finally:
+        db.close()
+
+    if not exists:
+        raise credentials_exception
+    return user_id
+
+
+def _load_stream_state(user_id: str, last_id: Optional[int]) -> dict:
+    """스트림 전송용 읽지 않은 수와 last_id 이후 새 알림 조회 (last_id가 없으면 현재 최신 ID만 조회)"""
+    db = SessionLocal()
+    try:
+        unread_cnt = get_unread_count(db, user_id)
+        if last_id is None:
+            latest_id = db.query(func.max(BbsNotification.id)).filter(
+                BbsNotification.user_id == user_id
+            ).scalar()
+            return {"unread_cnt": unread_cnt, "last_id": latest_id or 0, "notifications": []}
+
+        notifications = db.query(BbsNotification).filter(
+            BbsNotification.user_id == user_id,
+            BbsNotification.id > last_id
+        ).order_by(BbsNotification.id).limit(50).all()
+        items = [
+            NotificationResponse.model_validate(notification, from_attributes=True).model_dump(mode="json")
+            for notification in notifications
+        ]
+        return {
+            "unread_cnt": unread_cnt,
+            "last_id": notifications[-1].id if notifications else last_id,
+            "notifications": items,
+        }
+    finally:
+        db.close()
+
+
+def _sse(event: str, data) -> str:
+    """SSE 메시지 포맷"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+@router.get(
+    "/notifications/stream",
+    summary="알림 실시간 스트림 (SSE)",
+    description="""
+    새 알림과 읽지 않은 알림 수를 Server-Sent Events로 전달합니다.
+
+    - EventSource는 헤더를 설정할 수 없으므로 `token` 쿼리 파라미터로도 인증할 수 있습니다.
+    - 이벤트: `unread_count` (`{"unread_cnt": n}`), `notification` (알림 객체)
+    """
+)
+async def stream_notifications(
+    request: Request,
+    token: Optional[str] = Query(None, description="액세스 토큰 (Authorization 헤더 대신 사용)")
+):
+    """알림 실시간 스트림"""
+    authorization = request.headers.get("authorization")
+    if authorization and authorization.lower().startswith("bearer "):
+        token = authorization[7:].strip()
+    user_id = await asyncio.to_thread(_authenticate_stream_user, token)
+
+    async def event_stream():
+        queue = notification_hub.subscribe(user_id)
+        try:
+            state = await asyncio.to_thread(_load_stream_state, user_id, None)
+            last_id = state["last_id"]
+            yield _sse("unread_count", {"unread_cnt": state["unread_cnt"]})
+
+            while True:
+                try:
+                    await asyncio.wait_for(queue.get(), timeout=settings.notification_stream_keepalive)
+                except asyncio.TimeoutError:
+                    if await request.is_disconnected():
+                        break
+                    yield ": keepalive\n\n"
+                    continue
+
+                # 연속된 메시지는 한 번의 조회로 처리
+                while not queue.empty():
+                    queue.get_nowait()
+
+                state = await asyncio.to_thread(_load_stream_state, user_id, last_id)
+                last_id = state["last_id"]
+                for item in state["notifications"]:
+                    yield _sse("notification", item)
+                yield _sse("unread_count", {"unread_cnt": state["unread_cnt"]})
+        finally:
+            notification_hub.unsubscribe(user_id, queue)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.put(
     "/notifications/{notification_id}/read",
     summary="알림 읽음 처리",
@@ -459,20 +763,22 @@ async def mark_notification_read(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """알림 읽음 처리"""
-    notification = db.query(BbsNotification).filter(
+    if read_notification(db, current_user.user_id, notification_id):
+        db.commit()
+        notification_hub.publish([current_user.user_id], COUNT_CHANGED_MESSAGE)
+        return {"message": "알림이 읽음 처리되었습니다"}
+
+    # 바뀐 행이 없으면 이미 읽은 알림인지 없는 알림인지 확인
+    exists = db.query(BbsNotification.id).filter(
         BbsNotification.id == notification_id,
         BbsNotification.user_id == current_user.user_id
     ).first()
-
-    if not notification:
+    if not exists:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="알림을 찾을 수 없습니다"
         )
 
-    notification.is_read = True
-    db.commit()
-
     return {"message": "알림이 읽음 처리되었습니다"}
 
 
@@ -486,16 +792,53 @@ async def mark_all_notifications_read(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """모든 알림 읽음 처리"""
-    db.query(BbsNotification).filter(
-        BbsNotification.user_id == current_user.user_id,
-        BbsNotification.is_read == False
-    ).update({"is_read": True})
-
+    updated = read_all_notifications(db, current_user.user_id)
     db.commit()
+    if updated:
+        notification_hub.publish([current_user.user_id], COUNT_CHANGED_MESSAGE)
 
     return {"message": "모든 알림이 읽음 처리되었습니다"}
 
 
+@router.post(
+    "/notifications/admin-notice",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="관리자 공지 알림 발송",
+    description="모든 활성 사용자에게 공지 알림을 발송합니다. 발송은 백그라운드에서 일괄 처리됩니다. 관리자 권한이 필요합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def send_admin_notice(
+    notice: AdminNoticeCreate,
+    current_user: CommonUser = Depends(get_current_active_user)
+):
+    """관리자 공지 알림 발송"""
+    queued = notification_dispatcher.emit(NotificationEvent(
+        kind=EVENT_ADMIN_NOTICE,
+        actor_id=current_user.user_id,
+        ttl=notice.ttl,
+        msg=notice.msg
+    ))
+
+    if not queued:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="알림 발송 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요."
+        )
+
+    return {"message": "공지 알림 발송이 예약되었습니다"}
+
+
+@router.get(
+    "/notifications/dispatcher/stats",
+    summary="알림 디스패처 상태 조회",
+    description="알림 디스패처의 큐 크기 및 처리 카운터를 조회합니다. 관리자 권한이 필요합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def get_notification_dispatcher_stats():
+    """알림 디스패처 상태 조회"""
+    return {**notification_dispatcher.stats(), "hub": notification_hub.stats()}
+
+
 # 태그 기능 엔드포인트
 @router.get(
     "/tags",
@@ -518,6 +861,14 @@ async def get_tags(
     return tags
 
 
+@cached("popular_tags")
+def load_popular_tags(db: Session, limit: int) -> List[TagResponse]:
+    """사용 횟수 상위 태그"""
+    tags = db.query(BbsTag).order_by(BbsTag.usage_cnt.desc()).limit(limit).all()
+
+    return [TagResponse.model_validate(tag, from_attributes=True) for tag in tags]
+
+
 @router.get(
     "/tags/popular",
     response_model=List[TagResponse],
@@ -528,12 +879,34 @@ async def get_popular_tags(
     limit: int = Query(20, ge=1, le=100, description="반환할 태그 수"),
     db: Session = Depends(get_db)
 ):
-    """인기 태그 조회"""
-    tags = db.query(BbsTag).filter(
-        BbsTag.del_yn == False
-    ).order_by(BbsTag.usage_cnt.desc()).limit(limit).all()
+    """인기 태그 조회 (사용 횟수 순위는 캐시 TTL만큼 늦게 반영될 수 있음)"""
+    return await run_in_threadpool(load_popular_tags, db, limit)
 
-    return tags
+
+def warm_tag_caches(db: Session) -> None:
+    """시작 예열: 인기 태그 기본 조회 캐시 채우기"""
+    load_popular_tags(db, 20)
+
+
+@router.get(
+    "/tags/trending",
+    response_model=List[TrendingTagResponse],
+    summary="급상승 태그 조회",
+    description="최근 기간(예: 1h, 24h, 7d) 동안 많이 사용된 태그를 조회합니다. 주기 작업이 미리 계산한 순위를 반환합니다."
+)
+async def get_trending_tags_endpoint(
+    window: str = Query("24h", description="집계 기간 (TRENDING_TAG_WINDOWS에 설정된 값)"),
+    limit: int = Query(20, ge=1, le=100, description="반환할 태그 수"),
+    db: Session = Depends(get_db)
+):
+    """급상승 태그 조회"""
+    try:
+        return get_trending_tags(db, window, limit)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
 
 
 @router.get(
@@ -824,15 +1197,14 @@ async def get_user_likes(
         BbsPost.stts != PostStatus.DELETED
     ).order_by(BbsPostLike.crt_dt.desc()).offset(skip).limit(limit).all()
 
+    view_counts = get_post_view_counts(db, [row[0].id for row in likes])
+
     result = []
     for post, category_nm, board_nm, liked_at in likes:
         post_dict = PostResponse.from_orm(post).dict()
         
-        # 조회수: bbs_post_views 테이블에서 실제 카운트
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
-        post_dict['vw_cnt'] = int(view_count)
+        # 조회수: 일별 롤업 기반
+        post_dict['vw_cnt'] = view_counts.get(post.id, 0)
         
         # 댓글수: bbs_comments 테이블에서 실제 카운트 (삭제되지 않은 댓글만)
         comment_count = db.query(func.count(BbsComment.id)).filter(
@@ -891,7 +1263,7 @@ async def get_user_followed_boards(
         BbsBoard,
         BbsFollow.crt_dt.label('followed_at')
     ).join(
-        BbsFollow, func.cast(BbsBoard.id, String) == BbsFollow.following_id
+        BbsFollow, BbsBoard.id == BbsFollow.board_id
     ).filter(
         BbsFollow.follower_id == target_user_id,
         BbsFollow.typ == FollowType.BOARD,
@@ -908,15 +1280,10 @@ async def get_user_followed_boards(
             BbsPost.stts != PostStatus.DELETED
         ).scalar() or 0
 
-        follower_count = db.query(func.count(BbsFollow.id)).filter(
-            BbsFollow.following_id == str(board.id),
-            BbsFollow.typ == FollowType.BOARD
-        ).scalar() or 0
-
         board_dict = BoardResponse.model_validate(board, from_attributes=True).model_dump()
         board_dict.update({
             'post_count': int(post_count),
-            'follower_count': int(follower_count),
+            'follower_count': board.follower_cnt or 0,
             'followed_at': followed_at
         })
         result.append(board_dict)
@@ -973,15 +1340,14 @@ async def get_user_posts(
 
     posts = query.order_by(BbsPost.crt_dt.desc()).offset(skip).limit(limit).all()
 
+    view_counts = get_post_view_counts(db, [row[0].id for row in posts])
+
     result = []
     for post, category_nm, board_nm in posts:
         post_dict = PostResponse.from_orm(post).dict()
         
-        # 조회수: bbs_post_views 테이블에서 실제 카운트
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
-        post_dict['vw_cnt'] = int(view_count)
+        # 조회수: 일별 롤업 기반
+        post_dict['vw_cnt'] = view_counts.get(post.id, 0)
         
         # 댓글수: bbs_comments 테이블에서 실제 카운트 (삭제되지 않은 댓글만)
         comment_count = db.query(func.count(BbsComment.id)).filter(
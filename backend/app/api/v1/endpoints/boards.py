@@ -1,18 +1,36 @@
 """게시판 관련 엔드포인트"""
 from typing import List, Optional
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, UploadFile, File, Body, Request
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_, func, text, cast, Date
 from app.database import get_db
 from app.models.board import (
     BbsBoard, BbsCategory, BbsPost, BbsComment, BbsAttachment,
     BbsPostLike, BbsCommentLike, BbsBookmark, BbsReport, BbsNotification,
-    BbsTag, BbsPostTag, BbsFollow, BbsPostView, PostStatus, CommentStatus,
-    LikeType, ReportTargetType, BoardType, PermissionLevel, FollowType
+    BbsTag, BbsPostTag, BbsPostView, PostStatus, CommentStatus,
+    ReportTargetType, BoardType, PermissionLevel
 )
 from app.models.user import CommonUser
 from app.dependencies import get_current_active_user, is_admin_user
+from app.core.moderation import (
+    bulk_update_post_status, bulk_move_posts, bulk_update_comment_status,
+    ACTION_MOVE, OUTCOME_UPDATED
+)
+from app.core.cache import cache, cached
+from app.core.rate_limit import rate_limit_by_user
+from app.core.related_posts import get_related_posts
+from app.core.tags import set_post_tags
+from app.core.toggles import (
+    toggle_post_like as toggle_post_like_row,
+    toggle_comment_like as toggle_comment_like_row,
+    toggle_bookmark as toggle_bookmark_row
+)
+from app.core.view_rollup import get_post_view_counts, get_board_view_counts, get_daily_view_series
+from app.core.notifications import (
+    notification_dispatcher, NotificationEvent, EVENT_COMMENT, EVENT_LIKE, EVENT_NEW_POST
+)
 from app.schemas.board import (
     BoardCreate, BoardUpdate, BoardResponse, CategoryCreate, CategoryUpdate,
     CategoryResponse, PostCreate, PostUpdate, PostResponse, PostDetailResponse,
@@ -21,7 +39,9 @@ from app.schemas.board import (
     TagCreate, TagUpdate, TagResponse, FollowCreate, FollowResponse,
     SearchRequest, SearchResponse, BoardStatisticsResponse, PopularPostResponse,
     UserActivityStatsResponse, UserPreferenceUpdate, UserPreferenceResponse,
-    AttachmentResponse
+    AttachmentResponse, DailyViewSeriesResponse,
+    BulkPostActionRequest, BulkCommentActionRequest, BulkActionResponse,
+    RelatedPostResponse
 )
 
 router = APIRouter()
@@ -135,24 +155,15 @@ async def create_board(
 
     db_board = BbsBoard(**board.dict())
     db.add(db_board)
+    cache.invalidate_tags("boards", db=db)
     db.commit()
     db.refresh(db_board)
     return db_board
 
 
-@router.get(
-    "/boards",
-    response_model=List[BoardResponse],
-    summary="게시판 목록 조회",
-    description="활성화된 게시판 목록을 조회합니다."
-)
-async def get_boards(
-    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
-    limit: int = Query(100, ge=1, le=1000, description="반환할 최대 레코드 수"),
-    include_inactive: bool = Query(False, description="비활성 게시판도 포함할지 여부"),
-    db: Session = Depends(get_db)
-):
-    """게시판 목록 조회"""
+@cached("boards", tags=("boards",))
+def load_boards(db: Session, skip: int, limit: int, include_inactive: bool) -> List[BoardResponse]:
+    """게시판 목록과 게시판별 게시글 수/조회수/팔로워 수 (게시판 변경 시 "boards" 태그로 무효화)"""
     query = db.query(BbsBoard).filter(BbsBoard.del_yn == False)
 
     # include_inactive가 False이면 활성 게시판만 필터링
@@ -161,6 +172,9 @@ async def get_boards(
 
     boards = query.order_by(BbsBoard.sort_order, BbsBoard.crt_dt.desc()).offset(skip).limit(limit).all()
 
+    # 총 조회수는 일별 롤업 테이블 기반으로 한 번에 조회
+    view_counts = get_board_view_counts(db, [board.id for board in boards])
+
     # 각 게시판의 실제 게시물 개수, 총 조회수, 팔로워 수 계산
     for board in boards:
         # 게시물 개수 계산 (삭제된 게시물 제외)
@@ -170,23 +184,29 @@ async def get_boards(
         ).scalar()
         board.post_count = actual_post_count or 0
 
-        # 총 조회수 계산 (bbs_post_views 테이블 기반, PUBLISHED 상태의 게시글만)
-        total_view_count = db.query(func.count(BbsPostView.id)).join(
-            BbsPost, BbsPostView.post_id == BbsPost.id
-        ).filter(
-            BbsPost.board_id == board.id,
-            BbsPost.stts == PostStatus.PUBLISHED
-        ).scalar() or 0
-        board.total_view_count = int(total_view_count)
+        # 총 조회수 (PUBLISHED 상태의 게시글만)
+        board.total_view_count = view_counts.get(board.id, 0)
 
-        # 팔로워 수 계산
-        follower_count = db.query(func.count(BbsFollow.id)).filter(
-            BbsFollow.following_id == str(board.id),
-            BbsFollow.typ == FollowType.BOARD
-        ).scalar() or 0
-        board.follower_count = follower_count
+        # 팔로워 수 (팔로우 트리거가 갱신하는 카운터)
+        board.follower_count = board.follower_cnt or 0
 
-    return boards
+    return [BoardResponse.model_validate(board, from_attributes=True) for board in boards]
+
+
+@router.get(
+    "/boards",
+    response_model=List[BoardResponse],
+    summary="게시판 목록 조회",
+    description="활성화된 게시판 목록을 조회합니다."
+)
+async def get_boards(
+    skip: int = Query(0, ge=0, description="건너뛸 레코드 수"),
+    limit: int = Query(100, ge=1, le=1000, description="반환할 최대 레코드 수"),
+    include_inactive: bool = Query(False, description="비활성 게시판도 포함할지 여부"),
+    db: Session = Depends(get_db)
+):
+    """게시판 목록 조회 (게시글 수와 조회수는 캐시 TTL만큼 늦게 반영될 수 있음)"""
+    return await run_in_threadpool(load_boards, db, skip, limit, include_inactive)
 
 
 @router.get(
@@ -218,21 +238,11 @@ async def get_board(
     ).scalar()
     board.post_count = actual_post_count or 0
 
-    # 총 조회수 계산 (bbs_post_views 테이블 기반, PUBLISHED 상태의 게시글만)
-    total_view_count = db.query(func.count(BbsPostView.id)).join(
-        BbsPost, BbsPostView.post_id == BbsPost.id
-    ).filter(
-        BbsPost.board_id == board.id,
-        BbsPost.stts == PostStatus.PUBLISHED
-    ).scalar() or 0
-    board.total_view_count = int(total_view_count)
+    # 총 조회수 계산 (일별 롤업 기반, PUBLISHED 상태의 게시글만)
+    board.total_view_count = get_board_view_counts(db, [board.id]).get(board.id, 0)
 
-    # 팔로워 수 계산
-    follower_count = db.query(func.count(BbsFollow.id)).filter(
-        BbsFollow.following_id == str(board.id),
-        BbsFollow.typ == FollowType.BOARD
-    ).scalar() or 0
-    board.follower_count = follower_count
+    # 팔로워 수 (팔로우 트리거가 갱신하는 카운터)
+    board.follower_count = board.follower_cnt or 0
 
     return board
 
@@ -259,13 +269,8 @@ async def get_board_statistics(
             detail="게시판을 찾을 수 없습니다"
         )
 
-    # 총 조회수 계산 (bbs_post_views 테이블 기반, PUBLISHED 상태의 게시글만)
-    total_view_count = db.query(func.count(BbsPostView.id)).join(
-        BbsPost, BbsPostView.post_id == BbsPost.id
-    ).filter(
-        BbsPost.board_id == board_id,
-        BbsPost.stts == PostStatus.PUBLISHED
-    ).scalar() or 0
+    # 총 조회수 계산 (일별 롤업 기반, PUBLISHED 상태의 게시글만)
+    total_view_count = get_board_view_counts(db, [board_id]).get(board_id, 0)
 
     return {
         "board_id": board_id,
@@ -274,6 +279,101 @@ async def get_board_statistics(
     }
 
 
+# 일별 조회수 시계열 조회 최대 기간 (일)
+MAX_VIEW_SERIES_DAYS = 366
+
+
+def resolve_view_series_range(start_date: Optional[date], end_date: Optional[date]) -> tuple:
+    """시계열 조회 기간 검증 (기본값: 최근 30일)"""
+    end_date = end_date or datetime.utcnow().date()
+    start_date = start_date or end_date - timedelta(days=29)
+    if start_date > end_date:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="시작일은 종료일보다 늦을 수 없습니다"
+        )
+    if (end_date - start_date).days + 1 > MAX_VIEW_SERIES_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"조회 기간은 최대 {MAX_VIEW_SERIES_DAYS}일까지 가능합니다"
+        )
+    return start_date, end_date
+
+
+@router.get(
+    "/boards/{board_id}/views/daily",
+    response_model=DailyViewSeriesResponse,
+    summary="게시판 일별 조회수 조회",
+    description="게시판의 일별 조회수 시계열을 조회합니다. 날짜는 UTC 기준입니다."
+)
+async def get_board_daily_views(
+    board_id: int = Path(..., description="게시판 ID"),
+    start_date: Optional[date] = Query(None, description="시작일 (기본값: 종료일 29일 전)"),
+    end_date: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    db: Session = Depends(get_db)
+):
+    """게시판 일별 조회수 조회"""
+    board = db.query(BbsBoard.id).filter(
+        BbsBoard.id == board_id,
+        BbsBoard.actv_yn == True
+    ).first()
+
+    if not board:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시판을 찾을 수 없습니다"
+        )
+
+    start_date, end_date = resolve_view_series_range(start_date, end_date)
+    series = get_daily_view_series(db, start_date, end_date, board_id=board_id)
+
+    return DailyViewSeriesResponse(
+        target_typ="BOARD",
+        target_id=board_id,
+        start_date=start_date,
+        end_date=end_date,
+        total_view_cnt=sum(item["view_cnt"] for item in series),
+        series=series
+    )
+
+
+@router.get(
+    "/posts/{post_id}/views/daily",
+    response_model=DailyViewSeriesResponse,
+    summary="게시글 일별 조회수 조회",
+    description="게시글의 일별 조회수 시계열을 조회합니다. 날짜는 UTC 기준입니다."
+)
+async def get_post_daily_views(
+    post_id: int = Path(..., description="게시글 ID"),
+    start_date: Optional[date] = Query(None, description="시작일 (기본값: 종료일 29일 전)"),
+    end_date: Optional[date] = Query(None, description="종료일 (기본값: 오늘)"),
+    db: Session = Depends(get_db)
+):
+    """게시글 일별 조회수 조회"""
+    post = db.query(BbsPost.id).filter(
+        BbsPost.id == post_id,
+        BbsPost.stts == PostStatus.PUBLISHED
+    ).first()
+
+    if not post:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다"
+        )
+
+    start_date, end_date = resolve_view_series_range(start_date, end_date)
+    series = get_daily_view_series(db, start_date, end_date, post_id=post_id)
+
+    return DailyViewSeriesResponse(
+        target_typ="POST",
+        target_id=post_id,
+        start_date=start_date,
+        end_date=end_date,
+        total_view_cnt=sum(item["view_cnt"] for item in series),
+        series=series
+    )
+
+
 @router.put(
     "/boards/{board_id}",
     response_model=BoardResponse,
@@ -315,6 +415,7 @@ async def update_board(
     for field, value in board_update.dict(exclude_unset=True).items():
         setattr(board, field, value)
 
+    cache.invalidate_tags("boards", db=db)
     db.commit()
     db.refresh(board)
     return board
@@ -343,6 +444,7 @@ async def delete_board(
         )
 
     board.del_yn = True
+    cache.invalidate_tags("boards", db=db)
     db.commit()
 
     return {"message": "게시판이 삭제되었습니다"}
@@ -389,22 +491,15 @@ async def create_category(
 
     db_category = BbsCategory(**category.dict())
     db.add(db_category)
+    cache.invalidate_tags(f"board:{category.board_id}", db=db)
     db.commit()
     db.refresh(db_category)
     return db_category
 
 
-@router.get(
-    "/boards/{board_id}/categories",
-    response_model=List[CategoryResponse],
-    summary="게시판별 카테고리 목록 조회",
-    description="특정 게시판의 활성화된 카테고리 목록을 조회합니다."
-)
-async def get_categories_by_board(
-    board_id: int = Path(..., description="게시판 ID"),
-    db: Session = Depends(get_db)
-):
-    """게시판별 카테고리 목록 조회"""
+@cached("categories", tags=("boards", "board:{board_id}"))
+def load_categories(db: Session, board_id: int) -> List[CategoryResponse]:
+    """게시판의 활성 카테고리와 카테고리별 게시글 수 (카테고리 변경 시 "board:<ID>" 태그로 무효화)"""
     categories = db.query(BbsCategory).filter(
         BbsCategory.board_id == board_id,
         BbsCategory.actv_yn == True,
@@ -419,7 +514,28 @@ async def get_categories_by_board(
         ).scalar()
         category.post_count = actual_post_count or 0
 
-    return categories
+    return [CategoryResponse.model_validate(category, from_attributes=True) for category in categories]
+
+
+@router.get(
+    "/boards/{board_id}/categories",
+    response_model=List[CategoryResponse],
+    summary="게시판별 카테고리 목록 조회",
+    description="특정 게시판의 활성화된 카테고리 목록을 조회합니다."
+)
+async def get_categories_by_board(
+    board_id: int = Path(..., description="게시판 ID"),
+    db: Session = Depends(get_db)
+):
+    """게시판별 카테고리 목록 조회"""
+    return await run_in_threadpool(load_categories, db, board_id)
+
+
+def warm_board_caches(db: Session) -> None:
+    """시작 예열: 게시판 목록(기본 조회 인자), 게시판별 카테고리, 인기 게시글 캐시 채우기"""
+    for board in load_boards(db, 0, 100, False):
+        load_categories(db, board.id)
+    load_popular_posts(db, 10)
 
 
 # 게시글 관리 엔드포인트
@@ -475,25 +591,31 @@ async def create_post(
         user_id=current_user.user_id
     )
     db.add(db_post)
-    db.commit()
-    db.refresh(db_post)
 
-    # 태그 처리
+    # 태그 처리 (게시글과 같은 트랜잭션에서 일괄 반영)
     if post.tags:
-        for tag_name in post.tags:
-            # 태그 존재 확인 또는 생성
-            tag = db.query(BbsTag).filter(BbsTag.nm == tag_name).first()
-            if not tag:
-                tag = BbsTag(nm=tag_name)
-                db.add(tag)
-                db.commit()
-                db.refresh(tag)
-
-            # 게시글-태그 연결
-            post_tag = BbsPostTag(post_id=db_post.id, tag_id=tag.id)
-            db.add(post_tag)
+        db.flush()
+        try:
+            set_post_tags(db, db_post.id, post.tags)
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
 
-        db.commit()
+    db.commit()
+    db.refresh(db_post)
+
+    # 게시판 팔로워 알림 (백그라운드에서 일괄 생성)
+    if db_post.stts == PostStatus.PUBLISHED:
+        notification_dispatcher.emit(NotificationEvent(
+            kind=EVENT_NEW_POST,
+            actor_id=current_user.user_id,
+            post_id=db_post.id,
+            board_id=db_post.board_id,
+            ttl=db_post.ttl
+        ))
 
     return db_post
 
@@ -554,6 +676,9 @@ async def get_posts(
     total_count = query.count()
     posts = query.offset(offset).limit(limit).all()
 
+    # 조회수는 일별 롤업 기반으로 한 번에 조회
+    view_counts = get_post_view_counts(db, [row[0].id for row in posts])
+
     # 응답 포맷팅
     post_list = []
     for post, author_nickname, category_nm in posts:
@@ -561,11 +686,7 @@ async def get_posts(
         post_dict['author_nickname'] = author_nickname
         post_dict['category_nm'] = category_nm
 
-        # 조회수 계산 (bbs_post_views 테이블 기반)
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
-        post_dict['vw_cnt'] = int(view_count)
+        post_dict['vw_cnt'] = view_counts.get(post.id, 0)
 
         # 비밀글 처리: 본인 글이 아니면 제목과 요약 숨기기
         if post.scr_yn and post.user_id != current_user.user_id:
@@ -666,6 +787,9 @@ async def get_all_posts_admin(
     total_count = query.count()
     posts = query.offset(offset).limit(limit).all()
 
+    # 조회수는 일별 롤업 기반으로 한 번에 조회
+    view_counts = get_post_view_counts(db, [row[0].id for row in posts])
+
     # 응답 포맷팅
     post_list = []
     for post, author_nickname, category_nm, board_nm in posts:
@@ -674,11 +798,7 @@ async def get_all_posts_admin(
         post_dict['category_nm'] = category_nm
         post_dict['board_nm'] = board_nm
 
-        # 조회수 계산 (bbs_post_views 테이블 기반)
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
-        post_dict['vw_cnt'] = int(view_count)
+        post_dict['vw_cnt'] = view_counts.get(post.id, 0)
 
         # 댓글수 계산
         comment_count = db.query(func.count(BbsComment.id)).filter(
@@ -708,6 +828,43 @@ async def get_all_posts_admin(
     )
 
 
+@cached("post_extras", tags=("post:{post_id}",))
+def load_post_extras(db: Session, post_id: int, user_id: str, category_id: Optional[int]) -> dict:
+    """
+    게시글 상세의 작성자 닉네임, 카테고리 이름, 태그, 첨부파일 (게시글 수정 시 "post:{id}" 태그로 무효화)
+
+    작성자와 카테고리가 바뀌면 키도 바뀌므로 이전 항목은 TTL로 만료됩니다.
+    """
+    # 작성자 정보
+    author = db.query(CommonUser).filter(CommonUser.user_id == user_id).first()
+    author_nickname = author.nickname if author else None
+
+    # 카테고리 정보
+    category = None
+    if category_id:
+        category = db.query(BbsCategory).filter(BbsCategory.id == category_id).first()
+    category_nm = category.nm if category else None
+
+    # 태그 정보
+    tags = db.query(BbsTag.nm).join(
+        BbsPostTag, BbsTag.id == BbsPostTag.tag_id
+    ).filter(BbsPostTag.post_id == post_id).all()
+    tag_names = [tag[0] for tag in tags]
+
+    # 첨부파일 정보
+    attachments = db.query(BbsAttachment).filter(
+        BbsAttachment.post_id == post_id,
+        BbsAttachment.del_yn == False
+    ).all()
+
+    return {
+        'author_nickname': author_nickname,
+        'category_nm': category_nm,
+        'tags': tag_names,
+        'attachments': [AttachmentResponse.from_orm(att).dict() for att in attachments],
+    }
+
+
 @router.get(
     "/posts/{post_id}",
     response_model=PostDetailResponse,
@@ -769,27 +926,8 @@ async def get_post(
             db=db
         )
 
-    # 작성자 정보
-    author = db.query(CommonUser).filter(CommonUser.user_id == post.user_id).first()
-    author_nickname = author.nickname if author else None
-
-    # 카테고리 정보
-    category = None
-    if post.category_id:
-        category = db.query(BbsCategory).filter(BbsCategory.id == post.category_id).first()
-    category_nm = category.nm if category else None
-
-    # 태그 정보
-    tags = db.query(BbsTag.nm).join(
-        BbsPostTag, BbsTag.id == BbsPostTag.tag_id
-    ).filter(BbsPostTag.post_id == post_id).all()
-    tag_names = [tag[0] for tag in tags]
-
-    # 첨부파일 정보
-    attachments = db.query(BbsAttachment).filter(
-        BbsAttachment.post_id == post_id,
-        BbsAttachment.del_yn == False
-    ).all()
+    # 작성자/카테고리/태그/첨부파일 (캐시)
+    extras = await run_in_threadpool(load_post_extras, db, post_id, post.user_id, post.category_id)
 
     # 좋아요 여부 확인
     post_like = db.query(BbsPostLike).filter(
@@ -805,19 +943,14 @@ async def get_post(
     ).first()
     is_bookmarked = bookmark is not None
 
-    # 조회수 계산 (bbs_post_views 테이블 기반)
-    view_count = db.query(func.count(BbsPostView.id)).filter(
-        BbsPostView.post_id == post_id
-    ).scalar() or 0
+    # 조회수 계산 (일별 롤업 기반)
+    view_count = get_post_view_counts(db, [post_id]).get(post_id, 0)
 
     # 응답 구성
     post_dict = PostDetailResponse.from_orm(post).dict()
     post_dict.update({
-        'vw_cnt': int(view_count),  # bbs_post_views 테이블 기반 조회수
-        'author_nickname': author_nickname,
-        'category_nm': category_nm,
-        'tags': tag_names,
-        'attachments': [AttachmentResponse.from_orm(att).dict() for att in attachments],
+        'vw_cnt': view_count,
+        **extras,
         'is_liked': is_liked,
         'is_bookmarked': is_bookmarked
     })
@@ -885,6 +1018,31 @@ async def verify_post_password(
     return {"verified": True, "access_token": access_token}
 
 
+@router.get(
+    "/posts/{post_id}/related",
+    response_model=List[RelatedPostResponse],
+    summary="관련 게시글 조회",
+    description="같은 게시판에서 태그가 비슷한 공개 게시글을 유사도 순으로 조회합니다. 주기 작업이 미리 계산한 결과를 반환합니다."
+)
+async def get_post_related(
+    post_id: int = Path(..., description="게시글 ID"),
+    limit: int = Query(5, ge=1, le=20, description="반환할 최대 게시글 수"),
+    db: Session = Depends(get_db)
+):
+    """관련 게시글 조회"""
+    exists = db.query(BbsPost.id).filter(
+        BbsPost.id == post_id,
+        BbsPost.stts != PostStatus.DELETED
+    ).first()
+    if not exists:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="게시글을 찾을 수 없습니다"
+        )
+
+    return get_related_posts(db, post_id, limit)
+
+
 @router.put(
     "/posts/{post_id}",
     response_model=PostResponse,
@@ -941,28 +1099,74 @@ async def update_post(
     for field, value in update_data.items():
         setattr(post, field, value)
 
-    # 태그 업데이트
+    # 태그 업데이트 (바뀐 태그만 반영)
     if post_update.tags is not None:
-        # 기존 태그 삭제
-        db.query(BbsPostTag).filter(BbsPostTag.post_id == post_id).delete()
-
-        # 새 태그 추가
-        for tag_name in post_update.tags:
-            tag = db.query(BbsTag).filter(BbsTag.nm == tag_name).first()
-            if not tag:
-                tag = BbsTag(nm=tag_name)
-                db.add(tag)
-                db.commit()
-                db.refresh(tag)
-
-            post_tag = BbsPostTag(post_id=post_id, tag_id=tag.id)
-            db.add(post_tag)
+        try:
+            set_post_tags(db, post_id, post_update.tags)
+        except ValueError as e:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
 
+    cache.invalidate_tags(f"post:{post_id}", db=db)
     db.commit()
     db.refresh(post)
     return post
 
 
+@router.post(
+    "/posts/admin/bulk",
+    response_model=BulkActionResponse,
+    summary="게시글 일괄 관리 (관리자용)",
+    description="여러 게시글을 한 번에 숨김/표시/삭제하거나 다른 게시판으로 이동합니다. 항목별 처리 결과를 반환합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def bulk_moderate_posts(
+    bulk_request: BulkPostActionRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: CommonUser = Depends(get_current_active_user)
+):
+    """게시글 일괄 관리 (관리자용)"""
+    action = bulk_request.action.value
+    ip_addr = get_client_ip(request)
+
+    if action == ACTION_MOVE:
+        if bulk_request.target_board_id is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="이동할 게시판 ID가 필요합니다"
+            )
+        target_board = db.query(BbsBoard.id).filter(
+            BbsBoard.id == bulk_request.target_board_id,
+            BbsBoard.del_yn == False
+        ).first()
+        if not target_board:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="이동할 게시판을 찾을 수 없습니다"
+            )
+        results = bulk_move_posts(
+            db, current_user.user_id, bulk_request.ids, bulk_request.target_board_id,
+            reason=bulk_request.reason, ip_addr=ip_addr
+        )
+    else:
+        results = bulk_update_post_status(
+            db, current_user.user_id, bulk_request.ids, action,
+            reason=bulk_request.reason, ip_addr=ip_addr
+        )
+    db.commit()
+
+    return BulkActionResponse(
+        action=action,
+        requested=len(results),
+        updated=sum(1 for result in results if result["outcome"] == OUTCOME_UPDATED),
+        results=results
+    )
+
+
 @router.delete(
     "/posts/{post_id}",
     summary="게시글 삭제",
@@ -1075,6 +1279,15 @@ async def create_comment(
     db.commit()
     db.refresh(db_comment)
 
+    # 게시글 작성자/부모 댓글 작성자 알림 (백그라운드에서 병합 후 생성)
+    notification_dispatcher.emit(NotificationEvent(
+        kind=EVENT_COMMENT,
+        actor_id=current_user.user_id,
+        post_id=db_comment.post_id,
+        comment_id=db_comment.id,
+        parent_comment_id=db_comment.parent_id
+    ))
+
     # 작성자 닉네임 조회
     author = db.query(CommonUser).filter(
         CommonUser.user_id == db_comment.user_id
@@ -1536,9 +1749,39 @@ async def delete_comment_admin(
     return {"message": "댓글이 삭제되었습니다"}
 
 
+@router.post(
+    "/comments/admin/bulk",
+    response_model=BulkActionResponse,
+    summary="댓글 일괄 관리 (관리자용)",
+    description="여러 댓글을 한 번에 숨김/표시/삭제합니다. 항목별 처리 결과를 반환합니다.",
+    dependencies=[Depends(is_admin_user)]
+)
+async def bulk_moderate_comments(
+    bulk_request: BulkCommentActionRequest,
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: CommonUser = Depends(get_current_active_user)
+):
+    """댓글 일괄 관리 (관리자용)"""
+    action = bulk_request.action.value
+    results = bulk_update_comment_status(
+        db, current_user.user_id, bulk_request.ids, action,
+        ip_addr=get_client_ip(request)
+    )
+    db.commit()
+
+    return BulkActionResponse(
+        action=action,
+        requested=len(results),
+        updated=sum(1 for result in results if result["outcome"] == OUTCOME_UPDATED),
+        results=results
+    )
+
+
 @router.post(
     "/comments/{comment_id}/like",
     summary="댓글 좋아요 토글",
+    dependencies=[Depends(rate_limit_by_user("comment_like"))],
     description="댓글에 좋아요를 추가하거나 제거합니다."
 )
 async def toggle_comment_like(
@@ -1547,48 +1790,18 @@ async def toggle_comment_like(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """댓글 좋아요 토글"""
-    # 댓글 존재 확인
-    comment = db.query(BbsComment).filter(
-        BbsComment.id == comment_id,
-        BbsComment.stts != CommentStatus.DELETED
-    ).first()
-
-    if not comment:
+    # 존재 확인, 추가/제거, 좋아요 수 갱신을 한 문장으로 처리
+    result = toggle_comment_like_row(db, comment_id, current_user.user_id)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="댓글을 찾을 수 없습니다"
         )
-
-    # 기존 좋아요 확인
-    existing_like = db.query(BbsCommentLike).filter(
-        BbsCommentLike.comment_id == comment_id,
-        BbsCommentLike.user_id == current_user.user_id
-    ).first()
-
-    if existing_like:
-        # 좋아요 제거
-        db.delete(existing_like)
-        liked = False
-    else:
-        # 좋아요 추가
-        new_like = BbsCommentLike(
-            comment_id=comment_id,
-            user_id=current_user.user_id,
-            typ=LikeType.LIKE
-        )
-        db.add(new_like)
-        liked = True
-
     db.commit()
 
-    # 좋아요 수 조회
-    like_count = db.query(func.count(BbsCommentLike.id)).filter(
-        BbsCommentLike.comment_id == comment_id
-    ).scalar()
-
     return {
-        "liked": liked,
-        "like_count": like_count
+        "liked": result.active,
+        "like_count": result.count
     }
 
 
@@ -1596,6 +1809,7 @@ async def toggle_comment_like(
 @router.post(
     "/posts/{post_id}/like",
     summary="게시글 좋아요 토글",
+    dependencies=[Depends(rate_limit_by_user("post_like"))],
     description="게시글에 좋아요를 추가하거나 제거합니다."
 )
 async def toggle_post_like(
@@ -1609,77 +1823,35 @@ async def toggle_post_like(
     if like_request is None:
         like_request = LikeRequest()
 
-    # 게시글 존재 확인
-    post = db.query(BbsPost).filter(
-        BbsPost.id == post_id,
-    ).first()
-
-    if not post:
+    # 존재 확인, 추가/제거, 좋아요 수 갱신을 한 문장으로 처리
+    result = toggle_post_like_row(db, post_id, current_user.user_id, like_request.typ.value)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다"
         )
+    db.commit()
 
-    # 기존 좋아요 확인
-    existing_like = db.query(BbsPostLike).filter(
-        BbsPostLike.post_id == post_id,
-        BbsPostLike.user_id == current_user.user_id
-    ).first()
+    if result.active and result.changed:
+        # 이번 요청으로 추가된 경우에만 게시글 작성자 알림 (백그라운드에서 병합 후 생성)
+        notification_dispatcher.emit(NotificationEvent(
+            kind=EVENT_LIKE,
+            actor_id=current_user.user_id,
+            post_id=post_id
+        ))
 
-    # 트리거가 자동으로 lk_cnt를 업데이트하므로 단순화된 처리
-    try:
-        if existing_like:
-            # 좋아요 취소 - 트리거가 자동으로 lk_cnt 감소
-            db.delete(existing_like)
-            db.commit()
-            
-            # 트리거가 업데이트한 최신 값 조회
-            db.refresh(post)
-            
-            return {
-                "liked": False,
-                "like_count": post.lk_cnt,
-                "like": LikeResponse(
-                    id=existing_like.id,
-                    user_id=existing_like.user_id,
-                    typ=existing_like.typ,
-                    crt_dt=existing_like.crt_dt
-                )
-            }
-        else:
-            # 좋아요 추가 - 트리거가 자동으로 lk_cnt 증가
-            like = BbsPostLike(
-                post_id=post_id,
-                user_id=current_user.user_id,
-                typ=like_request.typ
-            )
-            db.add(like)
-            db.commit()
-            db.refresh(like)
-            db.refresh(post)  # 트리거가 업데이트한 최신 값 조회
-            
-            return {
-                "liked": True,
-                "like_count": post.lk_cnt,
-                "like": LikeResponse(
-                    id=like.id,
-                    user_id=like.user_id,
-                    typ=like.typ,
-                    crt_dt=like.crt_dt
-                )
-            }
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"좋아요 처리 실패: {str(e)}"
-        )
+    return {
+        "liked": result.active,
+        "like_count": result.count,
+        "like": LikeResponse(**result.row) if result.row else None
+    }
 
 
 # 북마크 엔드포인트
 @router.post(
     "/posts/{post_id}/bookmark",
     summary="게시글 북마크 토글",
+    dependencies=[Depends(rate_limit_by_user("bookmark"))],
     description="게시글을 북마크에 추가하거나 제거합니다."
 )
 async def toggle_bookmark(
@@ -1688,38 +1860,17 @@ async def toggle_bookmark(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """게시글 북마크 토글"""
-    # 게시글 존재 확인
-    post = db.query(BbsPost).filter(
-        BbsPost.id == post_id,
-    ).first()
-
-    if not post:
+    result = toggle_bookmark_row(db, post_id, current_user.user_id)
+    if not result.found:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다"
         )
+    db.commit()
 
-    # 기존 북마크 확인
-    existing_bookmark = db.query(BbsBookmark).filter(
-        BbsBookmark.post_id == post_id,
-        BbsBookmark.user_id == current_user.user_id
-    ).first()
-
-    if existing_bookmark:
-        # 북마크 취소
-        db.delete(existing_bookmark)
-        db.commit()
+    if not result.active:
         return {"message": "북마크가 취소되었습니다"}
-    else:
-        # 북마크 추가
-        bookmark = BbsBookmark(
-            post_id=post_id,
-            user_id=current_user.user_id
-        )
-        db.add(bookmark)
-        db.commit()
-        db.refresh(bookmark)
-        return bookmark
+    return result.row
 
 
 # 검색 엔드포인트
@@ -1774,18 +1925,15 @@ async def search_posts(
     total_count = search_query.count()
     results = search_query.offset(offset).limit(limit).all()
 
+    # 조회수는 일별 롤업 기반으로 한 번에 조회
+    view_counts = get_post_view_counts(db, [row[0].id for row in results])
+
     # 응답 포맷팅
     post_list = []
     for post, author_nickname, board_nm in results:
         post_dict = PostResponse.from_orm(post).dict()
         post_dict['author_nickname'] = author_nickname
-        
-        # 조회수 계산 (bbs_post_views 테이블 기반)
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
-        post_dict['vw_cnt'] = int(view_count)
-        
+        post_dict['vw_cnt'] = view_counts.get(post.id, 0)
         post_list.append(PostResponse(**post_dict))
 
     total_pages = (total_count + limit - 1) // limit
@@ -1811,6 +1959,12 @@ async def get_popular_posts(
     db: Session = Depends(get_db)
 ):
     """인기 게시글 조회"""
+    return await run_in_threadpool(load_popular_posts, db, limit)
+
+
+@cached("popular_posts")
+def load_popular_posts(db: Session, limit: int) -> List[PopularPostResponse]:
+    """인기 게시글 목록 (CACHE_TTLS의 popular_posts 주기로 갱신)"""
     # 게시글 조회 (인기도 점수는 나중에 계산)
     posts = db.query(
         BbsPost,
@@ -1825,12 +1979,12 @@ async def get_popular_posts(
         BbsPost.stts != PostStatus.DELETED  # 삭제된 게시물 제외
     ).limit(limit * 2).all()  # 더 많이 가져온 후 정렬
 
+    # 조회수는 일별 롤업 기반으로 한 번에 조회
+    view_counts = get_post_view_counts(db, [row[0].id for row in posts])
+
     result = []
     for post, author_nickname, board_nm in posts:
-        # 조회수 계산 (bbs_post_views 테이블 기반)
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
+        view_count = view_counts.get(post.id, 0)
         
         # 인기도 점수 계산 (조회수 + 좋아요*10 + 댓글*5)
         popularity_score = int(view_count) + post.lk_cnt * 10 + post.cmt_cnt * 5
@@ -1838,7 +1992,7 @@ async def get_popular_posts(
         post_dict = PopularPostResponse(
             id=post.id,
             ttl=post.ttl,
-            vw_cnt=int(view_count),  # bbs_post_views 테이블 기반 조회수
+            vw_cnt=view_count,
             lk_cnt=post.lk_cnt,
             cmt_cnt=post.cmt_cnt,
             author_nickname=author_nickname,
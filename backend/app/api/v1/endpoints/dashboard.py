@@ -8,12 +8,14 @@ from app.database import get_db
 from app.models.board import (
     BbsPost, BbsComment, BbsBookmark, BbsFollow, BbsReport,
     BbsBoard, BbsCategory, PostStatus, CommentStatus, FollowType,
-    BbsPostView, BbsPostLike, ReportStatus, ReportReason, ReportTargetType
+    BbsPostLike, ReportStatus, ReportReason, ReportTargetType
 )
 from app.models.inquiry import CommonInquiry, InquiryStatus, InquiryCategory
 from app.models.user import CommonUser
 from app.dependencies import is_admin_user
 from app.dependencies import get_current_active_user
+from app.core.view_rollup import get_post_view_counts
+from app.core.report_targets import resolve_report_targets
 from app.schemas.dashboard import (
     DashboardStatsResponse, RecentActivityResponse, ActivityType,
     MyPostResponse, MyCommentResponse, MyBookmarkResponse,
@@ -164,7 +166,7 @@ async def get_recent_activities(
         BbsBoard.nm.label('title'),
         BbsFollow.crt_dt
     ).join(
-        BbsBoard, cast(BbsBoard.id, String) == BbsFollow.following_id
+        BbsBoard, BbsBoard.id == BbsFollow.board_id
     ).filter(
         BbsFollow.follower_id == user_id,
         BbsFollow.typ == FollowType.BOARD
@@ -219,12 +221,12 @@ async def get_my_posts(
         BbsPost.stts != PostStatus.DELETED
     ).order_by(BbsPost.crt_dt.desc()).offset(skip).limit(limit).all()
 
+    view_counts = get_post_view_counts(db, [row[0].id for row in posts])
+
     items = []
     for post, board_id, board_name in posts:
-        # 조회수
-        view_count = db.query(func.count(BbsPostView.id)).filter(
-            BbsPostView.post_id == post.id
-        ).scalar() or 0
+        # 조회수 (일별 롤업 기반)
+        view_count = view_counts.get(post.id, 0)
 
         # 댓글수
         comment_count = db.query(func.count(BbsComment.id)).filter(
@@ -387,7 +389,7 @@ async def get_my_follows(
         BbsBoard.nm.label('board_name'),
         BbsBoard.dsc.label('board_description')
     ).join(
-        BbsBoard, cast(BbsBoard.id, String) == BbsFollow.following_id
+        BbsBoard, BbsBoard.id == BbsFollow.board_id
     ).filter(
         BbsFollow.follower_id == user_id,
         BbsFollow.typ == FollowType.BOARD,
@@ -434,38 +436,24 @@ async def get_my_reports(
         BbsReport.reporter_id == user_id
     ).order_by(BbsReport.crt_dt.desc()).offset(skip).limit(limit).all()
 
+    # 신고 대상 정보를 유형별로 한 번에 조회
+    targets = resolve_report_targets(db, [(report.target_type, report.target_id) for report in reports])
+
     items = []
     for report in reports:
         # 신고 제목 생성 (대상 타입과 ID로)
-        target_author_id = None
-        target_author_nickname = None
-        
+        target = targets[(report.target_type, report.target_id)]
+        target_author_id = target.author_id
+        target_author_nickname = target.author_nickname
+
         if report.target_type == ReportTargetType.POST:
-            target = db.query(BbsPost).filter(BbsPost.id == report.target_id).first()
-            if target:
-                title = f"게시글 신고: {target.ttl}"
-                target_author_id = target.user_id
-                # 작성자 닉네임 조회
-                author = db.query(CommonUser).filter(CommonUser.user_id == target.user_id).first()
-                target_author_nickname = author.nickname if author else None
-            else:
-                title = f"게시글 신고: ID {report.target_id}"
+            title = f"게시글 신고: {target.title}" if target.exists else f"게시글 신고: ID {report.target_id}"
         elif report.target_type == ReportTargetType.COMMENT:
-            target = db.query(BbsComment).filter(BbsComment.id == report.target_id).first()
-            if target:
-                title = f"댓글 신고: {target.cn[:50] if target.cn else '내용 없음'}"
-                target_author_id = target.user_id
-                # 작성자 닉네임 조회
-                author = db.query(CommonUser).filter(CommonUser.user_id == target.user_id).first()
-                target_author_nickname = author.nickname if author else None
-            else:
-                title = f"댓글 신고: ID {report.target_id}"
+            title = f"댓글 신고: {target.title or '내용 없음'}" if target.exists else f"댓글 신고: ID {report.target_id}"
         else:
             # 사용자 신고의 경우 target_id가 사용자 ID
             title = f"사용자 신고: ID {report.target_id}"
             target_author_id = str(report.target_id)
-            author = db.query(CommonUser).filter(CommonUser.user_id == str(report.target_id)).first()
-            target_author_nickname = author.nickname if author else None
 
         # 신고 상태 매핑 (프론트엔드 형식에 맞춤)
         status_mapping = {
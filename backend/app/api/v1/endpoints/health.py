@@ -1,6 +1,9 @@
 """헬스 체크 엔드포인트"""
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel
+from app.core.admission import admission_controller, STATE_SATURATED
+from app.core.warmup import warmup
 
 router = APIRouter()
 
@@ -11,6 +14,20 @@ class HealthResponse(BaseModel):
     message: str
 
 
+class ReadinessResponse(BaseModel):
+    """준비 상태 응답"""
+    status: str
+    state: str
+    warmed_up: bool
+    in_flight: int
+    max_in_flight: int
+    pool_capacity: int
+    pool_checked_out: int
+    pool_waiting: int
+    pool_usage: float
+    pool_wait_ms: float
+
+
 @router.get(
     "",
     response_model=HealthResponse,
@@ -35,3 +52,28 @@ async def health_check():
         "message": "Server is running"
     }
 
+
+@router.get(
+    "/ready",
+    response_model=ReadinessResponse,
+    summary="준비 상태 확인",
+    description="""
+    워커가 새 요청을 받을 수 있는지 확인합니다.
+
+    **응답:**
+    - 처리 중인 요청 수와 DB 커넥션 풀 상태(사용률, 대기 중인 요청, 최근 대기 시간)를 반환합니다.
+    - 시작 예열(커넥션, 매퍼, 캐시)이 끝나기 전에는 503을 반환합니다 (`warmed_up: false`).
+    - 포화 상태(saturated)면 503을 반환해 로드 밸런서가 이 워커로 요청을 보내지 않게 합니다.
+    - shedding 상태는 낮은 우선순위 요청(통계, 관리자 목록, 내보내기)만 거절하는 단계로 200을 반환합니다.
+    - 이 엔드포인트는 인증이 필요하지 않습니다.
+    """,
+    response_description="준비 상태와 부하 정보를 반환합니다."
+)
+async def readiness_check():
+    """준비 상태 확인 (예열 전이거나 포화 상태면 503)"""
+    status = admission_controller.status()
+    ready = warmup.ready and status["state"] != STATE_SATURATED
+    return JSONResponse(
+        status_code=200 if ready else 503,
+        content={"status": "ready" if ready else "not_ready", "warmed_up": warmup.ready, **status},
+    )
@@ -12,6 +12,16 @@ import uuid
 router = APIRouter()
 
 
+def locale_list_query(db: Session):
+    """삭제되지 않은 다국어 리소스 목록 쿼리"""
+    return db.query(CommonLocale).filter(CommonLocale.del_yn == False)
+
+
+def warm_locale_statements(db: Session) -> None:
+    """시작 예열: 다국어 리소스 목록 쿼리를 한 번 실행해 SQL 컴파일 캐시 채우기"""
+    locale_list_query(db).offset(0).limit(100).all()
+
+
 @router.post(
     "",
     response_model=LocaleResponse,
@@ -116,7 +126,7 @@ async def get_locales(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """다국어 리소스 목록 조회"""
-    query = db.query(CommonLocale).filter(CommonLocale.del_yn == False)
+    query = locale_list_query(db)
     
     if lang_cd:
         query = query.filter(CommonLocale.lang_cd == lang_cd)
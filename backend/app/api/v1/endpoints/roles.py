@@ -14,6 +14,18 @@ import uuid
 router = APIRouter()
 
 
+def role_list_query(db: Session):
+    """삭제되지 않은 역할과 권한 목록 쿼리"""
+    return db.query(CommonRole).options(
+        joinedload(CommonRole.role_permissions).joinedload(CommonRolePermission.permission)
+    ).filter(CommonRole.del_yn == False)
+
+
+def warm_role_statements(db: Session) -> None:
+    """시작 예열: 역할 목록 쿼리를 한 번 실행해 SQL 컴파일 캐시 채우기"""
+    role_list_query(db).offset(0).limit(100).all()
+
+
 @router.post(
     "",
     response_model=RoleResponse,
@@ -102,9 +114,7 @@ async def get_roles(
     current_user: CommonUser = Depends(get_current_active_user)
 ):
     """역할 목록 조회"""
-    query = db.query(CommonRole).options(
-        joinedload(CommonRole.role_permissions).joinedload(CommonRolePermission.permission)
-    ).filter(CommonRole.del_yn == False)
+    query = role_list_query(db)
     
     if actv_yn is not None:
         query = query.filter(CommonRole.actv_yn == actv_yn)
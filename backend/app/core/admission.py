@@ -0,0 +1,235 @@
+"""과부하 시 요청 수락 제어 (우선순위별 부하 차단, 경로별 statement_timeout, 준비 상태 판단)"""
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import json
+import re
+from fastapi import Request
+from fastapi.responses import JSONResponse
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from app.core.config import settings
+from app.core.metrics import Counter, GaugeCallback, registry
+from app.database import engine
+
+# 수락 상태
+STATE_OK = "ok"
+STATE_SHEDDING = "shedding"  # 낮은 우선순위 요청 거절
+STATE_SATURATED = "saturated"  # 제외 경로를 뺀 모든 요청 거절, 준비 상태 실패
+
+# PostgreSQL statement_timeout 초과 오류 코드 (query_canceled)
+QUERY_CANCELED = "57014"
+
+_STATE_LEVELS = {STATE_OK: 0, STATE_SHEDDING: 1, STATE_SATURATED: 2}
+
+# 현재 요청에 적용할 statement_timeout (ms, 요청 밖이나 0이면 적용하지 않음)
+_statement_timeout_ms: ContextVar[int] = ContextVar("statement_timeout_ms", default=0)
+
+
+def compile_path_patterns(patterns: Sequence[str]) -> List[Tuple[str, "re.Pattern"]]:
+    """
+    경로 접두사 패턴 컴파일
+
+    /api/v1/boards/boards/*/statistics처럼 *는 경로 한 단계와 일치하며,
+    패턴은 경로 단위 접두사로 비교합니다 (/api/v1/logs는 /api/v1/logs/admin과 일치, /api/v1/logsx와는 불일치).
+    """
+    compiled = []
+    for pattern in patterns:
+        body = re.escape(pattern.rstrip("/")).replace(r"\*", "[^/]+")
+        compiled.append((pattern, re.compile(f"^{body}(?:/|$)")))
+    return compiled
+
+
+def match_path(patterns: List[Tuple[str, "re.Pattern"]], path: str) -> Optional[str]:
+    """경로와 일치하는 가장 긴 패턴"""
+    matched = [pattern for pattern, regex in patterns if regex.match(path)]
+    return max(matched, key=len) if matched else None
+
+
+class AdmissionController:
+    """
+    요청 수락 제어기
+
+    처리 중인 요청 수와 커넥션 풀 상태(사용률, 대기 중인 요청, 최근 대기 시간)로
+    수락 상태를 정합니다. shedding에서는 낮은 우선순위 요청만, saturated에서는
+    제외 경로를 뺀 모든 요청을 503으로 즉시 거절해 풀 대기열에 요청이 쌓이지 않게 합니다.
+    처리 중인 요청 수는 이벤트 루프 스레드에서만 변경합니다.
+    """
+
+    def __init__(
+        self,
+        pool_getter,
+        max_in_flight: int,
+        shed_in_flight: int,
+        shed_pool_ratio: float,
+        shed_pool_wait_ms: float,
+        saturated_pool_wait_ms: float,
+    ):
+        self.pool_getter = pool_getter
+        self.max_in_flight = max_in_flight
+        self.shed_in_flight = shed_in_flight
+        self.shed_pool_ratio = shed_pool_ratio
+        self.shed_pool_wait_ms = shed_pool_wait_ms
+        self.saturated_pool_wait_ms = saturated_pool_wait_ms
+        self.in_flight = 0
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """커넥션 풀 상태"""
+        pool = self.pool_getter()
+        capacity = pool.size() + max(getattr(pool, "_max_overflow", 0), 0)
+        checked_out = pool.checkedout()
+        recent_wait = pool.recent_wait() if hasattr(pool, "recent_wait") else 0.0
+        return {
+            "pool_capacity": capacity,
+            "pool_checked_out": checked_out,
+            "pool_waiting": getattr(pool, "waiting", 0),
+            "pool_usage": round(checked_out / capacity, 3) if capacity else 0.0,
+            "pool_wait_ms": round(recent_wait * 1000, 1),
+        }
+
+    def state(self, pool_stats: Optional[Dict[str, Any]] = None) -> str:
+        """현재 수락 상태"""
+        pool_stats = pool_stats or self.pool_stats()
+        if (
+            self.in_flight >= self.max_in_flight
+            or pool_stats["pool_wait_ms"] >= self.saturated_pool_wait_ms
+        ):
+            return STATE_SATURATED
+        if (
+            self.in_flight >= self.shed_in_flight
+            or pool_stats["pool_waiting"] > 0
+            or pool_stats["pool_usage"] >= self.shed_pool_ratio
+            or pool_stats["pool_wait_ms"] >= self.shed_pool_wait_ms
+        ):
+            return STATE_SHEDDING
+        return STATE_OK
+
+    def status(self) -> Dict[str, Any]:
+        """준비 상태 응답용 정보"""
+        pool_stats = self.pool_stats()
+        return {
+            "state": self.state(pool_stats),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            **pool_stats,
+        }
+
+    def admit(self, low_priority: bool) -> bool:
+        """요청 수락 여부"""
+        level = _STATE_LEVELS[self.state()]
+        return level == 0 or (level == 1 and not low_priority)
+
+
+def _apply_statement_timeout(conn) -> None:
+    """트랜잭션 시작 시 요청별 statement_timeout 적용 (SET LOCAL이라 트랜잭션이 끝나면 해제)"""
+    timeout = _statement_timeout_ms.get()
+    if timeout <= 0 or conn.dialect.name != "postgresql":
+        return
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute("SET LOCAL statement_timeout = %s", (int(timeout),))
+    finally:
+        cursor.close()
+
+
+def install_statement_timeout(target=engine) -> None:
+    """엔진에 statement_timeout 적용 리스너 등록 (중복 등록하지 않음)"""
+    if not event.contains(target, "begin", _apply_statement_timeout):
+        event.listen(target, "begin", _apply_statement_timeout)
+
+
+def statement_timeout_for(path: str) -> int:
+    """경로에 적용할 statement_timeout (ms)"""
+    matched = match_path(_statement_timeout_patterns, path)
+    return settings.db_statement_timeouts[matched] if matched else settings.db_statement_timeout_ms
+
+
+def _rejection_headers(retry_after: int) -> List[Tuple[bytes, bytes]]:
+    return [
+        (b"content-type", b"application/json"),
+        (b"retry-after", str(retry_after).encode()),
+    ]
+
+
+class AdmissionMiddleware:
+    """
+    요청 수락 제어 미들웨어
+
+    거절한 요청은 라우팅과 DB 접근 없이 503과 Retry-After로 바로 응답합니다.
+    수락한 요청에는 경로별 statement_timeout을 컨텍스트에 설정해 트랜잭션마다 적용합니다.
+    """
+
+    def __init__(self, app, controller: "AdmissionController"):
+        self.app = app
+        self.controller = controller
+        self.retry_after = settings.admission_retry_after
+        install_statement_timeout()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        path = scope["path"]
+        if match_path(_exempt_patterns, path):
+            await self.app(scope, receive, send)
+            return
+
+        low_priority = match_path(_low_priority_patterns, path) is not None
+        if not self.controller.admit(low_priority):
+            admission_rejected.inc(("low" if low_priority else "normal",))
+            body = json.dumps(
+                {"detail": "서버가 혼잡합니다. 잠시 후 다시 시도해주세요."}, ensure_ascii=False
+            ).encode("utf-8")
+            await send({
+                "type": "http.response.start",
+                "status": 503,
+                "headers": _rejection_headers(self.retry_after),
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        self.controller.in_flight += 1
+        token = _statement_timeout_ms.set(statement_timeout_for(path))
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _statement_timeout_ms.reset(token)
+            self.controller.in_flight -= 1
+
+
+async def statement_timeout_handler(request: Request, exc: OperationalError):
+    """statement_timeout 초과는 503 + Retry-After로 응답 (다른 DB 오류는 그대로 500 처리)"""
+    if getattr(getattr(exc, "orig", None), "pgcode", None) != QUERY_CANCELED:
+        raise exc
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "요청 처리 시간이 초과되었습니다. 잠시 후 다시 시도해주세요."},
+        headers={"Retry-After": str(settings.admission_retry_after)},
+    )
+
+
+_low_priority_patterns = compile_path_patterns(settings.admission_low_priority_paths)
+_exempt_patterns = compile_path_patterns(settings.admission_exempt_paths)
+_statement_timeout_patterns = compile_path_patterns(list(settings.db_statement_timeouts))
+
+# 애플리케이션 전역 수락 제어기
+admission_controller = AdmissionController(
+    pool_getter=lambda: engine.pool,
+    max_in_flight=settings.admission_max_in_flight,
+    shed_in_flight=settings.admission_shed_in_flight,
+    shed_pool_ratio=settings.admission_shed_pool_ratio,
+    shed_pool_wait_ms=settings.admission_shed_pool_wait_ms,
+    saturated_pool_wait_ms=settings.admission_saturated_pool_wait_ms,
+)
+
+admission_rejected = registry.register(Counter(
+    "admission_rejected", "과부하로 거절한 요청 수", ("priority",)
+))
+registry.register(GaugeCallback(
+    "admission_in_flight", "수락 제어 대상 중 처리 중인 요청 수", (),
+    lambda: [((), admission_controller.in_flight)]
+))
+registry.register(GaugeCallback(
+    "admission_state", "수락 상태 (0: ok, 1: shedding, 2: saturated)", (),
+    lambda: [((), _STATE_LEVELS[admission_controller.state()])]
+))
@@ -0,0 +1,294 @@
+"""감사 로그 자동 수집 (ASGI 미들웨어 + 비동기 배치 기록기)"""
+from datetime import datetime
+from typing import Optional, List, Dict, Any
+import asyncio
+import logging
+import random
+import uuid
+from sqlalchemy import insert
+from app.core.config import settings
+from app.core.security import decode_token
+from app.database import engine
+from app.models.audit_log import CommonAuditLog
+
+logger = logging.getLogger(__name__)
+
+# sample 정책에서 표본 추출을 시작하는 큐 사용률
+SAMPLE_THRESHOLD_RATIO = 0.8
+
+
+class AuditLogWriter:
+    """
+    감사 로그 배치 기록기
+
+    요청 경로에서는 메모리 큐에 넣기만 하고, 백그라운드 태스크가 큐를 모아
+    한 번의 multi-row INSERT로 기록합니다. 요청마다 동기 커밋이 발생하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        batch_size: int,
+        flush_interval: float,
+        overflow_policy: str = "drop",
+        sample_rate: float = 0.1,
+        block_timeout: float = 0.05,
+    ):
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow_policy = overflow_policy
+        self.sample_rate = sample_rate
+        self.block_timeout = block_timeout
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 큐에서 꺼냈지만 아직 기록하지 않은 로그 (종료 시 유실 방지)
+        self._pending: List[Dict[str, Any]] = []
+        self.counters: Dict[str, int] = {
+            "enqueued": 0,
+            "dropped": 0,
+            "sampled_out": 0,
+            "written": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 태스크 동작 여부"""
+        return self._task is not None and not self._task.done()
+
+    def qsize(self) -> int:
+        """현재 큐에 대기 중인 로그 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """기록기 상태 및 카운터"""
+        return {
+            "running": self.running,
+            "queue_size": self.qsize(),
+            "queue_max_size": self.max_size,
+            "overflow_policy": self.overflow_policy,
+            **self.counters,
+        }
+
+    async def start(self) -> None:
+        """백그라운드 기록 태스크 시작"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run(), name="audit-log-writer")
+
+    async def stop(self) -> None:
+        """백그라운드 태스크 중지 (남은 로그는 모두 기록)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        # 종료 시점에 수집 중이던 로그와 큐에 남은 로그 기록
+        remaining, self._pending = self._pending, []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        for start in range(0, len(remaining), self.batch_size):
+            await self._flush(remaining[start:start + self.batch_size])
+
+    async def enqueue(self, record: Dict[str, Any]) -> bool:
+        """
+        감사 로그를 큐에 추가
+
+        Returns:
+            큐에 추가되었으면 True, 오버플로 정책에 의해 버려졌으면 False
+        """
+        if not self.running:
+            self.counters["dropped"] += 1
+            return False
+
+        if self.overflow_policy == "sample" and self._queue.qsize() >= self.max_size * SAMPLE_THRESHOLD_RATIO:
+            if random.random() >= self.sample_rate:
+                self.counters["sampled_out"] += 1
+                return False
+
+        try:
+            if self.overflow_policy == "block":
+                await asyncio.wait_for(self._queue.put(record), timeout=self.block_timeout)
+            else:
+                self._queue.put_nowait(record)
+        except (asyncio.QueueFull, asyncio.TimeoutError):
+            self.counters["dropped"] += 1
+            return False
+
+        self.counters["enqueued"] += 1
+        return True
+
+    async def _run(self) -> None:
+        """큐에서 배치를 모아 기록하는 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+
+            while len(self._pending) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            batch, self._pending = self._pending, []
+            await self._flush(batch)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """배치를 스레드풀에서 한 번의 INSERT로 기록"""
+        if not batch:
+            return
+        try:
+            await asyncio.to_thread(_insert_audit_logs, batch)
+            self.counters["written"] += len(batch)
+            self.counters["batches"] += 1
+        except Exception as e:
+            self.counters["failed"] += len(batch)
+            logger.error(f"감사 로그 배치 기록 실패 ({len(batch)}건): {type(e).__name__}: {str(e)}")
+
+
+def _insert_audit_logs(batch: List[Dict[str, Any]]) -> None:
+    """감사 로그 multi-row INSERT"""
+    with engine.begin() as conn:
+        conn.execute(insert(CommonAuditLog.__table__), batch)
+
+
+def build_audit_record(
+    method: str,
+    path: str,
+    status_code: int,
+    user_id: Optional[str],
+    ip_addr: Optional[str],
+    user_agent: Optional[str],
+    err_msg: Optional[str] = None,
+) -> Dict[str, Any]:
+    """미들웨어에서 수집한 요청 정보로 감사 로그 레코드 생성"""
+    return {
+        "audit_log_id": f"LOG_{uuid.uuid4().hex.upper()}",
+        "user_id": user_id,
+        "act_typ": "API_CALL",
+        "rsrc_typ": _resource_type(path),
+        "rsrc_id": None,
+        "old_val": None,
+        "new_val": None,
+        "ip_addr": ip_addr[:45] if ip_addr else None,
+        "user_agent": user_agent,
+        "req_mthd": method,
+        "req_path": path[:500],
+        "stts_cd": status_code,
+        "err_msg": err_msg,
+        "del_yn": False,
+        "crt_dt": datetime.now(),
+        "crt_by": user_id,
+        "crt_by_nm": None,
+        "use_yn": True,
+    }
+
+
+def _resource_type(path: str) -> Optional[str]:
+    """요청 경로에서 리소스 타입 추출 (예: /api/v1/board-extra/... -> BOARD_EXTRA)"""
+    segments = [segment for segment in path.split("/") if segment]
+    if len(segments) >= 3 and segments[0] == "api":
+        return segments[2].replace("-", "_").upper()[:50]
+    return None
+
+
+def _header(scope, name: bytes) -> Optional[str]:
+    """ASGI scope에서 헤더 값 조회"""
+    for key, value in scope.get("headers", []):
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def _client_ip(scope) -> Optional[str]:
+    """클라이언트 IP 주소 추출 (X-Forwarded-For 우선)"""
+    x_forwarded_for = _header(scope, b"x-forwarded-for")
+    if x_forwarded_for:
+        return x_forwarded_for.split(",")[0].strip()
+    client = scope.get("client")
+    return client[0] if client else None
+
+
+def _user_id_from_scope(scope) -> Optional[str]:
+    """Authorization 헤더의 액세스 토큰에서 사용자 ID 추출 (DB 조회 없음)"""
+    authorization = _header(scope, b"authorization")
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    payload = decode_token(authorization[7:].strip())
+    return payload.get("sub") if payload else None
+
+
+class AuditLogMiddleware:
+    """
+    감사 로그 자동 수집 미들웨어
+
+    설정된 경로/메서드의 요청에 대해 메서드, 경로, 상태 코드, IP, User-Agent를 수집해
+    AuditLogWriter 큐에 넣습니다. 응답 본문은 건드리지 않는 순수 ASGI 미들웨어입니다.
+    """
+
+    def __init__(self, app, writer: AuditLogWriter):
+        self.app = app
+        self.writer = writer
+        self.paths = tuple(settings.audit_log_paths)
+        self.exclude_paths = tuple(settings.audit_log_exclude_paths)
+        self.methods = {method.upper() for method in settings.audit_log_methods}
+
+    def _should_audit(self, scope) -> bool:
+        """감사 대상 요청인지 확인"""
+        if scope["type"] != "http" or scope["method"] not in self.methods:
+            return False
+        path = scope["path"]
+        return path.startswith(self.paths) and not path.startswith(self.exclude_paths)
+
+    async def __call__(self, scope, receive, send):
+        if not self._should_audit(scope):
+            await self.app(scope, receive, send)
+            return
+
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        err_msg = None
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            err_msg = f"{type(e).__name__}: {str(e)}"
+            raise
+        finally:
+            record = build_audit_record(
+                method=scope["method"],
+                path=scope["path"],
+                status_code=status_holder["status"],
+                user_id=_user_id_from_scope(scope),
+                ip_addr=_client_ip(scope),
+                user_agent=_header(scope, b"user-agent"),
+                err_msg=err_msg,
+            )
+            await self.writer.enqueue(record)
+
+
+# 애플리케이션 전역 감사 로그 기록기
+audit_log_writer = AuditLogWriter(
+    max_size=settings.audit_queue_size,
+    batch_size=settings.audit_batch_size,
+    flush_interval=settings.audit_flush_interval,
+    overflow_policy=settings.audit_overflow_policy,
+    sample_rate=settings.audit_sample_rate,
+    block_timeout=settings.audit_block_timeout,
+)
@@ -0,0 +1,195 @@
+"""감사 로그(common_audit_log) 월별 파티션 관리"""
+from datetime import date, datetime
+from typing import List, Optional, Tuple
+import logging
+import re
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "common_audit_log"
+
+# 파티션 이름 형식: common_audit_log_y2026m01
+PARTITION_NAME_PATTERN = re.compile(rf"^{PARENT_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+# 범위에 맞는 파티션이 없는 행이 들어가는 DEFAULT 파티션
+DEFAULT_PARTITION = f"{PARENT_TABLE}_default"
+
+# 여러 워커가 동시에 파티션 DDL을 실행하지 않도록 하는 advisory lock 키
+PARTITION_LOCK_KEY = "common_audit_log_partition"
+
+
+def add_months(month_start: date, months: int) -> date:
+    """월 시작일에 개월 수 더하기"""
+    index = month_start.year * 12 + (month_start.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month_start: date) -> str:
+    """월 시작일에 해당하는 파티션 이름"""
+    return f"{PARENT_TABLE}_y{month_start.year:04d}m{month_start.month:02d}"
+
+
+def parse_partition_month(name: str) -> Optional[date]:
+    """파티션 이름에서 월 시작일 추출 (관리 대상이 아니면 None)"""
+    match = PARTITION_NAME_PATTERN.match(name)
+    if not match:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def is_partitioned(conn: Connection) -> bool:
+    """common_audit_log가 파티션 테이블로 전환되었는지 확인"""
+    relkind = conn.execute(
+        text("SELECT relkind FROM pg_class WHERE oid = to_regclass(:table)"),
+        {"table": PARENT_TABLE}
+    ).scalar()
+    return relkind == "p"
+
+
+def list_partitions(conn: Connection) -> List[str]:
+    """현재 연결된 파티션 이름 목록"""
+    rows = conn.execute(text("""
+        SELECT child.relname
+        FROM pg_inherits
+        JOIN pg_class parent ON pg_inherits.inhparent = parent.oid
+        JOIN pg_class child ON pg_inherits.inhrelid = child.oid
+        WHERE parent.oid = to_regclass(:table)
+        ORDER BY child.relname
+    """), {"table": PARENT_TABLE}).all()
+    return [row[0] for row in rows]
+
+
+def default_partition_has_rows(conn: Connection, month_start: date, month_end: date) -> bool:
+    """DEFAULT 파티션에 해당 월의 행이 있는지 확인 (DEFAULT 파티션이 없으면 False)"""
+    if conn.execute(text("SELECT to_regclass(:table)"), {"table": DEFAULT_PARTITION}).scalar() is None:
+        return False
+    return bool(conn.execute(
+        text(f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} WHERE crt_dt >= :start AND crt_dt < :end)"),
+        {"start": month_start, "end": month_end}
+    ).scalar())
+
+
+def create_partition(conn: Connection, month_start: date) -> str:
+    """
+    월별 파티션 생성 (이미 있으면 무시)
+
+    유지보수가 밀려 해당 월의 행이 DEFAULT 파티션에 들어가 있으면 파티션을 바로 만들 수 없으므로,
+    DEFAULT 파티션을 분리하고 새 파티션을 만든 뒤 그 월의 행을 옮기고 다시 연결합니다.
+    """
+    name = partition_name(month_start)
+    month_end = add_months(month_start, 1)
+    create_sql = text(
+        f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{month_start.isoformat()}') TO ('{month_end.isoformat()}')"
+    )
+    if not default_partition_has_rows(conn, month_start, month_end):
+        conn.execute(create_sql)
+        return name
+
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {DEFAULT_PARTITION}"))
+    conn.execute(create_sql)
+    moved = conn.execute(text(f"""
+        WITH moved AS (
+            DELETE FROM {DEFAULT_PARTITION}
+            WHERE crt_dt >= :start AND crt_dt < :end
+            RETURNING *
+        )
+        INSERT INTO {name} SELECT * FROM moved
+    """), {"start": month_start, "end": month_end}).rowcount
+    conn.execute(text(f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    logger.warning(f"DEFAULT 파티션의 행을 {name}로 이동: {moved}건")
+    return name
+
+
+def ensure_future_partitions(conn: Connection, today: date, months_ahead: int) -> List[str]:
+    """이번 달부터 months_ahead개월 뒤까지의 파티션을 미리 생성"""
+    existing = set(list_partitions(conn))
+    current = date(today.year, today.month, 1)
+    created = []
+    for offset in range(months_ahead + 1):
+        month_start = add_months(current, offset)
+        if partition_name(month_start) not in existing:
+            created.append(create_partition(conn, month_start))
+    return created
+
+
+def expired_partitions(partitions: List[str], today: date, retention_months: int) -> List[Tuple[str, date]]:
+    """보존 기간이 지난 파티션 목록 (파티션 전체 구간이 보존 기간 이전인 경우만)"""
+    if retention_months <= 0:
+        return []
+    cutoff = add_months(date(today.year, today.month, 1), -retention_months)
+    expired = []
+    for name in partitions:
+        month_start = parse_partition_month(name)
+        if month_start is not None and add_months(month_start, 1) <= cutoff:
+            expired.append((name, month_start))
+    return expired
+
+
+def remove_expired_partitions(conn: Connection, today: date, retention_months: int, drop: bool) -> List[str]:
+    """보존 기간이 지난 파티션 분리(DETACH) 및 삭제(DROP)"""
+    removed = []
+    for name, _ in expired_partitions(list_partitions(conn), today, retention_months):
+        conn.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if drop:
+            conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+        removed.append(name)
+    return removed
+
+
+def run_partition_maintenance(today: Optional[date] = None) -> dict:
+    """
+    파티션 유지보수 작업 (스케줄러에서 주기적으로 실행)
+
+    - 이번 달부터 AUDIT_LOG_PARTITION_MONTHS_AHEAD개월 뒤까지 파티션 미리 생성
+    - AUDIT_LOG_RETENTION_MONTHS보다 오래된 파티션 분리 후 삭제
+      (AUDIT_LOG_PARTITION_DROP=False이면 분리만 하여 아카이브용으로 남김)
+    """
+    today = today or datetime.now().date()
+    result = {"created": [], "removed": [], "skipped": None, "errors": []}
+
+    # 생성과 보존 기간 정리는 따로 커밋 (한쪽이 실패해도 다른 쪽은 계속 진행)
+    try:
+        with engine.begin() as conn:
+            if not is_partitioned(conn):
+                result["skipped"] = "not_partitioned"
+                logger.warning("common_audit_log가 파티션 테이블이 아닙니다. database/sql/partition_audit_log.sql 마이그레이션을 먼저 실행하세요.")
+                return result
+            if not _try_lock(conn):
+                result["skipped"] = "locked"
+                return result
+            result["created"] = ensure_future_partitions(conn, today, settings.audit_log_partition_months_ahead)
+    except Exception as e:
+        result["errors"].append("create")
+        logger.error(f"감사 로그 파티션 생성 실패: {type(e).__name__}: {str(e)}")
+
+    try:
+        with engine.begin() as conn:
+            if not _try_lock(conn):
+                result["skipped"] = "locked"
+                return result
+            result["removed"] = remove_expired_partitions(
+                conn,
+                today,
+                settings.audit_log_retention_months,
+                drop=settings.audit_log_partition_drop,
+            )
+    except Exception as e:
+        result["errors"].append("retention")
+        logger.error(f"감사 로그 파티션 정리 실패: {type(e).__name__}: {str(e)}")
+
+    if result["created"] or result["removed"]:
+        logger.info(f"감사 로그 파티션 유지보수 완료: 생성 {result['created']}, 제거 {result['removed']}")
+    return result
+
+
+def _try_lock(conn: Connection) -> bool:
+    """트랜잭션 범위 advisory lock (다른 워커가 실행 중이면 False)"""
+    return bool(conn.execute(
+        text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+        {"key": PARTITION_LOCK_KEY}
+    ).scalar())
@@ -0,0 +1,504 @@
+"""읽기 캐시 (메모리 TTL+LRU 또는 PostgreSQL UNLOGGED 테이블 백엔드, 태그 기반 무효화)"""
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+import asyncio
+import functools
+import hashlib
+import inspect
+import logging
+import math
+import pickle
+import random
+import threading
+import time
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core import metrics
+from app.core.invalidation import invalidation_bus
+from app.core.singleflight import SingleFlight, SingleFlightTimeout
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 키 생성에서 제외하는 인자 (DB 세션 등 값이 아닌 의존성)
+DEFAULT_EXCLUDE = ("db",)
+
+# 메모리 백엔드 항목당 키/메타데이터 추정 크기 (bytes)
+ENTRY_OVERHEAD_BYTES = 200
+
+# 캐시 무효화 버스 네임스페이스 ("cache:board:5"는 태그 board:5 무효화)
+BUS_NAMESPACE = "cache"
+
+# 네임스페이스별 카운터 (coalesced: 진행 중인 계산 결과를 받은 호출, early_refreshes: 만료 전 재계산)
+COUNTER_NAMES = ("hits", "misses", "sets", "errors", "coalesced", "early_refreshes")
+
+
+def dumps(value: Any) -> bytes:
+    """값 직렬화 (캐시할 함수는 dict/list/pydantic 모델 같은 일반 데이터를 반환해야 함)"""
+    return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def loads(data: bytes) -> Any:
+    """값 역직렬화 (호출마다 새 객체를 만들어 캐시된 값이 변경되지 않음)"""
+    return pickle.loads(data)
+
+
+class MemoryCacheBackend:
+    """
+    프로세스 내 캐시 (TTL + LRU, 직렬화된 크기 기준 용량 제한)
+
+    전체 크기가 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    max_bytes의 1/8보다 큰 값은 저장하지 않습니다.
+    """
+
+    blocking = False
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[float, bytes, Tuple[str, ...]]]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] < time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Sequence[str]) -> None:
+        size = len(value) + len(key) + ENTRY_OVERHEAD_BYTES
+        if size > self.max_bytes // 8:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, value, tuple(tags))
+            self._size += size
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._size > self.max_bytes and self._entries:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+    def invalidate_tags(self, tags: Iterable[str]) -> int:
+        with self._lock:
+            keys = set()
+            for tag in tags:
+                keys.update(self._tags.get(tag, ()))
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._size = 0
+
+    def _remove(self, key: str) -> None:
+        """항목과 태그 색인 제거 (잠금 안에서 호출)"""
+        _, value, tags = self._entries.pop(key)
+        self._size -= len(value) + len(key) + ENTRY_OVERHEAD_BYTES
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._size, "evictions": self.evictions}
+
+
+GET_SQL = text("""
+    SELECT val FROM common_cache_entries
+    WHERE cache_key = :key AND expires_at > clock_timestamp()
+""")
+
+SET_SQL = text("""
+    INSERT INTO common_cache_entries (cache_key, val, tags, expires_at)
+    VALUES (:key, :val, CAST(:tags AS TEXT[]), clock_timestamp() + make_interval(secs => :ttl))
+    ON CONFLICT (cache_key) DO UPDATE
+    SET val = EXCLUDED.val, tags = EXCLUDED.tags, expires_at = EXCLUDED.expires_at
+""")
+
+DELETE_SQL = text("DELETE FROM common_cache_entries WHERE cache_key = :key")
+
+INVALIDATE_TAGS_SQL = text("DELETE FROM common_cache_entries WHERE tags && CAST(:tags AS TEXT[])")
+
+PURGE_SQL = text("DELETE FROM common_cache_entries WHERE expires_at < clock_timestamp()")
+
+
+class PostgresCacheBackend:
+    """
+    PostgreSQL UNLOGGED 테이블 캐시 (여러 워커 공유)
+
+    태그는 TEXT[] 컬럼에 GIN 색인으로 저장해 태그 무효화를 DELETE 한 문장으로 처리합니다.
+    만료된 항목은 조회에서 제외하고 주기 작업이 삭제합니다.
+    """
+
+    blocking = True
+
+    def get(self, key: str) -> Optional[bytes]:
+        with engine.connect() as conn:
+            value = conn.execute(GET_SQL, {"key": key}).scalar()
+        return bytes(value) if value is not None else None
+
+    def set(self, key: str, value: bytes, ttl: float, tags: Sequence[str]) -> None:
+        with engine.begin() as conn:
+            conn.execute(SET_SQL, {"key": key, "val": value, "tags": list(tags), "ttl": ttl})
+
+    def delete(self, key: str) -> None:
+        with engine.begin() as conn:
+            conn.execute(DELETE_SQL, {"key": key})
+
+    def invalidate_tags(self, tags: Iterable[str], conn=None) -> int:
+        if conn is not None:
+            return conn.execute(INVALIDATE_TAGS_SQL, {"tags": list(tags)}).rowcount
+        with engine.begin() as conn:
+            return conn.execute(INVALIDATE_TAGS_SQL, {"tags": list(tags)}).rowcount
+
+    def clear(self) -> None:
+        with engine.begin() as conn:
+            conn.execute(text("DELETE FROM common_cache_entries"))
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+def purge_expired_cache_entries() -> int:
+    """만료된 공유 캐시 항목 삭제 (postgres 백엔드 주기 작업)"""
+    with engine.begin() as conn:
+        removed = conn.execute(PURGE_SQL).rowcount
+    if removed:
+        logger.info(f"만료된 캐시 항목 정리: {removed}건 삭제")
+    return removed
+
+
+class Cache:
+    """
+    네임스페이스별 읽기 캐시
+
+    값은 직렬화해서 저장하므로 반환받은 객체를 바꿔도 캐시에는 영향이 없습니다.
+    캐시 저장소 오류는 로그만 남기고 원본 함수를 실행합니다 (캐시 장애로 요청이 실패하지 않음).
+    네임스페이스별 적중/미스 횟수는 /metrics의 cache_stats로 노출됩니다.
+    """
+
+    def __init__(
+        self,
+        backend,
+        enabled: bool = True,
+        default_ttl: float = 60.0,
+        ttls: Optional[Dict[str, float]] = None,
+        early_refresh_beta: float = 1.0,
+    ):
+        self.backend = backend
+        self.enabled = enabled
+        self.default_ttl = default_ttl
+        self.ttls = ttls or {}
+        self.early_refresh_beta = early_refresh_beta
+        self.counters: Dict[str, Dict[str, int]] = {}
+
+    def ttl_for(self, namespace: str) -> float:
+        """네임스페이스의 TTL (CACHE_TTLS에 없으면 CACHE_DEFAULT_TTL)"""
+        return self.ttls.get(namespace, self.default_ttl)
+
+    def count(self, namespace: str, name: str) -> None:
+        """네임스페이스 카운터 증가"""
+        counters = self.counters.get(namespace)
+        if counters is None:
+            counters = self.counters.setdefault(namespace, dict.fromkeys(COUNTER_NAMES, 0))
+        counters[name] += 1
+
+    def namespace_stats(self, namespace: str) -> Dict[str, int]:
+        """네임스페이스 적중/미스 횟수"""
+        return dict(self.counters.get(namespace) or dict.fromkeys(COUNTER_NAMES, 0))
+
+    def stats(self) -> Dict[str, Any]:
+        """저장소 상태와 네임스페이스별 카운터"""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            **self.backend.stats(),
+            "namespaces": {namespace: dict(counters) for namespace, counters in self.counters.items()},
+        }
+
+    def lookup(self, namespace: str, key: str) -> Optional[Tuple[Any, bool]]:
+        """
+        캐시 조회 ((값, 조기 재계산 여부), 없으면 None)
+
+        만료가 가까울수록, 계산이 오래 걸린 값일수록 높은 확률로 재계산 대상으로 표시합니다
+        (probabilistic early expiration: now - delta * beta * ln(rand) >= 만료 시각).
+        """
+        if not self.enabled:
+            return None
+        try:
+            data = self.backend.get(key)
+            entry = loads(data) if data is not None else None
+            # 값, 계산 시간(초), 만료 시각(epoch)
+            value, delta, expires_at = entry if entry is not None else (None, 0.0, 0.0)
+        except Exception as e:
+            self.count(namespace, "errors")
+            logger.error(f"캐시 조회 실패 ({key}): {type(e).__name__}: {str(e)}")
+            return None
+        if entry is None:
+            self.count(namespace, "misses")
+            return None
+        self.count(namespace, "hits")
+        refresh = (
+            self.early_refresh_beta > 0
+            and time.time() - delta * self.early_refresh_beta * math.log(1.0 - random.random()) >= expires_at
+        )
+        return value, refresh
+
+    def get(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """캐시 조회 ((적중 여부, 값))"""
+        entry = self.lookup(namespace, key)
+        return (True, entry[0]) if entry is not None else (False, None)
+
+    def set(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Sequence[str] = (),
+        delta: float = 0.0,
+    ) -> None:
+        """캐시 저장 (delta: 값을 계산하는 데 걸린 초, 조기 재계산 확률에 사용)"""
+        if not self.enabled:
+            return
+        ttl = self.ttl_for(namespace) if ttl is None else ttl
+        if ttl <= 0:
+            return
+        try:
+            self.backend.set(key, dumps((value, delta, time.time() + ttl)), ttl, tags)
+            self.count(namespace, "sets")
+        except Exception as e:
+            self.count(namespace, "errors")
+            logger.error(f"캐시 저장 실패 ({key}): {type(e).__name__}: {str(e)}")
+
+    async def alookup(self, namespace: str, key: str) -> Optional[Tuple[Any, bool]]:
+        """캐시 조회 (공유 백엔드는 스레드풀에서 실행)"""
+        if self.backend.blocking and self.enabled:
+            return await run_in_threadpool(self.lookup, namespace, key)
+        return self.lookup(namespace, key)
+
+    async def aget(self, namespace: str, key: str) -> Tuple[bool, Any]:
+        """캐시 조회 (공유 백엔드는 스레드풀에서 실행)"""
+        entry = await self.alookup(namespace, key)
+        return (True, entry[0]) if entry is not None else (False, None)
+
+    async def aset(
+        self,
+        namespace: str,
+        key: str,
+        value: Any,
+        ttl: Optional[float] = None,
+        tags: Sequence[str] = (),
+        delta: float = 0.0,
+    ) -> None:
+        """캐시 저장 (공유 백엔드는 스레드풀에서 실행)"""
+        if self.backend.blocking and self.enabled:
+            await run_in_threadpool(self.set, namespace, key, value, ttl, tags, delta)
+        else:
+            self.set(namespace, key, value, ttl, tags, delta)
+
+    def invalidate_tags(self, *tags: str, db: Optional[Session] = None) -> None:
+        """
+        태그가 붙은 캐시 항목 무효화
+
+        db를 주면 그 세션의 트랜잭션이 커밋될 때 무효화합니다 (롤백되면 유지).
+        메모리 백엔드는 캐시 무효화 버스로 모든 워커에서 제거하고,
+        공유 백엔드는 같은 트랜잭션에서 DELETE합니다.
+        """
+        if not tags:
+            return
+        if isinstance(self.backend, PostgresCacheBackend):
+            try:
+                self.backend.invalidate_tags(tags, conn=db.connection() if db is not None else None)
+            except Exception as e:
+                logger.error(f"캐시 태그 무효화 실패 ({list(tags)}): {type(e).__name__}: {str(e)}")
+                if db is not None:
+                    raise
+            return
+        keys = [f"{BUS_NAMESPACE}:{tag}" for tag in tags]
+        if db is not None:
+            invalidation_bus.invalidate_on_commit(db, *keys)
+        else:
+            invalidation_bus.publish(*keys)
+
+    def evict_tag_local(self, tag: str) -> None:
+        """이 프로세스의 메모리 캐시에서 태그 항목 제거 (무효화 버스 수신용)"""
+        if not isinstance(self.backend, PostgresCacheBackend):
+            self.backend.invalidate_tags([tag])
+
+    def clear_local(self) -> None:
+        """이 프로세스의 메모리 캐시 비우기 (무효화 버스 수신용)"""
+        if not isinstance(self.backend, PostgresCacheBackend):
+            self.backend.clear()
+
+
+def _on_event_loop() -> bool:
+    """현재 스레드에서 이벤트 루프가 실행 중인지 여부"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def make_key(namespace: str, func: Callable, arguments: Dict[str, Any]) -> str:
+    """네임스페이스, 함수 이름, 인자로 캐시 키 생성 (인자는 repr 해시)"""
+    digest = hashlib.sha1(repr(sorted(arguments.items())).encode("utf-8")).hexdigest()
+    return f"{namespace}:{func.__module__}.{func.__qualname__}:{digest}"
+
+
+def cached(
+    namespace: str,
+    ttl: Optional[float] = None,
+    tags: Sequence[str] = (),
+    exclude: Sequence[str] = DEFAULT_EXCLUDE,
+):
+    """
+    함수/엔드포인트 결과 캐시 데코레이터 (동기/비동기 함수 모두 지원)
+
+    키는 exclude와 Session 인자를 뺀 나머지 인자로 만들고, tags는 인자 이름으로
+    채우는 형식 문자열입니다 (예: tags=("boards", "board:{board_id}")).
+    None을 반환하면 캐시하지 않습니다. 원본 함수는 __wrapped__로 호출할 수 있습니다.
+
+    같은 키의 동시 미스는 single-flight로 한 번만 계산해 결과(또는 예외)를 나눠 받고,
+    만료가 가까운 값은 한 호출만 미리 재계산하며 그동안 다른 호출은 기존 값을 받습니다.
+    먼저 시작한 계산을 CACHE_SINGLE_FLIGHT_TIMEOUT 넘게 기다리면 직접 계산합니다.
+    동기 함수는 스레드풀에서 호출해야 병합되며(run_in_threadpool), 이벤트 루프 스레드에서 호출되면
+    루프를 막지 않도록 기다리지 않고 기존 값을 쓰거나 직접 계산합니다.
+
+    Args:
+        namespace: 캐시 네임스페이스 (TTL 설정과 적중 통계 단위)
+        ttl: 초 단위 TTL (없으면 CACHE_TTLS 또는 CACHE_DEFAULT_TTL)
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        def key_and_tags(args, kwargs) -> Tuple[str, List[str]]:
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                name: value for name, value in bound.arguments.items()
+                if name not in exclude and not isinstance(value, Session)
+            }
+            return make_key(namespace, func, arguments), [tag.format(**bound.arguments) for tag in tags]
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key, entry_tags = key_and_tags(args, kwargs)
+                computed = []
+
+                async def compute():
+                    started = time.perf_counter()
+                    value = await func(*args, **kwargs)
+                    computed.append(True)
+                    if value is not None:
+                        await cache.aset(namespace, key, value, ttl, entry_tags, time.perf_counter() - started)
+                    return value
+
+                entry = await cache.alookup(namespace, key)
+                if entry is not None:
+                    stale, refresh = entry
+                    if not refresh or flight.in_flight(key):
+                        return stale
+                    cache.count(namespace, "early_refreshes")
+                    try:
+                        return await flight.ado(key, compute, settings.cache_single_flight_timeout)
+                    except Exception as e:
+                        logger.warning(f"캐시 조기 재계산 실패, 기존 값 사용 ({key}): {type(e).__name__}: {str(e)}")
+                        return stale
+
+                try:
+                    value = await flight.ado(key, compute, settings.cache_single_flight_timeout)
+                except SingleFlightTimeout:
+                    return await func(*args, **kwargs)
+                if not computed:
+                    cache.count(namespace, "coalesced")
+                return value
+
+            wrapper = async_wrapper
+        else:
+            @functools.wraps(func)
+            def sync_wrapper(*args, **kwargs):
+                key, entry_tags = key_and_tags(args, kwargs)
+                computed = []
+
+                def compute():
+                    started = time.perf_counter()
+                    value = func(*args, **kwargs)
+                    computed.append(True)
+                    if value is not None:
+                        cache.set(namespace, key, value, ttl, entry_tags, time.perf_counter() - started)
+                    return value
+
+                # 이벤트 루프 스레드에서는 다른 스레드의 계산을 기다리지 않음 (대기 0초)
+                timeout = 0 if _on_event_loop() else settings.cache_single_flight_timeout
+                entry = cache.lookup(namespace, key)
+                if entry is not None:
+                    stale, refresh = entry
+                    if not refresh or flight.in_flight(key):
+                        return stale
+                    cache.count(namespace, "early_refreshes")
+                    try:
+                        return flight.do(key, compute, timeout)
+                    except SingleFlightTimeout:
+                        return stale
+                    except Exception as e:
+                        logger.warning(f"캐시 조기 재계산 실패, 기존 값 사용 ({key}): {type(e).__name__}: {str(e)}")
+                        return stale
+
+                try:
+                    value = flight.do(key, compute, timeout)
+                except SingleFlightTimeout:
+                    return func(*args, **kwargs)
+                if not computed:
+                    cache.count(namespace, "coalesced")
+                return value
+
+            wrapper = sync_wrapper
+
+        metrics.register_cache(namespace, lambda: cache.namespace_stats(namespace))
+        return wrapper
+
+    return decorator
+
+
+def _build_backend():
+    if settings.cache_backend == "postgres":
+        return PostgresCacheBackend()
+    return MemoryCacheBackend(max_bytes=settings.cache_memory_max_bytes)
+
+
+# 애플리케이션 전역 캐시
+cache = Cache(
+    backend=_build_backend(),
+    enabled=settings.cache_enabled,
+    default_ttl=settings.cache_default_ttl,
+    ttls=settings.cache_ttls,
+    early_refresh_beta=settings.cache_early_refresh_beta,
+)
+# 캐시 미스 계산 병합 (프로세스 단위)
+flight = SingleFlight()
+invalidation_bus.register(BUS_NAMESPACE, cache.evict_tag_local, cache.clear_local)
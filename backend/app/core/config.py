@@ -1,8 +1,9 @@
 """애플리케이션 설정"""
-from typing import List, Union, Optional
+from typing import Dict, List, Union, Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, field_validator, ValidationError
 import json
+import re
 import logging
 import sys
 
@@ -21,6 +22,21 @@ class Settings(BaseSettings):
     # 서버 설정
     host: str = Field(default="0.0.0.0", alias="HOST")
     port: int = Field(default=8000, alias="PORT")
+    # 프로덕션 실행 (run.py, DEBUG=False일 때 멀티 워커)
+    server_workers: int = Field(default=0, alias="SERVER_WORKERS")  # 0이면 CPU 수 기준 자동
+    server_max_workers: int = Field(default=8, alias="SERVER_MAX_WORKERS")  # 자동 계산 시 상한 (워커마다 DB 풀 생성)
+    server_preload: bool = Field(default=True, alias="SERVER_PRELOAD")  # 앱을 마스터에서 import한 뒤 워커 fork
+    server_loop: str = Field(default="auto", alias="SERVER_LOOP")  # auto, asyncio, uvloop
+    server_http: str = Field(default="auto", alias="SERVER_HTTP")  # auto, h11, httptools
+    server_graceful_timeout: int = Field(default=30, alias="SERVER_GRACEFUL_TIMEOUT")  # 초, 워커 종료 시 처리 중 요청 대기
+    server_worker_ready_timeout: int = Field(default=60, alias="SERVER_WORKER_READY_TIMEOUT")  # 초
+    server_max_requests: int = Field(default=0, alias="SERVER_MAX_REQUESTS")  # 워커당 처리 후 교체할 요청 수 (0: 무제한)
+    # X-Forwarded-For/Proto를 신뢰할 프록시 주소 (쉼표 구분, *: 모두), uvicorn이 클라이언트 주소를 바꿔 줌
+    forwarded_allow_ips: str = Field(default="127.0.0.1", alias="FORWARDED_ALLOW_IPS")
+    # 시작 예열 (lifespan에서 커넥션/매퍼/캐시 예열, 끝나기 전에는 준비 상태 확인이 503)
+    server_warmup_enabled: bool = Field(default=True, alias="SERVER_WARMUP_ENABLED")
+    server_warmup_connections: int = Field(default=5, alias="SERVER_WARMUP_CONNECTIONS")  # 시작 시 미리 여는 DB 커넥션 수
+    server_warmup_timeout: float = Field(default=30.0, alias="SERVER_WARMUP_TIMEOUT")  # 초, 넘으면 백그라운드에서 계속
     
     # 데이터베이스 설정 (필수)
     database_url: str = Field(alias="DATABASE_URL")
@@ -39,7 +55,243 @@ class Settings(BaseSettings):
     
     # CORS 설정 (필수)
     cors_origins: List[str] = Field(alias="CORS_ORIGINS")
-    
+
+    # 감사 로그 미들웨어 설정
+    audit_middleware_enabled: bool = Field(default=True, alias="AUDIT_MIDDLEWARE_ENABLED")
+    audit_log_paths: List[str] = Field(default=["/api/v1"], alias="AUDIT_LOG_PATHS")
+    audit_log_exclude_paths: List[str] = Field(
+        default=["/api/v1/health", "/api/v1/audit-logs"],
+        alias="AUDIT_LOG_EXCLUDE_PATHS"
+    )
+    audit_log_methods: List[str] = Field(
+        default=["POST", "PUT", "PATCH", "DELETE"],
+        alias="AUDIT_LOG_METHODS"
+    )
+    audit_queue_size: int = Field(default=10000, alias="AUDIT_QUEUE_SIZE")
+    audit_batch_size: int = Field(default=500, alias="AUDIT_BATCH_SIZE")
+    audit_flush_interval: float = Field(default=1.0, alias="AUDIT_FLUSH_INTERVAL")
+    # 큐가 가득 찼을 때의 정책: drop(버림), sample(표본 추출), block(대기)
+    audit_overflow_policy: str = Field(default="drop", alias="AUDIT_OVERFLOW_POLICY")
+    audit_sample_rate: float = Field(default=0.1, alias="AUDIT_SAMPLE_RATE")
+    audit_block_timeout: float = Field(default=0.05, alias="AUDIT_BLOCK_TIMEOUT")
+
+    # 감사 로그 파티션 관리 설정
+    audit_log_partition_enabled: bool = Field(default=True, alias="AUDIT_LOG_PARTITION_ENABLED")
+    audit_log_partition_interval: int = Field(default=21600, alias="AUDIT_LOG_PARTITION_INTERVAL")  # 초
+    audit_log_partition_months_ahead: int = Field(default=3, alias="AUDIT_LOG_PARTITION_MONTHS_AHEAD")
+    audit_log_retention_months: int = Field(default=24, alias="AUDIT_LOG_RETENTION_MONTHS")  # 0이면 무기한 보존
+    audit_log_partition_drop: bool = Field(default=True, alias="AUDIT_LOG_PARTITION_DROP")  # False면 분리(DETACH)만 수행
+
+    # 게시글 조회수 롤업 설정
+    view_rollup_enabled: bool = Field(default=True, alias="VIEW_ROLLUP_ENABLED")
+    view_rollup_interval: int = Field(default=300, alias="VIEW_ROLLUP_INTERVAL")  # 초
+    view_rollup_batch_size: int = Field(default=50000, alias="VIEW_ROLLUP_BATCH_SIZE")
+    view_raw_retention_days: int = Field(default=90, alias="VIEW_RAW_RETENTION_DAYS")  # 0이면 원본 보존
+    view_purge_interval: int = Field(default=3600, alias="VIEW_PURGE_INTERVAL")  # 초
+
+    # 알림 디스패처 설정
+    notification_queue_size: int = Field(default=10000, alias="NOTIFICATION_QUEUE_SIZE")
+    notification_flush_interval: float = Field(default=2.0, alias="NOTIFICATION_FLUSH_INTERVAL")  # 초
+    notification_coalesce_window: int = Field(default=86400, alias="NOTIFICATION_COALESCE_WINDOW")  # 초, 읽지 않은 알림 병합 기간
+    notification_fanout_batch_size: int = Field(default=5000, alias="NOTIFICATION_FANOUT_BATCH_SIZE")
+    # 실시간 알림 푸시 백엔드: memory(단일 워커), postgres(LISTEN/NOTIFY, 다중 워커)
+    notification_pubsub_backend: str = Field(default="memory", alias="NOTIFICATION_PUBSUB_BACKEND")
+    notification_pubsub_channel: str = Field(default="bbs_notifications", alias="NOTIFICATION_PUBSUB_CHANNEL")
+    notification_stream_keepalive: float = Field(default=15.0, alias="NOTIFICATION_STREAM_KEEPALIVE")  # 초
+    notification_counter_reconcile_interval: int = Field(default=3600, alias="NOTIFICATION_COUNTER_RECONCILE_INTERVAL")  # 초
+
+    # 워커 간 캐시 무효화 버스: memory(단일 워커), postgres(LISTEN/NOTIFY, 다중 워커)
+    cache_invalidation_backend: str = Field(default="memory", alias="CACHE_INVALIDATION_BACKEND")
+    cache_invalidation_channel: str = Field(default="cache_invalidation", alias="CACHE_INVALIDATION_CHANNEL")
+
+    # 읽기 캐시: memory(워커별 TTL+LRU, 무효화는 캐시 무효화 버스로 전파), postgres(UNLOGGED 테이블 공유)
+    cache_enabled: bool = Field(default=True, alias="CACHE_ENABLED")
+    cache_backend: str = Field(default="memory", alias="CACHE_BACKEND")
+    cache_default_ttl: float = Field(default=60.0, alias="CACHE_DEFAULT_TTL")  # 초
+    # 네임스페이스별 TTL (초, JSON)
+    cache_ttls: Dict[str, float] = Field(
+        default={
+            "boards": 60.0,
+            "categories": 300.0,
+            "popular_tags": 60.0,
+            "popular_posts": 60.0,
+            "post_extras": 60.0,
+        },
+        alias="CACHE_TTLS"
+    )
+    cache_memory_max_bytes: int = Field(default=64 * 1024 * 1024, alias="CACHE_MEMORY_MAX_BYTES")
+    cache_single_flight_timeout: float = Field(default=10.0, alias="CACHE_SINGLE_FLIGHT_TIMEOUT")  # 초, 먼저 시작한 계산 대기 한도
+    cache_early_refresh_beta: float = Field(default=1.0, alias="CACHE_EARLY_REFRESH_BETA")  # 만료 전 재계산 강도 (0: 사용 안 함)
+    cache_purge_interval: int = Field(default=600, alias="CACHE_PURGE_INTERVAL")  # 초, postgres 백엔드 만료 항목 정리 주기
+
+    # 태그 사용 횟수 보정
+    tag_usage_reconcile_interval: int = Field(default=3600, alias="TAG_USAGE_RECONCILE_INTERVAL")  # 초
+
+    # 좋아요 수 보정
+    like_counter_reconcile_interval: int = Field(default=3600, alias="LIKE_COUNTER_RECONCILE_INTERVAL")  # 초
+
+    # 팔로잉 타임라인 설정
+    timeline_max_sources: int = Field(default=500, alias="TIMELINE_MAX_SOURCES")  # 병합할 최대 팔로우 대상 수
+    timeline_cache_ttl: float = Field(default=30.0, alias="TIMELINE_CACHE_TTL")  # 초, 0이면 캐시 사용 안 함
+    timeline_cache_max_users: int = Field(default=10000, alias="TIMELINE_CACHE_MAX_USERS")
+
+    # 관련 게시글 설정
+    related_posts_enabled: bool = Field(default=True, alias="RELATED_POSTS_ENABLED")
+    related_posts_interval: int = Field(default=300, alias="RELATED_POSTS_INTERVAL")  # 초
+    related_posts_batch_size: int = Field(default=500, alias="RELATED_POSTS_BATCH_SIZE")  # 한 번에 재계산할 게시글 수
+    related_posts_top_k: int = Field(default=10, alias="RELATED_POSTS_TOP_K")  # 게시글별 보관할 관련 게시글 수
+    related_posts_candidates_per_tag: int = Field(default=1000, alias="RELATED_POSTS_CANDIDATES_PER_TAG")  # 태그별로 비교할 최근 게시글 수
+
+    # 급상승 태그 설정
+    trending_tag_windows: str = Field(default="1h,24h,7d", alias="TRENDING_TAG_WINDOWS")  # 쉼표로 구분한 집계 기간 (s/m/h/d 단위)
+    trending_tag_bucket_seconds: int = Field(default=300, alias="TRENDING_TAG_BUCKET_SECONDS")  # 사용 횟수 버킷 크기
+    trending_tag_interval: int = Field(default=300, alias="TRENDING_TAG_INTERVAL")  # 초, 순위 재계산 주기
+    trending_tag_top_k: int = Field(default=50, alias="TRENDING_TAG_TOP_K")  # 기간별로 보관할 태그 수
+
+    # 요청별 SQL 계측 설정
+    sql_metrics_enabled: bool = Field(default=True, alias="SQL_METRICS_ENABLED")  # Server-Timing 헤더 및 느린 요청 로그
+    sql_slow_request_ms: float = Field(default=500.0, alias="SQL_SLOW_REQUEST_MS")  # 요청당 DB 시간 합계 기준, 0이면 사용 안 함
+    sql_slow_request_queries: int = Field(default=50, alias="SQL_SLOW_REQUEST_QUERIES")  # 요청당 SQL 실행 수 기준, 0이면 사용 안 함
+    sql_slow_statement_ms: float = Field(default=200.0, alias="SQL_SLOW_STATEMENT_MS")  # SQL 한 건의 실행 시간 기준, 0이면 사용 안 함
+
+    # Prometheus 메트릭 설정
+    metrics_enabled: bool = Field(default=True, alias="METRICS_ENABLED")
+    metrics_path: str = Field(default="/metrics", alias="METRICS_PATH")
+    metrics_token: Optional[str] = Field(default=None, alias="METRICS_TOKEN")  # 설정하면 Authorization: Bearer 토큰 필요
+
+    # 과부하 시 요청 수락 제어 (부하 차단)
+    admission_enabled: bool = Field(default=True, alias="ADMISSION_ENABLED")
+    admission_max_in_flight: int = Field(default=200, alias="ADMISSION_MAX_IN_FLIGHT")  # 이 이상이면 모든 요청 거절 (포화)
+    admission_shed_in_flight: int = Field(default=100, alias="ADMISSION_SHED_IN_FLIGHT")  # 이 이상이면 낮은 우선순위 요청 거절
+    admission_shed_pool_ratio: float = Field(default=0.9, alias="ADMISSION_SHED_POOL_RATIO")  # 커넥션 사용률 기준 (pool_size + max_overflow 대비)
+    admission_shed_pool_wait_ms: float = Field(default=100.0, alias="ADMISSION_SHED_POOL_WAIT_MS")  # 최근 커넥션 대기 시간 기준
+    admission_saturated_pool_wait_ms: float = Field(default=1000.0, alias="ADMISSION_SATURATED_POOL_WAIT_MS")  # 이 이상이면 포화
+    admission_retry_after: int = Field(default=5, alias="ADMISSION_RETRY_AFTER")  # 초, 거절 응답의 Retry-After
+    # 먼저 거절할 경로 접두사 (*는 경로 한 단계와 일치)
+    admission_low_priority_paths: List[str] = Field(
+        default=[
+            "/api/v1/boards/statistics",
+            "/api/v1/boards/boards/*/statistics",
+            "/api/v1/boards/posts/admin",
+            "/api/v1/boards/comments/admin",
+            "/api/v1/dashboard/stats",
+            "/api/v1/dashboard/admin",
+            "/api/v1/audit-logs",
+            "/api/v1/logs",
+            "/api/v1/inquiries/admin",
+            "/api/v1/board-extra/reports/grouped",
+        ],
+        alias="ADMISSION_LOW_PRIORITY_PATHS"
+    )
+    # 수락 제어에서 제외할 경로 (헬스 체크, 메트릭, 장시간 유지되는 스트림)
+    admission_exempt_paths: List[str] = Field(
+        default=["/api/v1/health", "/metrics", "/api/v1/board-extra/notifications/stream"],
+        alias="ADMISSION_EXEMPT_PATHS"
+    )
+
+    # DB 커넥션/쿼리 시간 제한
+    db_pool_timeout: float = Field(default=10.0, alias="DB_POOL_TIMEOUT")  # 초, 커넥션 대기 최대 시간
+    db_statement_timeout_ms: int = Field(default=15000, alias="DB_STATEMENT_TIMEOUT_MS")  # 요청 기본 statement_timeout, 0이면 DB 기본값
+    # 경로 접두사별 statement_timeout (가장 길게 일치하는 접두사 적용, 0이면 DB 기본값)
+    db_statement_timeouts: Dict[str, int] = Field(
+        default={
+            "/api/v1/audit-logs/export": 60000,
+            "/api/v1/boards/statistics": 10000,
+            "/api/v1/dashboard/admin": 10000,
+        },
+        alias="DB_STATEMENT_TIMEOUTS"
+    )
+
+    # 요청 빈도 제한 설정 (토큰 버킷)
+    rate_limit_enabled: bool = Field(default=True, alias="RATE_LIMIT_ENABLED")
+    # 버킷 저장소: memory(워커별), postgres(UNLOGGED 테이블, 여러 워커 공유)
+    rate_limit_backend: str = Field(default="memory", alias="RATE_LIMIT_BACKEND")
+    # 정책 이름별 허용량 ("횟수/기간", 기간 단위 s/m/h/d 또는 second/minute/hour/day)
+    rate_limit_policies: Dict[str, str] = Field(
+        default={
+            "login": "10/minute",
+            "post_like": "30/minute",
+            "comment_like": "30/minute",
+            "bookmark": "30/minute",
+            "report": "10/hour",
+        },
+        alias="RATE_LIMIT_POLICIES"
+    )
+    rate_limit_memory_max_keys: int = Field(default=100000, alias="RATE_LIMIT_MEMORY_MAX_KEYS")
+    rate_limit_purge_interval: int = Field(default=3600, alias="RATE_LIMIT_PURGE_INTERVAL")  # 초, postgres 백엔드 버킷 정리 주기
+
+    @field_validator('audit_overflow_policy', mode='before')
+    @classmethod
+    def validate_audit_overflow_policy(cls, v: Optional[str]) -> str:
+        """감사 로그 큐 오버플로 정책 검증"""
+        policy = (v or "drop").strip().lower()
+        if policy not in ("drop", "sample", "block"):
+            raise ValueError("AUDIT_OVERFLOW_POLICY는 drop, sample, block 중 하나여야 합니다.")
+        return policy
+
+    @field_validator('notification_pubsub_backend', mode='before')
+    @classmethod
+    def validate_notification_pubsub_backend(cls, v: Optional[str]) -> str:
+        """실시간 알림 푸시 백엔드 검증"""
+        backend = (v or "memory").strip().lower()
+        if backend not in ("memory", "postgres"):
+            raise ValueError("NOTIFICATION_PUBSUB_BACKEND는 memory, postgres 중 하나여야 합니다.")
+        return backend
+
+    @field_validator('cache_invalidation_backend', mode='before')
+    @classmethod
+    def validate_cache_invalidation_backend(cls, v: Optional[str]) -> str:
+        """캐시 무효화 버스 백엔드 검증"""
+        backend = (v or "memory").strip().lower()
+        if backend not in ("memory", "postgres"):
+            raise ValueError("CACHE_INVALIDATION_BACKEND는 memory, postgres 중 하나여야 합니다.")
+        return backend
+
+    @field_validator('cache_backend', mode='before')
+    @classmethod
+    def validate_cache_backend(cls, v: Optional[str]) -> str:
+        """읽기 캐시 저장소 검증"""
+        backend = (v or "memory").strip().lower()
+        if backend not in ("memory", "postgres"):
+            raise ValueError("CACHE_BACKEND는 memory, postgres 중 하나여야 합니다.")
+        return backend
+
+    @field_validator('rate_limit_backend', mode='before')
+    @classmethod
+    def validate_rate_limit_backend(cls, v: Optional[str]) -> str:
+        """요청 빈도 제한 저장소 검증"""
+        backend = (v or "memory").strip().lower()
+        if backend not in ("memory", "postgres"):
+            raise ValueError("RATE_LIMIT_BACKEND는 memory, postgres 중 하나여야 합니다.")
+        return backend
+
+    @field_validator('server_loop', mode='before')
+    @classmethod
+    def validate_server_loop(cls, v: Optional[str]) -> str:
+        """이벤트 루프 구현 검증"""
+        loop = (v or "auto").strip().lower()
+        if loop not in ("auto", "asyncio", "uvloop"):
+            raise ValueError("SERVER_LOOP는 auto, asyncio, uvloop 중 하나여야 합니다.")
+        return loop
+
+    @field_validator('server_http', mode='before')
+    @classmethod
+    def validate_server_http(cls, v: Optional[str]) -> str:
+        """HTTP 파서 구현 검증"""
+        http = (v or "auto").strip().lower()
+        if http not in ("auto", "h11", "httptools"):
+            raise ValueError("SERVER_HTTP는 auto, h11, httptools 중 하나여야 합니다.")
+        return http
+
+    @field_validator('trending_tag_windows', mode='before')
+    @classmethod
+    def validate_trending_tag_windows(cls, v: Optional[str]) -> str:
+        """급상승 태그 집계 기간 검증"""
+        windows = [window.strip().lower() for window in (v or "1h,24h,7d").split(',') if window.strip()]
+        if not windows or not all(re.fullmatch(r"[1-9][0-9]*[smhd]", window) for window in windows):
+            raise ValueError("TRENDING_TAG_WINDOWS는 1h,24h,7d처럼 숫자와 단위(s/m/h/d)를 쉼표로 구분해야 합니다.")
+        return ",".join(dict.fromkeys(windows))
+
     @field_validator('cors_origins', mode='before')
     @classmethod
     def parse_cors_origins(cls, v: Union[str, List[str]]) -> List[str]:
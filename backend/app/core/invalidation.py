@@ -0,0 +1,217 @@
+"""워커 간 캐시 무효화 버스 (PostgreSQL LISTEN/NOTIFY)"""
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+import asyncio
+import json
+import logging
+import os
+import uuid
+from sqlalchemy import event, text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.metrics import GaugeCallback, registry
+from app.core.pubsub import MAX_NOTIFY_PAYLOAD_BYTES, PgListener
+from app.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+# 세션 트랜잭션이 커밋되면 무효화할 키 (session.info 키)
+_PENDING_KEYS = "invalidation_keys"
+
+# 네임스페이스 전체 무효화 키의 식별자 부분 ("board:*")
+ALL = "*"
+
+
+def _new_origin() -> str:
+    """프로세스별 발행자 식별자"""
+    return f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+def split_key(key: str) -> Tuple[str, str]:
+    """
+    "board:12" 형식의 키를 (네임스페이스, 식별자)로 분리
+
+    식별자가 없거나 "*"이면 네임스페이스 전체를 뜻합니다 ("board", "board:*").
+    """
+    namespace, _, ident = key.partition(":")
+    return namespace, (ident or ALL)
+
+
+def _notify_payloads(origin: str, keys: List[str]) -> List[str]:
+    """NOTIFY payload 크기 제한에 맞게 키 목록을 나눠 직렬화"""
+    payloads = []
+    chunk: List[str] = []
+    for key in keys:
+        candidate = json.dumps({"origin": origin, "keys": chunk + [key]})
+        if chunk and len(candidate.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            payloads.append(json.dumps({"origin": origin, "keys": chunk}))
+            chunk = [key]
+        else:
+            chunk.append(key)
+    if chunk:
+        payloads.append(json.dumps({"origin": origin, "keys": chunk}))
+    return payloads
+
+
+class InvalidationBus:
+    """
+    캐시 무효화 버스
+
+    프로세스 내 캐시는 네임스페이스별로 제거 함수(evict)와 전체 비우기 함수(flush)를 등록하고,
+    데이터를 바꾼 쪽은 "board:12", "user:abc", "locale:ko" 같은 키를 발행합니다.
+    - memory: 이 프로세스의 캐시에서만 제거 (단일 워커)
+    - postgres: 트랜잭션 안에서 pg_notify로 발행해 커밋된 경우에만 다른 워커에 전달되고,
+      각 워커의 LISTEN 스레드가 받아 자기 캐시에서 제거 (다중 워커)
+
+    LISTEN 연결이 끊겼다가 다시 연결되면 그 사이 알림을 놓쳤을 수 있으므로 등록된 캐시를 모두 비웁니다.
+    """
+
+    def __init__(self, backend: str, channel: str):
+        self.backend = backend
+        self.channel = channel
+        # 자기 프로세스가 발행한 알림은 이미 로컬에서 제거했으므로 건너뜀
+        self.origin = _new_origin()
+        self._handlers: Dict[str, Tuple[Callable[[str], None], Callable[[], None]]] = {}
+        self._listener: Optional[PgListener] = None
+        self.counters: Dict[str, int] = {"published": 0, "received": 0, "evicted": 0, "flushed": 0, "errors": 0}
+
+    def reset_origin(self) -> None:
+        """
+        발행자 식별자 새로 만들기 (fork한 자식 프로세스에서 호출)
+
+        앱을 import한 마스터에서 fork한 워커는 같은 식별자를 물려받으므로,
+        그대로 두면 다른 워커의 알림을 자기 알림으로 보고 건너뜁니다.
+        """
+        self.origin = _new_origin()
+
+    def register(self, namespace: str, evict: Callable[[str], None], flush: Callable[[], None]) -> None:
+        """네임스페이스의 캐시 제거 함수와 전체 비우기 함수 등록"""
+        self._handlers[namespace] = (evict, flush)
+
+    def stats(self) -> Dict[str, object]:
+        """버스 상태 및 카운터"""
+        return {
+            "backend": self.backend,
+            "namespaces": sorted(self._handlers),
+            "listener_running": self._listener.running if self._listener else None,
+            **self.counters,
+        }
+
+    async def start(self) -> None:
+        """버스 시작 (postgres 백엔드는 LISTEN 스레드 시작)"""
+        if self.backend == "postgres" and self._listener is None:
+            self._listener = PgListener(asyncio.get_running_loop())
+            self._listener.add_channel(self.channel, self._on_payload)
+            self._listener.add_connect_callback(self.flush_all)
+            self._listener.start()
+
+    async def stop(self) -> None:
+        """버스 중지"""
+        if self._listener is not None:
+            await asyncio.to_thread(self._listener.stop)
+            self._listener = None
+
+    def invalidate_on_commit(self, db: Session, *keys: str) -> None:
+        """
+        세션 트랜잭션이 커밋되면 키 무효화 (롤백되면 버림)
+
+        커밋 전에 다른 요청이 이전 값을 다시 캐시하지 않도록 로컬 제거도 커밋 후에 수행합니다.
+        """
+        db.info.setdefault(_PENDING_KEYS, set()).update(keys)
+
+    def publish(self, *keys: str) -> None:
+        """키 즉시 무효화 (트랜잭션 밖의 변경용, 어느 스레드에서나 호출 가능)"""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return
+        if self.backend == "postgres":
+            try:
+                with engine.begin() as conn:
+                    self._notify(conn, keys)
+            except Exception as e:
+                self.counters["errors"] += 1
+                logger.error(f"캐시 무효화 발행 실패: {type(e).__name__}: {str(e)}")
+        self.evict_local(keys)
+
+    def _notify(self, conn, keys: List[str]) -> None:
+        for payload in _notify_payloads(self.origin, keys):
+            conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+        self.counters["published"] += len(keys)
+
+    def evict_local(self, keys: Iterable[str]) -> None:
+        """이 프로세스의 캐시에서 키 제거 (등록되지 않은 네임스페이스는 무시)"""
+        for key in keys:
+            namespace, ident = split_key(key)
+            handlers = self._handlers.get(namespace)
+            if handlers is None:
+                continue
+            evict, flush = handlers
+            try:
+                if ident == ALL:
+                    flush()
+                else:
+                    evict(ident)
+                self.counters["evicted"] += 1
+            except Exception as e:
+                self.counters["errors"] += 1
+                logger.error(f"캐시 무효화 실패 ({key}): {type(e).__name__}: {str(e)}")
+
+    def flush_all(self) -> None:
+        """등록된 모든 캐시 비우기 (알림을 놓쳤을 수 있을 때)"""
+        for namespace, (_, flush) in list(self._handlers.items()):
+            try:
+                flush()
+            except Exception as e:
+                self.counters["errors"] += 1
+                logger.error(f"캐시 전체 비우기 실패 ({namespace}): {type(e).__name__}: {str(e)}")
+        self.counters["flushed"] += 1
+
+    def _on_payload(self, payload: str) -> None:
+        """LISTEN으로 받은 payload 처리 (이벤트 루프에서 실행)"""
+        try:
+            data = json.loads(payload)
+            origin, keys = data["origin"], data["keys"]
+        except (ValueError, KeyError, TypeError):
+            # 어떤 키인지 알 수 없으므로 전체를 비움
+            logger.warning(f"잘못된 캐시 무효화 payload, 전체 비우기: {payload[:100]}")
+            self.flush_all()
+            return
+        if origin == self.origin:
+            return
+        self.counters["received"] += len(keys)
+        self.evict_local(keys)
+
+    def install(self, session_factory=SessionLocal) -> None:
+        """세션 커밋/롤백 훅 등록 (중복 등록하지 않음)"""
+        if not event.contains(session_factory, "before_commit", self._before_commit):
+            event.listen(session_factory, "before_commit", self._before_commit)
+            event.listen(session_factory, "after_commit", self._after_commit)
+            event.listen(session_factory, "after_rollback", self._after_rollback)
+
+    def _before_commit(self, session: Session) -> None:
+        # 같은 트랜잭션에서 NOTIFY하면 커밋된 경우에만 전달됨
+        keys = session.info.get(_PENDING_KEYS)
+        if keys and self.backend == "postgres":
+            self._notify(session.connection(), sorted(keys))
+
+    def _after_commit(self, session: Session) -> None:
+        keys = session.info.pop(_PENDING_KEYS, None)
+        if keys:
+            self.evict_local(sorted(keys))
+
+    def _after_rollback(self, session: Session) -> None:
+        session.info.pop(_PENDING_KEYS, None)
+
+
+# 애플리케이션 전역 캐시 무효화 버스
+invalidation_bus = InvalidationBus(
+    backend=settings.cache_invalidation_backend,
+    channel=settings.cache_invalidation_channel,
+)
+invalidation_bus.install()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=invalidation_bus.reset_origin)
+
+registry.register(GaugeCallback(
+    "cache_invalidation_events", "캐시 무효화 버스 처리 카운터", ("event",),
+    lambda: [((name,), value) for name, value in list(invalidation_bus.counters.items())]
+))
@@ -0,0 +1,346 @@
+"""Prometheus 텍스트 형식 메트릭 (요청 지연/상태 코드, DB 커넥션 풀, 백그라운드 큐, 캐시)"""
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+import hmac
+import threading
+import time
+from fastapi import Request, Response
+from sqlalchemy.pool import QueuePool
+from app.core.config import settings
+
+# 요청 지연 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# 커넥션 풀 대기 시간 히스토그램 버킷 (초)
+POOL_WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LabelValues = Tuple[str, ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _format_sample(name: str, labels: Dict[str, str], value: float) -> str:
+    if not labels:
+        return f"{name} {_format_value(value)}"
+    label_text = ",".join(f'{key}="{_escape(str(val))}"' for key, val in labels.items())
+    return f"{name}{{{label_text}}} {_format_value(value)}"
+
+
+class Counter:
+    """단조 증가 카운터"""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: LabelValues = (), amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = list(self._values.items())
+        for labels, value in items:
+            yield f"{self.name}_total", dict(zip(self.labelnames, labels)), value
+
+
+class Histogram:
+    """
+    누적 버킷 히스토그램
+
+    관측 시에는 해당 버킷 하나만 증가시키고 누적 합은 출력할 때 계산합니다.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블별 [버킷별 개수..., +Inf 개수], 합계
+        self._counts: Dict[LabelValues, List[int]] = {}
+        self._sums: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, labels: LabelValues = ()) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            counts = self._counts.get(labels)
+            if counts is None:
+                counts = self._counts[labels] = [0] * (len(self.buckets) + 1)
+                self._sums[labels] = 0.0
+            counts[index] += 1
+            self._sums[labels] += value
+
+    def samples(self) -> Iterable[Sample]:
+        with self._lock:
+            items = [(labels, list(counts), self._sums[labels]) for labels, counts in self._counts.items()]
+        for labels, counts, total in items:
+            base = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                yield f"{self.name}_bucket", {**base, "le": _format_value(bound)}, cumulative
+            yield f"{self.name}_sum", base, total
+            yield f"{self.name}_count", base, cumulative
+
+
+class GaugeCallback:
+    """출력 시점에 함수를 호출해 값을 읽는 게이지 (함수는 (레이블 값, 값) 목록 반환)"""
+    kind = "gauge"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str], func: Callable[[], Iterable[Tuple[LabelValues, float]]]):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.func = func
+
+    def samples(self) -> Iterable[Sample]:
+        for labels, value in self.func():
+            if value is not None:
+                yield self.name, dict(zip(self.labelnames, labels)), float(value)
+
+
+class MetricsRegistry:
+    """메트릭 등록 및 Prometheus 텍스트 형식 출력"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+
+    def register(self, metric):
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            try:
+                samples = list(metric.samples())
+            except Exception as e:
+                lines.append(f"# {metric.name} 수집 실패: {type(e).__name__}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(_format_sample(name, labels, value) for name, labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+# 처리 중인 요청 수 (이벤트 루프 스레드에서만 변경)
+_in_progress = [0]
+# 이름별 백그라운드 큐 (크기 조회 함수, 최대 크기, 처리 카운터)
+_queues: Dict[str, Tuple[Callable[[], int], int, Optional[Dict[str, int]]]] = {}
+# 이름별 캐시 통계 조회 함수
+_caches: Dict[str, Callable[[], Dict[str, int]]] = {}
+
+http_requests = registry.register(Counter(
+    "http_requests", "처리한 HTTP 요청 수", ("method", "route", "status")
+))
+http_request_duration = registry.register(Histogram(
+    "http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route")
+))
+http_requests_in_progress = registry.register(GaugeCallback(
+    "http_requests_in_progress", "처리 중인 HTTP 요청 수", (), lambda: [((), _in_progress[0])]
+))
+db_pool_wait = registry.register(Histogram(
+    "db_pool_wait_seconds", "커넥션 풀에서 커넥션을 얻기까지 걸린 시간", (), POOL_WAIT_BUCKETS
+))
+
+
+class TimedQueuePool(QueuePool):
+    """
+    커넥션 대여 대기 시간을 기록하는 QueuePool
+
+    db_pool_wait_seconds 히스토그램 외에 대기 중인 스레드 수와 최근 대기 시간
+    (반감기 WAIT_HALF_LIFE초로 감쇠하는 최댓값)을 유지해 과부하 판단에 사용합니다.
+    """
+
+    WAIT_HALF_LIFE = 10.0
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._wait_lock = threading.Lock()
+        self.waiting = 0
+        self._recent_wait = 0.0
+        self._recent_wait_at = time.monotonic()
+
+    def _decayed_wait(self, now: float) -> float:
+        return self._recent_wait * 0.5 ** ((now - self._recent_wait_at) / self.WAIT_HALF_LIFE)
+
+    def recent_wait(self) -> float:
+        """최근 커넥션 대기 시간 (초)"""
+        with self._wait_lock:
+            return self._decayed_wait(time.monotonic())
+
+    def _do_get(self):
+        started = time.perf_counter()
+        with self._wait_lock:
+            self.waiting += 1
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - started
+            now = time.monotonic()
+            with self._wait_lock:
+                self.waiting -= 1
+                self._recent_wait = max(self._decayed_wait(now), elapsed)
+                self._recent_wait_at = now
+            db_pool_wait.observe(elapsed)
+
+
+def register_pool(engine) -> None:
+    """엔진 커넥션 풀 게이지 등록 (dispose 후 새로 만든 풀도 읽도록 매번 engine.pool 조회)"""
+    registry.register(GaugeCallback(
+        "db_pool_size", "커넥션 풀 기본 크기 (pool_size)", (), lambda: [((), engine.pool.size())]
+    ))
+    registry.register(GaugeCallback(
+        "db_pool_checked_out", "사용 중인 커넥션 수", (), lambda: [((), engine.pool.checkedout())]
+    ))
+    registry.register(GaugeCallback(
+        "db_pool_checked_in", "풀에서 대기 중인 유휴 커넥션 수", (), lambda: [((), engine.pool.checkedin())]
+    ))
+    # overflow()는 아직 만들지 않은 기본 커넥션만큼 음수가 되므로 0 미만은 0으로 표시
+    registry.register(GaugeCallback(
+        "db_pool_overflow", "max_overflow 범위에서 추가로 연 커넥션 수", (), lambda: [((), max(engine.pool.overflow(), 0))]
+    ))
+    registry.register(GaugeCallback(
+        "db_pool_max_overflow", "커넥션 풀 max_overflow 설정", (), lambda: [((), getattr(engine.pool, "_max_overflow", 0))]
+    ))
+    registry.register(GaugeCallback(
+        "db_pool_waiting", "커넥션을 기다리는 요청 수", (), lambda: [((), getattr(engine.pool, "waiting", None))]
+    ))
+
+
+def register_queue(name: str, qsize: Callable[[], int], max_size: int, counters: Optional[Dict[str, int]] = None) -> None:
+    """백그라운드 큐 깊이 게이지 등록 (counters를 주면 처리 카운터도 함께 출력)"""
+    _queues[name] = (qsize, max_size, counters)
+
+
+def register_cache(name: str, stats: Callable[[], Dict[str, int]]) -> None:
+    """캐시 적중 통계 등록 (stats()는 hits, misses와 크기 항목을 담은 dict 반환)"""
+    _caches[name] = stats
+
+
+def register_scheduler(scheduler) -> None:
+    """주기 작업 실행 통계 등록"""
+    registry.register(GaugeCallback(
+        "scheduler_job_runs", "주기 작업 실행 횟수", ("job",),
+        lambda: [((job["name"],), job["run_count"]) for job in scheduler.jobs()]
+    ))
+    registry.register(GaugeCallback(
+        "scheduler_job_errors", "주기 작업 실패 횟수", ("job",),
+        lambda: [((job["name"],), job["error_count"]) for job in scheduler.jobs()]
+    ))
+    registry.register(GaugeCallback(
+        "scheduler_job_last_duration_seconds", "주기 작업 마지막 실행 시간", ("job",),
+        lambda: [((job["name"],), job["last_duration"]) for job in scheduler.jobs()]
+    ))
+
+
+def _queue_depths():
+    return [((name,), qsize()) for name, (qsize, _, _) in list(_queues.items())]
+
+
+def _queue_capacities():
+    return [((name,), max_size) for name, (_, max_size, _) in list(_queues.items())]
+
+
+def _queue_events():
+    return [
+        ((name, event), value)
+        for name, (_, _, counters) in list(_queues.items()) if counters
+        for event, value in list(counters.items())
+    ]
+
+
+def _cache_stats():
+    for name, stats in list(_caches.items()):
+        for key, value in stats().items():
+            yield (name, key), value
+
+
+def _cache_hit_ratios():
+    for name, stats in list(_caches.items()):
+        values = stats()
+        lookups = values.get("hits", 0) + values.get("misses", 0)
+        yield (name,), (values.get("hits", 0) / lookups if lookups else None)
+
+
+registry.register(GaugeCallback("background_queue_depth", "백그라운드 큐에 대기 중인 항목 수", ("queue",), _queue_depths))
+registry.register(GaugeCallback("background_queue_capacity", "백그라운드 큐 최대 크기", ("queue",), _queue_capacities))
+registry.register(GaugeCallback("background_queue_events", "백그라운드 큐 처리 카운터", ("queue", "event"), _queue_events))
+registry.register(GaugeCallback("cache_stats", "캐시 적중/미스 횟수와 크기", ("cache", "stat"), _cache_stats))
+registry.register(GaugeCallback("cache_hit_ratio", "캐시 적중률 (프로세스 시작 이후)", ("cache",), _cache_hit_ratios))
+
+
+def _route_template(scope) -> str:
+    """
+    매칭된 라우트의 경로 템플릿
+
+    include_router로 등록한 라우트는 FastAPI 버전에 따라 scope["route"].path가 접두사 없는
+    상대 경로일 수 있어, 접두사가 포함된 유효 라우트 정보가 있으면 그 경로를 사용합니다.
+    """
+    effective = (scope.get("fastapi") or {}).get("effective_route_context")
+    path = getattr(effective, "path", None) or getattr(scope.get("route"), "path", None)
+    return path or "unmatched"
+
+
+class MetricsMiddleware:
+    """
+    요청 지연/상태 코드 수집 미들웨어
+
+    경로 레이블은 실제 URL이 아니라 매칭된 라우트 템플릿(/api/v1/boards/posts/{post_id})을
+    사용해 레이블 수가 늘어나지 않게 합니다. 매칭되지 않은 요청은 unmatched로 묶습니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        _in_progress[0] += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _in_progress[0] -= 1
+            route_path = _route_template(scope)
+            method = scope["method"]
+            http_request_duration.observe(time.perf_counter() - started, (method, route_path))
+            http_requests.inc((method, route_path, str(status_holder["status"])))
+
+
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus 스크레이프 엔드포인트 (METRICS_TOKEN을 설정하면 Bearer 토큰 필요)"""
+    if settings.metrics_token:
+        authorization = request.headers.get("authorization", "")
+        if not hmac.compare_digest(authorization, f"Bearer {settings.metrics_token}"):
+            return Response(status_code=401)
+    return Response(content=registry.render(), media_type=CONTENT_TYPE)
@@ -0,0 +1,249 @@
+"""게시글/댓글 일괄 관리 (id 목록을 한 번의 UPDATE로 처리)"""
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+from app.core.related_posts import enqueue_related_refresh
+from app.models.board import (
+    BbsAdminLog, BbsPostHistory, AdminActionType, ChangeType
+)
+
+# 일괄 작업 종류
+ACTION_HIDE = "HIDE"
+ACTION_SHOW = "SHOW"
+ACTION_DELETE = "DELETE"
+ACTION_MOVE = "MOVE"
+
+# 처리 결과
+OUTCOME_UPDATED = "UPDATED"
+OUTCOME_SKIPPED = "SKIPPED"
+OUTCOME_NOT_FOUND = "NOT_FOUND"
+
+# 작업별 (변경 후 상태, 관리자 로그 유형, 설명) - 삭제는 단건 API와 같이 숨김 유형으로 기록
+POST_STATUS_ACTIONS: Dict[str, Tuple[str, AdminActionType, str]] = {
+    ACTION_HIDE: ("HIDDEN", AdminActionType.POST_HIDE, "숨김"),
+    ACTION_SHOW: ("PUBLISHED", AdminActionType.POST_SHOW, "표시"),
+    ACTION_DELETE: ("DELETED", AdminActionType.POST_HIDE, "삭제"),
+}
+COMMENT_STATUS_ACTIONS: Dict[str, Tuple[str, AdminActionType, str]] = {
+    ACTION_HIDE: ("HIDDEN", AdminActionType.COMMENT_HIDE, "숨김"),
+    ACTION_SHOW: ("PUBLISHED", AdminActionType.COMMENT_SHOW, "표시"),
+    ACTION_DELETE: ("DELETED", AdminActionType.COMMENT_HIDE, "삭제"),
+}
+
+
+def _result(target_id: int, outcome: str, detail: Optional[str] = None) -> Dict:
+    return {"id": target_id, "outcome": outcome, "detail": detail}
+
+
+def _lock_targets(db: Session, table: str, columns: str, ids: List[int]) -> Dict[int, tuple]:
+    """대상 행을 한 번에 잠그고 id별로 반환 (동시 단건 수정과 경합하지 않도록 FOR UPDATE)"""
+    rows = db.execute(
+        text(f"SELECT id, {columns} FROM {table} WHERE id = ANY(:ids) ORDER BY id FOR UPDATE"),
+        {"ids": ids}
+    ).all()
+    return {row[0]: tuple(row[1:]) for row in rows}
+
+
+def _write_logs(
+    db: Session,
+    admin_id: str,
+    act_typ: AdminActionType,
+    target_typ: str,
+    label: str,
+    changes: List[Tuple[int, Dict, Dict]],
+    ip_addr: Optional[str],
+) -> None:
+    """관리자 로그를 다중 행 INSERT 한 번으로 기록"""
+    if not changes:
+        return
+    db.execute(insert(BbsAdminLog), [
+        {
+            "admin_id": admin_id,
+            "act_typ": act_typ,
+            "act_dsc": f"{label} #{target_id} 일괄 처리",
+            "target_typ": target_typ,
+            "target_id": target_id,
+            "old_val": old_val,
+            "new_val": new_val,
+            "ip_addr": ip_addr,
+        }
+        for target_id, old_val, new_val in changes
+    ])
+
+
+def bulk_update_post_status(
+    db: Session,
+    admin_id: str,
+    ids: List[int],
+    action: str,
+    reason: Optional[str] = None,
+    ip_addr: Optional[str] = None,
+) -> List[Dict]:
+    """
+    게시글 일괄 숨김/표시/삭제
+
+    삭제된 게시글과 이미 목표 상태인 게시글은 건너뜁니다. 호출한 세션의 트랜잭션에서 실행되며
+    커밋은 호출 측에서 합니다.
+
+    Returns:
+        요청 순서대로의 id별 처리 결과
+    """
+    new_stts, act_typ, label = POST_STATUS_ACTIONS[action]
+    ids = list(dict.fromkeys(ids))
+    current = _lock_targets(db, "bbs_posts", "stts::text, ttl, cn", ids)
+
+    results = []
+    changed: List[int] = []
+    for post_id in ids:
+        if post_id not in current:
+            results.append(_result(post_id, OUTCOME_NOT_FOUND))
+        elif current[post_id][0] == "DELETED":
+            results.append(_result(post_id, OUTCOME_SKIPPED, "삭제된 게시글입니다"))
+        elif current[post_id][0] == new_stts:
+            results.append(_result(post_id, OUTCOME_SKIPPED, f"이미 {new_stts} 상태입니다"))
+        else:
+            results.append(_result(post_id, OUTCOME_UPDATED))
+            changed.append(post_id)
+
+    if not changed:
+        return results
+
+    db.execute(
+        text("UPDATE bbs_posts SET stts = CAST(:stts AS post_status), upd_dt = CURRENT_TIMESTAMP WHERE id = ANY(:ids)"),
+        {"stts": new_stts, "ids": changed}
+    )
+
+    change_typ = ChangeType.DELETE if action == ACTION_DELETE else ChangeType.UPDATE
+    db.execute(insert(BbsPostHistory), [
+        {
+            "post_id": post_id,
+            "user_id": admin_id,
+            "prev_ttl": current[post_id][1],
+            "prev_cn": current[post_id][2] if action == ACTION_DELETE else None,
+            "change_typ": change_typ,
+            "change_rsn": reason or f"관리자 일괄 {label}",
+        }
+        for post_id in changed
+    ])
+    _write_logs(db, admin_id, act_typ, "POST", "게시글", [
+        (post_id, {"status": current[post_id][0]}, {"status": new_stts}) for post_id in changed
+    ], ip_addr)
+    return results
+
+
+def bulk_move_posts(
+    db: Session,
+    admin_id: str,
+    ids: List[int],
+    target_board_id: int,
+    reason: Optional[str] = None,
+    ip_addr: Optional[str] = None,
+) -> List[Dict]:
+    """
+    게시글 일괄 게시판 이동
+
+    카테고리는 게시판에 속하므로 이동한 게시글의 카테고리는 해제합니다.
+    게시판별 게시글 수(post_count)도 같은 트랜잭션에서 옮깁니다.
+    """
+    ids = list(dict.fromkeys(ids))
+    current = _lock_targets(db, "bbs_posts", "stts::text, board_id, category_id, ttl", ids)
+
+    results = []
+    changed: List[int] = []
+    for post_id in ids:
+        if post_id not in current:
+            results.append(_result(post_id, OUTCOME_NOT_FOUND))
+        elif current[post_id][0] == "DELETED":
+            results.append(_result(post_id, OUTCOME_SKIPPED, "삭제된 게시글입니다"))
+        elif current[post_id][1] == target_board_id:
+            results.append(_result(post_id, OUTCOME_SKIPPED, "이미 대상 게시판의 게시글입니다"))
+        else:
+            results.append(_result(post_id, OUTCOME_UPDATED))
+            changed.append(post_id)
+
+    if not changed:
+        return results
+
+    db.execute(text("""
+        UPDATE bbs_posts
+        SET board_id = :board_id, category_id = NULL, upd_dt = CURRENT_TIMESTAMP
+        WHERE id = ANY(:ids)
+    """), {"board_id": target_board_id, "ids": changed})
+
+    # 게시글 수 이동 (원래 게시판/카테고리 감소, 대상 게시판 증가)
+    moved_from_boards = Counter(current[post_id][1] for post_id in changed)
+    moved_from_categories = Counter(current[post_id][2] for post_id in changed if current[post_id][2] is not None)
+    db.execute(text("""
+        UPDATE bbs_boards b
+        SET post_count = GREATEST(b.post_count - d.cnt, 0)
+        FROM unnest(CAST(:board_ids AS BIGINT[]), CAST(:cnts AS INT[])) AS d(board_id, cnt)
+        WHERE b.id = d.board_id
+    """), {"board_ids": list(moved_from_boards), "cnts": list(moved_from_boards.values())})
+    if moved_from_categories:
+        db.execute(text("""
+            UPDATE bbs_categories c
+            SET post_count = GREATEST(c.post_count - d.cnt, 0)
+            FROM unnest(CAST(:category_ids AS BIGINT[]), CAST(:cnts AS INT[])) AS d(category_id, cnt)
+            WHERE c.id = d.category_id
+        """), {"category_ids": list(moved_from_categories), "cnts": list(moved_from_categories.values())})
+    db.execute(
+        text("UPDATE bbs_boards SET post_count = post_count + :cnt WHERE id = :board_id"),
+        {"cnt": len(changed), "board_id": target_board_id}
+    )
+    # 관련 게시글은 게시판 안에서만 찾으므로 이동한 게시글은 다시 계산
+    enqueue_related_refresh(db, changed)
+
+    db.execute(insert(BbsPostHistory), [
+        {
+            "post_id": post_id,
+            "user_id": admin_id,
+            "prev_ttl": current[post_id][3],
+            "change_typ": ChangeType.UPDATE,
+            "change_rsn": reason or f"관리자 일괄 이동 (게시판 #{current[post_id][1]} -> #{target_board_id})",
+        }
+        for post_id in changed
+    ])
+    _write_logs(db, admin_id, AdminActionType.POST_MOVE, "POST", "게시글", [
+        (post_id, {"board_id": current[post_id][1], "category_id": current[post_id][2]}, {"board_id": target_board_id})
+        for post_id in changed
+    ], ip_addr)
+    return results
+
+
+def bulk_update_comment_status(
+    db: Session,
+    admin_id: str,
+    ids: List[int],
+    action: str,
+    ip_addr: Optional[str] = None,
+) -> List[Dict]:
+    """댓글 일괄 숨김/표시/삭제 (삭제된 댓글과 이미 목표 상태인 댓글은 건너뜀)"""
+    new_stts, act_typ, label = COMMENT_STATUS_ACTIONS[action]
+    ids = list(dict.fromkeys(ids))
+    current = _lock_targets(db, "bbs_comments", "stts::text", ids)
+
+    results = []
+    changed: List[int] = []
+    for comment_id in ids:
+        if comment_id not in current:
+            results.append(_result(comment_id, OUTCOME_NOT_FOUND))
+        elif current[comment_id][0] == "DELETED":
+            results.append(_result(comment_id, OUTCOME_SKIPPED, "삭제된 댓글입니다"))
+        elif current[comment_id][0] == new_stts:
+            results.append(_result(comment_id, OUTCOME_SKIPPED, f"이미 {new_stts} 상태입니다"))
+        else:
+            results.append(_result(comment_id, OUTCOME_UPDATED))
+            changed.append(comment_id)
+
+    if not changed:
+        return results
+
+    db.execute(
+        text("UPDATE bbs_comments SET stts = CAST(:stts AS comment_status), upd_dt = CURRENT_TIMESTAMP WHERE id = ANY(:ids)"),
+        {"stts": new_stts, "ids": changed}
+    )
+    _write_logs(db, admin_id, act_typ, "COMMENT", "댓글", [
+        (comment_id, {"status": current[comment_id][0]}, {"status": new_stts}) for comment_id in changed
+    ], ip_addr)
+    return results
@@ -0,0 +1,564 @@
+"""알림 생성 엔진 (요청 밖에서 배치 처리하는 fan-out 디스패처)"""
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
+import asyncio
+import json
+import logging
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.core.pubsub import notification_hub, BROADCAST
+from app.database import engine
+from app.models.board import BbsNotification, BbsNotificationCounter, NotificationType
+
+logger = logging.getLogger(__name__)
+
+# 이벤트 종류
+EVENT_COMMENT = "COMMENT"
+EVENT_LIKE = "LIKE"
+EVENT_FOLLOW = "FOLLOW"
+EVENT_NEW_POST = "NEW_POST"
+EVENT_ADMIN_NOTICE = "ADMIN_NOTICE"
+
+# 병합된 알림의 metadata에 보관하는 최근 행위자 수
+MAX_ACTOR_IDS = 10
+
+# 구독자에게 전달하는 메시지 (수신 측에서 읽지 않은 수와 새 알림을 조회)
+NEW_NOTIFICATION_MESSAGE = {"type": "notification"}
+COUNT_CHANGED_MESSAGE = {"type": "unread_count"}
+
+# 읽지 않은 알림 수 증가 (행이 없으면 생성)
+INCREMENT_UNREAD_SQL = """
+    INSERT INTO bbs_notification_counters (user_id, unread_cnt, upd_dt)
+    VALUES (:user_id, :cnt, CURRENT_TIMESTAMP)
+    ON CONFLICT (user_id) DO UPDATE
+    SET unread_cnt = bbs_notification_counters.unread_cnt + EXCLUDED.unread_cnt,
+        upd_dt = EXCLUDED.upd_dt
+"""
+
+
+@dataclass
+class NotificationEvent:
+    """알림 생성 요청 이벤트 (수신자 결정은 백그라운드에서 수행)"""
+    kind: str
+    actor_id: Optional[str] = None
+    recipient_id: Optional[str] = None
+    post_id: Optional[int] = None
+    comment_id: Optional[int] = None
+    parent_comment_id: Optional[int] = None
+    board_id: Optional[int] = None
+    ttl: Optional[str] = None
+    msg: Optional[str] = None
+    crt_dt: datetime = field(default_factory=datetime.now)
+
+
+class NotificationDispatcher:
+    """
+    알림 디스패처
+
+    요청 경로에서는 이벤트를 메모리 큐에 넣기만 하고, 백그라운드 태스크가
+    flush_interval 동안 모인 이벤트를 수신자별로 병합해 한 번에 기록합니다.
+    """
+
+    def __init__(self, max_size: int, flush_interval: float):
+        self.max_size = max_size
+        self.flush_interval = flush_interval
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 큐에서 꺼냈지만 아직 처리하지 않은 이벤트 (종료 시 유실 방지)
+        self._pending: List[NotificationEvent] = []
+        self.counters: Dict[str, int] = {
+            "emitted": 0,
+            "dropped": 0,
+            "processed": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+
+    @property
+    def running(self) -> bool:
+        """백그라운드 태스크 동작 여부"""
+        return self._task is not None and not self._task.done()
+
+    def qsize(self) -> int:
+        """현재 큐에 대기 중인 이벤트 수"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def stats(self) -> Dict[str, Any]:
+        """디스패처 상태 및 카운터"""
+        return {
+            "running": self.running,
+            "queue_size": self.qsize(),
+            "queue_max_size": self.max_size,
+            **self.counters,
+        }
+
+    async def start(self) -> None:
+        """백그라운드 처리 태스크 시작"""
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(self._run(), name="notification-dispatcher")
+
+    async def stop(self) -> None:
+        """백그라운드 태스크 중지 (남은 이벤트는 모두 처리)"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+        remaining, self._pending = self._pending, []
+        while self._queue is not None and not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        await self._process(remaining)
+
+    def emit(self, event: NotificationEvent) -> bool:
+        """
+        알림 이벤트 추가 (블로킹 없음)
+
+        Returns:
+            큐에 추가되었으면 True, 디스패처가 중지되었거나 큐가 가득 차면 False
+        """
+        if not self.running:
+            self.counters["dropped"] += 1
+            return False
+        try:
+            self._queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.counters["dropped"] += 1
+            return False
+        self.counters["emitted"] += 1
+        return True
+
+    async def _run(self) -> None:
+        """flush_interval 동안 이벤트를 모아 처리하는 루프"""
+        loop = asyncio.get_running_loop()
+        while True:
+            self._pending.append(await self._queue.get())
+            deadline = loop.time() + self.flush_interval
+
+            while True:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    self._pending.append(await asyncio.wait_for(self._queue.get(), timeout=timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            events, self._pending = self._pending, []
+            await self._process(events)
+
+    async def _process(self, events: List[NotificationEvent]) -> None:
+        """이벤트 묶음을 스레드풀에서 처리"""
+        if not events:
+            return
+        try:
+            await asyncio.to_thread(process_notification_events, events)
+            self.counters["processed"] += len(events)
+            self.counters["batches"] += 1
+        except Exception as e:
+            self.counters["failed"] += len(events)
+            logger.error(f"알림 처리 실패 ({len(events)}건): {type(e).__name__}: {str(e)}")
+
+
+def process_notification_events(events: List[NotificationEvent]) -> None:
+    """이벤트 종류별 처리 (개인 알림은 병합 후 일괄 기록, 대량 알림은 집합 단위 INSERT)"""
+    direct = [event for event in events if event.kind in (EVENT_COMMENT, EVENT_LIKE, EVENT_FOLLOW)]
+    if direct:
+        with engine.begin() as conn:
+            recipients = _write_direct_notifications(conn, direct)
+        notification_hub.publish(recipients, NEW_NOTIFICATION_MESSAGE)
+
+    for event in events:
+        if event.kind == EVENT_NEW_POST:
+            fan_out_board_followers(event)
+        elif event.kind == EVENT_ADMIN_NOTICE:
+            fan_out_admin_notice(event)
+
+
+def _write_direct_notifications(conn: Connection, events: List[NotificationEvent]) -> List[str]:
+    """
+    댓글/좋아요/팔로우 알림 기록
+
+    같은 수신자·유형·게시글에 대한 이벤트는 하나로 병합하고, 최근 병합 대상(읽지 않은 알림)이
+    이미 있으면 새로 만들지 않고 갱신합니다. (예: "홍길동님 외 11명이 회원님의 게시글을 좋아합니다")
+
+    Returns:
+        알림이 생성/갱신된 수신자 ID 목록
+    """
+    post_ids = list({event.post_id for event in events if event.post_id})
+    parent_ids = list({event.parent_comment_id for event in events if event.parent_comment_id})
+
+    posts: Dict[int, Tuple[str, str]] = {}
+    if post_ids:
+        rows = conn.execute(
+            text("SELECT id, user_id, ttl FROM bbs_posts WHERE id = ANY(:ids)"),
+            {"ids": post_ids}
+        ).all()
+        posts = {row[0]: (row[1], row[2]) for row in rows}
+
+    parent_authors: Dict[int, str] = {}
+    if parent_ids:
+        rows = conn.execute(
+            text("SELECT id, user_id FROM bbs_comments WHERE id = ANY(:ids)"),
+            {"ids": parent_ids}
+        ).all()
+        parent_authors = {row[0]: row[1] for row in rows}
+
+    # (수신자, 알림 유형, 게시글 ID) 단위로 행위자 모으기
+    groups: Dict[Tuple[str, str, Optional[int]], Dict[str, Any]] = {}
+
+    def add(recipient_id: Optional[str], typ: NotificationType, event: NotificationEvent) -> None:
+        if not recipient_id or recipient_id == event.actor_id:
+            return
+        key = (recipient_id, typ.value, event.post_id if typ != NotificationType.NEW_FOLLOW else None)
+        group = groups.setdefault(key, {"actor_ids": [], "comment_id": None})
+        if event.actor_id in group["actor_ids"]:
+            group["actor_ids"].remove(event.actor_id)
+        group["actor_ids"].append(event.actor_id)
+        if event.comment_id:
+            group["comment_id"] = event.comment_id
+
+    for event in events:
+        if event.kind == EVENT_FOLLOW:
+            add(event.recipient_id, NotificationType.NEW_FOLLOW, event)
+            continue
+        post = posts.get(event.post_id)
+        if not post:
+            continue
+        if event.kind == EVENT_LIKE:
+            add(post[0], NotificationType.NEW_LIKE, event)
+        elif event.kind == EVENT_COMMENT:
+            add(post[0], NotificationType.NEW_COMMENT, event)
+            if event.parent_comment_id and parent_authors.get(event.parent_comment_id) != post[0]:
+                add(parent_authors.get(event.parent_comment_id), NotificationType.NEW_COMMENT, event)
+
+    if not groups:
+        return []
+
+    actor_ids = list({actor_id for group in groups.values() for actor_id in group["actor_ids"]})
+    rows = conn.execute(
+        text("SELECT user_id, nickname FROM common_user WHERE user_id = ANY(:ids)"),
+        {"ids": actor_ids}
+    ).all()
+    nicknames = {row[0]: row[1] or row[0] for row in rows}
+
+    # 병합 대상 기존 알림 조회 (같은 키의 읽지 않은 최근 알림)
+    keys = list(groups.keys())
+    rows = conn.execute(text("""
+        SELECT DISTINCT ON (n.user_id, n.typ, COALESCE(n.related_post_id, 0))
+               n.id, n.user_id, n.typ::text, n.related_post_id, n.metadata
+        FROM bbs_notifications n
+        JOIN (
+            SELECT unnest(CAST(:user_ids AS varchar[])) AS user_id,
+                   unnest(CAST(:typs AS text[])) AS typ,
+                   unnest(CAST(:post_ids AS bigint[])) AS post_id
+        ) k ON n.user_id = k.user_id
+           AND n.typ::text = k.typ
+           AND COALESCE(n.related_post_id, 0) = COALESCE(k.post_id, 0)
+        WHERE n.is_read = FALSE
+          AND n.crt_dt >= CURRENT_TIMESTAMP - make_interval(secs => :window)
+        ORDER BY n.user_id, n.typ, COALESCE(n.related_post_id, 0), n.crt_dt DESC
+    """), {
+        "user_ids": [key[0] for key in keys],
+        "typs": [key[1] for key in keys],
+        "post_ids": [key[2] for key in keys],
+        "window": settings.notification_coalesce_window,
+    }).all()
+    existing = {(row[1], row[2], row[3]): (row[0], row[4] or {}) for row in rows}
+
+    now = datetime.now()
+    inserts: List[Dict[str, Any]] = []
+    updates: List[Dict[str, Any]] = []
+    for key, group in groups.items():
+        recipient_id, typ, post_id = key
+        new_actor_ids = group["actor_ids"]
+        previous = existing.get(key)
+
+        if previous:
+            old_metadata = previous[1]
+            old_actor_ids = old_metadata.get("actor_ids", [])
+            added = [actor_id for actor_id in new_actor_ids if actor_id not in old_actor_ids]
+            count = int(old_metadata.get("count", len(old_actor_ids))) + len(added)
+            merged_actor_ids = ([a for a in old_actor_ids if a not in new_actor_ids] + new_actor_ids)[-MAX_ACTOR_IDS:]
+        else:
+            count = len(new_actor_ids)
+            merged_actor_ids = new_actor_ids[-MAX_ACTOR_IDS:]
+
+        latest_actor_id = new_actor_ids[-1]
+        ttl, msg = _render_message(
+            NotificationType(typ),
+            nicknames.get(latest_actor_id, latest_actor_id),
+            count,
+            posts.get(post_id, (None, None))[1]
+        )
+        metadata = {"count": count, "actor_ids": merged_actor_ids}
+
+        if previous:
+            updates.append({
+                "id": previous[0],
+                "ttl": ttl,
+                "msg": msg,
+                "related_comment_id": group["comment_id"],
+                "related_user_id": latest_actor_id,
+                "metadata": json.dumps(metadata),
+            })
+        else:
+            inserts.append({
+                "user_id": recipient_id,
+                "typ": NotificationType(typ),
+                "ttl": ttl,
+                "msg": msg,
+                "is_read": False,
+                "related_post_id": post_id,
+                "related_comment_id": group["comment_id"],
+                "related_user_id": latest_actor_id,
+                "metadata": metadata,
+                "crt_dt": now,
+            })
+
+    if updates:
+        conn.execute(text("""
+            UPDATE bbs_notifications
+            SET ttl = :ttl,
+                msg = :msg,
+                related_comment_id = COALESCE(:related_comment_id, related_comment_id),
+                related_user_id = :related_user_id,
+                metadata = CAST(:metadata AS jsonb),
+                crt_dt = CURRENT_TIMESTAMP
+            WHERE id = :id
+        """), updates)
+    if inserts:
+        conn.execute(insert(BbsNotification.__table__), inserts)
+
+        # 새로 생성된 알림만 읽지 않은 수에 반영 (병합 갱신은 수 변화 없음)
+        increments: Dict[str, int] = {}
+        for row in inserts:
+            increments[row["user_id"]] = increments.get(row["user_id"], 0) + 1
+        conn.execute(
+            text(INCREMENT_UNREAD_SQL),
+            [{"user_id": user_id, "cnt": cnt} for user_id, cnt in increments.items()]
+        )
+
+    return [key[0] for key in groups]
+
+
+def _render_message(typ: NotificationType, actor_nickname: str, count: int, post_ttl: Optional[str]) -> Tuple[str, str]:
+    """알림 제목/메시지 생성 (병합된 경우 '외 N명' 표기)"""
+    actors = f"{actor_nickname}님" if count <= 1 else f"{actor_nickname}님 외 {count - 1}명"
+    if typ == NotificationType.NEW_LIKE:
+        return "새 좋아요", f"{actors}이 회원님의 게시글 '{post_ttl}'을(를) 좋아합니다."
+    if typ == NotificationType.NEW_COMMENT:
+        return "새 댓글", f"{actors}이 '{post_ttl}'에 댓글을 남겼습니다."
+    return "새 팔로워", f"{actors}이 회원님을 팔로우합니다."
+
+
+def fan_out_board_followers(event: NotificationEvent) -> int:
+    """
+    게시판 팔로워에게 새 게시글 알림 일괄 생성
+
+    팔로워를 NOTIFICATION_FANOUT_BATCH_SIZE명씩 INSERT ... SELECT로 기록하며,
+    배치마다 별도 트랜잭션으로 커밋해 긴 잠금을 피합니다.
+    """
+    board_nm = None
+    with engine.connect() as conn:
+        board_nm = conn.execute(
+            text("SELECT nm FROM bbs_boards WHERE id = :board_id"),
+            {"board_id": event.board_id}
+        ).scalar()
+
+    return _fan_out(
+        """
+        WITH batch AS (
+            SELECT f.id AS cursor, f.follower_id AS user_id
+            FROM bbs_follows f
+            WHERE f.board_id = :board_id
+              AND f.follower_id <> :actor_id
+              AND f.id > :cursor
+            ORDER BY f.id
+            LIMIT :batch_size
+        ), ins AS (
+            INSERT INTO bbs_notifications (user_id, typ, ttl, msg, is_read, related_post_id, related_user_id, metadata, crt_dt)
+            SELECT user_id, 'NEW_POST', :ttl, :msg, FALSE, :post_id, :actor_id, CAST(:metadata AS jsonb), CURRENT_TIMESTAMP
+            FROM batch
+        ), cnt AS (
+            INSERT INTO bbs_notification_counters (user_id, unread_cnt, upd_dt)
+            SELECT DISTINCT user_id, 1, CURRENT_TIMESTAMP FROM batch
+            ON CONFLICT (user_id) DO UPDATE
+            SET unread_cnt = bbs_notification_counters.unread_cnt + 1,
+                upd_dt = EXCLUDED.upd_dt
+        )
+        SELECT MAX(cursor), COUNT(*), array_agg(user_id) FROM batch
+        """,
+        {
+            "board_id": event.board_id,
+            "actor_id": event.actor_id,
+            "post_id": event.post_id,
+            "ttl": "새 게시글",
+            "msg": f"팔로우한 게시판 '{board_nm}'에 새 게시글 '{event.ttl}'이(가) 등록되었습니다.",
+            "metadata": json.dumps({"board_id": event.board_id}),
+        },
+        initial_cursor=0,
+    )
+
+
+def fan_out_admin_notice(event: NotificationEvent) -> int:
+    """전체 활성 사용자에게 관리자 공지 알림 일괄 생성 (사용자 ID 순 키셋 배치)"""
+    return _fan_out(
+        """
+        WITH batch AS (
+            SELECT u.user_id AS cursor, u.user_id
+            FROM common_user u
+            WHERE u.del_yn = FALSE
+              AND u.actv_yn = TRUE
+              AND u.user_id > :cursor
+            ORDER BY u.user_id
+            LIMIT :batch_size
+        ), ins AS (
+            INSERT INTO bbs_notifications (user_id, typ, ttl, msg, is_read, related_user_id, metadata, crt_dt)
+            SELECT user_id, 'ADMIN_NOTICE', :ttl, :msg, FALSE, :actor_id, CAST(:metadata AS jsonb), CURRENT_TIMESTAMP
+            FROM batch
+        ), cnt AS (
+            INSERT INTO bbs_notification_counters (user_id, unread_cnt, upd_dt)
+            SELECT user_id, 1, CURRENT_TIMESTAMP FROM batch
+            ON CONFLICT (user_id) DO UPDATE
+            SET unread_cnt = bbs_notification_counters.unread_cnt + 1,
+                upd_dt = EXCLUDED.upd_dt
+        )
+        SELECT MAX(cursor), COUNT(*), NULL FROM batch
+        """,
+        {
+            "actor_id": event.actor_id,
+            "ttl": event.ttl,
+            "msg": event.msg,
+            "metadata": json.dumps({"notice": True}),
+        },
+        initial_cursor="",
+        publish_to=BROADCAST,
+    )
+
+
+def _fan_out(statement: str, params: Dict[str, Any], initial_cursor: Any, publish_to: Optional[str] = None) -> int:
+    """
+    키셋 커서로 배치를 나눠 INSERT ... SELECT 반복 실행
+
+    배치마다 수신자에게 푸시하며, publish_to=BROADCAST이면 모든 배치가 끝난 뒤 한 번만 푸시합니다.
+    """
+    total = 0
+    cursor = initial_cursor
+    batch_size = settings.notification_fanout_batch_size
+    while True:
+        with engine.begin() as conn:
+            last_cursor, count, user_ids = conn.execute(
+                text(statement),
+                {**params, "cursor": cursor, "batch_size": batch_size}
+            ).one()
+        total += count
+        if user_ids and publish_to is None:
+            notification_hub.publish(user_ids, NEW_NOTIFICATION_MESSAGE)
+        if count < batch_size:
+            break
+        cursor = last_cursor
+
+    if publish_to == BROADCAST and total:
+        notification_hub.publish(BROADCAST, NEW_NOTIFICATION_MESSAGE)
+    return total
+
+
+def get_unread_count(db: Session, user_id: str) -> int:
+    """읽지 않은 알림 수 (카운터 행이 없으면 0)"""
+    unread_cnt = db.query(BbsNotificationCounter.unread_cnt).filter(
+        BbsNotificationCounter.user_id == user_id
+    ).scalar()
+    return max(int(unread_cnt or 0), 0)
+
+
+def decrement_unread_count(db: Session, user_id: str, cnt: int = 1) -> None:
+    """읽지 않은 알림 수 감소 (호출한 세션의 트랜잭션에 포함)"""
+    if cnt <= 0:
+        return
+    db.execute(text("""
+        UPDATE bbs_notification_counters
+        SET unread_cnt = GREATEST(unread_cnt - :cnt, 0),
+            upd_dt = CURRENT_TIMESTAMP
+        WHERE user_id = :user_id
+    """), {"user_id": user_id, "cnt": cnt})
+
+
+def read_notification(db: Session, user_id: str, notification_id: int) -> bool:
+    """
+    알림 하나를 읽음 처리하고 카운터 감소 (실제로 바뀐 경우만, 호출한 세션의 트랜잭션에 포함)
+
+    조건부 UPDATE로 처리해 같은 알림을 동시에 읽음 처리해도 카운터는 한 번만 줄어듭니다.
+    """
+    updated = db.execute(text("""
+        UPDATE bbs_notifications
+        SET is_read = TRUE
+        WHERE id = :id AND user_id = :user_id AND is_read = FALSE
+        RETURNING id
+    """), {"id": notification_id, "user_id": user_id}).first()
+    if updated is None:
+        return False
+    decrement_unread_count(db, user_id)
+    return True
+
+
+def read_all_notifications(db: Session, user_id: str) -> int:
+    """
+    모든 알림을 읽음 처리하고 바뀐 건수만큼 카운터 감소 (호출한 세션의 트랜잭션에 포함)
+
+    카운터를 0으로 초기화하지 않으므로 그 사이 발송기가 추가한 알림의 카운트가 사라지지 않습니다.
+    """
+    updated = db.execute(text("""
+        UPDATE bbs_notifications
+        SET is_read = TRUE
+        WHERE user_id = :user_id AND is_read = FALSE
+    """), {"user_id": user_id}).rowcount
+    decrement_unread_count(db, user_id, updated)
+    return updated
+
+
+def reconcile_unread_counters() -> dict:
+    """
+    카운터와 실제 읽지 않은 알림 수 보정 (스케줄러에서 주기적으로 실행)
+
+    게시글/댓글 삭제로 알림이 연쇄 삭제되는 경우처럼 카운터를 거치지 않는 변경을 바로잡습니다.
+    """
+    with engine.begin() as conn:
+        corrected = conn.execute(text("""
+            WITH actual AS (
+                SELECT user_id, COUNT(*) AS cnt
+                FROM bbs_notifications
+                WHERE is_read = FALSE
+                GROUP BY user_id
+            ), merged AS (
+                SELECT COALESCE(a.user_id, c.user_id) AS user_id, COALESCE(a.cnt, 0) AS cnt
+                FROM actual a
+                FULL OUTER JOIN bbs_notification_counters c ON c.user_id = a.user_id
+                WHERE c.user_id IS NULL OR c.unread_cnt <> COALESCE(a.cnt, 0)
+            )
+            INSERT INTO bbs_notification_counters (user_id, unread_cnt, upd_dt)
+            SELECT user_id, cnt, CURRENT_TIMESTAMP FROM merged
+            ON CONFLICT (user_id) DO UPDATE
+            SET unread_cnt = EXCLUDED.unread_cnt,
+                upd_dt = EXCLUDED.upd_dt
+        """)).rowcount
+
+    if corrected:
+        logger.info(f"읽지 않은 알림 카운터 {corrected}건 보정")
+    return {"corrected": corrected}
+
+
+# 애플리케이션 전역 알림 디스패처
+notification_dispatcher = NotificationDispatcher(
+    max_size=settings.notification_queue_size,
+    flush_interval=settings.notification_flush_interval,
+)
@@ -0,0 +1,248 @@
+"""사용자별 실시간 메시지 허브 (SSE 푸시용 pub/sub)"""
+from typing import Any, Callable, Dict, List, Optional, Set
+import asyncio
+import json
+import logging
+import select
+import threading
+from sqlalchemy import text
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 모든 접속 사용자를 대상으로 하는 메시지
+BROADCAST = "*"
+
+# PostgreSQL NOTIFY payload 최대 크기(8000 bytes)보다 작게 유지
+MAX_NOTIFY_PAYLOAD_BYTES = 7000
+
+
+class MessageHub:
+    """
+    프로세스 내 pub/sub 허브
+
+    SSE 연결마다 asyncio.Queue를 구독자로 등록하고, 메시지의 대상 사용자에게만 전달합니다.
+    실제 발행 경로는 백엔드가 담당합니다.
+    - memory: 같은 프로세스의 구독자에게 바로 전달 (단일 워커)
+    - postgres: pg_notify로 발행하고 LISTEN 스레드가 받아 전달 (다중 워커)
+    """
+
+    def __init__(self, backend: str, channel: str, subscriber_queue_size: int = 100):
+        self.backend = backend
+        self.channel = channel
+        self.subscriber_queue_size = subscriber_queue_size
+        self._subscribers: Dict[str, Set[asyncio.Queue]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._listener: Optional["PgListener"] = None
+        self.counters: Dict[str, int] = {"published": 0, "delivered": 0, "dropped": 0}
+
+    def subscriber_count(self) -> int:
+        """현재 구독 중인 연결 수"""
+        return sum(len(queues) for queues in self._subscribers.values())
+
+    def stats(self) -> Dict[str, Any]:
+        """허브 상태 및 카운터"""
+        return {
+            "backend": self.backend,
+            "users": len(self._subscribers),
+            "subscribers": self.subscriber_count(),
+            "listener_running": self._listener.running if self._listener else None,
+            **self.counters,
+        }
+
+    async def start(self) -> None:
+        """허브 시작 (postgres 백엔드는 LISTEN 스레드 시작)"""
+        self._loop = asyncio.get_running_loop()
+        if self.backend == "postgres" and self._listener is None:
+            self._listener = PgListener(self._loop)
+            self._listener.add_channel(self.channel, self._on_payload)
+            self._listener.start()
+
+    async def stop(self) -> None:
+        """허브 중지"""
+        if self._listener is not None:
+            await asyncio.to_thread(self._listener.stop)
+            self._listener = None
+
+    def subscribe(self, user_id: str) -> asyncio.Queue:
+        """사용자 메시지 구독 등록"""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.subscriber_queue_size)
+        self._subscribers.setdefault(user_id, set()).add(queue)
+        return queue
+
+    def unsubscribe(self, user_id: str, queue: asyncio.Queue) -> None:
+        """구독 해제"""
+        queues = self._subscribers.get(user_id)
+        if queues is None:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._subscribers[user_id]
+
+    def publish(self, user_ids: Any, message: Dict[str, Any]) -> None:
+        """
+        메시지 발행 (어느 스레드에서나 호출 가능)
+
+        Args:
+            user_ids: 대상 사용자 ID 목록 또는 BROADCAST
+            message: 전달할 메시지 (JSON 직렬화 가능해야 함)
+        """
+        if user_ids != BROADCAST:
+            user_ids = list(dict.fromkeys(user_ids))
+            if not user_ids:
+                return
+        self.counters["published"] += 1
+
+        if self.backend == "postgres":
+            for payload in _notify_payloads(user_ids, message):
+                with engine.begin() as conn:
+                    conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": self.channel, "payload": payload})
+            return
+
+        if self._loop is None:
+            return
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            self._deliver(user_ids, message)
+        else:
+            self._loop.call_soon_threadsafe(self._deliver, user_ids, message)
+
+    def _on_payload(self, payload: str) -> None:
+        """LISTEN으로 받은 payload 처리 (이벤트 루프에서 실행)"""
+        try:
+            data = json.loads(payload)
+        except ValueError:
+            logger.warning(f"잘못된 알림 payload 무시: {payload[:100]}")
+            return
+        self._deliver(data.get("users", []), data.get("message", {}))
+
+    def _deliver(self, user_ids: Any, message: Dict[str, Any]) -> None:
+        """이 프로세스의 구독자에게 전달 (이벤트 루프에서 실행)"""
+        if user_ids == BROADCAST:
+            targets = list(self._subscribers.values())
+        else:
+            targets = [self._subscribers[user_id] for user_id in user_ids if user_id in self._subscribers]
+
+        for queues in targets:
+            for queue in list(queues):
+                try:
+                    queue.put_nowait(message)
+                    self.counters["delivered"] += 1
+                except asyncio.QueueFull:
+                    # 느린 클라이언트는 메시지를 건너뜀 (다음 메시지에서 최신 상태를 다시 조회)
+                    self.counters["dropped"] += 1
+
+
+def _notify_payloads(user_ids: Any, message: Dict[str, Any]) -> List[str]:
+    """NOTIFY payload 크기 제한에 맞게 대상 사용자 목록을 나눠 직렬화"""
+    if user_ids == BROADCAST:
+        return [json.dumps({"users": BROADCAST, "message": message}, default=str)]
+
+    payloads = []
+    chunk: List[str] = []
+    for user_id in user_ids:
+        candidate = json.dumps({"users": chunk + [user_id], "message": message}, default=str)
+        if chunk and len(candidate.encode("utf-8")) > MAX_NOTIFY_PAYLOAD_BYTES:
+            payloads.append(json.dumps({"users": chunk, "message": message}, default=str))
+            chunk = [user_id]
+        else:
+            chunk.append(user_id)
+    if chunk:
+        payloads.append(json.dumps({"users": chunk, "message": message}, default=str))
+    return payloads
+
+
+class PgListener:
+    """
+    PostgreSQL LISTEN 스레드
+
+    커넥션 풀과 별도의 전용 커넥션으로 채널을 구독하고, 수신한 payload를
+    이벤트 루프의 콜백으로 넘깁니다. 연결이 끊기면 재접속하며, 연결(재접속 포함)할 때마다
+    연결 콜백을 호출해 끊긴 동안 놓친 알림을 보정할 수 있게 합니다.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, poll_timeout: float = 1.0, reconnect_delay: float = 3.0):
+        self.loop = loop
+        self.poll_timeout = poll_timeout
+        self.reconnect_delay = reconnect_delay
+        self._channels: Dict[str, List[Callable[[str], None]]] = {}
+        self._connect_callbacks: List[Callable[[], None]] = []
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        """LISTEN 스레드 동작 여부"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def add_channel(self, channel: str, callback: Callable[[str], None]) -> None:
+        """채널과 수신 콜백 등록 (start 전에 호출)"""
+        self._channels.setdefault(channel, []).append(callback)
+
+    def add_connect_callback(self, callback: Callable[[], None]) -> None:
+        """LISTEN 연결 시마다 이벤트 루프에서 호출할 콜백 등록 (start 전에 호출)"""
+        self._connect_callbacks.append(callback)
+
+    def start(self) -> None:
+        """LISTEN 스레드 시작"""
+        if self.running:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="pg-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """LISTEN 스레드 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout * 2 + 1)
+            self._thread = None
+
+    def _connect(self):
+        """풀과 별도인 DBAPI 커넥션 생성 후 채널 LISTEN"""
+        args, kwargs = engine.dialect.create_connect_args(engine.url)
+        conn = engine.dialect.dbapi.connect(*args, **kwargs)
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            for channel in self._channels:
+                cursor.execute(f'LISTEN "{channel}"')
+        return conn
+
+    def _run(self) -> None:
+        """수신 루프 (연결 오류 시 재접속)"""
+        while not self._stop_event.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                logger.info(f"PostgreSQL LISTEN 시작: {list(self._channels)}")
+                for callback in self._connect_callbacks:
+                    self.loop.call_soon_threadsafe(callback)
+                while not self._stop_event.is_set():
+                    readable, _, _ = select.select([conn], [], [], self.poll_timeout)
+                    if not readable:
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        notify = conn.notifies.pop(0)
+                        for callback in self._channels.get(notify.channel, []):
+                            self.loop.call_soon_threadsafe(callback, notify.payload)
+            except Exception as e:
+                logger.error(f"PostgreSQL LISTEN 연결 오류: {type(e).__name__}: {str(e)}")
+                self._stop_event.wait(self.reconnect_delay)
+            finally:
+                if conn is not None:
+                    try:
+                        conn.close()
+                    except Exception:
+                        pass
+
+
+# 알림 푸시용 전역 허브
+notification_hub = MessageHub(
+    backend=settings.notification_pubsub_backend,
+    channel=settings.notification_pubsub_channel,
+)
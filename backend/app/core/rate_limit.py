@@ -0,0 +1,257 @@
+"""사용자/IP별 요청 빈도 제한 (토큰 버킷, 메모리 또는 PostgreSQL UNLOGGED 테이블 백엔드)"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, Tuple
+import logging
+import math
+import re
+import threading
+import time
+from fastapi import Depends, HTTPException, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import text
+from app.core.config import settings
+from app.database import engine
+from app.dependencies import get_current_active_user
+from app.models.user import CommonUser
+
+logger = logging.getLogger(__name__)
+
+_PERIODS = {"s": 1, "second": 1, "m": 60, "minute": 60, "h": 3600, "hour": 3600, "d": 86400, "day": 86400}
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    빈도 제한 정책 (토큰 버킷)
+
+    limit개까지 연속 요청을 허용하고, 토큰은 period초에 limit개 비율로 채워집니다.
+    """
+    name: str
+    limit: int
+    period: float
+
+    @property
+    def rate(self) -> float:
+        """초당 충전되는 토큰 수"""
+        return self.limit / self.period
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimitPolicy":
+        """
+        "30/minute", "10/5m", "1000/day" 형식의 정책 문자열 파싱
+
+        Raises:
+            ValueError: 형식이 잘못된 경우
+        """
+        match = re.fullmatch(r"\s*([1-9][0-9]*)\s*/\s*([0-9]*)\s*([a-z]+)\s*", spec.lower())
+        if not match or match.group(3) not in _PERIODS:
+            raise ValueError(f"빈도 제한 정책 형식이 잘못되었습니다: {name}={spec} (예: 30/minute, 10/5m)")
+        multiplier = int(match.group(2)) if match.group(2) else 1
+        if multiplier <= 0:
+            raise ValueError(f"빈도 제한 정책 형식이 잘못되었습니다: {name}={spec} (예: 30/minute, 10/5m)")
+        return cls(name=name, limit=int(match.group(1)), period=float(multiplier * _PERIODS[match.group(3)]))
+
+
+@dataclass
+class RateLimitResult:
+    """토큰 차감 결과"""
+    allowed: bool
+    remaining: int
+    reset_after: float  # 버킷이 가득 차기까지 남은 시간 (초)
+    retry_after: float  # 거절된 경우 다음 토큰까지 남은 시간 (초)
+
+
+def _result(policy: RateLimitPolicy, allowed: bool, tokens: float) -> RateLimitResult:
+    return RateLimitResult(
+        allowed=allowed,
+        remaining=max(int(math.floor(tokens)), 0),
+        reset_after=max(policy.limit - tokens, 0.0) / policy.rate,
+        retry_after=0.0 if allowed else max(1.0 - tokens, 0.0) / policy.rate,
+    )
+
+
+class MemoryRateLimitBackend:
+    """
+    프로세스 내 토큰 버킷 (단일 워커용)
+
+    키 수가 max_keys를 넘으면 가장 오래 사용하지 않은 버킷부터 제거합니다.
+    제거된 버킷은 다음 요청 때 가득 찬 상태로 다시 만들어집니다.
+    """
+
+    blocking = False
+
+    def __init__(self, max_keys: int = 100000):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def hit(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at = self._buckets.get(key, (float(policy.limit), now))
+            tokens = min(float(policy.limit), tokens + (now - updated_at) * policy.rate)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return _result(policy, allowed, tokens)
+
+
+# 충전 후 토큰이 1개 이상일 때만 차감 (한 문장으로 원자적으로 처리, 거절 시 행을 반환하지 않음)
+HIT_SQL = text("""
+    INSERT INTO common_rate_limit_buckets AS b (bucket_key, tokens, upd_dt)
+    VALUES (:key, :limit - 1, clock_timestamp())
+    ON CONFLICT (bucket_key) DO UPDATE
+    SET tokens = LEAST(:limit, b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.upd_dt) * :rate) - 1,
+        upd_dt = clock_timestamp()
+    WHERE LEAST(:limit, b.tokens + EXTRACT(EPOCH FROM clock_timestamp() - b.upd_dt) * :rate) >= 1
+    RETURNING tokens
+""")
+
+PEEK_SQL = text("""
+    SELECT LEAST(:limit, tokens + EXTRACT(EPOCH FROM clock_timestamp() - upd_dt) * :rate)
+    FROM common_rate_limit_buckets
+    WHERE bucket_key = :key
+""")
+
+PURGE_SQL = text("""
+    DELETE FROM common_rate_limit_buckets
+    WHERE upd_dt < clock_timestamp() - make_interval(secs => :max_age)
+""")
+
+
+class PostgresRateLimitBackend:
+    """
+    PostgreSQL UNLOGGED 테이블 토큰 버킷 (여러 워커 공유)
+
+    요청마다 한 문장(INSERT ... ON CONFLICT DO UPDATE)으로 충전과 차감을 처리하고,
+    거절된 경우에만 남은 토큰을 한 번 더 조회합니다. UNLOGGED 테이블이라 WAL을 쓰지 않으며
+    DB 재시작 시 비워져도 모든 버킷이 가득 찬 상태로 돌아갈 뿐입니다.
+    """
+
+    blocking = True
+
+    def hit(self, key: str, policy: RateLimitPolicy) -> RateLimitResult:
+        params = {"key": key, "limit": policy.limit, "rate": policy.rate}
+        with engine.begin() as conn:
+            tokens = conn.execute(HIT_SQL, params).scalar()
+            if tokens is not None:
+                return _result(policy, True, float(tokens))
+            tokens = conn.execute(PEEK_SQL, params).scalar()
+        return _result(policy, False, float(tokens or 0.0))
+
+
+def purge_rate_limit_buckets() -> int:
+    """
+    가득 찬 것과 같은 오래된 버킷 삭제 (postgres 백엔드 주기 작업)
+
+    정책 중 가장 긴 충전 시간(period)보다 오래 사용하지 않은 버킷은 가득 찬 상태이므로 지워도 동작이 같습니다.
+    """
+    max_age = max((policy.period for policy in RATE_LIMIT_POLICIES.values()), default=3600.0)
+    with engine.begin() as conn:
+        removed = conn.execute(PURGE_SQL, {"max_age": max_age}).rowcount
+    if removed:
+        logger.info(f"빈도 제한 버킷 정리: {removed}건 삭제")
+    return removed
+
+
+def rate_limit_headers(policy: RateLimitPolicy, result: RateLimitResult) -> Dict[str, str]:
+    """RateLimit 표준 헤더 (draft-ietf-httpapi-ratelimit-headers)"""
+    headers = {
+        "RateLimit-Limit": str(policy.limit),
+        "RateLimit-Remaining": str(result.remaining),
+        "RateLimit-Reset": str(math.ceil(result.reset_after)),
+        "RateLimit-Policy": f"{policy.limit};w={int(policy.period)}",
+    }
+    if not result.allowed:
+        headers["Retry-After"] = str(max(math.ceil(result.retry_after), 1))
+    return headers
+
+
+class RateLimiter:
+    """정책 조회와 백엔드 호출 (postgres 백엔드는 스레드풀에서 실행해 이벤트 루프를 막지 않음)"""
+
+    def __init__(self, backend, policies: Dict[str, RateLimitPolicy], enabled: bool = True):
+        self.backend = backend
+        self.policies = policies
+        self.enabled = enabled
+
+    async def check(self, policy_name: str, subject: str, response: Response) -> None:
+        """
+        토큰 1개 차감 후 응답에 RateLimit 헤더 설정
+
+        Raises:
+            HTTPException: 429, 허용량을 넘은 경우
+        """
+        policy = self.policies.get(policy_name)
+        if not self.enabled or policy is None:
+            return
+        key = f"{policy.name}:{subject}"
+        try:
+            if self.backend.blocking:
+                result = await run_in_threadpool(self.backend.hit, key, policy)
+            else:
+                result = self.backend.hit(key, policy)
+        except Exception as e:
+            # 빈도 제한 저장소 장애로 본 요청까지 실패시키지 않음
+            logger.error(f"빈도 제한 확인 실패 ({key}): {type(e).__name__}: {str(e)}")
+            return
+        headers = rate_limit_headers(policy, result)
+        if not result.allowed:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요.",
+                headers=headers,
+            )
+        response.headers.update(headers)
+
+
+def _client_ip(request: Request) -> str:
+    """
+    클라이언트 IP 주소 (연결 주소 기준)
+
+    X-Forwarded-For는 클라이언트가 마음대로 보낼 수 있어 빈도 제한 키로 쓰면 요청마다 값을 바꿔 우회할 수 있습니다.
+    신뢰하는 프록시(FORWARDED_ALLOW_IPS) 뒤에서는 uvicorn이 연결 주소를 원래 클라이언트 주소로 바꿔 줍니다.
+    """
+    return request.client.host if request.client else "unknown"
+
+
+def rate_limit_by_user(policy_name: str) -> Callable:
+    """로그인 사용자 ID 기준 빈도 제한 의존성 (라우트 dependencies에 사용)"""
+    async def dependency(
+        response: Response,
+        current_user: CommonUser = Depends(get_current_active_user)
+    ) -> None:
+        await rate_limiter.check(policy_name, f"user:{current_user.user_id}", response)
+
+    return dependency
+
+
+def rate_limit_by_ip(policy_name: str) -> Callable:
+    """클라이언트 IP 기준 빈도 제한 의존성 (라우트 dependencies에 사용)"""
+    async def dependency(request: Request, response: Response) -> None:
+        await rate_limiter.check(policy_name, f"ip:{_client_ip(request)}", response)
+
+    return dependency
+
+
+def _build_backend():
+    if settings.rate_limit_backend == "postgres":
+        return PostgresRateLimitBackend()
+    return MemoryRateLimitBackend(max_keys=settings.rate_limit_memory_max_keys)
+
+
+RATE_LIMIT_POLICIES: Dict[str, RateLimitPolicy] = {
+    name: RateLimitPolicy.parse(name, spec) for name, spec in settings.rate_limit_policies.items()
+}
+
+# 애플리케이션 전역 빈도 제한기
+rate_limiter = RateLimiter(
+    backend=_build_backend(),
+    policies=RATE_LIMIT_POLICIES,
+    enabled=settings.rate_limit_enabled,
+)
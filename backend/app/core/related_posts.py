@@ -0,0 +1,238 @@
+"""태그 시그니처 기반 관련 게시글 (대기열 증분 계산 -> bbs_post_related)"""
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+import heapq
+import logging
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커가 동시에 재계산하지 않도록 하는 advisory lock 키
+RELATED_LOCK_KEY = "bbs_post_related_refresh"
+
+# 게시글의 태그 시그니처 (정렬된 태그 ID)
+Signature = Tuple[int, ...]
+
+# (게시판, 태그)별 최근 게시글만 후보로 조회 (인기 태그가 후보 수를 키우지 않도록)
+CANDIDATES_SQL = """
+    SELECT DISTINCT s.board_id, c.post_id
+    FROM unnest(CAST(:board_ids AS BIGINT[]), CAST(:tag_ids AS BIGINT[])) AS s(board_id, tag_id)
+    CROSS JOIN LATERAL (
+        SELECT pt.post_id
+        FROM bbs_post_tags pt
+        JOIN bbs_posts p ON p.id = pt.post_id
+        WHERE pt.tag_id = s.tag_id
+          AND p.board_id = s.board_id
+          AND p.stts <> 'DELETED'
+        ORDER BY pt.post_id DESC
+        LIMIT :per_tag
+    ) c
+"""
+
+RELATED_POSTS_SQL = """
+    SELECT p.id, p.ttl, p.board_id, p.user_id, u.nickname AS author_nickname,
+           p.lk_cnt, p.cmt_cnt, p.crt_dt, r.score
+    FROM bbs_post_related r
+    JOIN bbs_posts p ON p.id = r.related_post_id
+    LEFT JOIN common_user u ON u.user_id = p.user_id
+    WHERE r.post_id = :post_id
+      AND p.stts = 'PUBLISHED'
+      AND COALESCE(p.scr_yn, FALSE) = FALSE
+    ORDER BY r.score DESC, r.related_post_id DESC
+    LIMIT :limit
+"""
+
+
+class TagSignatureIndex:
+    """
+    게시판 하나의 태그 시그니처 역색인 (메모리)
+
+    태그 ID -> 게시글 ID 목록으로 후보를 좁힌 뒤 후보와만 Jaccard 유사도를 계산합니다.
+    """
+
+    def __init__(self):
+        self.signatures: Dict[int, Signature] = {}
+        self.postings: Dict[int, List[int]] = defaultdict(list)
+
+    def add(self, post_id: int, tag_ids: Iterable[int]) -> None:
+        signature = tuple(sorted(set(tag_ids)))
+        self.signatures[post_id] = signature
+        for tag_id in signature:
+            self.postings[tag_id].append(post_id)
+
+    def nearest(self, post_id: int, k: int) -> List[Tuple[int, float]]:
+        """유사도 상위 k건 (동점이면 최근 게시글 우선)"""
+        signature = set(self.signatures.get(post_id, ()))
+        if not signature:
+            return []
+        shared: Dict[int, int] = defaultdict(int)
+        for tag_id in signature:
+            for other_id in self.postings.get(tag_id, ()):
+                if other_id != post_id:
+                    shared[other_id] += 1
+
+        scored = (
+            (cnt / (len(signature) + len(self.signatures[other_id]) - cnt), other_id)
+            for other_id, cnt in shared.items()
+        )
+        return [(other_id, score) for score, other_id in heapq.nlargest(k, scored)]
+
+
+def enqueue_related_refresh(db: Session, post_ids: Iterable[int]) -> None:
+    """관련 게시글 재계산 대기열에 추가 (호출한 세션의 트랜잭션에서 실행)"""
+    post_ids = list(set(post_ids))
+    if not post_ids:
+        return
+    db.execute(text("""
+        INSERT INTO bbs_post_related_queue (post_id, crt_dt)
+        SELECT unnest(CAST(:post_ids AS BIGINT[])), CURRENT_TIMESTAMP
+        ON CONFLICT (post_id) DO NOTHING
+    """), {"post_ids": post_ids})
+
+
+def get_related_posts(db: Session, post_id: int, limit: int) -> List[Dict]:
+    """미리 계산된 관련 게시글 중 공개된 게시글 (유사도 순)"""
+    rows = db.execute(text(RELATED_POSTS_SQL), {"post_id": post_id, "limit": limit}).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def _load_signatures(conn: Connection, post_ids: List[int]) -> Dict[int, List[int]]:
+    """게시글별 태그 ID 목록"""
+    if not post_ids:
+        return {}
+    rows = conn.execute(text("""
+        SELECT post_id, array_agg(tag_id ORDER BY tag_id)
+        FROM bbs_post_tags
+        WHERE post_id = ANY(:post_ids)
+        GROUP BY post_id
+    """), {"post_ids": post_ids}).all()
+    return {post_id: list(tag_ids) for post_id, tag_ids in rows}
+
+
+def _refresh_batch(conn: Connection, dirty: List[int]) -> int:
+    """
+    대기열에서 꺼낸 게시글의 관련 게시글 재계산
+
+    바뀐 게시글이 들어간 기존 쌍은 양방향 모두 지우고, 새로 계산한 상위 k건을 양방향으로 넣은 뒤
+    영향을 받은 게시글마다 상위 k건만 남깁니다. 상대 게시글의 목록은 잘려나간 후보를 다시
+    채우지 않으므로 k건보다 적어질 수 있지만 해당 게시글이 다음에 재계산될 때 채워집니다.
+    """
+    top_k = settings.related_posts_top_k
+
+    # 삭제되지 않은 게시글만 다시 계산 (삭제/태그 없음은 기존 쌍만 제거)
+    boards = dict(conn.execute(
+        text("SELECT id, board_id FROM bbs_posts WHERE id = ANY(:ids) AND stts <> 'DELETED'"),
+        {"ids": dirty}
+    ).all())
+    dirty_signatures = _load_signatures(conn, list(boards))
+
+    conn.execute(
+        text("DELETE FROM bbs_post_related WHERE post_id = ANY(:ids) OR related_post_id = ANY(:ids)"),
+        {"ids": dirty}
+    )
+
+    pairs = sorted({(boards[post_id], tag_id) for post_id, tag_ids in dirty_signatures.items() for tag_id in tag_ids})
+    if not pairs:
+        return 0
+
+    candidates: Dict[int, Set[int]] = defaultdict(set)
+    for board_id, post_id in conn.execute(text(CANDIDATES_SQL), {
+        "board_ids": [board_id for board_id, _ in pairs],
+        "tag_ids": [tag_id for _, tag_id in pairs],
+        "per_tag": settings.related_posts_candidates_per_tag,
+    }):
+        candidates[board_id].add(post_id)
+    for post_id in dirty_signatures:
+        candidates[boards[post_id]].add(post_id)
+
+    signatures = _load_signatures(conn, [post_id for post_ids in candidates.values() for post_id in post_ids])
+    indexes: Dict[int, TagSignatureIndex] = {}
+    for board_id, post_ids in candidates.items():
+        index = indexes[board_id] = TagSignatureIndex()
+        for post_id in post_ids:
+            index.add(post_id, signatures.get(post_id, ()))
+
+    scores: Dict[Tuple[int, int], float] = {}
+    for post_id in dirty_signatures:
+        for other_id, score in indexes[boards[post_id]].nearest(post_id, top_k):
+            scores[(post_id, other_id)] = score
+            scores[(other_id, post_id)] = score
+    if not scores:
+        return 0
+
+    keys = list(scores)
+    conn.execute(text("""
+        INSERT INTO bbs_post_related (post_id, related_post_id, score, upd_dt)
+        SELECT post_id, related_post_id, score, CURRENT_TIMESTAMP
+        FROM unnest(CAST(:post_ids AS BIGINT[]), CAST(:related_ids AS BIGINT[]), CAST(:scores AS DOUBLE PRECISION[]))
+            AS d(post_id, related_post_id, score)
+        ON CONFLICT (post_id, related_post_id) DO UPDATE
+        SET score = EXCLUDED.score,
+            upd_dt = EXCLUDED.upd_dt
+    """), {
+        "post_ids": [post_id for post_id, _ in keys],
+        "related_ids": [related_id for _, related_id in keys],
+        "scores": [scores[key] for key in keys],
+    })
+
+    # 상대 게시글 목록에 추가되어 k건을 넘은 부분 정리
+    conn.execute(text("""
+        DELETE FROM bbs_post_related r
+        USING (
+            SELECT post_id, related_post_id,
+                   ROW_NUMBER() OVER (PARTITION BY post_id ORDER BY score DESC, related_post_id DESC) AS rn
+            FROM bbs_post_related
+            WHERE post_id = ANY(:post_ids)
+        ) ranked
+        WHERE r.post_id = ranked.post_id
+          AND r.related_post_id = ranked.related_post_id
+          AND ranked.rn > :top_k
+    """), {"post_ids": list({post_id for post_id, _ in keys}), "top_k": top_k})
+
+    return len(dirty_signatures)
+
+
+def run_related_posts_refresh() -> dict:
+    """
+    대기열의 게시글 관련 게시글 재계산 (스케줄러에서 주기적으로 실행)
+
+    RELATED_POSTS_BATCH_SIZE건씩 대기열에서 꺼내 각 배치를 하나의 트랜잭션으로 처리합니다.
+    """
+    result = {"refreshed": 0, "dequeued": 0, "skipped": None}
+
+    while True:
+        with engine.begin() as conn:
+            locked = conn.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                {"key": RELATED_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                result["skipped"] = "locked"
+                return result
+
+            dirty = conn.execute(text("""
+                DELETE FROM bbs_post_related_queue
+                WHERE post_id IN (
+                    SELECT post_id FROM bbs_post_related_queue
+                    ORDER BY crt_dt, post_id
+                    LIMIT :batch_size
+                    FOR UPDATE SKIP LOCKED
+                )
+                RETURNING post_id
+            """), {"batch_size": settings.related_posts_batch_size}).scalars().all()
+            if not dirty:
+                break
+
+            result["dequeued"] += len(dirty)
+            result["refreshed"] += _refresh_batch(conn, list(dirty))
+
+        if len(dirty) < settings.related_posts_batch_size:
+            break
+
+    if result["dequeued"]:
+        logger.info(f"관련 게시글 재계산: 대기열 {result['dequeued']}건, 계산 {result['refreshed']}건")
+    return result
@@ -0,0 +1,185 @@
+"""신고 대상(게시글/댓글/사용자) 일괄 조회 및 대상별 신고 집계"""
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import base64
+import json
+from sqlalchemy import cast, func, String, tuple_
+from sqlalchemy.orm import Session
+from app.models.board import (
+    BbsBoard, BbsComment, BbsPost, BbsReport, ReportStatus, ReportTargetType
+)
+from app.models.user import CommonUser
+
+# 신고 대상 키 (대상 유형, 대상 ID)
+TargetKey = Tuple[ReportTargetType, int]
+
+
+@dataclass
+class ReportTarget:
+    """신고 대상 요약 정보"""
+    target_type: str
+    target_id: int
+    exists: bool = False
+    title: Optional[str] = None
+    author_id: Optional[str] = None
+    author_nickname: Optional[str] = None
+    post_id: Optional[int] = None
+    board_id: Optional[int] = None
+    board_nm: Optional[str] = None
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
+
+
+def resolve_report_targets(db: Session, keys: Iterable[TargetKey]) -> Dict[TargetKey, ReportTarget]:
+    """
+    신고 대상 정보를 유형별로 묶어 최대 4번의 쿼리로 조회
+
+    댓글 -> 게시글 -> 게시판 순으로 필요한 ID를 모은 뒤 작성자/신고 대상 사용자를 한 번에 조회합니다.
+    (댓글, 게시글, 게시판, 사용자 각 1회이며 해당 유형이 없으면 생략)
+    """
+    keys = list(dict.fromkeys(keys))
+    targets = {
+        (target_type, target_id): ReportTarget(target_type=target_type.value, target_id=target_id)
+        for target_type, target_id in keys
+    }
+    post_ids = {target_id for target_type, target_id in keys if target_type == ReportTargetType.POST}
+    comment_ids = {target_id for target_type, target_id in keys if target_type == ReportTargetType.COMMENT}
+    user_ids = {str(target_id) for target_type, target_id in keys if target_type == ReportTargetType.USER}
+
+    comments = {}
+    if comment_ids:
+        for comment_id, post_id, user_id, cn in db.query(
+            BbsComment.id, BbsComment.post_id, BbsComment.user_id, BbsComment.cn
+        ).filter(BbsComment.id.in_(comment_ids)).all():
+            comments[comment_id] = (post_id, user_id, cn)
+            post_ids.add(post_id)
+            user_ids.add(user_id)
+
+    posts = {}
+    if post_ids:
+        for post_id, board_id, user_id, ttl in db.query(
+            BbsPost.id, BbsPost.board_id, BbsPost.user_id, BbsPost.ttl
+        ).filter(BbsPost.id.in_(post_ids)).all():
+            posts[post_id] = (board_id, user_id, ttl)
+            user_ids.add(user_id)
+
+    boards = {}
+    board_ids = {board_id for board_id, _, _ in posts.values()}
+    if board_ids:
+        boards = dict(db.query(BbsBoard.id, BbsBoard.nm).filter(BbsBoard.id.in_(board_ids)).all())
+
+    nicknames = {}
+    if user_ids:
+        nicknames = dict(db.query(CommonUser.user_id, CommonUser.nickname).filter(CommonUser.user_id.in_(user_ids)).all())
+
+    for (target_type, target_id), target in targets.items():
+        if target_type == ReportTargetType.POST and target_id in posts:
+            board_id, user_id, ttl = posts[target_id]
+            target.exists = True
+            target.title = ttl
+            target.author_id = user_id
+            target.post_id = target_id
+            target.board_id = board_id
+        elif target_type == ReportTargetType.COMMENT and target_id in comments:
+            post_id, user_id, cn = comments[target_id]
+            target.exists = True
+            target.title = cn[:50] if cn else None
+            target.author_id = user_id
+            target.post_id = post_id
+            target.board_id = posts[post_id][0] if post_id in posts else None
+        elif target_type == ReportTargetType.USER and str(target_id) in nicknames:
+            target.exists = True
+            target.author_id = str(target_id)
+
+        if target.author_id is not None:
+            target.author_nickname = nicknames.get(target.author_id)
+        if target.board_id is not None:
+            target.board_nm = boards.get(target.board_id)
+
+    return targets
+
+
+def encode_group_cursor(report_cnt: int, last_reported_at: datetime, target_type: str, target_id: int) -> str:
+    """대상별 집계 목록의 키셋 커서 생성"""
+    raw = json.dumps([report_cnt, last_reported_at.isoformat(), target_type, target_id])
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_group_cursor(cursor: str) -> Tuple[int, datetime, str, int]:
+    """대상별 집계 목록 커서 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        report_cnt, last_reported_at, target_type, target_id = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return int(report_cnt), datetime.fromisoformat(last_reported_at), str(target_type), int(target_id)
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다") from e
+
+
+def get_report_groups(
+    db: Session,
+    stts: Optional[ReportStatus],
+    limit: int,
+    cursor: Optional[str] = None,
+) -> Tuple[List[Dict], Optional[str]]:
+    """
+    신고를 대상별로 묶어 신고 수가 많은 순으로 조회 (키셋 페이지네이션)
+
+    정렬 키 (신고 수, 마지막 신고 일시, 대상 유형, 대상 ID)를 모두 내림차순으로 정렬하고
+    다음 페이지는 HAVING의 행 비교로 이어서 조회합니다.
+
+    Raises:
+        ValueError: 커서 형식이 잘못된 경우
+    """
+    report_cnt = func.count(BbsReport.id)
+    last_reported_at = func.max(BbsReport.crt_dt)
+    target_type_text = cast(BbsReport.target_type, String)
+
+    query = db.query(
+        BbsReport.target_type,
+        BbsReport.target_id,
+        report_cnt.label("report_cnt"),
+        last_reported_at.label("last_reported_at"),
+        func.min(BbsReport.crt_dt).label("first_reported_at"),
+        func.array_agg(func.distinct(cast(BbsReport.rsn, String))).label("reasons"),
+    )
+    if stts is not None:
+        query = query.filter(BbsReport.stts == stts)
+    query = query.group_by(BbsReport.target_type, BbsReport.target_id)
+
+    if cursor:
+        cursor_cnt, cursor_last, cursor_type, cursor_id = decode_group_cursor(cursor)
+        query = query.having(
+            tuple_(report_cnt, last_reported_at, target_type_text, BbsReport.target_id)
+            < tuple_(cursor_cnt, cursor_last, cursor_type, cursor_id)
+        )
+
+    rows = query.order_by(
+        report_cnt.desc(),
+        last_reported_at.desc(),
+        target_type_text.desc(),
+        BbsReport.target_id.desc()
+    ).limit(limit + 1).all()
+
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    targets = resolve_report_targets(db, [(row.target_type, row.target_id) for row in rows])
+
+    items = []
+    for row in rows:
+        items.append({
+            "target_type": row.target_type,
+            "target_id": row.target_id,
+            "report_cnt": int(row.report_cnt),
+            "first_reported_at": row.first_reported_at,
+            "last_reported_at": row.last_reported_at,
+            "reasons": sorted(row.reasons or []),
+            "target": targets[(row.target_type, row.target_id)].to_dict(),
+        })
+
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]
+        next_cursor = encode_group_cursor(int(last.report_cnt), last.last_reported_at, last.target_type.value, last.target_id)
+    return items, next_cursor
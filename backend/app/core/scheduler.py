@@ -0,0 +1,101 @@
+"""주기 작업 스케줄러"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Any
+import asyncio
+import logging
+import time
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PeriodicJob:
+    """주기 작업 정의"""
+    name: str
+    interval: float
+    func: Callable[[], Any]
+    run_on_start: bool = True
+    last_run_at: Optional[float] = None
+    last_duration: Optional[float] = None
+    last_error: Optional[str] = None
+    run_count: int = 0
+    error_count: int = 0
+
+
+class Scheduler:
+    """
+    애플리케이션 내장 주기 작업 스케줄러
+
+    동기 함수로 작성된 작업을 스레드풀에서 실행하므로 이벤트 루프를 막지 않습니다.
+    여러 워커에서 동시에 실행될 수 있으므로 작업 함수는 멱등이어야 하며,
+    필요한 경우 PostgreSQL advisory lock으로 단일 실행을 보장합니다.
+    """
+
+    def __init__(self):
+        self._jobs: Dict[str, PeriodicJob] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    def add_job(self, name: str, interval: float, func: Callable[[], Any], run_on_start: bool = True) -> None:
+        """주기 작업 등록 (interval: 초)"""
+        self._jobs[name] = PeriodicJob(name=name, interval=interval, func=func, run_on_start=run_on_start)
+
+    def jobs(self) -> List[Dict[str, Any]]:
+        """등록된 작업 상태 목록"""
+        return [
+            {
+                "name": job.name,
+                "interval": job.interval,
+                "last_run_at": job.last_run_at,
+                "last_duration": job.last_duration,
+                "last_error": job.last_error,
+                "run_count": job.run_count,
+                "error_count": job.error_count,
+            }
+            for job in self._jobs.values()
+        ]
+
+    async def run_job(self, name: str) -> None:
+        """작업 1회 실행"""
+        job = self._jobs[name]
+        started = time.monotonic()
+        try:
+            await asyncio.to_thread(job.func)
+            job.last_error = None
+        except Exception as e:
+            job.error_count += 1
+            job.last_error = f"{type(e).__name__}: {str(e)}"
+            logger.error(f"주기 작업 실패 [{job.name}]: {job.last_error}")
+        finally:
+            job.run_count += 1
+            job.last_run_at = time.time()
+            job.last_duration = time.monotonic() - started
+
+    async def _loop(self, job: PeriodicJob) -> None:
+        """작업별 실행 루프"""
+        if not job.run_on_start:
+            await asyncio.sleep(job.interval)
+        while True:
+            await self.run_job(job.name)
+            await asyncio.sleep(job.interval)
+
+    async def start(self) -> None:
+        """등록된 모든 작업 시작"""
+        if self._tasks:
+            return
+        for job in self._jobs.values():
+            self._tasks.append(asyncio.create_task(self._loop(job), name=f"scheduler-{job.name}"))
+
+    async def stop(self) -> None:
+        """모든 작업 중지"""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        self._tasks = []
+
+
+# 애플리케이션 전역 스케줄러
+scheduler = Scheduler()
@@ -0,0 +1,359 @@
+"""프로덕션 서버 실행 (프리포크 멀티 워커, 무중단 순차 재시작)"""
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+import importlib.util
+import logging
+import os
+import select
+import signal
+import socket
+import time
+import uvicorn
+from app.core.config import settings
+
+# uvicorn 설정이 구성하는 로거를 사용해 마스터/워커 로그가 uvicorn 로그와 같은 형식으로 출력되도록 함
+logger = logging.getLogger("uvicorn.error")
+
+APP_PATH = "app.main:app"
+
+# 준비 전에 연속으로 종료된 워커가 이 횟수를 넘으면 마스터 종료 (잘못된 배포에서 재시작 반복 방지)
+MAX_BOOT_FAILURES = 5
+
+# 워커 시작 훅 (fork 직후, 이벤트 루프 시작 전에 워커 번호와 함께 호출)
+worker_start_hooks: List[Callable[[int], None]] = []
+
+
+def add_worker_start_hook(hook: Callable[[int], None]) -> None:
+    """워커 시작 훅 등록"""
+    worker_start_hooks.append(hook)
+
+
+def available_cpus() -> int:
+    """프로세스가 사용할 수 있는 CPU 수 (CPU affinity 반영)"""
+    if hasattr(os, "sched_getaffinity"):
+        return max(len(os.sched_getaffinity(0)), 1)
+    return os.cpu_count() or 1
+
+
+def worker_count(configured: int, max_workers: int) -> int:
+    """워커 수 (설정값이 없으면 CPU 수, 단 max_workers 이하)"""
+    if configured > 0:
+        return configured
+    return max(1, min(available_cpus(), max_workers))
+
+
+def resolve_loop(name: str) -> str:
+    """이벤트 루프 구현 선택 (auto는 uvloop가 설치된 경우 uvloop)"""
+    if name == "auto":
+        return "uvloop" if importlib.util.find_spec("uvloop") else "asyncio"
+    return name
+
+
+def resolve_http(name: str) -> str:
+    """HTTP 파서 구현 선택 (auto는 httptools가 설치된 경우 httptools)"""
+    if name == "auto":
+        return "httptools" if importlib.util.find_spec("httptools") else "h11"
+    return name
+
+
+def reset_db_pool(worker_id: int) -> None:
+    """
+    fork 전에 마스터가 만든 DB 커넥션을 닫지 않고 버림 (부모와 소켓을 공유하지 않도록)
+
+    커넥션 예열은 워커의 lifespan 시작에서 수행합니다 (app.core.warmup).
+    """
+    from app.database import engine
+
+    engine.dispose(close=False)
+
+
+add_worker_start_hook(reset_db_pool)
+
+
+class _WorkerServer(uvicorn.Server):
+    """앱 시작(lifespan startup)이 끝나면 준비 파이프로 마스터에 알리는 uvicorn 서버"""
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        super().__init__(config)
+        self.ready_fd = ready_fd
+
+    async def startup(self, sockets=None) -> None:
+        await super().startup(sockets=sockets)
+        if self.started and not self.should_exit:
+            os.write(self.ready_fd, b"1")
+        os.close(self.ready_fd)
+
+
+@dataclass
+class Worker:
+    """워커 프로세스"""
+    worker_id: int
+    pid: int
+    ready_fd: int  # 준비 알림 파이프 (읽기 쪽)
+    started_at: float
+    ready: bool = False
+
+
+class Supervisor:
+    """
+    프리포크 워커 관리자
+
+    마스터가 리스닝 소켓을 열고 (preload인 경우 앱까지 import한 뒤) 워커를 fork합니다.
+    워커는 같은 소켓을 공유해 커널이 연결을 나눠 받으며, 각자 lifespan을 실행합니다.
+
+    시그널:
+        SIGHUP: 워커를 하나씩 교체 (새 워커가 준비된 뒤 기존 워커를 정상 종료)
+        SIGTERM, SIGINT: 모든 워커 정상 종료 후 마스터 종료
+
+    preload 모드에서는 새 워커도 마스터가 import한 코드를 그대로 쓰므로,
+    새 코드를 배포할 때는 SERVER_PRELOAD=False로 실행하거나 마스터를 재시작해야 합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        preload: bool,
+        loop: str,
+        http: str,
+        graceful_timeout: int,
+        ready_timeout: int,
+        max_requests: int = 0,
+    ):
+        self.num_workers = workers
+        self.preload = preload
+        self.loop = loop
+        self.http = http
+        self.graceful_timeout = graceful_timeout
+        self.ready_timeout = ready_timeout
+        self.max_requests = max_requests
+        self.workers: Dict[int, Worker] = {}  # worker_id -> 현재 워커
+        self.retiring: Dict[int, float] = {}  # pid -> 강제 종료 시각
+        self.sock: Optional[socket.socket] = None
+        self.boot_failures = 0
+        self._signals: List[int] = []
+        self._app = None
+
+    def build_config(self) -> uvicorn.Config:
+        """uvicorn 설정 (preload면 마스터가 import한 앱 객체 사용)"""
+        return uvicorn.Config(
+            self._app if self.preload else APP_PATH,
+            host=settings.host,
+            port=settings.port,
+            loop=self.loop,
+            http=self.http,
+            timeout_graceful_shutdown=self.graceful_timeout,
+            limit_max_requests=self.max_requests or None,
+            forwarded_allow_ips=settings.forwarded_allow_ips,
+        )
+
+    def run(self) -> int:
+        """워커를 시작하고 시그널을 처리하며 대기 (종료 코드 반환)"""
+        if self.preload:
+            from app.main import app
+            self._app = app
+        config = self.build_config()
+        self.sock = config.bind_socket()
+        logger.info(
+            f"마스터 [{os.getpid()}] 시작: 워커 {self.num_workers}개, loop={self.loop}, http={self.http}, "
+            f"preload={self.preload}"
+        )
+
+        for sig in (signal.SIGHUP, signal.SIGTERM, signal.SIGINT):
+            signal.signal(sig, self._on_signal)
+
+        started = [self.spawn(worker_id) for worker_id in range(self.num_workers)]
+        if not all([self.wait_ready(worker) for worker in started]):
+            logger.error("워커 시작 실패로 서버를 종료합니다")
+            self.stop()
+            return 1
+        logger.info(f"워커 {self.num_workers}개 준비 완료")
+
+        try:
+            while True:
+                while self._signals:
+                    sig = self._signals.pop(0)
+                    if sig == signal.SIGHUP:
+                        self.reload()
+                    else:
+                        self.stop()
+                        return 0
+                if not self.reap():
+                    self.stop()
+                    return 1
+                time.sleep(0.5)
+        finally:
+            self.sock.close()
+
+    def _on_signal(self, sig, frame) -> None:
+        self._signals.append(sig)
+
+    def spawn(self, worker_id: int) -> Worker:
+        """워커 fork (자식은 서버 실행 후 종료)"""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            self._run_worker(worker_id, write_fd)
+        os.close(write_fd)
+        worker = Worker(worker_id=worker_id, pid=pid, ready_fd=read_fd, started_at=time.monotonic())
+        self.workers[worker_id] = worker
+        return worker
+
+    def _run_worker(self, worker_id: int, ready_fd: int) -> None:
+        exit_code = 0
+        try:
+            # SIGHUP은 마스터만 처리 (프로세스 그룹 전체에 보내져도 워커는 유지)
+            signal.signal(signal.SIGHUP, signal.SIG_IGN)
+            for sig in (signal.SIGTERM, signal.SIGINT):
+                signal.signal(sig, signal.SIG_DFL)
+            for hook in worker_start_hooks:
+                hook(worker_id)
+            _WorkerServer(self.build_config(), ready_fd).run(sockets=[self.sock])
+        except BaseException:
+            logger.exception(f"워커 {worker_id} [{os.getpid()}] 비정상 종료")
+            exit_code = 1
+        finally:
+            os._exit(exit_code)
+
+    def wait_ready(self, worker: Worker) -> bool:
+        """워커가 준비되었다고 알릴 때까지 대기 (시간 초과나 준비 전 종료 시 False)"""
+        deadline = worker.started_at + self.ready_timeout
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.error(f"워커 {worker.worker_id} [{worker.pid}] 준비 시간 초과 ({self.ready_timeout}초)")
+                    return False
+                try:
+                    readable, _, _ = select.select([worker.ready_fd], [], [], remaining)
+                except InterruptedError:
+                    continue
+                if readable:
+                    worker.ready = os.read(worker.ready_fd, 1) == b"1"
+                    if not worker.ready:
+                        logger.error(f"워커 {worker.worker_id} [{worker.pid}] 준비 전 종료")
+                    else:
+                        self.boot_failures = 0
+                    return worker.ready
+        finally:
+            os.close(worker.ready_fd)
+
+    def reload(self) -> None:
+        """워커 순차 교체 (새 워커가 준비되지 않으면 중단하고 기존 워커 유지)"""
+        logger.info("워커 순차 재시작 시작")
+        for worker_id, old in list(self.workers.items()):
+            new = self.spawn(worker_id)
+            if not self.wait_ready(new):
+                self.workers[worker_id] = old
+                self._kill(new.pid, signal.SIGKILL)
+                self._waitpid(new.pid, block=True)
+                logger.error("새 워커가 준비되지 않아 순차 재시작을 중단합니다 (기존 워커 유지)")
+                return
+            self.retire(old.pid)
+        logger.info("워커 순차 재시작 완료")
+
+    def retire(self, pid: int) -> None:
+        """워커 정상 종료 요청 (처리 중인 요청은 graceful_timeout까지 마무리)"""
+        self._kill(pid, signal.SIGTERM)
+        self.retiring[pid] = time.monotonic() + self.graceful_timeout + 5
+
+    def reap(self) -> bool:
+        """종료된 워커 회수와 재시작, 종료가 늦은 워커 강제 종료 (계속 실행할 수 없으면 False)"""
+        now = time.monotonic()
+        for pid, deadline in list(self.retiring.items()):
+            if now >= deadline:
+                logger.warning(f"워커 [{pid}] 정상 종료 시간 초과로 강제 종료")
+                self._kill(pid, signal.SIGKILL)
+                self.retiring[pid] = now + self.graceful_timeout
+
+        while True:
+            pid, status = self._waitpid(-1, block=False)
+            if not pid:
+                return True
+            if self.retiring.pop(pid, None) is not None:
+                continue
+            worker = next((w for w in self.workers.values() if w.pid == pid), None)
+            if worker is None:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            # SERVER_MAX_REQUESTS에 도달한 워커는 코드 0으로 종료
+            log = logger.info if code == 0 else logger.warning
+            log(f"워커 {worker.worker_id} [{pid}] 종료 (코드 {code}), 새 워커로 교체합니다")
+            new = self.spawn(worker.worker_id)
+            if not self.wait_ready(new):
+                self._kill(new.pid, signal.SIGKILL)
+                self.boot_failures += 1
+                if self.boot_failures >= MAX_BOOT_FAILURES:
+                    logger.error(f"워커가 준비 전에 {self.boot_failures}회 연속 종료되어 서버를 종료합니다")
+                    return False
+
+    def stop(self) -> None:
+        """모든 워커 정상 종료 (시간 초과 시 강제 종료)"""
+        pids = [worker.pid for worker in self.workers.values()] + list(self.retiring)
+        for pid in pids:
+            self._kill(pid, signal.SIGTERM)
+        deadline = time.monotonic() + self.graceful_timeout + 5
+        while pids and time.monotonic() < deadline:
+            pids = [pid for pid in pids if not self._waitpid(pid, block=False)[0]]
+            time.sleep(0.1)
+        for pid in pids:
+            logger.warning(f"워커 [{pid}] 정상 종료 시간 초과로 강제 종료")
+            self._kill(pid, signal.SIGKILL)
+            self._waitpid(pid, block=True)
+        self.workers.clear()
+        self.retiring.clear()
+        logger.info("모든 워커 종료")
+
+    @staticmethod
+    def _kill(pid: int, sig: int) -> None:
+        try:
+            os.kill(pid, sig)
+        except ProcessLookupError:
+            pass
+
+    @staticmethod
+    def _waitpid(pid: int, block: bool):
+        """종료된 자식 회수 ((pid, status), 없으면 (0, 0))"""
+        try:
+            return os.waitpid(pid, 0 if block else os.WNOHANG)
+        except ChildProcessError:
+            return 0, 0
+
+
+def run_production() -> int:
+    """설정에 따라 프로덕션 서버 실행 (fork를 지원하지 않는 OS에서는 단일 프로세스)"""
+    workers = worker_count(settings.server_workers, settings.server_max_workers)
+    loop = resolve_loop(settings.server_loop)
+    http = resolve_http(settings.server_http)
+
+    if workers > 1:
+        if settings.rate_limit_backend == "memory":
+            logger.warning("RATE_LIMIT_BACKEND=memory는 워커별로 따로 집계됩니다 (여러 워커에서는 postgres 권장)")
+        if settings.notification_pubsub_backend == "memory":
+            logger.warning("NOTIFICATION_PUBSUB_BACKEND=memory는 다른 워커의 실시간 알림을 받지 못합니다 (postgres 권장)")
+        if settings.cache_invalidation_backend == "memory":
+            logger.warning("CACHE_INVALIDATION_BACKEND=memory는 다른 워커의 캐시를 비우지 못합니다 (postgres 권장)")
+
+    if not hasattr(os, "fork"):
+        logger.warning("이 OS는 fork를 지원하지 않아 단일 프로세스로 실행합니다")
+        uvicorn.run(
+            APP_PATH,
+            host=settings.host,
+            port=settings.port,
+            loop=loop,
+            http=http,
+            timeout_graceful_shutdown=settings.server_graceful_timeout,
+            limit_max_requests=settings.server_max_requests or None,
+            forwarded_allow_ips=settings.forwarded_allow_ips,
+        )
+        return 0
+
+    return Supervisor(
+        workers=workers,
+        preload=settings.server_preload,
+        loop=loop,
+        http=http,
+        graceful_timeout=settings.server_graceful_timeout,
+        ready_timeout=settings.server_worker_ready_timeout,
+        max_requests=settings.server_max_requests,
+    ).run()
@@ -0,0 +1,106 @@
+"""동일 키 동시 계산 병합 (single-flight, 스레드/asyncio)"""
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+import asyncio
+import threading
+
+
+class SingleFlightTimeout(TimeoutError):
+    """먼저 시작한 계산을 기다리다 시간이 초과됨"""
+
+
+class _Call:
+    """진행 중인 스레드 계산"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 호출을 계산 한 번으로 병합
+
+    처음 호출한 쪽(leader)만 함수를 실행하고, 실행 중에 들어온 호출(follower)은 그 결과를 기다려
+    같은 값이나 같은 예외를 받습니다. 계산이 끝나면 키를 지우므로 결과를 보관하지는 않습니다(캐시와 함께 사용).
+    - do: 스레드용 (스레드풀에서 실행되는 동기 함수)
+    - ado: asyncio용 (계산을 별도 태스크로 실행해 leader 요청이 취소되어도 follower는 결과를 받음)
+    timeout이 지나면 follower는 SingleFlightTimeout을 받고, 계산은 계속 진행됩니다.
+    """
+
+    def __init__(self):
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._tasks: Dict[Hashable, "asyncio.Future"] = {}
+        self.counters: Dict[str, int] = {"leaders": 0, "shared": 0, "timeouts": 0}
+
+    def in_flight(self, key: Hashable) -> bool:
+        """키의 계산이 진행 중인지 여부"""
+        return key in self._calls or key in self._tasks
+
+    def do(self, key: Hashable, func: Callable[[], Any], timeout: Optional[float] = None) -> Any:
+        """
+        스레드 병합 실행
+
+        Raises:
+            SingleFlightTimeout: follower가 timeout 안에 결과를 받지 못한 경우
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.counters["leaders"] += 1
+            else:
+                self.counters["shared"] += 1
+
+        if not leader:
+            if not call.event.wait(timeout):
+                self.counters["timeouts"] += 1
+                raise SingleFlightTimeout(f"single-flight 대기 시간 초과: {key}")
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+
+    async def ado(self, key: Hashable, func: Callable[[], Awaitable[Any]], timeout: Optional[float] = None) -> Any:
+        """
+        asyncio 병합 실행 (이벤트 루프 스레드에서 호출)
+
+        Raises:
+            SingleFlightTimeout: timeout 안에 결과를 받지 못한 경우
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._tasks[key] = task
+            self.counters["leaders"] += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        else:
+            self.counters["shared"] += 1
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), timeout)
+        except asyncio.TimeoutError:
+            if task.done():
+                # 계산 자체가 TimeoutError로 실패한 경우는 그대로 전달
+                raise
+            self.counters["timeouts"] += 1
+            raise SingleFlightTimeout(f"single-flight 대기 시간 초과: {key}") from None
+
+    def _finish(self, key: Hashable, task: "asyncio.Future") -> None:
+        if self._tasks.get(key) is task:
+            del self._tasks[key]
+        # 모든 호출자가 시간 초과로 떠난 경우에도 예외 미회수 경고가 나지 않도록 확인
+        if not task.cancelled():
+            task.exception()
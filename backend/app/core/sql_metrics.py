@@ -0,0 +1,151 @@
+"""요청별 SQL 계측 (Server-Timing 헤더 + 느린 요청 로그)"""
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Optional, Dict, Any
+import json
+import logging
+import time
+from sqlalchemy import event
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 느린 요청 로그에 남길 SQL 문 최대 길이
+MAX_STATEMENT_LENGTH = 1000
+
+
+@dataclass
+class RequestSqlStats:
+    """요청 하나에서 실행된 SQL 집계"""
+    count: int = 0
+    total_ms: float = 0.0
+    slowest_ms: float = 0.0
+    slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+
+# 현재 요청의 SQL 집계 (요청 밖에서 실행되는 백그라운드 작업은 None)
+_current_stats: ContextVar[Optional[RequestSqlStats]] = ContextVar("request_sql_stats", default=None)
+
+
+def current_sql_stats() -> Optional[RequestSqlStats]:
+    """현재 요청의 SQL 집계 조회"""
+    return _current_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        context._sql_metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    started = getattr(context, "_sql_metrics_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, (time.perf_counter() - started) * 1000)
+
+
+def install_sql_listeners(target=engine) -> None:
+    """엔진에 SQL 실행 시간 수집 리스너 등록 (중복 등록하지 않음)"""
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+        event.listen(target, "after_cursor_execute", _after_cursor_execute)
+
+
+def server_timing_header(stats: RequestSqlStats, app_ms: float) -> str:
+    """Server-Timing 헤더 값 (db: SQL 실행 시간 합계, app: 응답 시작까지 걸린 시간)"""
+    return (
+        f'db;dur={stats.total_ms:.1f};desc="{stats.count} queries", '
+        f'db-slowest;dur={stats.slowest_ms:.1f}, '
+        f'app;dur={app_ms:.1f}'
+    )
+
+
+def is_slow_request(stats: RequestSqlStats) -> bool:
+    """설정된 기준(DB 시간 합계/SQL 실행 수/SQL 한 건 실행 시간) 중 하나라도 넘었는지 확인"""
+    return (
+        (settings.sql_slow_request_ms > 0 and stats.total_ms >= settings.sql_slow_request_ms)
+        or (settings.sql_slow_request_queries > 0 and stats.count >= settings.sql_slow_request_queries)
+        or (settings.sql_slow_statement_ms > 0 and stats.slowest_ms >= settings.sql_slow_statement_ms)
+    )
+
+
+def build_slow_request_record(
+    method: str,
+    path: str,
+    status_code: int,
+    duration_ms: float,
+    stats: RequestSqlStats,
+) -> Dict[str, Any]:
+    """느린 요청 로그 레코드 (SQL 파라미터는 개인정보가 섞일 수 있어 남기지 않음)"""
+    statement = stats.slowest_statement
+    if statement is not None:
+        statement = " ".join(statement.split())[:MAX_STATEMENT_LENGTH]
+    return {
+        "event": "slow_request",
+        "method": method,
+        "path": path,
+        "status_code": status_code,
+        "duration_ms": round(duration_ms, 1),
+        "sql_count": stats.count,
+        "sql_total_ms": round(stats.total_ms, 1),
+        "sql_slowest_ms": round(stats.slowest_ms, 1),
+        "sql_slowest_statement": statement,
+    }
+
+
+class SqlMetricsMiddleware:
+    """
+    요청별 SQL 계측 미들웨어
+
+    요청마다 컨텍스트에 집계 객체를 두고 엔진의 before/after_cursor_execute 이벤트에서
+    실행 수, 실행 시간 합계, 가장 느린 SQL을 기록합니다. 스레드풀에서 실행되는 동기
+    엔드포인트도 컨텍스트가 복사되므로 같은 집계 객체에 기록됩니다.
+
+    응답 시작 시 그때까지의 집계를 Server-Timing 헤더로 내보내고, 응답이 끝난 뒤
+    기준을 넘은 요청은 JSON 구조의 경고 로그로 남깁니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        install_sql_listeners()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSqlStats()
+        started = time.perf_counter()
+        status_holder = {"status": 500}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                status_holder["status"] = message["status"]
+                app_ms = (time.perf_counter() - started) * 1000
+                headers = list(message.get("headers") or [])
+                headers.append((b"server-timing", server_timing_header(stats, app_ms).encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current_stats.set(stats)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current_stats.reset(token)
+            if is_slow_request(stats):
+                record = build_slow_request_record(
+                    method=scope["method"],
+                    path=scope["path"],
+                    status_code=status_holder["status"],
+                    duration_ms=(time.perf_counter() - started) * 1000,
+                    stats=stats,
+                )
+                logger.warning(json.dumps(record, ensure_ascii=False), extra={"sql_metrics": record})
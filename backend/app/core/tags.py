@@ -0,0 +1,145 @@
+"""게시글 태그 일괄 처리 (태그 upsert, 게시글-태그 연결, 사용 횟수 갱신)"""
+from typing import Dict, Iterable, List
+import logging
+from sqlalchemy import text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.core.related_posts import enqueue_related_refresh
+from app.core.trending_tags import record_tag_usage
+from app.database import engine
+from app.models.board import BbsPostTag
+
+logger = logging.getLogger(__name__)
+
+# 태그 이름 최대 길이 (bbs_tags.nm)
+MAX_TAG_LENGTH = 50
+
+# 없는 태그만 생성하고 기존 태그와 합쳐 (id, nm) 반환
+UPSERT_TAGS_SQL = """
+    WITH ins AS (
+        INSERT INTO bbs_tags (nm, usage_cnt, crt_dt)
+        SELECT nm, 0, CURRENT_TIMESTAMP FROM unnest(CAST(:names AS VARCHAR[])) AS t(nm)
+        ON CONFLICT (nm) DO NOTHING
+        RETURNING id, nm
+    )
+    SELECT id, nm FROM ins
+    UNION ALL
+    SELECT id, nm FROM bbs_tags WHERE nm = ANY(:names)
+"""
+
+
+def normalize_tag_names(names: Iterable[str]) -> List[str]:
+    """
+    태그 이름 정리 (앞뒤 공백 제거, 빈 값 제외, 입력 순서를 유지한 중복 제거)
+
+    Raises:
+        ValueError: 태그 이름이 너무 긴 경우
+    """
+    result = []
+    for name in names or []:
+        name = (name or "").strip()
+        if not name:
+            continue
+        if len(name) > MAX_TAG_LENGTH:
+            raise ValueError(f"태그는 {MAX_TAG_LENGTH}자 이하여야 합니다: {name[:MAX_TAG_LENGTH]}...")
+        result.append(name)
+    return list(dict.fromkeys(result))
+
+
+def upsert_tags(db: Session, names: List[str]) -> Dict[str, int]:
+    """
+    태그를 한 번의 INSERT ... ON CONFLICT DO NOTHING RETURNING으로 생성하고 이름별 ID 반환
+
+    같은 문장 안에서 다른 트랜잭션이 먼저 만든 태그는 스냅샷에 보이지 않을 수 있으므로
+    빠진 이름만 한 번 더 조회합니다.
+    """
+    if not names:
+        return {}
+    tag_ids = {nm: tag_id for tag_id, nm in db.execute(text(UPSERT_TAGS_SQL), {"names": names})}
+
+    missing = [name for name in names if name not in tag_ids]
+    if missing:
+        tag_ids.update({
+            nm: tag_id for tag_id, nm in db.execute(
+                text("SELECT id, nm FROM bbs_tags WHERE nm = ANY(:names)"), {"names": missing}
+            )
+        })
+    return tag_ids
+
+
+def set_post_tags(db: Session, post_id: int, names: Iterable[str]) -> List[int]:
+    """
+    게시글의 태그를 주어진 목록으로 교체
+
+    기존 연결과 비교해 빠진 태그는 한 번의 DELETE, 추가된 태그는 다중 행 INSERT 한 번으로
+    반영하고 바뀐 태그의 usage_cnt를 UPDATE 한 번으로 조정합니다. 급상승 태그 버킷과 관련 게시글
+    대기열도 함께 갱신하며, 호출한 세션의 트랜잭션에서 실행되므로 커밋은 호출 측에서 합니다.
+
+    Returns:
+        게시글에 연결된 태그 ID 목록 (입력 순서)
+
+    Raises:
+        ValueError: 태그 이름이 너무 긴 경우
+    """
+    names = normalize_tag_names(names)
+    tag_ids = upsert_tags(db, names)
+    desired = [tag_ids[name] for name in names if name in tag_ids]
+    desired_set = set(desired)
+
+    current = {
+        tag_id for (tag_id,) in db.execute(
+            text("SELECT tag_id FROM bbs_post_tags WHERE post_id = :post_id FOR UPDATE"), {"post_id": post_id}
+        )
+    }
+    removed = sorted(current - desired_set)
+    added = [tag_id for tag_id in desired if tag_id not in current]
+
+    detached = []
+    if removed:
+        detached = db.execute(
+            text("DELETE FROM bbs_post_tags WHERE post_id = :post_id AND tag_id = ANY(:tag_ids) RETURNING tag_id, crt_dt"),
+            {"post_id": post_id, "tag_ids": removed}
+        ).all()
+    if added:
+        db.execute(
+            pg_insert(BbsPostTag).on_conflict_do_nothing(index_elements=["post_id", "tag_id"]),
+            [{"post_id": post_id, "tag_id": tag_id} for tag_id in added]
+        )
+
+    deltas = {tag_id: -1 for tag_id in removed}
+    deltas.update({tag_id: 1 for tag_id in added})
+    if deltas:
+        tag_order = sorted(deltas)
+        db.execute(text("""
+            UPDATE bbs_tags t
+            SET usage_cnt = GREATEST(COALESCE(t.usage_cnt, 0) + d.delta, 0)
+            FROM unnest(CAST(:tag_ids AS BIGINT[]), CAST(:deltas AS INT[])) AS d(tag_id, delta)
+            WHERE t.id = d.tag_id
+        """), {"tag_ids": tag_order, "deltas": [deltas[tag_id] for tag_id in tag_order]})
+        record_tag_usage(db, added, detached)
+        enqueue_related_refresh(db, [post_id])
+
+    return desired
+
+
+def reconcile_tag_usage() -> dict:
+    """
+    태그 사용 횟수와 실제 게시글-태그 연결 수 보정 (스케줄러에서 주기적으로 실행)
+
+    게시글/태그 삭제로 연결이 연쇄 삭제되는 경우처럼 set_post_tags를 거치지 않는 변경을 바로잡습니다.
+    """
+    with engine.begin() as conn:
+        corrected = conn.execute(text("""
+            UPDATE bbs_tags t
+            SET usage_cnt = COALESCE(a.cnt, 0)
+            FROM bbs_tags t2
+            LEFT JOIN (
+                SELECT tag_id, COUNT(*) AS cnt FROM bbs_post_tags GROUP BY tag_id
+            ) a ON a.tag_id = t2.id
+            WHERE t.id = t2.id
+              AND t.usage_cnt IS DISTINCT FROM COALESCE(a.cnt, 0)
+        """)).rowcount
+
+    if corrected:
+        logger.info(f"태그 사용 횟수 {corrected}건 보정")
+    return {"corrected": corrected}
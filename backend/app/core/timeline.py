@@ -0,0 +1,230 @@
+"""팔로잉 타임라인 (팔로우한 게시판/작성자 게시글 스트림의 k-way 병합)"""
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import base64
+import heapq
+import threading
+import time
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.models.board import BbsFollow, FollowType
+
+# (crt_dt, id) 내림차순 커서
+TimelineKey = Tuple[datetime, int]
+
+# 게시판 스트림: 게시판별로 idx_bbs_posts_board_stts_crt_dt를 역순 탐색
+BOARD_STREAMS_SQL = """
+    SELECT s.board_id AS source, p.id, p.crt_dt
+    FROM unnest(CAST(:board_ids AS BIGINT[])) AS s(board_id)
+    CROSS JOIN LATERAL (
+        SELECT id, crt_dt
+        FROM bbs_posts
+        WHERE board_id = s.board_id
+          AND stts = 'PUBLISHED'
+          {cursor_filter}
+        ORDER BY crt_dt DESC, id DESC
+        LIMIT :per_source
+    ) p
+"""
+
+# 작성자 스트림: 작성자별로 idx_bbs_posts_user_crt_dt를 역순 탐색 (비활성/삭제 게시판 글 제외)
+AUTHOR_STREAMS_SQL = """
+    SELECT s.user_id AS source, p.id, p.crt_dt
+    FROM unnest(CAST(:user_ids AS VARCHAR[])) AS s(user_id)
+    CROSS JOIN LATERAL (
+        SELECT bp.id, bp.crt_dt
+        FROM bbs_posts bp
+        JOIN bbs_boards b ON b.id = bp.board_id AND b.actv_yn = TRUE AND b.del_yn = FALSE
+        WHERE bp.user_id = s.user_id
+          AND bp.stts = 'PUBLISHED'
+          {cursor_filter}
+        ORDER BY bp.crt_dt DESC, bp.id DESC
+        LIMIT :per_source
+    ) p
+"""
+
+
+# 커서 이후 구간만 탐색 (crt_dt 조건은 인덱스 범위 탐색용)
+CURSOR_FILTER_SQL = "AND {alias}crt_dt <= :cursor_dt AND ({alias}crt_dt, {alias}id) < (:cursor_dt, :cursor_id)"
+
+
+def _stream_sql(template: str, alias: str, with_cursor: bool) -> str:
+    """스트림 쿼리에 커서 조건 적용"""
+    cursor_filter = CURSOR_FILTER_SQL.format(alias=alias) if with_cursor else ""
+    return template.format(cursor_filter=cursor_filter)
+
+
+def encode_cursor(key: TimelineKey) -> str:
+    """(crt_dt, id)를 URL에 넣을 수 있는 커서 문자열로 변환"""
+    raw = f"{key[0].isoformat()}|{key[1]}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> TimelineKey:
+    """커서 문자열 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        crt_dt, post_id = base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8").split("|")
+        return datetime.fromisoformat(crt_dt), int(post_id)
+    except Exception as e:
+        raise ValueError("잘못된 커서입니다") from e
+
+
+def load_follow_sources(db: Session, user_id: str) -> Tuple[List[int], List[str]]:
+    """팔로우한 게시판 ID와 사용자 ID 목록 (최근 팔로우 순, TIMELINE_MAX_SOURCES개까지)"""
+    rows = db.query(BbsFollow.typ, BbsFollow.board_id, BbsFollow.following_id).filter(
+        BbsFollow.follower_id == user_id
+    ).order_by(BbsFollow.crt_dt.desc()).limit(settings.timeline_max_sources).all()
+
+    board_ids = [board_id for typ, board_id, _ in rows if typ == FollowType.BOARD]
+    user_ids = [following_id for typ, _, following_id in rows if typ == FollowType.USER]
+    return board_ids, user_ids
+
+
+def merge_timeline(
+    db: Session,
+    board_ids: List[int],
+    user_ids: List[str],
+    cursor: Optional[TimelineKey],
+    limit: int,
+) -> Tuple[List[int], Optional[TimelineKey]]:
+    """
+    게시판/작성자 스트림을 (crt_dt, id) 내림차순으로 k-way 병합
+
+    한 페이지에 어느 스트림도 limit건 넘게 기여할 수 없으므로 스트림마다 limit + 1건만 가져오면
+    (LATERAL 조인으로 한 번에 조회) 병합 결과가 정확합니다. 팔로우한 게시판의 글을 팔로우한
+    작성자가 쓴 경우처럼 여러 스트림에 나오는 게시글은 한 번만 포함합니다.
+
+    Returns:
+        (게시글 ID 목록, 다음 페이지 커서 - 마지막 페이지면 None)
+    """
+    params = {"per_source": limit + 1}
+    if cursor:
+        params.update({"cursor_dt": cursor[0], "cursor_id": cursor[1]})
+    with_cursor = cursor is not None
+
+    streams: Dict[Tuple[str, object], List[TimelineKey]] = {}
+    if board_ids:
+        for source, post_id, crt_dt in db.execute(text(_stream_sql(BOARD_STREAMS_SQL, "", with_cursor)), {**params, "board_ids": board_ids}):
+            streams.setdefault(("BOARD", source), []).append((crt_dt, post_id))
+    if user_ids:
+        for source, post_id, crt_dt in db.execute(text(_stream_sql(AUTHOR_STREAMS_SQL, "bp.", with_cursor)), {**params, "user_ids": user_ids}):
+            streams.setdefault(("USER", source), []).append((crt_dt, post_id))
+
+    post_ids: List[int] = []
+    seen = set()
+    last_key: Optional[TimelineKey] = None
+    has_more = False
+    # LATERAL 결과의 행 순서는 보장되지 않으므로 스트림별로 정렬한 뒤 병합
+    for key in heapq.merge(*(sorted(keys, reverse=True) for keys in streams.values()), reverse=True):
+        if key[1] in seen:
+            continue
+        if len(post_ids) == limit:
+            has_more = True
+            break
+        seen.add(key[1])
+        post_ids.append(key[1])
+        last_key = key
+
+    return post_ids, (last_key if has_more else None)
+
+
+class TimelinePageCache:
+    """
+    사용자별 타임라인 페이지 캐시 (프로세스 내 LRU)
+
+    (커서, limit)별로 병합 결과(게시글 ID와 다음 커서)만 저장하고, 게시글 내용과 카운트는
+    매 요청 조회합니다. 팔로우/언팔로우 시 캐시 무효화 버스("timeline:<사용자 ID>")로
+    모든 워커에서 해당 사용자의 캐시를 비웁니다.
+    """
+
+    def __init__(self, ttl: float, max_users: int, max_pages_per_user: int = 20):
+        self.ttl = ttl
+        self.max_users = max_users
+        self.max_pages_per_user = max_pages_per_user
+        self._pages: "OrderedDict[str, OrderedDict[Tuple[Optional[str], int], Tuple[float, List[int], Optional[str]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: str, cursor: Optional[str], limit: int) -> Optional[Tuple[List[int], Optional[str]]]:
+        """캐시된 페이지 조회 (없거나 만료되면 None)"""
+        if self.ttl <= 0:
+            return None
+        with self._lock:
+            pages = self._pages.get(user_id)
+            entry = pages.get((cursor, limit)) if pages is not None else None
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, post_ids, next_cursor = entry
+            if expires_at < time.monotonic():
+                del pages[(cursor, limit)]
+                self.misses += 1
+                return None
+            self._pages.move_to_end(user_id)
+            self.hits += 1
+            return list(post_ids), next_cursor
+
+    def set(self, user_id: str, cursor: Optional[str], limit: int, post_ids: List[int], next_cursor: Optional[str]) -> None:
+        """페이지 저장 (사용자 수와 사용자별 페이지 수를 넘으면 오래된 것부터 제거)"""
+        if self.ttl <= 0:
+            return
+        with self._lock:
+            pages = self._pages.setdefault(user_id, OrderedDict())
+            self._pages.move_to_end(user_id)
+            pages[(cursor, limit)] = (time.monotonic() + self.ttl, list(post_ids), next_cursor)
+            pages.move_to_end((cursor, limit))
+            while len(pages) > self.max_pages_per_user:
+                pages.popitem(last=False)
+            while len(self._pages) > self.max_users:
+                self._pages.popitem(last=False)
+
+    def invalidate(self, user_id: str) -> None:
+        """사용자의 캐시된 페이지 모두 제거"""
+        with self._lock:
+            self._pages.pop(user_id, None)
+
+    def clear(self) -> None:
+        """모든 사용자의 캐시된 페이지 제거"""
+        with self._lock:
+            self._pages.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 크기 및 적중 횟수"""
+        with self._lock:
+            return {
+                "users": len(self._pages),
+                "pages": sum(len(pages) for pages in self._pages.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
+
+
+def get_timeline_page(db: Session, user_id: str, cursor: Optional[str], limit: int) -> Tuple[List[int], Optional[str]]:
+    """
+    팔로잉 타임라인 한 페이지의 게시글 ID와 다음 커서
+
+    Raises:
+        ValueError: 커서 형식이 잘못된 경우
+    """
+    cached = timeline_cache.get(user_id, cursor, limit)
+    if cached is not None:
+        return cached
+
+    cursor_key = decode_cursor(cursor) if cursor else None
+    board_ids, user_ids = load_follow_sources(db, user_id)
+    post_ids, next_key = merge_timeline(db, board_ids, user_ids, cursor_key, limit)
+    next_cursor = encode_cursor(next_key) if next_key else None
+
+    timeline_cache.set(user_id, cursor, limit, post_ids, next_cursor)
+    return post_ids, next_cursor
+
+
+# 타임라인 페이지 전역 캐시
+timeline_cache = TimelinePageCache(
+    ttl=settings.timeline_cache_ttl,
+    max_users=settings.timeline_cache_max_users,
+)
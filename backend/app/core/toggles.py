@@ -0,0 +1,223 @@
+"""좋아요/북마크 토글 (한 문장으로 삭제 또는 추가와 카운터 갱신)"""
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+import logging
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 좋아요 유형별 카운터 증감 (DISLIKE는 lk_cnt를 줄임)
+_LIKE_DELTA = "CASE WHEN typ = 'LIKE' THEN 1 ELSE -1 END * CASE WHEN active THEN 1 ELSE -1 END"
+
+# 대상이 있으면 기존 행을 지우고, 지운 행이 없으면 추가한 뒤 카운터를 같은 문장에서 갱신
+TOGGLE_POST_LIKE_SQL = text(f"""
+    WITH target AS (
+        SELECT id FROM bbs_posts WHERE id = :target_id
+    ),
+    removed AS (
+        DELETE FROM bbs_post_likes
+        WHERE post_id = :target_id AND user_id = :user_id
+          AND EXISTS (SELECT 1 FROM target)
+        RETURNING id, user_id, typ, crt_dt
+    ),
+    added AS (
+        INSERT INTO bbs_post_likes (post_id, user_id, typ, crt_dt)
+        SELECT t.id, :user_id, CAST(:typ AS like_type), CURRENT_TIMESTAMP
+        FROM target t
+        WHERE NOT EXISTS (SELECT 1 FROM removed)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id, user_id, typ, crt_dt
+    ),
+    changed AS (
+        SELECT id, user_id, typ, crt_dt, TRUE AS active FROM added
+        UNION ALL
+        SELECT id, user_id, typ, crt_dt, FALSE AS active FROM removed
+    ),
+    counter AS (
+        UPDATE bbs_posts p
+        SET lk_cnt = COALESCE(p.lk_cnt, 0) + d.delta
+        FROM (SELECT SUM({_LIKE_DELTA}) AS delta FROM changed) d
+        WHERE p.id = :target_id AND d.delta IS NOT NULL
+        RETURNING p.lk_cnt
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM target) AS found,
+        c.id, c.user_id, c.typ, c.crt_dt, c.active,
+        (SELECT lk_cnt FROM counter) AS cnt
+    FROM (SELECT 1) AS one
+    LEFT JOIN changed c ON TRUE
+""")
+
+TOGGLE_COMMENT_LIKE_SQL = text(f"""
+    WITH target AS (
+        SELECT id FROM bbs_comments WHERE id = :target_id AND stts <> 'DELETED'
+    ),
+    removed AS (
+        DELETE FROM bbs_comment_likes
+        WHERE comment_id = :target_id AND user_id = :user_id
+          AND EXISTS (SELECT 1 FROM target)
+        RETURNING id, user_id, typ, crt_dt
+    ),
+    added AS (
+        INSERT INTO bbs_comment_likes (comment_id, user_id, typ, crt_dt)
+        SELECT t.id, :user_id, CAST(:typ AS like_type), CURRENT_TIMESTAMP
+        FROM target t
+        WHERE NOT EXISTS (SELECT 1 FROM removed)
+        ON CONFLICT (comment_id, user_id) DO NOTHING
+        RETURNING id, user_id, typ, crt_dt
+    ),
+    changed AS (
+        SELECT id, user_id, typ, crt_dt, TRUE AS active FROM added
+        UNION ALL
+        SELECT id, user_id, typ, crt_dt, FALSE AS active FROM removed
+    ),
+    counter AS (
+        UPDATE bbs_comments c
+        SET lk_cnt = COALESCE(c.lk_cnt, 0) + d.delta
+        FROM (SELECT SUM({_LIKE_DELTA}) AS delta FROM changed) d
+        WHERE c.id = :target_id AND d.delta IS NOT NULL
+        RETURNING c.lk_cnt
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM target) AS found,
+        c.id, c.user_id, c.typ, c.crt_dt, c.active,
+        (SELECT lk_cnt FROM counter) AS cnt
+    FROM (SELECT 1) AS one
+    LEFT JOIN changed c ON TRUE
+""")
+
+TOGGLE_BOOKMARK_SQL = text("""
+    WITH target AS (
+        SELECT id FROM bbs_posts WHERE id = :target_id
+    ),
+    removed AS (
+        DELETE FROM bbs_bookmarks
+        WHERE post_id = :target_id AND user_id = :user_id
+          AND EXISTS (SELECT 1 FROM target)
+        RETURNING id, post_id, user_id, crt_dt
+    ),
+    added AS (
+        INSERT INTO bbs_bookmarks (post_id, user_id, crt_dt)
+        SELECT t.id, :user_id, CURRENT_TIMESTAMP
+        FROM target t
+        WHERE NOT EXISTS (SELECT 1 FROM removed)
+        ON CONFLICT (post_id, user_id) DO NOTHING
+        RETURNING id, post_id, user_id, crt_dt
+    ),
+    changed AS (
+        SELECT id, post_id, user_id, crt_dt, TRUE AS active FROM added
+        UNION ALL
+        SELECT id, post_id, user_id, crt_dt, FALSE AS active FROM removed
+    )
+    SELECT
+        EXISTS (SELECT 1 FROM target) AS found,
+        c.id, c.post_id, c.user_id, c.crt_dt, c.active
+    FROM (SELECT 1) AS one
+    LEFT JOIN changed c ON TRUE
+""")
+
+# 동시 요청이 먼저 추가해 아무것도 바뀌지 않은 경우의 현재 상태 조회
+CURRENT_POST_LIKE_SQL = text("""
+    SELECT l.id, l.user_id, l.typ, l.crt_dt, p.lk_cnt AS cnt
+    FROM bbs_posts p
+    LEFT JOIN bbs_post_likes l ON l.post_id = p.id AND l.user_id = :user_id
+    WHERE p.id = :target_id
+""")
+
+CURRENT_COMMENT_LIKE_SQL = text("""
+    SELECT l.id, l.user_id, l.typ, l.crt_dt, c.lk_cnt AS cnt
+    FROM bbs_comments c
+    LEFT JOIN bbs_comment_likes l ON l.comment_id = c.id AND l.user_id = :user_id
+    WHERE c.id = :target_id
+""")
+
+CURRENT_BOOKMARK_SQL = text("""
+    SELECT id, post_id, user_id, crt_dt
+    FROM bbs_bookmarks
+    WHERE post_id = :target_id AND user_id = :user_id
+""")
+
+# 실제 좋아요 행(LIKE - DISLIKE)과 다른 lk_cnt만 재계산
+RECONCILE_POST_LIKES_SQL = text("""
+    UPDATE bbs_posts p
+    SET lk_cnt = COALESCE(l.cnt, 0)
+    FROM bbs_posts p2
+    LEFT JOIN (
+        SELECT post_id, SUM(CASE WHEN typ = 'LIKE' THEN 1 ELSE -1 END) AS cnt
+        FROM bbs_post_likes GROUP BY post_id
+    ) l ON l.post_id = p2.id
+    WHERE p.id = p2.id
+      AND p.lk_cnt IS DISTINCT FROM COALESCE(l.cnt, 0)
+""")
+
+RECONCILE_COMMENT_LIKES_SQL = text("""
+    UPDATE bbs_comments c
+    SET lk_cnt = COALESCE(l.cnt, 0)
+    FROM bbs_comments c2
+    LEFT JOIN (
+        SELECT comment_id, SUM(CASE WHEN typ = 'LIKE' THEN 1 ELSE -1 END) AS cnt
+        FROM bbs_comment_likes GROUP BY comment_id
+    ) l ON l.comment_id = c2.id
+    WHERE c.id = c2.id
+      AND c.lk_cnt IS DISTINCT FROM COALESCE(l.cnt, 0)
+""")
+
+
+@dataclass
+class ToggleResult:
+    """토글 결과"""
+    found: bool  # 대상(게시글/댓글) 존재 여부
+    active: bool = False  # 토글 후 좋아요/북마크 상태
+    changed: bool = False  # 이번 요청으로 추가 또는 삭제되었는지 여부
+    row: Optional[Dict[str, Any]] = None  # 추가되거나 삭제된 행 (변경이 없으면 현재 행)
+    count: Optional[int] = None  # 토글 후 좋아요 수
+
+
+def _toggle(db: Session, toggle_sql, current_sql, target_id: int, user_id: str, **params) -> ToggleResult:
+    result = db.execute(toggle_sql, {"target_id": target_id, "user_id": user_id, **params}).mappings().first()
+    if not result["found"]:
+        return ToggleResult(found=False)
+    if result["active"] is not None:
+        row = {key: value for key, value in result.items() if key not in ("found", "active", "cnt")}
+        return ToggleResult(
+            found=True, active=result["active"], changed=True, row=row, count=result.get("cnt")
+        )
+
+    # 같은 사용자의 동시 요청이 먼저 추가한 경우 (ON CONFLICT DO NOTHING) 현재 상태를 그대로 반환
+    current = db.execute(current_sql, {"target_id": target_id, "user_id": user_id}).mappings().first()
+    row = {key: value for key, value in current.items() if key != "cnt"} if current and current["id"] else None
+    return ToggleResult(found=True, active=row is not None, row=row, count=current.get("cnt") if current else None)
+
+
+def toggle_post_like(db: Session, post_id: int, user_id: str, typ: str = "LIKE") -> ToggleResult:
+    """게시글 좋아요 토글 (커밋은 호출자가 수행)"""
+    return _toggle(db, TOGGLE_POST_LIKE_SQL, CURRENT_POST_LIKE_SQL, post_id, user_id, typ=typ)
+
+
+def toggle_comment_like(db: Session, comment_id: int, user_id: str, typ: str = "LIKE") -> ToggleResult:
+    """댓글 좋아요 토글 (삭제된 댓글은 대상 없음으로 처리, 커밋은 호출자가 수행)"""
+    return _toggle(db, TOGGLE_COMMENT_LIKE_SQL, CURRENT_COMMENT_LIKE_SQL, comment_id, user_id, typ=typ)
+
+
+def toggle_bookmark(db: Session, post_id: int, user_id: str) -> ToggleResult:
+    """게시글 북마크 토글 (커밋은 호출자가 수행)"""
+    return _toggle(db, TOGGLE_BOOKMARK_SQL, CURRENT_BOOKMARK_SQL, post_id, user_id)
+
+
+def reconcile_like_counters() -> dict:
+    """
+    게시글/댓글 좋아요 수와 실제 좋아요 행 보정 (스케줄러에서 주기적으로 실행)
+
+    lk_cnt는 토글 문장만 갱신하므로 사용자/게시글 삭제의 연쇄 삭제, 관리자 정리, 수동 SQL처럼
+    토글을 거치지 않고 좋아요 행이 바뀐 경우를 바로잡습니다.
+    """
+    with engine.begin() as conn:
+        posts = conn.execute(RECONCILE_POST_LIKES_SQL).rowcount
+    with engine.begin() as conn:
+        comments = conn.execute(RECONCILE_COMMENT_LIKES_SQL).rowcount
+
+    if posts or comments:
+        logger.info(f"좋아요 수 보정: 게시글 {posts}건, 댓글 {comments}건")
+    return {"posts": posts, "comments": comments}
@@ -0,0 +1,157 @@
+"""급상승 태그 (시간 버킷별 태그 사용 횟수 -> 기간별 감쇠 점수 상위 k건)"""
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+# 여러 워커가 동시에 순위를 계산하지 않도록 하는 advisory lock 키
+TRENDING_LOCK_KEY = "bbs_trending_tags"
+
+# 기간 단위별 초
+WINDOW_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+# 시각을 버킷 시작 시각으로 내림
+BUCKET_SQL = "to_timestamp(floor(extract(epoch FROM {ts}) / :bucket) * :bucket)"
+
+
+def parse_windows(spec: str) -> Dict[str, int]:
+    """'1h,24h,7d' 형식의 기간 목록을 {이름: 초}로 변환"""
+    return {
+        window: int(window[:-1]) * WINDOW_UNITS[window[-1]]
+        for window in (w.strip() for w in spec.split(",")) if window
+    }
+
+
+# 설정된 집계 기간 (이름 -> 초)
+TRENDING_WINDOWS = parse_windows(settings.trending_tag_windows)
+MAX_WINDOW_SECONDS = max(TRENDING_WINDOWS.values())
+
+
+def record_tag_usage(
+    db: Session,
+    attached: Iterable[int],
+    detached: Iterable[Tuple[int, datetime]] = (),
+) -> None:
+    """
+    태그 연결/해제를 시간 버킷 카운터에 반영 (호출한 세션의 트랜잭션에서 한 번의 UPSERT)
+
+    연결은 현재 버킷에 +1, 해제는 원래 연결된 시각의 버킷에 -1을 합니다. 가장 긴 집계 기간보다
+    오래된 연결의 해제는 이미 정리된 버킷이므로 반영하지 않습니다.
+
+    Args:
+        attached: 새로 연결된 태그 ID
+        detached: 해제된 (태그 ID, 연결 일시)
+    """
+    tag_ids: List[int] = []
+    times: List[Optional[datetime]] = []
+    deltas: List[int] = []
+    for tag_id in attached:
+        tag_ids.append(tag_id)
+        times.append(None)
+        deltas.append(1)
+    for tag_id, crt_dt in detached:
+        tag_ids.append(tag_id)
+        times.append(crt_dt)
+        deltas.append(-1)
+    if not tag_ids:
+        return
+
+    db.execute(text(f"""
+        INSERT INTO bbs_tag_usage_buckets (tag_id, bucket_start, cnt)
+        SELECT tag_id, {BUCKET_SQL.format(ts="COALESCE(ts, CURRENT_TIMESTAMP)")} AS bucket_start, SUM(delta)
+        FROM unnest(
+            CAST(:tag_ids AS BIGINT[]), CAST(:times AS TIMESTAMPTZ[]), CAST(:deltas AS INT[])
+        ) AS d(tag_id, ts, delta)
+        WHERE COALESCE(ts, CURRENT_TIMESTAMP) >= CURRENT_TIMESTAMP - make_interval(secs => :max_window)
+        GROUP BY 1, 2
+        ON CONFLICT (tag_id, bucket_start) DO UPDATE
+        SET cnt = bbs_tag_usage_buckets.cnt + EXCLUDED.cnt
+    """), {
+        "tag_ids": tag_ids,
+        "times": times,
+        "deltas": deltas,
+        "bucket": settings.trending_tag_bucket_seconds,
+        "max_window": MAX_WINDOW_SECONDS,
+    })
+
+
+def get_trending_tags(db: Session, window: str, limit: int) -> List[Dict]:
+    """
+    미리 계산된 기간별 급상승 태그
+
+    Raises:
+        ValueError: 설정되지 않은 기간인 경우
+    """
+    if window not in TRENDING_WINDOWS:
+        raise ValueError(f"지원하지 않는 기간입니다. 사용 가능한 기간: {', '.join(TRENDING_WINDOWS)}")
+    rows = db.execute(text("""
+        SELECT t.id, t.nm, t.color, r.rnk, r.score, r.cnt, r.upd_dt
+        FROM bbs_trending_tags r
+        JOIN bbs_tags t ON t.id = r.tag_id
+        WHERE r.window_nm = :window
+        ORDER BY r.rnk
+        LIMIT :limit
+    """), {"window": window, "limit": limit}).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def run_trending_tags_refresh() -> dict:
+    """
+    기간별 급상승 태그 순위 재계산과 오래된 버킷 정리 (스케줄러에서 주기적으로 실행)
+
+    버킷 사용 횟수에 기간의 절반을 반감기로 하는 지수 감쇠를 적용해 합산하므로 기간 안에서도
+    최근 사용이 더 높은 점수를 받습니다. 기간별 상위 TRENDING_TAG_TOP_K건만 저장합니다.
+    """
+    result = {"windows": {}, "purged": 0, "skipped": None}
+
+    with engine.begin() as conn:
+        locked = conn.execute(
+            text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+            {"key": TRENDING_LOCK_KEY}
+        ).scalar()
+        if not locked:
+            result["skipped"] = "locked"
+            return result
+
+        for window, seconds in TRENDING_WINDOWS.items():
+            conn.execute(text("DELETE FROM bbs_trending_tags WHERE window_nm = :window"), {"window": window})
+            result["windows"][window] = conn.execute(text("""
+                INSERT INTO bbs_trending_tags (window_nm, tag_id, rnk, score, cnt, upd_dt)
+                SELECT :window, tag_id,
+                       ROW_NUMBER() OVER (ORDER BY score DESC, cnt DESC, tag_id DESC),
+                       score, cnt, CURRENT_TIMESTAMP
+                FROM (
+                    SELECT tag_id,
+                           SUM(cnt * power(0.5, extract(epoch FROM CURRENT_TIMESTAMP - bucket_start) / :half_life)) AS score,
+                           SUM(cnt) AS cnt
+                    FROM bbs_tag_usage_buckets
+                    WHERE bucket_start >= CURRENT_TIMESTAMP - make_interval(secs => :window_seconds)
+                    GROUP BY tag_id
+                    HAVING SUM(cnt) > 0
+                    ORDER BY score DESC, cnt DESC, tag_id DESC
+                    LIMIT :top_k
+                ) ranked
+            """), {
+                "window": window,
+                "window_seconds": seconds,
+                "half_life": seconds / 2,
+                "top_k": settings.trending_tag_top_k,
+            }).rowcount
+
+        # 가장 긴 기간보다 오래된 버킷 정리
+        result["purged"] = conn.execute(text(f"""
+            DELETE FROM bbs_tag_usage_buckets
+            WHERE bucket_start < {BUCKET_SQL.format(ts="CURRENT_TIMESTAMP - make_interval(secs => :max_window)")}
+        """), {
+            "bucket": settings.trending_tag_bucket_seconds,
+            "max_window": MAX_WINDOW_SECONDS,
+        }).rowcount
+
+    if result["purged"]:
+        logger.info(f"급상승 태그 버킷 {result['purged']}건 정리")
+    return result
@@ -0,0 +1,279 @@
+"""게시글 조회수 일별 롤업 (bbs_post_views -> bbs_post_view_daily)"""
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional
+import logging
+from sqlalchemy import text, func, cast, Date
+from sqlalchemy.orm import Session
+from app.core.config import settings
+from app.database import engine
+from app.models.board import BbsPost, BbsPostView, BbsPostViewDaily, PostStatus
+
+logger = logging.getLogger(__name__)
+
+# bbs_rollup_state에 기록되는 작업명
+ROLLUP_NAME = "post_view_daily"
+
+# 여러 워커가 동시에 롤업/정리를 실행하지 않도록 하는 advisory lock 키
+ROLLUP_LOCK_KEY = "bbs_post_view_rollup"
+PURGE_LOCK_KEY = "bbs_post_view_purge"
+
+
+# 원본 조회 기록은 (기록한 트랜잭션 ID, ID) 순서로 집계하고, bbs_rollup_state에 마지막으로 집계한 위치를 기록
+# 트랜잭션 ID가 현재 스냅샷의 xmin보다 작은 기록은 모두 커밋(또는 롤백)이 끝났으므로
+# 늦게 커밋된 기록이 이미 지나간 위치 뒤에 끼어들지 않습니다 (ID만 기준으로 하면 누락될 수 있음).
+def _pending_views():
+    """아직 롤업되지 않은 원본 조회 기록 조건 (마지막 집계 위치 이후)"""
+    return text(f"""
+        (bbs_post_views.ins_xid, bbs_post_views.id) > (
+            SELECT last_xid, last_id FROM bbs_rollup_state WHERE nm = '{ROLLUP_NAME}'
+            UNION ALL
+            SELECT '0'::xid8, 0
+            ORDER BY 1 DESC, 2 DESC
+            LIMIT 1
+        )
+    """)
+
+
+def _view_day(column):
+    """조회 일시를 UTC 기준 날짜로 변환 (bbs_post_views 유니크 인덱스와 같은 기준)"""
+    return cast(func.timezone('UTC', column), Date)
+
+
+def get_post_view_counts(db: Session, post_ids: Iterable[int]) -> Dict[int, int]:
+    """
+    게시글별 누적 조회수
+
+    롤업 테이블의 합계와 아직 롤업되지 않은 최근 원본 기록 수를 더해 계산합니다.
+    목록 조회에서 게시글마다 COUNT를 실행하지 않도록 한 번에 조회합니다.
+    """
+    post_ids = list(set(post_ids))
+    if not post_ids:
+        return {}
+    counts = {post_id: 0 for post_id in post_ids}
+
+    rolled = db.query(
+        BbsPostViewDaily.post_id,
+        func.sum(BbsPostViewDaily.view_cnt)
+    ).filter(
+        BbsPostViewDaily.post_id.in_(post_ids)
+    ).group_by(BbsPostViewDaily.post_id).all()
+
+    recent = db.query(
+        BbsPostView.post_id,
+        func.count(BbsPostView.id)
+    ).filter(
+        BbsPostView.post_id.in_(post_ids),
+        _pending_views()
+    ).group_by(BbsPostView.post_id).all()
+
+    for post_id, count in list(rolled) + list(recent):
+        counts[post_id] += int(count or 0)
+    return counts
+
+
+def get_board_view_counts(db: Session, board_ids: Iterable[int]) -> Dict[int, int]:
+    """게시판별 누적 조회수 (PUBLISHED 상태의 게시글만)"""
+    board_ids = list(set(board_ids))
+    if not board_ids:
+        return {}
+    counts = {board_id: 0 for board_id in board_ids}
+
+    rolled = db.query(
+        BbsPost.board_id,
+        func.sum(BbsPostViewDaily.view_cnt)
+    ).join(
+        BbsPostViewDaily, BbsPostViewDaily.post_id == BbsPost.id
+    ).filter(
+        BbsPost.board_id.in_(board_ids),
+        BbsPost.stts == PostStatus.PUBLISHED
+    ).group_by(BbsPost.board_id).all()
+
+    recent = db.query(
+        BbsPost.board_id,
+        func.count(BbsPostView.id)
+    ).join(
+        BbsPost, BbsPostView.post_id == BbsPost.id
+    ).filter(
+        BbsPost.board_id.in_(board_ids),
+        BbsPost.stts == PostStatus.PUBLISHED,
+        _pending_views()
+    ).group_by(BbsPost.board_id).all()
+
+    for board_id, count in list(rolled) + list(recent):
+        counts[board_id] += int(count or 0)
+    return counts
+
+
+def get_daily_view_series(
+    db: Session,
+    start_date: date,
+    end_date: date,
+    post_id: Optional[int] = None,
+    board_id: Optional[int] = None,
+) -> List[Dict]:
+    """
+    일별 조회수 시계열 (post_id 또는 board_id 기준)
+
+    조회 기록이 없는 날짜는 0으로 채워 start_date부터 end_date까지 모든 날짜를 반환합니다.
+    """
+    rolled = db.query(
+        BbsPostViewDaily.view_dt,
+        func.sum(BbsPostViewDaily.view_cnt)
+    ).filter(
+        BbsPostViewDaily.view_dt >= start_date,
+        BbsPostViewDaily.view_dt <= end_date
+    )
+
+    view_day = _view_day(BbsPostView.crt_dt)
+    recent = db.query(
+        view_day,
+        func.count(BbsPostView.id)
+    ).filter(
+        _pending_views(),
+        view_day >= start_date,
+        view_day <= end_date
+    )
+
+    if post_id is not None:
+        rolled = rolled.filter(BbsPostViewDaily.post_id == post_id)
+        recent = recent.filter(BbsPostView.post_id == post_id)
+    if board_id is not None:
+        rolled = rolled.join(BbsPost, BbsPostViewDaily.post_id == BbsPost.id).filter(
+            BbsPost.board_id == board_id,
+            BbsPost.stts == PostStatus.PUBLISHED
+        )
+        recent = recent.join(BbsPost, BbsPostView.post_id == BbsPost.id).filter(
+            BbsPost.board_id == board_id,
+            BbsPost.stts == PostStatus.PUBLISHED
+        )
+
+    counts: Dict[date, int] = {}
+    for view_dt, count in list(rolled.group_by(BbsPostViewDaily.view_dt).all()) + list(recent.group_by(view_day).all()):
+        counts[view_dt] = counts.get(view_dt, 0) + int(count or 0)
+
+    series = []
+    current = start_date
+    while current <= end_date:
+        series.append({"date": current, "view_cnt": counts.get(current, 0)})
+        current += timedelta(days=1)
+    return series
+
+
+def run_view_rollup() -> dict:
+    """
+    원본 조회 기록을 일별 집계 테이블에 증분 반영 (스케줄러에서 주기적으로 실행)
+
+    bbs_rollup_state에 기록된 마지막 위치 이후의 기록만 (트랜잭션 ID, ID) 순서로 VIEW_ROLLUP_BATCH_SIZE건씩 집계합니다.
+    아직 끝나지 않은 트랜잭션이 남길 수 있는 기록을 건너뛰지 않도록, 현재 스냅샷의 xmin 이전 트랜잭션이 기록한 것만 집계합니다.
+    """
+    result = {"rolled_up": 0, "last_id": None, "skipped": None}
+
+    while True:
+        with engine.begin() as conn:
+            locked = conn.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                {"key": ROLLUP_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                result["skipped"] = "locked"
+                return result
+
+            conn.execute(text("""
+                INSERT INTO bbs_rollup_state (nm, last_id, last_xid, upd_dt)
+                VALUES (:nm, 0, '0', CURRENT_TIMESTAMP)
+                ON CONFLICT (nm) DO NOTHING
+            """), {"nm": ROLLUP_NAME})
+            last_xid, last_id = conn.execute(
+                text("SELECT last_xid::text, last_id FROM bbs_rollup_state WHERE nm = :nm FOR UPDATE"),
+                {"nm": ROLLUP_NAME}
+            ).one()
+
+            upper = conn.execute(text("""
+                SELECT ins_xid::text, id FROM (
+                    SELECT ins_xid, id FROM bbs_post_views
+                    WHERE (ins_xid, id) > (CAST(:last_xid AS xid8), :last_id)
+                      AND ins_xid < pg_snapshot_xmin(pg_current_snapshot())
+                    ORDER BY ins_xid, id
+                    LIMIT :batch_size
+                ) batch
+                ORDER BY ins_xid DESC, id DESC
+                LIMIT 1
+            """), {
+                "last_xid": last_xid,
+                "last_id": last_id,
+                "batch_size": settings.view_rollup_batch_size,
+            }).first()
+            if upper is None:
+                result["last_id"] = last_id
+                break
+            upper_xid, upper_id = upper
+
+            inserted = conn.execute(text("""
+                INSERT INTO bbs_post_view_daily (post_id, view_dt, view_cnt, upd_dt)
+                SELECT post_id, (crt_dt AT TIME ZONE 'UTC')::date, COUNT(*), CURRENT_TIMESTAMP
+                FROM bbs_post_views
+                WHERE (ins_xid, id) > (CAST(:last_xid AS xid8), :last_id)
+                  AND (ins_xid, id) <= (CAST(:upper_xid AS xid8), :upper_id)
+                GROUP BY post_id, (crt_dt AT TIME ZONE 'UTC')::date
+                ON CONFLICT (post_id, view_dt) DO UPDATE
+                SET view_cnt = bbs_post_view_daily.view_cnt + EXCLUDED.view_cnt,
+                    upd_dt = EXCLUDED.upd_dt
+            """), {"last_xid": last_xid, "last_id": last_id, "upper_xid": upper_xid, "upper_id": upper_id}).rowcount
+
+            conn.execute(text("""
+                UPDATE bbs_rollup_state
+                SET last_xid = CAST(:upper_xid AS xid8), last_id = :upper_id, upd_dt = CURRENT_TIMESTAMP
+                WHERE nm = :nm
+            """), {"upper_xid": upper_xid, "upper_id": upper_id, "nm": ROLLUP_NAME})
+            result["rolled_up"] += inserted
+            result["last_id"] = upper_id
+
+    if result["rolled_up"]:
+        logger.info(f"조회수 롤업 완료: 집계 행 {result['rolled_up']}건, 마지막 ID {result['last_id']}")
+    return result
+
+
+def purge_raw_views() -> dict:
+    """
+    보존 기간이 지난 원본 조회 기록 삭제 (스케줄러에서 주기적으로 실행)
+
+    이미 롤업된 기록만 삭제하므로 누적 조회수는 변하지 않습니다.
+    VIEW_RAW_RETENTION_DAYS가 0 이하이면 삭제하지 않습니다.
+    """
+    result = {"deleted": 0, "skipped": None}
+    retention_days = settings.view_raw_retention_days
+    if retention_days <= 0:
+        result["skipped"] = "disabled"
+        return result
+
+    while True:
+        with engine.begin() as conn:
+            locked = conn.execute(
+                text("SELECT pg_try_advisory_xact_lock(hashtext(:key))"),
+                {"key": PURGE_LOCK_KEY}
+            ).scalar()
+            if not locked:
+                result["skipped"] = "locked"
+                break
+
+            deleted = conn.execute(text("""
+                DELETE FROM bbs_post_views
+                WHERE id IN (
+                    SELECT id FROM bbs_post_views
+                    WHERE (ins_xid, id) <= (SELECT last_xid, last_id FROM bbs_rollup_state WHERE nm = :nm)
+                      AND crt_dt < CURRENT_TIMESTAMP - make_interval(days => :days)
+                    ORDER BY id
+                    LIMIT :batch_size
+                )
+            """), {
+                "nm": ROLLUP_NAME,
+                "days": retention_days,
+                "batch_size": settings.view_rollup_batch_size,
+            }).rowcount
+        result["deleted"] += deleted
+        if deleted < settings.view_rollup_batch_size:
+            break
+
+    if result["deleted"]:
+        logger.info(f"보존 기간이 지난 조회 기록 {result['deleted']}건 삭제")
+    return result
@@ -0,0 +1,134 @@
+"""앱 시작 예열 (DB 커넥션, 매퍼 구성, 자주 쓰는 캐시/쿼리) 및 준비 상태"""
+from typing import Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import time
+from sqlalchemy.orm import Session, configure_mappers
+from app.core.config import settings
+from app.core.metrics import GaugeCallback, registry
+from app.database import SessionLocal, engine
+
+logger = logging.getLogger(__name__)
+
+
+def open_pool_connections(count: int) -> int:
+    """
+    커넥션 풀 예열 (count개를 동시에 열었다가 풀에 반납, 연 개수 반환)
+
+    풀 크기보다 많이 열면 overflow 커넥션은 반납 시 닫히므로 풀 크기까지만 엽니다.
+    """
+    count = min(count, engine.pool.size())
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+    return len(connections)
+
+
+class Warmup:
+    """
+    앱 시작 예열
+
+    lifespan 시작 시 스레드에서 순서대로 실행합니다.
+    - pool: SERVER_WARMUP_CONNECTIONS개 커넥션 연결
+    - mappers: SQLAlchemy 매퍼 구성 (첫 쿼리에서 하던 관계 설정)
+    - 등록된 단계: 자주 쓰는 캐시 채우기와 쿼리 미리 실행 (단계마다 새 세션)
+
+    단계가 실패해도 로그만 남기고 다음 단계를 진행합니다 (DB 장애로 워커가 뜨지 못하는 일이 없도록).
+    모든 단계가 끝나야 준비 완료(ready)이며, /api/v1/health/ready는 그 전까지 503을 반환합니다.
+    SERVER_WARMUP_TIMEOUT 안에 끝나지 않으면 시작은 계속하고 나머지 예열은 백그라운드에서 마칩니다.
+    """
+
+    def __init__(self, enabled: bool, connections: int, timeout: float):
+        self.enabled = enabled
+        self.connections = connections
+        self.timeout = timeout
+        self.ready = not enabled
+        self._steps: List[Tuple[str, Callable[[Session], None]]] = []
+        self._task: Optional["asyncio.Future"] = None
+        self.results: Dict[str, str] = {}
+        self.durations: Dict[str, float] = {}
+        self.duration: Optional[float] = None
+
+    def add_step(self, name: str, step: Callable[[Session], None]) -> None:
+        """예열 단계 등록 (세션을 받아 캐시를 채우거나 쿼리를 실행하는 함수)"""
+        self._steps.append((name, step))
+
+    def stats(self) -> Dict[str, object]:
+        """예열 상태와 단계별 결과/소요 시간"""
+        return {
+            "enabled": self.enabled,
+            "ready": self.ready,
+            "duration": round(self.duration, 3) if self.duration is not None else None,
+            "steps": {
+                name: {"result": result, "seconds": round(self.durations.get(name, 0.0), 3)}
+                for name, result in self.results.items()
+            },
+        }
+
+    def _run_step(self, name: str, step: Callable[[], None]) -> None:
+        started = time.perf_counter()
+        try:
+            step()
+            self.results[name] = "ok"
+        except Exception as e:
+            self.results[name] = "failed"
+            logger.warning(f"예열 단계 실패 ({name}): {type(e).__name__}: {str(e)}")
+        finally:
+            self.durations[name] = time.perf_counter() - started
+
+    def _run_session_step(self, step: Callable[[Session], None]) -> None:
+        db = SessionLocal()
+        try:
+            step(db)
+        finally:
+            db.rollback()
+            db.close()
+
+    def run(self) -> None:
+        """예열 실행 (동기, 끝나면 준비 완료)"""
+        started = time.perf_counter()
+        try:
+            self._run_step("pool", lambda: open_pool_connections(self.connections))
+            self._run_step("mappers", configure_mappers)
+            for name, step in self._steps:
+                self._run_step(name, lambda step=step: self._run_session_step(step))
+        finally:
+            self.duration = time.perf_counter() - started
+            self.ready = True
+        failed = [name for name, result in self.results.items() if result != "ok"]
+        logger.info(
+            f"예열 완료: {self.duration:.2f}초"
+            + (f" (실패한 단계: {', '.join(failed)})" if failed else "")
+        )
+
+    async def start(self) -> None:
+        """예열 시작 (SERVER_WARMUP_TIMEOUT까지 기다리고, 넘으면 백그라운드에서 계속)"""
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.ensure_future(asyncio.to_thread(self.run))
+        try:
+            await asyncio.wait_for(asyncio.shield(self._task), self.timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"예열이 {self.timeout}초 안에 끝나지 않아 백그라운드에서 계속합니다 (완료 전까지 준비 안 됨)")
+
+    async def stop(self) -> None:
+        """진행 중인 예열이 끝날 때까지 대기 (스레드는 중단할 수 없으므로 종료 전에 정리)"""
+        if self._task is not None and not self._task.done():
+            await asyncio.wait([self._task])
+
+
+# 애플리케이션 전역 예열
+warmup = Warmup(
+    enabled=settings.server_warmup_enabled,
+    connections=settings.server_warmup_connections,
+    timeout=settings.server_warmup_timeout,
+)
+
+registry.register(GaugeCallback(
+    "app_warmup_ready", "시작 예열 완료 여부 (1: 준비 완료)", (),
+    lambda: [((), 1 if warmup.ready else 0)]
+))
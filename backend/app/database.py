@@ -3,13 +3,16 @@ from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
+from app.core.metrics import TimedQueuePool
 
-# 데이터베이스 엔진 생성
+# 데이터베이스 엔진 생성 (커넥션 대기 시간은 /metrics의 db_pool_wait_seconds로 노출)
 engine = create_engine(
     settings.database_url,
+    poolclass=TimedQueuePool,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    pool_timeout=settings.db_pool_timeout,
     echo=settings.debug,
 )
 
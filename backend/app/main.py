@@ -1,8 +1,54 @@
 """FastAPI 애플리케이션 진입점"""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import OperationalError
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.core.audit import AuditLogMiddleware, audit_log_writer
+from app.core.audit_partition import run_partition_maintenance
+from app.core.scheduler import scheduler
+from app.core.view_rollup import run_view_rollup, purge_raw_views
+from app.core.notifications import notification_dispatcher, reconcile_unread_counters
+from app.core.pubsub import notification_hub
+from app.core.invalidation import invalidation_bus
+from app.core.tags import reconcile_tag_usage
+from app.core.toggles import reconcile_like_counters
+from app.core.related_posts import run_related_posts_refresh
+from app.core.trending_tags import run_trending_tags_refresh
+from app.core.rate_limit import purge_rate_limit_buckets
+from app.core.cache import purge_expired_cache_entries
+from app.core.sql_metrics import SqlMetricsMiddleware
+from app.core.timeline import timeline_cache
+from app.core import metrics
+from app.core.admission import AdmissionMiddleware, admission_controller, statement_timeout_handler
+from app.core.warmup import warmup
+from app.api.v1.endpoints.boards import warm_board_caches
+from app.api.v1.endpoints.board_extra import warm_tag_caches
+from app.api.v1.endpoints.locales import warm_locale_statements
+from app.api.v1.endpoints.roles import warm_role_statements
+from app.database import engine
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """백그라운드 태스크 시작과 예열, 종료 시 역순 정리 (대기 중인 알림/감사 로그 기록)"""
+    await audit_log_writer.start()
+    await notification_hub.start()
+    await invalidation_bus.start()
+    await notification_dispatcher.start()
+    await scheduler.start()
+    await warmup.start()
+    try:
+        yield
+    finally:
+        await warmup.stop()
+        await scheduler.stop()
+        await notification_dispatcher.stop()
+        await invalidation_bus.stop()
+        await notification_hub.stop()
+        await audit_log_writer.stop()
+
 
 # FastAPI 애플리케이션 생성
 app = FastAPI(
@@ -11,8 +57,14 @@ app = FastAPI(
     description="NCACO Project Backend API",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
+# 과부하 시 요청 수락 제어 (CORS보다 먼저 등록해 거절 응답에도 CORS 헤더가 붙도록 안쪽에 배치)
+if settings.admission_enabled:
+    app.add_middleware(AdmissionMiddleware, controller=admission_controller)
+app.add_exception_handler(OperationalError, statement_timeout_handler)
+
 # CORS 설정
 # 개발 모드에서 CORS origins 확인 및 설정
 if settings.debug:
@@ -27,9 +79,93 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# 감사 로그 자동 수집 미들웨어 (큐에 적재만 하고 기록은 백그라운드에서 배치 처리)
+if settings.audit_middleware_enabled:
+    app.add_middleware(AuditLogMiddleware, writer=audit_log_writer)
+
+# 요청별 SQL 실행 수/시간을 Server-Timing 헤더로 내보내고 기준을 넘은 요청은 로그로 기록
+if settings.sql_metrics_enabled:
+    app.add_middleware(SqlMetricsMiddleware)
+
+# 라우트별 요청 지연/상태 코드 수집 (가장 바깥에서 전체 처리 시간을 측정)
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+
+# 주기 작업 등록
+if settings.audit_log_partition_enabled:
+    scheduler.add_job(
+        "audit_log_partition",
+        settings.audit_log_partition_interval,
+        run_partition_maintenance
+    )
+if settings.view_rollup_enabled:
+    scheduler.add_job("post_view_rollup", settings.view_rollup_interval, run_view_rollup)
+    scheduler.add_job("post_view_purge", settings.view_purge_interval, purge_raw_views, run_on_start=False)
+scheduler.add_job(
+    "notification_counter_reconcile",
+    settings.notification_counter_reconcile_interval,
+    reconcile_unread_counters,
+    run_on_start=False
+)
+scheduler.add_job(
+    "tag_usage_reconcile",
+    settings.tag_usage_reconcile_interval,
+    reconcile_tag_usage,
+    run_on_start=False
+)
+scheduler.add_job(
+    "like_counter_reconcile",
+    settings.like_counter_reconcile_interval,
+    reconcile_like_counters,
+    run_on_start=False
+)
+if settings.related_posts_enabled:
+    scheduler.add_job("related_posts_refresh", settings.related_posts_interval, run_related_posts_refresh)
+scheduler.add_job("trending_tags_refresh", settings.trending_tag_interval, run_trending_tags_refresh)
+if settings.rate_limit_backend == "postgres":
+    scheduler.add_job(
+        "rate_limit_purge",
+        settings.rate_limit_purge_interval,
+        purge_rate_limit_buckets,
+        run_on_start=False
+    )
+if settings.cache_backend == "postgres":
+    scheduler.add_job(
+        "cache_purge",
+        settings.cache_purge_interval,
+        purge_expired_cache_entries,
+        run_on_start=False
+    )
+
+# 메트릭 수집 대상 등록 (값은 스크레이프 시점에 읽음)
+metrics.register_pool(engine)
+metrics.register_queue("audit_log", audit_log_writer.qsize, audit_log_writer.max_size, audit_log_writer.counters)
+metrics.register_queue(
+    "notification",
+    notification_dispatcher.qsize,
+    notification_dispatcher.max_size,
+    notification_dispatcher.counters
+)
+metrics.register_cache("timeline", timeline_cache.stats)
+
+# 워커 간 캐시 무효화 대상 등록
+invalidation_bus.register("timeline", timeline_cache.invalidate, timeline_cache.clear)
+metrics.register_scheduler(scheduler)
+
+# 시작 예열 단계 (자주 쓰는 캐시와 쿼리, 끝나야 준비 상태 확인 통과)
+warmup.add_step("board_caches", warm_board_caches)
+warmup.add_step("tag_caches", warm_tag_caches)
+warmup.add_step("locale_statements", warm_locale_statements)
+warmup.add_step("role_statements", warm_role_statements)
+
+
 # API 라우터 등록
 app.include_router(api_router, prefix="/api/v1")
 
+# Prometheus 스크레이프 엔드포인트 (인증 없이 노출되므로 METRICS_TOKEN이나 네트워크 정책으로 제한)
+if settings.metrics_enabled:
+    app.add_api_route(settings.metrics_path, metrics.metrics_endpoint, methods=["GET"], include_in_schema=False)
+
 
 @app.get("/")
 async def root():
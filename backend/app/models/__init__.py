@@ -15,7 +15,9 @@ from app.models.board import (
     BbsFileThumbnail, BbsPostLike, BbsCommentLike, BbsBookmark,
     BbsReport, BbsNotification, BbsTag, BbsPostTag, BbsFollow,
     BbsActivityLog, BbsPostHistory, BbsUserPreference, BbsSearchLog,
-    BbsAdminLog, BbsStatistic
+    BbsAdminLog, BbsStatistic, BbsPostViewDaily, BbsRollupState,
+    BbsNotificationCounter, BbsUserFollowCount, BbsPostRelated,
+    BbsPostRelatedQueue, BbsTagUsageBucket, BbsTrendingTag
 )
 
 __all__ = [
@@ -35,6 +37,8 @@ __all__ = [
     "BbsFileThumbnail", "BbsPostLike", "BbsCommentLike", "BbsBookmark",
     "BbsReport", "BbsNotification", "BbsTag", "BbsPostTag", "BbsFollow",
     "BbsActivityLog", "BbsPostHistory", "BbsUserPreference", "BbsSearchLog",
-    "BbsAdminLog", "BbsStatistic"
+    "BbsAdminLog", "BbsStatistic", "BbsPostViewDaily", "BbsRollupState",
+    "BbsNotificationCounter", "BbsUserFollowCount", "BbsPostRelated",
+    "BbsPostRelatedQueue", "BbsTagUsageBucket", "BbsTrendingTag"
 ]
 
@@ -1,23 +1,23 @@
 """감사 로그 모델"""
 from datetime import datetime
-from sqlalchemy import Column, BigInteger, String, Boolean, DateTime, Integer, Text, ForeignKey, Index, func
+from sqlalchemy import Column, BigInteger, String, Boolean, DateTime, Integer, Text, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.database import Base
 
 
 class CommonAuditLog(Base):
-    """감사 로그 테이블"""
+    """감사 로그 테이블 (crt_dt 기준 월별 범위 파티션)"""
     __tablename__ = "common_audit_log"
 
-    # 기본 키
+    # 기본 키 (파티션 키인 crt_dt 포함)
     common_audit_log_sn = Column(BigInteger, primary_key=True, autoincrement=True, comment="일련번호")
 
     # 로그 정보
-    audit_log_id = Column(String(100), unique=True, nullable=False, comment="로그 고유 식별자")
-    user_id = Column(String(100), ForeignKey("common_user.user_id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, index=True, comment="사용자 ID (NULL 가능)")
-    act_typ = Column(String(50), nullable=False, index=True, comment="액션 타입 (LOGIN, LOGOUT, CREATE, UPDATE, DELETE, API_CALL)")
-    rsrc_typ = Column(String(50), nullable=True, index=True, comment="리소스 타입 (USER, FILE, ROLE 등)")
+    audit_log_id = Column(String(100), nullable=False, comment="로그 고유 식별자")
+    user_id = Column(String(100), ForeignKey("common_user.user_id", ondelete="SET NULL", onupdate="CASCADE"), nullable=True, comment="사용자 ID (NULL 가능)")
+    act_typ = Column(String(50), nullable=False, comment="액션 타입 (LOGIN, LOGOUT, CREATE, UPDATE, DELETE, API_CALL)")
+    rsrc_typ = Column(String(50), nullable=True, comment="리소스 타입 (USER, FILE, ROLE 등)")
     rsrc_id = Column(String(100), nullable=True, comment="리소스 ID")
 
     # 변경 정보
@@ -41,6 +41,7 @@ class CommonAuditLog(Base):
     # 생성 관련 (감사 로그는 수정되지 않음)
     crt_dt = Column(
         DateTime,
+        primary_key=True,
         default=func.current_timestamp(),
         nullable=False,
         comment="생성일시"
@@ -54,15 +55,13 @@ class CommonAuditLog(Base):
     # 관계
     user = relationship("CommonUser", back_populates="audit_logs")
 
-    # 인덱스
+    # 인덱스 (단일 컬럼 인덱스는 복합 인덱스의 선두 컬럼으로 대체)
     __table_args__ = (
-        Index("idx_audit_log_user_id", "user_id"),
+        UniqueConstraint("audit_log_id", "crt_dt", name="uk_audit_log_id"),
         Index("idx_audit_log_user_crt_dt", "user_id", "crt_dt"),
         Index("idx_audit_log_act_crt_dt", "act_typ", "crt_dt"),
         Index("idx_audit_log_rsrc", "rsrc_typ", "rsrc_id"),
         Index("idx_audit_log_crt_dt", "crt_dt"),
-        Index("idx_audit_log_act_typ", "act_typ"),
-        Index("idx_audit_log_rsrc_typ", "rsrc_typ"),
-        Index("idx_audit_log_del_yn", "del_yn"),
+        {"postgresql_partition_by": "RANGE (crt_dt)"},
     )
 
@@ -1,5 +1,5 @@
 """게시판 모델"""
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, BigInteger, Index, ForeignKey, UniqueConstraint, func, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Date, Text, BigInteger, Float, Index, ForeignKey, UniqueConstraint, CheckConstraint, func, Enum
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import INET, JSONB
 import enum
@@ -78,6 +78,7 @@ class NotificationType(enum.Enum):
     POST_MENTION = "POST_MENTION"
     COMMENT_MENTION = "COMMENT_MENTION"
     ADMIN_NOTICE = "ADMIN_NOTICE"
+    NEW_POST = "NEW_POST"
 
 
 class FollowType(enum.Enum):
@@ -109,6 +110,7 @@ class AdminActionType(enum.Enum):
     USER_UNBAN = "USER_UNBAN"
     POST_HIDE = "POST_HIDE"
     POST_SHOW = "POST_SHOW"
+    POST_MOVE = "POST_MOVE"
     COMMENT_HIDE = "COMMENT_HIDE"
     COMMENT_SHOW = "COMMENT_SHOW"
     REPORT_RESOLVE = "REPORT_RESOLVE"
@@ -134,6 +136,7 @@ class BbsBoard(BaseModel):
     max_file_size = Column(Integer, default=10, comment="최대 파일 크기(MB)")
     sort_order = Column(Integer, default=0, comment="정렬 순서")
     post_count = Column(Integer, default=0, comment="게시글 수")
+    follower_cnt = Column(Integer, default=0, nullable=False, comment="팔로워 수")  # bbs_follows 트리거가 갱신
 
     # 관계
     categories = relationship("BbsCategory", back_populates="board", cascade="all, delete-orphan")
@@ -390,6 +393,7 @@ class BbsReport(Base):
         Index("idx_bbs_reports_reporter", "reporter_id"),
         Index("idx_bbs_reports_target", "target_type", "target_id"),
         Index("idx_bbs_reports_stts_crt_dt", "stts", "crt_dt"),
+        Index("idx_bbs_reports_stts_target", "stts", "target_type", "target_id", "crt_dt"),
     )
 
 
@@ -417,6 +421,10 @@ class BbsNotification(Base):
     __table_args__ = (
         Index("idx_bbs_notifications_user_crt_dt", "user_id", "crt_dt"),
         Index("idx_bbs_notifications_user_is_read", "user_id", "is_read"),
+        Index(
+            "idx_bbs_notifications_coalesce", "user_id", "typ", "related_post_id", crt_dt.desc(),
+            postgresql_where=(is_read == False)
+        ),
     )
 
 
@@ -463,17 +471,28 @@ class BbsFollow(Base):
     id = Column(BigInteger, primary_key=True, autoincrement=True, comment="팔로우 일련번호")
     follower_id = Column(String(100), ForeignKey("common_user.user_id", ondelete="CASCADE"), nullable=False, comment="팔로워 ID")
     following_id = Column(String(100), nullable=False, comment="팔로잉 ID")  # 외래키 제약조건 제거 (USER/BOARD 타입 모두 지원)
+    board_id = Column(BigInteger, ForeignKey("bbs_boards.id", ondelete="CASCADE"), comment="팔로잉 게시판 ID (BOARD 유형만)")
     typ = Column(Enum(FollowType), default=FollowType.USER, comment="팔로우 유형")
     crt_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="생성일시")
 
     # 제약조건
     __table_args__ = (
-        UniqueConstraint("follower_id", "following_id", "typ", name="uq_follows_follower_following_type"),
-        Index("idx_bbs_follows_follower", "follower_id"),
-        Index("idx_bbs_follows_following", "following_id"),
+        UniqueConstraint("follower_id", "typ", "following_id", name="uq_bbs_follows_follower_typ_following"),
+        CheckConstraint("(typ = 'BOARD') = (board_id IS NOT NULL)", name="ck_bbs_follows_board_target"),
+        Index("idx_bbs_follows_board", "board_id", "id", postgresql_where=(board_id.isnot(None))),
+        Index("idx_bbs_follows_following_user", "following_id", "crt_dt", postgresql_where=(typ == FollowType.USER)),
     )
 
 
+class BbsUserFollowCount(Base):
+    """사용자별 팔로워 수 테이블 (bbs_follows 트리거가 갱신)"""
+    __tablename__ = "bbs_user_follow_counts"
+
+    user_id = Column(String(100), ForeignKey("common_user.user_id", ondelete="CASCADE"), primary_key=True, comment="사용자 ID")
+    follower_cnt = Column(Integer, default=0, nullable=False, comment="팔로워 수")
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="갱신일시")
+
+
 class BbsActivityLog(Base):
     """활동 로그 테이블"""
     __tablename__ = "bbs_activity_logs"
@@ -604,6 +623,7 @@ class BbsPostView(Base):
     ip_addr = Column(INET, nullable=False, comment="IP 주소")
     user_agent = Column(Text, comment="사용자 에이전트")
     crt_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="조회 일시")
+    # ins_xid (xid8, DB 기본값 pg_current_xact_id())는 롤업 SQL(app/core/view_rollup.py)에서만 사용
 
     # 관계
     post = relationship("BbsPost", backref="view_records")
@@ -614,3 +634,92 @@ class BbsPostView(Base):
         Index("idx_bbs_post_views_user_post_date", "user_id", "post_id", func.date("crt_dt")),
         Index("idx_bbs_post_views_ip_post_date", "ip_addr", "post_id", func.date("crt_dt")),
     )
+
+
+class BbsPostViewDaily(Base):
+    """게시글 일별 조회수 집계 테이블 (bbs_post_views 롤업)"""
+    __tablename__ = "bbs_post_view_daily"
+
+    post_id = Column(BigInteger, ForeignKey("bbs_posts.id", ondelete="CASCADE"), primary_key=True, comment="게시글 ID")
+    view_dt = Column(Date, primary_key=True, comment="조회일 (UTC)")
+    view_cnt = Column(Integer, default=0, nullable=False, comment="조회수")
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="집계 갱신일시")
+
+    # 인덱스
+    __table_args__ = (
+        Index("idx_bbs_post_view_daily_view_dt", "view_dt"),
+    )
+
+
+class BbsRollupState(Base):
+    """집계 작업 진행 상태 테이블 (원본 테이블의 마지막 집계 ID 기록)"""
+    __tablename__ = "bbs_rollup_state"
+
+    nm = Column(String(100), primary_key=True, comment="집계 작업명")
+    last_id = Column(BigInteger, default=0, nullable=False, comment="마지막으로 집계한 원본 ID")
+    # last_xid (xid8, 마지막으로 집계한 원본의 트랜잭션 ID)는 롤업 SQL에서만 사용
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="갱신일시")
+
+
+class BbsNotificationCounter(Base):
+    """사용자별 읽지 않은 알림 수 테이블"""
+    __tablename__ = "bbs_notification_counters"
+
+    user_id = Column(String(100), ForeignKey("common_user.user_id", ondelete="CASCADE"), primary_key=True, comment="사용자 ID")
+    unread_cnt = Column(Integer, default=0, nullable=False, comment="읽지 않은 알림 수")
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="갱신일시")
+
+
+class BbsPostRelated(Base):
+    """관련 게시글 테이블 (태그 시그니처 유사도 상위 k건, 주기 작업이 갱신)"""
+    __tablename__ = "bbs_post_related"
+
+    post_id = Column(BigInteger, ForeignKey("bbs_posts.id", ondelete="CASCADE"), primary_key=True, comment="게시글 ID")
+    related_post_id = Column(BigInteger, ForeignKey("bbs_posts.id", ondelete="CASCADE"), primary_key=True, comment="관련 게시글 ID")
+    score = Column(Float, nullable=False, comment="태그 유사도 (Jaccard)")
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="갱신일시")
+
+    # 인덱스
+    __table_args__ = (
+        Index("idx_bbs_post_related_post_score", "post_id", "score"),
+        Index("idx_bbs_post_related_related", "related_post_id"),
+    )
+
+
+class BbsPostRelatedQueue(Base):
+    """관련 게시글 재계산 대기 테이블 (태그/게시판이 바뀐 게시글)"""
+    __tablename__ = "bbs_post_related_queue"
+
+    post_id = Column(BigInteger, ForeignKey("bbs_posts.id", ondelete="CASCADE"), primary_key=True, comment="게시글 ID")
+    crt_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="등록일시")
+
+
+class BbsTagUsageBucket(Base):
+    """태그 시간 버킷별 사용 횟수 테이블 (태그 연결/해제 시 갱신, 급상승 태그 집계용)"""
+    __tablename__ = "bbs_tag_usage_buckets"
+
+    tag_id = Column(BigInteger, ForeignKey("bbs_tags.id", ondelete="CASCADE"), primary_key=True, comment="태그 ID")
+    bucket_start = Column(DateTime(timezone=True), primary_key=True, comment="버킷 시작 일시")
+    cnt = Column(Integer, default=0, nullable=False, comment="버킷 내 연결 수 (해제 시 감소)")
+
+    # 인덱스
+    __table_args__ = (
+        Index("idx_bbs_tag_usage_buckets_bucket", "bucket_start"),
+    )
+
+
+class BbsTrendingTag(Base):
+    """기간별 급상승 태그 테이블 (주기 작업이 상위 k건을 갱신)"""
+    __tablename__ = "bbs_trending_tags"
+
+    window_nm = Column(String(10), primary_key=True, comment="집계 기간 (1h, 24h, 7d 등)")
+    tag_id = Column(BigInteger, ForeignKey("bbs_tags.id", ondelete="CASCADE"), primary_key=True, comment="태그 ID")
+    rnk = Column(Integer, nullable=False, comment="순위")
+    score = Column(Float, nullable=False, comment="감쇠 적용 점수")
+    cnt = Column(Integer, nullable=False, comment="기간 내 연결 수")
+    upd_dt = Column(DateTime, default=func.current_timestamp(), nullable=False, comment="갱신일시")
+
+    # 인덱스
+    __table_args__ = (
+        Index("idx_bbs_trending_tags_window_rnk", "window_nm", "rnk"),
+    )
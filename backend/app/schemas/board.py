@@ -1,7 +1,7 @@
 """게시판 관련 스키마"""
-from datetime import datetime
+from datetime import datetime, date
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 from enum import Enum
 
 
@@ -76,6 +76,7 @@ class NotificationType(str, Enum):
     POST_MENTION = "POST_MENTION"
     COMMENT_MENTION = "COMMENT_MENTION"
     ADMIN_NOTICE = "ADMIN_NOTICE"
+    NEW_POST = "NEW_POST"
 
 
 class FollowType(str, Enum):
@@ -249,6 +250,26 @@ class PostListResponse(BaseModel):
     total_pages: int
 
 
+class RelatedPostResponse(BaseModel):
+    """관련 게시글 응답 스키마"""
+    id: int
+    ttl: str
+    board_id: int
+    user_id: str
+    author_nickname: Optional[str] = None
+    lk_cnt: int
+    cmt_cnt: int
+    crt_dt: datetime
+    score: float = Field(..., description="태그 유사도 (0~1)")
+
+
+class TimelineResponse(BaseModel):
+    """팔로잉 타임라인 응답 스키마 (커서 기반 페이지네이션)"""
+    posts: List[PostResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+    has_more: bool
+
+
 # 댓글 스키마
 class CommentBase(BaseModel):
     """댓글 기본 스키마"""
@@ -368,6 +389,36 @@ class ReportResponse(BaseModel):
     board_nm: Optional[str] = None  # 게시판명 (POST 타입인 경우)
 
 
+class ReportTargetInfo(BaseModel):
+    """신고 대상 요약 스키마"""
+    target_type: ReportTargetType
+    target_id: int
+    exists: bool
+    title: Optional[str] = None
+    author_id: Optional[str] = None
+    author_nickname: Optional[str] = None
+    post_id: Optional[int] = None
+    board_id: Optional[int] = None
+    board_nm: Optional[str] = None
+
+
+class ReportTargetGroupResponse(BaseModel):
+    """대상별 신고 집계 스키마"""
+    target_type: ReportTargetType
+    target_id: int
+    report_cnt: int
+    first_reported_at: datetime
+    last_reported_at: datetime
+    reasons: List[ReportReason]
+    target: ReportTargetInfo
+
+
+class ReportTargetGroupListResponse(BaseModel):
+    """대상별 신고 집계 목록 응답 스키마 (키셋 페이지네이션)"""
+    items: List[ReportTargetGroupResponse]
+    next_cursor: Optional[str] = Field(None, description="다음 페이지 커서 (마지막 페이지면 null)")
+
+
 # 알림 스키마
 class NotificationResponse(BaseModel):
     """알림 응답 스키마"""
@@ -380,10 +431,19 @@ class NotificationResponse(BaseModel):
     related_post_id: Optional[int]
     related_comment_id: Optional[int]
     related_user_id: Optional[str]
-    noti_metadata: Optional[Dict[str, Any]]
+    noti_metadata: Optional[Dict[str, Any]] = Field(
+        default=None,
+        validation_alias=AliasChoices("noti_metadata", "meta_data")
+    )
     crt_dt: datetime
 
 
+class AdminNoticeCreate(BaseModel):
+    """관리자 공지 알림 발송 요청 스키마"""
+    ttl: str = Field(..., min_length=1, max_length=200, description="알림 제목")
+    msg: str = Field(..., min_length=1, description="알림 메시지")
+
+
 # 태그 스키마
 class TagBase(BaseModel):
     """태그 기본 스키마"""
@@ -411,6 +471,17 @@ class TagResponse(TagBase):
 
 
 # 팔로우 스키마
+class TrendingTagResponse(BaseModel):
+    """급상승 태그 응답 스키마"""
+    id: int
+    nm: str
+    color: Optional[str] = None
+    rnk: int = Field(..., description="순위")
+    score: float = Field(..., description="최근 사용일수록 가중치가 큰 감쇠 점수")
+    cnt: int = Field(..., description="기간 내 사용 횟수")
+    upd_dt: datetime = Field(..., description="순위 계산 일시")
+
+
 class FollowCreate(BaseModel):
     """팔로우 생성 스키마"""
     following_id: str = Field(..., description="팔로잉 대상 ID")
@@ -426,6 +497,49 @@ class FollowResponse(BaseModel):
     crt_dt: datetime
 
 
+# 일괄 관리 스키마
+class BulkPostAction(str, Enum):
+    HIDE = "HIDE"
+    SHOW = "SHOW"
+    DELETE = "DELETE"
+    MOVE = "MOVE"
+
+
+class BulkCommentAction(str, Enum):
+    HIDE = "HIDE"
+    SHOW = "SHOW"
+    DELETE = "DELETE"
+
+
+class BulkPostActionRequest(BaseModel):
+    """게시글 일괄 관리 요청 스키마"""
+    ids: List[int] = Field(..., min_length=1, max_length=1000, description="게시글 ID 목록")
+    action: BulkPostAction = Field(..., description="작업 (HIDE, SHOW, DELETE, MOVE)")
+    target_board_id: Optional[int] = Field(None, description="이동할 게시판 ID (MOVE일 때 필수)")
+    reason: Optional[str] = Field(None, max_length=500, description="처리 사유")
+
+
+class BulkCommentActionRequest(BaseModel):
+    """댓글 일괄 관리 요청 스키마"""
+    ids: List[int] = Field(..., min_length=1, max_length=1000, description="댓글 ID 목록")
+    action: BulkCommentAction = Field(..., description="작업 (HIDE, SHOW, DELETE)")
+
+
+class BulkActionResult(BaseModel):
+    """일괄 관리 항목별 결과"""
+    id: int
+    outcome: str = Field(..., description="UPDATED, SKIPPED, NOT_FOUND")
+    detail: Optional[str] = None
+
+
+class BulkActionResponse(BaseModel):
+    """일괄 관리 응답 스키마"""
+    action: str
+    requested: int
+    updated: int
+    results: List[BulkActionResult]
+
+
 # 검색 요청 스키마
 class SearchRequest(BaseModel):
     """검색 요청 스키마"""
@@ -458,6 +572,22 @@ class BoardStatisticsResponse(BaseModel):
     last_post_date: Optional[datetime]
 
 
+class DailyViewCount(BaseModel):
+    """일별 조회수"""
+    date: date
+    view_cnt: int
+
+
+class DailyViewSeriesResponse(BaseModel):
+    """일별 조회수 시계열 응답 스키마"""
+    target_typ: str = Field(..., description="대상 유형 (POST, BOARD)")
+    target_id: int
+    start_date: date
+    end_date: date
+    total_view_cnt: int
+    series: List[DailyViewCount]
+
+
 class PopularPostResponse(BaseModel):
     """인기 게시글 응답 스키마"""
     id: int
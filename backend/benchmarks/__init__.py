@@ -0,0 +1 @@
+"""API 주요 엔드포인트 벤치마크 (python -m benchmarks)"""
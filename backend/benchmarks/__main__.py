@@ -0,0 +1,73 @@
+"""
+벤치마크 실행 스크립트
+
+예시:
+    python -m benchmarks --mode asgi --requests 200 --concurrency 10 --output bench.json
+    python -m benchmarks --mode http --concurrency 50 --compare bench.json
+"""
+import argparse
+import asyncio
+import sys
+from benchmarks.report import (
+    build_report, compare_reports, format_comparison, format_report, load_report, save_report
+)
+from benchmarks.runner import run_benchmarks
+from benchmarks.scenarios import SCENARIOS, SCENARIOS_BY_NAME, load_context
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="API 주요 엔드포인트 벤치마크")
+    parser.add_argument("--mode", choices=("asgi", "http"), default="asgi",
+                        help="asgi: httpx ASGITransport로 프로세스 내 실행, http: uvicorn 서버에 실제 HTTP 요청")
+    parser.add_argument("--url", default=None, help="http 모드에서 이미 실행 중인 서버 주소 (없으면 내부에서 uvicorn 실행)")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS_BY_NAME),
+                        help="실행할 시나리오 (쉼표 구분)")
+    parser.add_argument("--requests", type=int, default=200, help="시나리오별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument("--warmup", type=int, default=10, help="시나리오별 측정 전 요청 수")
+    parser.add_argument("--output", default=None, help="결과를 저장할 JSON 경로")
+    parser.add_argument("--compare", default=None, help="비교할 기준선 JSON 경로")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="기준선보다 이 비율 이상 나빠지면 회귀로 표시하고 종료 코드 1 반환")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS_BY_NAME]
+    if unknown:
+        print(f"알 수 없는 시나리오: {', '.join(unknown)} (사용 가능: {', '.join(SCENARIOS_BY_NAME)})", file=sys.stderr)
+        return 2
+    scenarios = [scenario for scenario in SCENARIOS if scenario.name in names]
+
+    ctx = load_context()
+    results = asyncio.run(run_benchmarks(
+        ctx, scenarios, args.mode, args.requests, args.concurrency, args.warmup, args.url
+    ))
+    report = build_report(results, {
+        "mode": args.mode,
+        "url": args.url,
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "warmup": args.warmup,
+        "board_id": ctx.board_id,
+        "post_id": ctx.post_id,
+    })
+    print(format_report(report))
+
+    if args.output:
+        save_report(report, args.output)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.compare:
+        baseline = load_report(args.compare)
+        changes = compare_reports(baseline, report, args.threshold)
+        print("\n" + format_comparison(changes, baseline))
+        if any(change["regression"] for change in changes):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,577 @@
+"""
+대용량 부하 테스트 데이터 생성 (Zipf 분포, COPY 병렬 적재)
+
+게시판/사용자/게시글의 인기도는 Zipf 분포를 따르고, 게시글 청크마다 게시글/댓글/좋아요/조회/태그를
+한 트랜잭션에서 COPY로 적재합니다. 적재 중에는 행 단위 통계 트리거를 끄고 끝난 뒤 카운터를
+집합 연산으로 한 번에 맞춥니다. 다른 요청이 없는 전용 데이터베이스에서 실행해야 합니다.
+
+예시:
+    python -m benchmarks.datagen --users 100000 --boards 20 --posts 2000000 --workers 8
+"""
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+import argparse
+import io
+import math
+import multiprocessing
+import random
+import sys
+import time
+import uuid
+from sqlalchemy import text
+from app.core.audit_partition import add_months, create_partition, is_partitioned
+from app.core.security import get_password_hash
+from app.database import engine
+
+# 생성한 사용자의 로그인 비밀번호 (벤치마크 BENCH_PASSWORD로 사용)
+DEFAULT_PASSWORD = "bench-password"
+
+# 적재 중 끄는 행 단위 통계 트리거 (테이블, 트리거)
+STAT_TRIGGERS = [
+    ("bbs_posts", "trigger_update_post_statistics"),
+    ("bbs_comments", "trigger_update_comment_statistics"),
+    ("bbs_follows", "trigger_update_follow_statistics"),
+]
+
+# 게시글 상태 분포
+POST_STATUSES = [("PUBLISHED", 0.95), ("DRAFT", 0.02), ("HIDDEN", 0.02), ("DELETED", 0.01)]
+
+# 제목/본문/검색어용 단어
+WORDS = [
+    "게시판", "질문", "답변", "공지", "후기", "리뷰", "추천", "정보", "공유", "자유", "개발", "디자인",
+    "서버", "데이터베이스", "성능", "캐시", "인덱스", "쿼리", "배포", "테스트", "프론트엔드", "백엔드",
+    "python", "fastapi", "postgres", "react", "docker", "linux", "api", "benchmark",
+    "오늘", "내일", "주말", "여행", "음식", "영화", "음악", "운동", "책", "사진", "게임", "코딩",
+]
+
+# 감사 로그 요청 경로
+AUDIT_PATHS = [
+    ("GET", "/api/v1/boards/posts", "BOARDS"),
+    ("GET", "/api/v1/boards/posts/{id}", "BOARDS"),
+    ("GET", "/api/v1/boards/posts/{id}/comments", "BOARDS"),
+    ("POST", "/api/v1/boards/posts/{id}/like", "BOARDS"),
+    ("GET", "/api/v1/dashboard/stats", "DASHBOARD"),
+    ("GET", "/api/v1/board-extra/notifications", "BOARD_EXTRA"),
+    ("POST", "/api/v1/auth/login", "AUTH"),
+]
+
+
+class Zipf:
+    """
+    1..n 순위의 Zipf(지수 s) 분포
+
+    연속 근사의 역CDF로 O(1) 메모리/시간에 순위를 뽑고, 순위별 기대 비율도 같은 근사로 계산합니다.
+    """
+
+    def __init__(self, n: int, s: float):
+        self.n = max(n, 1)
+        self.s = s
+        self._total = self._integral(self.n + 0.5) - self._integral(0.5)
+
+    def _integral(self, x: float) -> float:
+        if abs(self.s - 1.0) < 1e-9:
+            return math.log(x)
+        return x ** (1 - self.s) / (1 - self.s)
+
+    def _inverse(self, y: float) -> float:
+        if abs(self.s - 1.0) < 1e-9:
+            return math.exp(y)
+        return (y * (1 - self.s)) ** (1 / (1 - self.s))
+
+    def sample(self, rng: random.Random) -> int:
+        """0부터 시작하는 순위 (0이 가장 인기)"""
+        y = self._integral(0.5) + rng.random() * self._total
+        return min(self.n - 1, max(0, int(round(self._inverse(y))) - 1))
+
+    def share(self, rank: int) -> float:
+        """순위(0부터)의 기대 비율"""
+        return (self._integral(rank + 1.5) - self._integral(rank + 0.5)) / self._total
+
+
+def _multiplier(n: int) -> int:
+    """0..n-1의 순열을 만드는 곱셈 계수 (n과 서로소)"""
+    m = max(2, int(n * 0.618033988749895)) | 1
+    while math.gcd(m, n) != 1:
+        m += 2
+    return m
+
+
+def permute(rank: int, n: int, multiplier: int) -> int:
+    """순위를 ID 인덱스로 섞는 전단사 함수 (인기 항목이 ID 순서대로 몰리지 않도록)"""
+    return (rank * multiplier) % n
+
+
+def rounded_count(expected: float, rng: random.Random, cap: int) -> int:
+    """기대값을 확률적으로 반올림한 개수 (cap 이하)"""
+    count = int(expected)
+    if rng.random() < expected - count:
+        count += 1
+    return min(count, cap)
+
+
+@dataclass
+class Plan:
+    """워커 프로세스에 전달하는 생성 계획 (모든 값은 직렬화 가능)"""
+    seed: int
+    run_id: str
+    zipf_s: float
+    now: datetime
+    days: int
+    user_prefix: str
+    user_start: int
+    users: int
+    board_ids: List[int]
+    tag_ids: List[int]
+    post_base: int
+    posts: int
+    comment_base: int
+    comments: int
+    max_comments_per_post: int
+    max_depth: int
+    reply_ratio: float
+    likes: int
+    views: int
+    max_views_per_post: int
+    max_tags_per_post: int
+    follows: int
+    audit_logs: int
+    pwd_hash: str
+
+    def user_id(self, index: int) -> str:
+        return f"{self.user_prefix}{self.user_start + index}"
+
+    @property
+    def span(self) -> timedelta:
+        return timedelta(days=self.days)
+
+
+def _tsv(value) -> str:
+    """COPY text 형식 값"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _copy(cursor, table: str, columns: Sequence[str], rows: Iterable[Sequence]) -> int:
+    """행을 COPY text 형식으로 적재하고 행 수 반환"""
+    buffer = io.StringIO()
+    count = 0
+    for row in rows:
+        buffer.write("\t".join(_tsv(value) for value in row))
+        buffer.write("\n")
+        count += 1
+    if count:
+        buffer.seek(0)
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    return count
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def _between(rng: random.Random, start: datetime, end: datetime) -> datetime:
+    if end <= start:
+        return start
+    return start + (end - start) * rng.random()
+
+
+def _run_chunk(job: Tuple[Callable, Plan, int, int, int]) -> Dict[str, int]:
+    """워커에서 청크 하나를 별도 커넥션/트랜잭션으로 적재"""
+    loader, plan, chunk_idx, start, end = job
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        counts = loader(cursor, plan, chunk_idx, start, end)
+        conn.commit()
+        return counts
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def _init_worker() -> None:
+    """부모 프로세스에서 물려받은 커넥션 풀을 공유하지 않도록 정리"""
+    engine.dispose(close=False)
+
+
+def load_users(cursor, plan: Plan, chunk_idx: int, start: int, end: int) -> Dict[str, int]:
+    rng = random.Random(f"{plan.seed}-users-{chunk_idx}")
+    rows = []
+    for index in range(start, end):
+        user_id = plan.user_id(index)
+        username = user_id.lower()
+        rows.append((
+            user_id, f"{username}@bench.local", username, plan.pwd_hash, f"벤치 사용자 {index}",
+            f"bench{plan.user_start + index}", True, _between(rng, plan.now - plan.span, plan.now), "SYSTEM", "시스템",
+        ))
+    return {"common_user": _copy(cursor, "common_user", (
+        "user_id", "eml", "username", "pwd_hash", "nm", "nickname", "actv_yn", "crt_dt", "crt_by", "crt_by_nm",
+    ), rows)}
+
+
+def load_posts(cursor, plan: Plan, chunk_idx: int, start: int, end: int) -> Dict[str, int]:
+    """
+    게시글 [start, end) 범위와 딸린 댓글/좋아요/조회/태그 적재
+
+    댓글 ID는 게시글 인덱스마다 max_comments_per_post 크기의 구간을 미리 정해 부모 댓글을
+    참조할 수 있게 하고, 게시글의 댓글 수/좋아요 수/조회수는 생성한 행 수로 바로 채웁니다.
+    """
+    rng = random.Random(f"{plan.seed}-posts-{chunk_idx}")
+    post_zipf = Zipf(plan.posts, plan.zipf_s)
+    user_zipf = Zipf(plan.users, plan.zipf_s)
+    board_zipf = Zipf(len(plan.board_ids), plan.zipf_s)
+    tag_zipf = Zipf(len(plan.tag_ids), plan.zipf_s)
+    post_mult = _multiplier(plan.posts)
+    user_mult = _multiplier(plan.users)
+    statuses, status_weights = zip(*POST_STATUSES)
+
+    def author() -> str:
+        return plan.user_id(permute(user_zipf.sample(rng), plan.users, user_mult))
+
+    posts, comments, likes, views, post_tags = [], [], [], [], []
+    for index in range(start, end):
+        post_id = plan.post_base + index + 1
+        share = post_zipf.share(permute(index, plan.posts, post_mult))
+        crt_dt = plan.now - plan.span + plan.span * ((index + rng.random()) / plan.posts)
+        age_end = min(plan.now, crt_dt + timedelta(days=7))
+
+        # 댓글 (일부는 앞선 댓글에 대한 답글)
+        comment_cnt = rounded_count(plan.comments * share, rng, plan.max_comments_per_post)
+        depths: List[int] = []
+        last_comment_dt = None
+        for j in range(comment_cnt):
+            comment_id = plan.comment_base + index * plan.max_comments_per_post + j + 1
+            parent_id, depth = None, 0
+            if j and rng.random() < plan.reply_ratio:
+                parent_j = rng.randrange(j)
+                if depths[parent_j] < plan.max_depth:
+                    parent_id = plan.comment_base + index * plan.max_comments_per_post + parent_j + 1
+                    depth = depths[parent_j] + 1
+            depths.append(depth)
+            last_comment_dt = crt_dt + (age_end - crt_dt) * ((j + 1) / (comment_cnt + 1))
+            comments.append((comment_id, post_id, author(), parent_id, _sentence(rng, rng.randint(3, 20)),
+                             "PUBLISHED", depth, j, last_comment_dt, last_comment_dt))
+
+        # 좋아요 (게시글마다 서로 다른 사용자)
+        like_cnt = rounded_count(plan.likes * share, rng, plan.users)
+        for user_index in rng.sample(range(plan.users), like_cnt):
+            likes.append((post_id, plan.user_id(user_index), "LIKE", _between(rng, crt_dt, plan.now)))
+
+        # 조회 (비로그인 조회, 게시글 안에서 IP가 겹치지 않도록 순번으로 IP 생성)
+        view_cnt = rounded_count(plan.views * share, rng, plan.max_views_per_post)
+        for j in range(view_cnt):
+            ip = j + 16777216
+            views.append((post_id, f"{ip >> 24 & 255}.{ip >> 16 & 255}.{ip >> 8 & 255}.{ip & 255}",
+                          _between(rng, crt_dt, plan.now)))
+
+        # 태그
+        if plan.tag_ids and plan.max_tags_per_post:
+            chosen = set()
+            want = rng.randint(0, plan.max_tags_per_post)
+            for _ in range(want * 3):
+                if len(chosen) >= want:
+                    break
+                chosen.add(plan.tag_ids[tag_zipf.sample(rng)])
+            post_tags.extend((post_id, tag_id, crt_dt) for tag_id in chosen)
+
+        ttl = f"{_sentence(rng, rng.randint(2, 6))} #{post_id}"
+        posts.append((
+            post_id, plan.board_ids[board_zipf.sample(rng)], author(), ttl[:200],
+            "\n".join(_sentence(rng, rng.randint(8, 30)) for _ in range(rng.randint(1, 5))),
+            rng.choices(statuses, status_weights)[0], False, False,
+            view_cnt, like_cnt, comment_cnt, last_comment_dt, crt_dt, crt_dt, crt_dt,
+        ))
+
+    return {
+        "bbs_posts": _copy(cursor, "bbs_posts", (
+            "id", "board_id", "user_id", "ttl", "cn", "stts", "ntce_yn", "scr_yn",
+            "vw_cnt", "lk_cnt", "cmt_cnt", "lst_cmt_dt", "pbl_dt", "crt_dt", "upd_dt",
+        ), posts),
+        "bbs_comments": _copy(cursor, "bbs_comments", (
+            "id", "post_id", "user_id", "parent_id", "cn", "stts", "depth", "sort_order", "crt_dt", "upd_dt",
+        ), comments),
+        "bbs_post_likes": _copy(cursor, "bbs_post_likes", ("post_id", "user_id", "typ", "crt_dt"), likes),
+        "bbs_post_views": _copy(cursor, "bbs_post_views", ("post_id", "ip_addr", "crt_dt"), views),
+        "bbs_post_tags": _copy(cursor, "bbs_post_tags", ("post_id", "tag_id", "crt_dt"), post_tags),
+    }
+
+
+def load_follows(cursor, plan: Plan, chunk_idx: int, start: int, end: int) -> Dict[str, int]:
+    """팔로워 [start, end) 범위의 팔로우 (대상은 게시판 30%, 사용자 70%, 둘 다 Zipf 인기도)"""
+    rng = random.Random(f"{plan.seed}-follows-{chunk_idx}")
+    user_zipf = Zipf(plan.users, plan.zipf_s)
+    board_zipf = Zipf(len(plan.board_ids), plan.zipf_s)
+    user_mult = _multiplier(plan.users)
+    per_user = plan.follows / plan.users
+
+    rows = []
+    for index in range(start, end):
+        follower_id = plan.user_id(index)
+        seen = set()
+        for _ in range(rounded_count(per_user, rng, plan.users + len(plan.board_ids))):
+            if rng.random() < 0.3:
+                board_id = plan.board_ids[board_zipf.sample(rng)]
+                key = ("BOARD", str(board_id), board_id)
+            else:
+                target = permute(user_zipf.sample(rng), plan.users, user_mult)
+                if target == index:
+                    continue
+                key = ("USER", plan.user_id(target), None)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append((follower_id, key[1], key[2], key[0], _between(rng, plan.now - plan.span, plan.now)))
+    return {"bbs_follows": _copy(cursor, "bbs_follows", ("follower_id", "following_id", "board_id", "typ", "crt_dt"), rows)}
+
+
+def load_audit_logs(cursor, plan: Plan, chunk_idx: int, start: int, end: int) -> Dict[str, int]:
+    rng = random.Random(f"{plan.seed}-audit-{chunk_idx}")
+    user_zipf = Zipf(plan.users, plan.zipf_s)
+    user_mult = _multiplier(plan.users)
+    rows = []
+    for index in range(start, end):
+        method, path, rsrc_typ = rng.choice(AUDIT_PATHS)
+        user_id = plan.user_id(permute(user_zipf.sample(rng), plan.users, user_mult))
+        path = path.replace("{id}", str(plan.post_base + rng.randrange(plan.posts) + 1)) if plan.posts else path
+        status_cd = 200 if rng.random() < 0.97 else rng.choice((400, 401, 404, 500))
+        rows.append((
+            f"BENCH_{plan.run_id}_{index}", user_id, "API_CALL", rsrc_typ, method, path, status_cd,
+            f"10.0.{rng.randrange(256)}.{rng.randrange(256)}", _between(rng, plan.now - plan.span, plan.now), user_id,
+        ))
+    return {"common_audit_log": _copy(cursor, "common_audit_log", (
+        "audit_log_id", "user_id", "act_typ", "rsrc_typ", "req_mthd", "req_path", "stts_cd", "ip_addr", "crt_dt", "crt_by",
+    ), rows)}
+
+
+def _chunks(total: int, size: int) -> List[Tuple[int, int, int]]:
+    return [(idx, start, min(start + size, total)) for idx, start in enumerate(range(0, total, size))]
+
+
+def _reserve_ids(conn, table: str, count: int) -> int:
+    """테이블 ID 시퀀스를 count만큼 앞당기고 예약한 구간의 시작 직전 값을 반환"""
+    seq = conn.execute(text("SELECT pg_get_serial_sequence(:table, 'id')"), {"table": table}).scalar()
+    base = conn.execute(text(f"SELECT GREATEST((SELECT COALESCE(MAX(id), 0) FROM {table}), (SELECT last_value FROM {seq}))")).scalar()
+    if count:
+        conn.execute(text("SELECT setval(:seq, :value)"), {"seq": seq, "value": base + count})
+    return base
+
+
+def prepare(args: argparse.Namespace) -> Plan:
+    """게시판/태그 생성, ID 구간 예약"""
+    run_id = uuid.uuid4().hex[:8].upper()
+    with engine.begin() as conn:
+        user_start = conn.execute(
+            text("SELECT COUNT(*) FROM common_user WHERE user_id LIKE :prefix"),
+            {"prefix": f"{args.user_prefix}%"}
+        ).scalar()
+
+        board_ids = conn.execute(text("""
+            INSERT INTO bbs_boards (nm, dsc, typ, crt_by, crt_by_nm)
+            SELECT '벤치마크 게시판 ' || :run_id || '-' || n, '부하 테스트용 게시판', 'GENERAL', 'SYSTEM', '시스템'
+            FROM generate_series(1, :boards) AS n
+            RETURNING id
+        """), {"run_id": run_id, "boards": args.boards}).scalars().all()
+
+        tag_ids = []
+        if args.tags:
+            names = [f"bench-tag-{n}" for n in range(1, args.tags + 1)]
+            conn.execute(text("""
+                INSERT INTO bbs_tags (nm, usage_cnt, crt_dt)
+                SELECT unnest(CAST(:names AS VARCHAR[])), 0, CURRENT_TIMESTAMP
+                ON CONFLICT (nm) DO NOTHING
+            """), {"names": names})
+            tag_by_name = dict(conn.execute(text("SELECT nm, id FROM bbs_tags WHERE nm = ANY(:names)"), {"names": names}).all())
+            tag_ids = [tag_by_name[name] for name in names]
+
+        post_base = _reserve_ids(conn, "bbs_posts", args.posts)
+        comment_base = _reserve_ids(conn, "bbs_comments", 0)
+
+    return Plan(
+        seed=args.seed,
+        run_id=run_id,
+        zipf_s=args.zipf_s,
+        now=datetime.now(timezone.utc),
+        days=args.days,
+        user_prefix=args.user_prefix,
+        user_start=user_start,
+        users=args.users,
+        board_ids=list(board_ids),
+        tag_ids=tag_ids,
+        post_base=post_base,
+        posts=args.posts,
+        comment_base=comment_base,
+        comments=int(args.posts * args.comments_per_post),
+        max_comments_per_post=args.max_comments_per_post,
+        max_depth=args.max_depth,
+        reply_ratio=args.reply_ratio,
+        likes=int(args.posts * args.likes_per_post),
+        views=int(args.posts * args.views_per_post),
+        max_views_per_post=args.max_views_per_post,
+        max_tags_per_post=args.max_tags_per_post,
+        follows=int(args.users * args.follows_per_user),
+        audit_logs=args.audit_logs,
+        pwd_hash=get_password_hash(args.password),
+    )
+
+
+def ensure_audit_partitions(plan: Plan) -> List[str]:
+    """
+    감사 로그 생성 기간의 월별 파티션 미리 생성
+
+    새 DB에는 이번 달 전후 파티션만 있어 과거 기간의 행이 DEFAULT 파티션에 쌓이면
+    파티션 프루닝과 보존 기간 정리를 측정할 수 없습니다. 파티션 테이블이 아니면 건너뜁니다.
+    """
+    if not plan.audit_logs:
+        return []
+    created = []
+    with engine.begin() as conn:
+        if not is_partitioned(conn):
+            return []
+        start = (plan.now - plan.span).date()
+        month_start = start.replace(day=1)
+        while month_start <= plan.now.date():
+            created.append(create_partition(conn, month_start))
+            month_start = add_months(month_start, 1)
+    return created
+
+
+def set_stat_triggers(enabled: bool) -> None:
+    action = "ENABLE" if enabled else "DISABLE"
+    with engine.begin() as conn:
+        for table, trigger in STAT_TRIGGERS:
+            conn.execute(text(f"ALTER TABLE {table} {action} TRIGGER {trigger}"))
+
+
+def finalize(plan: Plan) -> None:
+    """트리거 대신 카운터/파생 테이블을 집합 연산으로 갱신"""
+    post_lo, post_hi = plan.post_base + 1, plan.post_base + plan.posts
+    params = {"post_lo": post_lo, "post_hi": post_hi, "board_ids": plan.board_ids, "tag_ids": plan.tag_ids}
+    statements = [
+        # 댓글 시퀀스를 구간 예약으로 건너뛴 ID 뒤로 이동
+        "SELECT setval(pg_get_serial_sequence('bbs_comments', 'id'), GREATEST((SELECT COALESCE(MAX(id), 1) FROM bbs_comments), 1))",
+        """
+        UPDATE bbs_boards b SET post_count = b.post_count + p.cnt
+        FROM (SELECT board_id, COUNT(*) AS cnt FROM bbs_posts WHERE id BETWEEN :post_lo AND :post_hi GROUP BY board_id) p
+        WHERE b.id = p.board_id
+        """,
+        """
+        UPDATE bbs_boards b SET follower_cnt = f.cnt
+        FROM (SELECT board_id, COUNT(*) AS cnt FROM bbs_follows WHERE board_id = ANY(:board_ids) GROUP BY board_id) f
+        WHERE b.id = f.board_id
+        """,
+        """
+        INSERT INTO bbs_user_follow_counts (user_id, follower_cnt, upd_dt)
+        SELECT following_id, COUNT(*), CURRENT_TIMESTAMP FROM bbs_follows WHERE typ = 'USER' GROUP BY following_id
+        ON CONFLICT (user_id) DO UPDATE SET follower_cnt = EXCLUDED.follower_cnt, upd_dt = EXCLUDED.upd_dt
+        """,
+        """
+        UPDATE bbs_tags t SET usage_cnt = c.cnt
+        FROM (SELECT tag_id, COUNT(*) AS cnt FROM bbs_post_tags WHERE tag_id = ANY(:tag_ids) GROUP BY tag_id) c
+        WHERE t.id = c.tag_id
+        """,
+        """
+        INSERT INTO bbs_tag_usage_buckets (tag_id, bucket_start, cnt)
+        SELECT tag_id, to_timestamp(floor(extract(epoch FROM crt_dt) / 300) * 300), COUNT(*)
+        FROM bbs_post_tags
+        WHERE post_id BETWEEN :post_lo AND :post_hi AND crt_dt >= CURRENT_TIMESTAMP - INTERVAL '7 days'
+        GROUP BY 1, 2
+        ON CONFLICT (tag_id, bucket_start) DO UPDATE SET cnt = bbs_tag_usage_buckets.cnt + EXCLUDED.cnt
+        """,
+        """
+        INSERT INTO bbs_post_related_queue (post_id)
+        SELECT DISTINCT post_id FROM bbs_post_tags WHERE post_id BETWEEN :post_lo AND :post_hi
+        ON CONFLICT (post_id) DO NOTHING
+        """,
+    ]
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.execute(text(statement), params)
+
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        for table in ("common_user", "bbs_posts", "bbs_comments", "bbs_post_likes", "bbs_post_views",
+                      "bbs_post_tags", "bbs_follows", "common_audit_log"):
+            conn.execute(text(f"ANALYZE {table}"))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="대용량 부하 테스트 데이터 생성 (Zipf 분포, COPY 병렬 적재)")
+    parser.add_argument("--users", type=int, default=10000)
+    parser.add_argument("--boards", type=int, default=20)
+    parser.add_argument("--posts", type=int, default=100000)
+    parser.add_argument("--comments-per-post", type=float, default=5.0, help="게시글당 평균 댓글 수")
+    parser.add_argument("--max-comments-per-post", type=int, default=2000)
+    parser.add_argument("--max-depth", type=int, default=3, help="답글 최대 깊이 (스키마 최대 5)")
+    parser.add_argument("--reply-ratio", type=float, default=0.35, help="답글 비율")
+    parser.add_argument("--likes-per-post", type=float, default=3.0, help="게시글당 평균 좋아요 수")
+    parser.add_argument("--views-per-post", type=float, default=20.0, help="게시글당 평균 조회 수")
+    parser.add_argument("--max-views-per-post", type=int, default=100000)
+    parser.add_argument("--tags", type=int, default=500, help="태그 수")
+    parser.add_argument("--max-tags-per-post", type=int, default=5)
+    parser.add_argument("--follows-per-user", type=float, default=10.0, help="사용자당 평균 팔로우 수")
+    parser.add_argument("--audit-logs", type=int, default=100000)
+    parser.add_argument("--days", type=int, default=365, help="데이터 생성 기간 (일)")
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="인기도 Zipf 지수")
+    parser.add_argument("--user-prefix", default="BENCH_")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="생성한 사용자의 비밀번호")
+    parser.add_argument("--workers", type=int, default=max(1, (multiprocessing.cpu_count() or 2) - 1))
+    parser.add_argument("--chunk-size", type=int, default=5000, help="청크당 게시글/사용자/감사 로그 수")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+    if args.users < 2 or args.boards < 1:
+        parser.error("--users는 2 이상, --boards는 1 이상이어야 합니다.")
+    if not 0 <= args.max_depth <= 5:
+        parser.error("--max-depth는 0~5 사이여야 합니다.")
+    return args
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    started = time.perf_counter()
+    plan = prepare(args)
+    print(f"실행 ID {plan.run_id}: 사용자 {plan.users}, 게시판 {len(plan.board_ids)}, 게시글 {plan.posts}, 워커 {args.workers}")
+    partitions = ensure_audit_partitions(plan)
+    if partitions:
+        print(f"  감사 로그 파티션 {partitions[0]} ~ {partitions[-1]} ({len(partitions)}개)")
+
+    totals: Dict[str, int] = {}
+    stages = [
+        ("사용자", load_users, plan.users),
+        ("게시글/댓글/좋아요/조회/태그", load_posts, plan.posts),
+        ("팔로우", load_follows, plan.users),
+        ("감사 로그", load_audit_logs, plan.audit_logs),
+    ]
+
+    set_stat_triggers(False)
+    try:
+        with multiprocessing.Pool(args.workers, initializer=_init_worker) as pool:
+            for label, loader, total in stages:
+                stage_started = time.perf_counter()
+                jobs = [(loader, plan, idx, start, end) for idx, start, end in _chunks(total, args.chunk_size)]
+                for counts in pool.imap_unordered(_run_chunk, jobs):
+                    for table, count in counts.items():
+                        totals[table] = totals.get(table, 0) + count
+                print(f"  {label}: {time.perf_counter() - stage_started:.1f}초")
+    finally:
+        set_stat_triggers(True)
+
+    finalize(plan)
+
+    elapsed = time.perf_counter() - started
+    rows = sum(totals.values())
+    for table, count in totals.items():
+        print(f"  {table:<18}{count:>12,}")
+    print(f"총 {rows:,}행, {elapsed:.1f}초 ({rows / elapsed:,.0f}행/초)")
+    print(f"로그인: {plan.user_id(0).lower()} / {args.password}, 게시판 ID {plan.board_ids[0]}~{plan.board_ids[-1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
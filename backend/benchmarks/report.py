@@ -0,0 +1,153 @@
+"""벤치마크 결과 요약, JSON 기준선 저장과 비교"""
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+import json
+import math
+import subprocess
+from benchmarks.runner import ScenarioResult
+
+# 비교 시 회귀로 판단하는 지표 (값이 커지면 나빠지는 지표)
+COMPARED_METRICS = ("p50_ms", "p95_ms", "p99_ms", "sql_per_request", "error_rate")
+
+# 변화율 대신 차이(비율 포인트)로 비교하고 조금이라도 늘면 회귀로 보는 지표
+ABSOLUTE_METRICS = ("error_rate",)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """nearest-rank 방식 백분위수"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def is_success(sample) -> bool:
+    """2xx 응답 여부"""
+    return 200 <= sample.status_code < 300
+
+
+def summarize(result: ScenarioResult) -> Dict:
+    """
+    시나리오 결과를 지연 백분위수/처리량/SQL 실행 수로 요약
+
+    지연/처리량/SQL 지표는 2xx 응답만으로 계산합니다. 빈도 제한(429)이나 과부하 거절(503)처럼
+    빨리 끝나는 실패 응답이 섞이면 백분위수가 낮아져 개선처럼 보이므로, 실패는 error_rate로 따로 봅니다.
+    """
+    succeeded = [sample for sample in result.samples if is_success(sample)]
+    latencies = [sample.latency * 1000 for sample in succeeded]
+    sql_counts = [sample.sql_count for sample in succeeded if sample.sql_count is not None]
+    errors = len(result.samples) - len(succeeded)
+    status_counts: Dict[str, int] = {}
+    for sample in result.samples:
+        status_counts[str(sample.status_code)] = status_counts.get(str(sample.status_code), 0) + 1
+
+    def rounded(value: Optional[float]) -> Optional[float]:
+        return round(value, 3) if value is not None else None
+
+    return {
+        "requests": len(result.samples),
+        "errors": errors,
+        "error_rate": round(errors / len(result.samples), 4) if result.samples else None,
+        "status_counts": status_counts,
+        "throughput_rps": rounded(len(succeeded) / result.elapsed) if result.elapsed else None,
+        "p50_ms": rounded(percentile(latencies, 50)),
+        "p95_ms": rounded(percentile(latencies, 95)),
+        "p99_ms": rounded(percentile(latencies, 99)),
+        "max_ms": rounded(max(latencies)) if latencies else None,
+        "sql_per_request": rounded(sum(sql_counts) / len(sql_counts)) if sql_counts else None,
+        "sql_max": max(sql_counts) if sql_counts else None,
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def build_report(results: List[ScenarioResult], options: Dict) -> Dict:
+    """기준선 JSON 구조 생성"""
+    return {
+        "meta": {
+            "commit": _git_commit(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            **options,
+        },
+        "scenarios": {result.name: summarize(result) for result in results},
+    }
+
+
+def save_report(report: Dict, path: str) -> None:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+
+def load_report(path: str) -> Dict:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def format_report(report: Dict) -> str:
+    """결과 표 출력용 문자열"""
+    header = f"{'scenario':<22}{'req':>6}{'err':>5}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'sql':>7}"
+    lines = [header, "-" * len(header)]
+    for name, stats in report["scenarios"].items():
+        lines.append(
+            f"{name:<22}{stats['requests']:>6}{stats['errors']:>5}"
+            f"{_fmt(stats['throughput_rps']):>9}{_fmt(stats['p50_ms']):>9}"
+            f"{_fmt(stats['p95_ms']):>9}{_fmt(stats['p99_ms']):>9}{_fmt(stats['sql_per_request']):>7}"
+        )
+    return "\n".join(lines)
+
+
+def _fmt(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+def compare_reports(baseline: Dict, current: Dict, threshold: float) -> List[Dict]:
+    """
+    기준선 대비 변화율 계산
+
+    Returns:
+        지표별 변화 목록 (threshold보다 크게 나빠진 항목과 오류율이 늘어난 항목은 regression=True,
+        오류율의 change는 변화율이 아닌 차이)
+    """
+    changes = []
+    for name, stats in current["scenarios"].items():
+        base = baseline.get("scenarios", {}).get(name)
+        if not base:
+            continue
+        for metric in COMPARED_METRICS:
+            before, after = base.get(metric), stats.get(metric)
+            if before is None or after is None:
+                continue
+            if metric in ABSOLUTE_METRICS:
+                change, regression = after - before, after > before
+            else:
+                change = (after - before) / before if before else (0.0 if after == before else math.inf)
+                regression = change > threshold
+            changes.append({
+                "scenario": name,
+                "metric": metric,
+                "baseline": before,
+                "current": after,
+                "change": change,
+                "regression": regression,
+            })
+    return changes
+
+
+def format_comparison(changes: List[Dict], baseline: Dict) -> str:
+    """비교 결과 출력용 문자열"""
+    lines = [f"기준선: {baseline.get('meta', {}).get('commit') or '-'} ({baseline.get('meta', {}).get('created_at', '-')})"]
+    for change in changes:
+        marker = "  <-- 회귀" if change["regression"] else ""
+        lines.append(
+            f"{change['scenario']:<22}{change['metric']:<16}"
+            f"{change['baseline']:>10.2f} -> {change['current']:>10.2f}  ({change['change']:+.1%}){marker}"
+        )
+    return "\n".join(lines)
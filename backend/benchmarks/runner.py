@@ -0,0 +1,203 @@
+"""벤치마크 실행 (httpx ASGITransport 프로세스 내 실행 / uvicorn 실제 서버 실행)"""
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import List, Optional
+import asyncio
+import socket
+import threading
+import time
+import httpx
+import uvicorn
+from sqlalchemy import event
+from app.database import engine
+from benchmarks.scenarios import API_PREFIX, BenchContext, Scenario
+
+# SQL 실행 수를 돌려주는 응답 헤더
+SQL_COUNT_HEADER = "x-bench-sql-count"
+
+# 현재 요청의 SQL 실행 수 기록 위치
+_current_sql_count: ContextVar[Optional[List[int]]] = ContextVar("bench_sql_count", default=None)
+
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany):
+    counter = _current_sql_count.get()
+    if counter is not None:
+        counter[0] += 1
+
+
+class SqlCountingApp:
+    """
+    요청마다 실행된 SQL 문 수를 응답 헤더로 돌려주는 ASGI 래퍼
+
+    요청 처리 컨텍스트에 카운터를 두고 엔진의 before_cursor_execute 이벤트에서 증가시킵니다.
+    스레드풀에서 실행되는 동기 코드도 컨텍스트가 복사되므로 같은 카운터에 기록됩니다.
+    응답 헤더를 보내기 전까지 실행된 SQL만 집계합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        event.listen(engine, "before_cursor_execute", _count_statement)
+
+    def close(self) -> None:
+        event.remove(engine, "before_cursor_execute", _count_statement)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        counter = [0]
+
+        async def send_with_count(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers") or [])
+                headers.append((SQL_COUNT_HEADER.encode(), str(counter[0]).encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        token = _current_sql_count.set(counter)
+        try:
+            await self.app(scope, receive, send_with_count)
+        finally:
+            _current_sql_count.reset(token)
+
+
+@dataclass
+class Sample:
+    """요청 하나의 측정 결과"""
+    latency: float
+    status_code: int
+    sql_count: Optional[int] = None
+
+
+@dataclass
+class ScenarioResult:
+    """시나리오 하나의 측정 결과 모음"""
+    name: str
+    samples: List[Sample] = field(default_factory=list)
+    elapsed: float = 0.0
+
+
+class _ServerThread(threading.Thread):
+    """uvicorn 서버를 별도 스레드(별도 이벤트 루프)에서 실행"""
+
+    def __init__(self, app, port: int):
+        super().__init__(daemon=True)
+        self.server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning", lifespan="on"))
+
+    def run(self) -> None:
+        self.server.run()
+
+    def stop(self) -> None:
+        self.server.should_exit = True
+        self.join(timeout=10)
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def _login(client: httpx.AsyncClient, ctx: BenchContext) -> None:
+    response = await client.post(f"{API_PREFIX}/auth/login", data={"username": ctx.username, "password": ctx.password})
+    response.raise_for_status()
+    ctx.access_token = response.json()["access_token"]
+
+
+async def _run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchContext,
+    scenario: Scenario,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+) -> ScenarioResult:
+    """requests건을 concurrency개의 워커로 나눠 보내고 요청별 지연과 SQL 실행 수를 기록"""
+    result = ScenarioResult(name=scenario.name)
+    path = scenario.path(ctx)
+
+    async def send() -> Sample:
+        started = time.perf_counter()
+        response = await client.request(scenario.method, path, **scenario.request_kwargs(ctx))
+        latency = time.perf_counter() - started
+        sql_count = response.headers.get(SQL_COUNT_HEADER)
+        return Sample(
+            latency=latency,
+            status_code=response.status_code,
+            sql_count=int(sql_count) if sql_count is not None else None
+        )
+
+    for _ in range(warmup):
+        await send()
+
+    remaining = iter(range(requests))
+
+    async def worker() -> None:
+        for _ in remaining:
+            result.samples.append(await send())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+async def run_benchmarks(
+    ctx: BenchContext,
+    scenarios: List[Scenario],
+    mode: str,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    url: Optional[str] = None,
+) -> List[ScenarioResult]:
+    """
+    시나리오를 순서대로 실행
+
+    Args:
+        mode: asgi(httpx ASGITransport로 프로세스 내 실행), http(uvicorn 서버에 실제 HTTP 요청)
+        url: http 모드에서 이미 실행 중인 서버 주소 (지정하면 그 서버가 SQL 실행 수 헤더를 주지 않는 한 측정하지 않음)
+
+    한 IP/한 사용자로 같은 요청을 반복하므로 프로세스 내 실행(asgi, url 없는 http)에서는 빈도 제한을 끕니다.
+    외부 서버(url)는 RATE_LIMIT_ENABLED=false로 실행해야 로그인/좋아요 시나리오가 429로 채워지지 않습니다.
+    """
+    from app.main import app
+    from app.core.rate_limit import rate_limiter
+
+    counter = None if mode == "http" and url else SqlCountingApp(app)
+    server = None
+    rate_limit_enabled = rate_limiter.enabled
+    if counter is not None:
+        rate_limiter.enabled = False
+    try:
+        if mode == "asgi":
+            async with app.router.lifespan_context(app):
+                transport = httpx.ASGITransport(app=counter)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                    await _login(client, ctx)
+                    return [
+                        await _run_scenario(client, ctx, scenario, requests, concurrency, warmup)
+                        for scenario in scenarios
+                    ]
+
+        if url is None:
+            port = _free_port()
+            server = _ServerThread(counter, port)
+            server.start()
+            while not server.server.started:
+                await asyncio.sleep(0.05)
+            url = f"http://127.0.0.1:{port}"
+
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60.0) as client:
+            await _login(client, ctx)
+            return [
+                await _run_scenario(client, ctx, scenario, requests, concurrency, warmup)
+                for scenario in scenarios
+            ]
+    finally:
+        rate_limiter.enabled = rate_limit_enabled
+        if server is not None:
+            server.stop()
+        if counter is not None:
+            counter.close()
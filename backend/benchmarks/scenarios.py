@@ -0,0 +1,132 @@
+"""벤치마크 시나리오 정의와 대상 데이터(게시판/게시글/로그인 계정) 준비"""
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+import os
+from sqlalchemy import text
+from app.database import engine
+
+API_PREFIX = "/api/v1"
+
+
+@dataclass
+class BenchContext:
+    """시나리오가 사용하는 대상 ID와 인증 정보"""
+    board_id: int
+    post_id: int
+    search_query: str
+    username: str
+    password: str
+    access_token: Optional[str] = None
+
+    @property
+    def auth_headers(self) -> Dict[str, str]:
+        return {"Authorization": f"Bearer {self.access_token}"} if self.access_token else {}
+
+
+@dataclass
+class Scenario:
+    """요청 하나를 만드는 시나리오"""
+    name: str
+    method: str
+    path: Callable[[BenchContext], str]
+    params: Callable[[BenchContext], Dict] = field(default=lambda ctx: {})
+    data: Optional[Callable[[BenchContext], Dict]] = None
+    json: Optional[Callable[[BenchContext], Dict]] = None
+    auth: bool = True
+
+    def request_kwargs(self, ctx: BenchContext) -> Dict:
+        kwargs = {"params": self.params(ctx), "headers": dict(ctx.auth_headers) if self.auth else {}}
+        if self.data is not None:
+            kwargs["data"] = self.data(ctx)
+        if self.json is not None:
+            kwargs["json"] = self.json(ctx)
+        return kwargs
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(
+        name="get_posts",
+        method="GET",
+        path=lambda ctx: f"{API_PREFIX}/boards/posts",
+        params=lambda ctx: {"board_id": ctx.board_id, "page": 1, "limit": 20},
+    ),
+    Scenario(
+        name="get_post",
+        method="GET",
+        path=lambda ctx: f"{API_PREFIX}/boards/posts/{ctx.post_id}",
+    ),
+    Scenario(
+        name="get_comments_by_post",
+        method="GET",
+        path=lambda ctx: f"{API_PREFIX}/boards/posts/{ctx.post_id}/comments",
+    ),
+    Scenario(
+        name="search_posts",
+        method="GET",
+        path=lambda ctx: f"{API_PREFIX}/boards/search",
+        params=lambda ctx: {"query": ctx.search_query, "page": 1, "limit": 20},
+        auth=False,
+    ),
+    Scenario(
+        name="toggle_post_like",
+        method="POST",
+        path=lambda ctx: f"{API_PREFIX}/boards/posts/{ctx.post_id}/like",
+        json=lambda ctx: {"typ": "LIKE"},
+    ),
+    Scenario(
+        name="dashboard_stats",
+        method="GET",
+        path=lambda ctx: f"{API_PREFIX}/dashboard/stats",
+    ),
+    Scenario(
+        name="login",
+        method="POST",
+        path=lambda ctx: f"{API_PREFIX}/auth/login",
+        data=lambda ctx: {"username": ctx.username, "password": ctx.password},
+        auth=False,
+    ),
+]
+
+SCENARIOS_BY_NAME = {scenario.name: scenario for scenario in SCENARIOS}
+
+
+def load_context() -> BenchContext:
+    """
+    벤치마크 대상 데이터 조회
+
+    BENCH_BOARD_ID/BENCH_POST_ID가 없으면 게시글이 가장 많은 활성 게시판과 그 게시판에서
+    댓글이 가장 많은 공개 게시글을 사용합니다. 로그인 계정은 BENCH_USERNAME/BENCH_PASSWORD로 지정합니다.
+    """
+    username = os.getenv("BENCH_USERNAME")
+    password = os.getenv("BENCH_PASSWORD")
+    if not username or not password:
+        raise RuntimeError("BENCH_USERNAME, BENCH_PASSWORD 환경 변수를 설정해주세요.")
+
+    board_id = os.getenv("BENCH_BOARD_ID")
+    post_id = os.getenv("BENCH_POST_ID")
+    with engine.connect() as conn:
+        if not board_id:
+            board_id = conn.execute(text("""
+                SELECT id FROM bbs_boards
+                WHERE actv_yn = TRUE AND del_yn = FALSE
+                ORDER BY post_count DESC, id
+                LIMIT 1
+            """)).scalar()
+        if not post_id and board_id:
+            post_id = conn.execute(text("""
+                SELECT id FROM bbs_posts
+                WHERE board_id = :board_id AND stts = 'PUBLISHED' AND COALESCE(scr_yn, FALSE) = FALSE
+                ORDER BY cmt_cnt DESC, id DESC
+                LIMIT 1
+            """), {"board_id": int(board_id)}).scalar()
+
+    if not board_id or not post_id:
+        raise RuntimeError("벤치마크할 게시판/게시글이 없습니다. 데이터를 먼저 생성하거나 BENCH_BOARD_ID, BENCH_POST_ID를 지정해주세요.")
+
+    return BenchContext(
+        board_id=int(board_id),
+        post_id=int(post_id),
+        search_query=os.getenv("BENCH_SEARCH_QUERY", "게시"),
+        username=username,
+        password=password,
+    )
@@ -1,12 +1,19 @@
 """서버 실행 스크립트"""
+import sys
 import uvicorn
 from app.core.config import settings
 
 if __name__ == "__main__":
-    uvicorn.run(
-        "app.main:app",
-        host=settings.host,
-        port=settings.port,
-        reload=settings.debug,
-    )
-
+    if settings.debug:
+        # 개발 모드: 단일 프로세스 + 코드 변경 시 자동 리로드
+        uvicorn.run(
+            "app.main:app",
+            host=settings.host,
+            port=settings.port,
+            reload=True,
+            forwarded_allow_ips=settings.forwarded_allow_ips,
+        )
+    else:
+        # 프로덕션 모드: 멀티 워커 (SIGHUP으로 무중단 순차 재시작)
+        from app.core.server import run_production
+        sys.exit(run_production())
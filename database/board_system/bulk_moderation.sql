@@ -0,0 +1,8 @@
+-- ============================================
+-- 게시글/댓글 일괄 관리 지원 (기존 DB 마이그레이션)
+-- - admin_action_type에 POST_MOVE(게시글 게시판 이동) 추가
+--
+-- 실행: psql -U postgres -d common_db -f bulk_moderation.sql
+-- ============================================
+
+ALTER TYPE admin_action_type ADD VALUE IF NOT EXISTS 'POST_MOVE';
@@ -0,0 +1,71 @@
+-- ============================================
+-- 좋아요 수 애플리케이션 관리 전환 (기존 DB 마이그레이션)
+-- - 좋아요/북마크 (대상, 사용자) 유니크 제약 보장 (중복 행은 가장 먼저 생성된 행만 유지)
+-- - 행 단위 좋아요 통계 트리거 제거 (토글 문장이 같은 문장 안에서 lk_cnt 갱신)
+-- - lk_cnt를 실제 좋아요 수(LIKE - DISLIKE)로 재계산
+--   (이후 토글을 거치지 않은 좋아요 행 삭제는 앱의 like_counter_reconcile 주기 작업이 보정)
+--
+-- 실행: psql -U postgres -d common_db -f like_counters.sql
+-- ============================================
+
+BEGIN;
+
+DO $$
+DECLARE
+    spec RECORD;
+BEGIN
+    FOR spec IN
+        SELECT * FROM (VALUES
+            ('bbs_post_likes', 'post_id', 'uq_post_likes_post_user'),
+            ('bbs_comment_likes', 'comment_id', 'uq_comment_likes_comment_user'),
+            ('bbs_bookmarks', 'post_id', 'uq_bookmarks_post_user')
+        ) AS v(tbl, col, constraint_name)
+    LOOP
+        IF NOT EXISTS (
+            SELECT 1
+            FROM pg_index i
+            WHERE i.indrelid = spec.tbl::regclass
+              AND i.indisunique
+              AND (
+                  SELECT array_agg(a.attname::TEXT ORDER BY k.ord)
+                  FROM unnest(i.indkey) WITH ORDINALITY AS k(attnum, ord)
+                  JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = k.attnum
+              ) = ARRAY[spec.col, 'user_id']
+        ) THEN
+            EXECUTE format(
+                'DELETE FROM %I a USING %I b WHERE a.%I = b.%I AND a.user_id = b.user_id AND a.id > b.id',
+                spec.tbl, spec.tbl, spec.col, spec.col
+            );
+            EXECUTE format(
+                'ALTER TABLE %I ADD CONSTRAINT %I UNIQUE (%I, user_id)',
+                spec.tbl, spec.constraint_name, spec.col
+            );
+        END IF;
+    END LOOP;
+END $$;
+
+DROP TRIGGER IF EXISTS trigger_update_post_like_statistics ON bbs_post_likes;
+DROP TRIGGER IF EXISTS trigger_update_comment_like_statistics ON bbs_comment_likes;
+DROP FUNCTION IF EXISTS update_like_statistics();
+
+UPDATE bbs_posts p
+SET lk_cnt = COALESCE(l.cnt, 0)
+FROM bbs_posts p2
+LEFT JOIN (
+    SELECT post_id, SUM(CASE WHEN typ = 'LIKE' THEN 1 ELSE -1 END) AS cnt
+    FROM bbs_post_likes GROUP BY post_id
+) l ON l.post_id = p2.id
+WHERE p.id = p2.id
+  AND p.lk_cnt IS DISTINCT FROM COALESCE(l.cnt, 0);
+
+UPDATE bbs_comments c
+SET lk_cnt = COALESCE(l.cnt, 0)
+FROM bbs_comments c2
+LEFT JOIN (
+    SELECT comment_id, SUM(CASE WHEN typ = 'LIKE' THEN 1 ELSE -1 END) AS cnt
+    FROM bbs_comment_likes GROUP BY comment_id
+) l ON l.comment_id = c2.id
+WHERE c.id = c2.id
+  AND c.lk_cnt IS DISTINCT FROM COALESCE(l.cnt, 0);
+
+COMMIT;
@@ -0,0 +1,25 @@
+-- ============================================
+-- 읽지 않은 알림 카운터 테이블 추가 (기존 DB 마이그레이션)
+-- 카운터 행이 없으면 읽지 않은 알림이 0건인 것으로 처리하므로
+-- 기존 읽지 않은 알림 수를 반드시 채워 넣어야 합니다.
+--
+-- 실행: psql -U postgres -d common_db -f notification_counters.sql
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS bbs_notification_counters (
+    user_id VARCHAR(100) PRIMARY KEY REFERENCES public.COMMON_USER(USER_ID) ON DELETE CASCADE,
+    unread_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE bbs_notification_counters IS '사용자별 읽지 않은 알림 수';
+
+-- 기존 읽지 않은 알림 수 채우기
+INSERT INTO bbs_notification_counters (user_id, unread_cnt, upd_dt)
+SELECT user_id, COUNT(*), CURRENT_TIMESTAMP
+FROM bbs_notifications
+WHERE is_read = FALSE
+GROUP BY user_id
+ON CONFLICT (user_id) DO UPDATE
+SET unread_cnt = EXCLUDED.unread_cnt,
+    upd_dt = EXCLUDED.upd_dt;
@@ -0,0 +1,13 @@
+-- ============================================
+-- 알림 fan-out 엔진 지원 (기존 DB 마이그레이션)
+-- - notification_type에 NEW_POST(팔로우한 게시판의 새 게시글) 추가
+-- - 읽지 않은 알림 병합 조회용 부분 인덱스 추가
+--
+-- 실행: psql -U postgres -d common_db -f notification_fanout.sql
+-- ============================================
+
+ALTER TYPE notification_type ADD VALUE IF NOT EXISTS 'NEW_POST';
+
+CREATE INDEX IF NOT EXISTS idx_bbs_notifications_coalesce
+    ON bbs_notifications(user_id, typ, related_post_id, crt_dt DESC)
+    WHERE is_read = FALSE;
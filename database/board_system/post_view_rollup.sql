@@ -0,0 +1,27 @@
+-- ============================================
+-- 게시글 일별 조회수 롤업 테이블 추가 (기존 DB 마이그레이션)
+-- bbs_post_views 원본 기록은 애플리케이션 스케줄러(app/core/view_rollup.py)가
+-- bbs_post_view_daily로 증분 집계하고, 보존 기간이 지난 원본은 삭제합니다.
+--
+-- 실행: psql -U postgres -d common_db -f post_view_rollup.sql
+-- 첫 롤업 실행 시 기존 원본 기록 전체가 VIEW_ROLLUP_BATCH_SIZE건씩 집계됩니다.
+-- ============================================
+
+CREATE TABLE IF NOT EXISTS bbs_post_view_daily (
+    post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    view_dt DATE NOT NULL, -- UTC 기준 조회일
+    view_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, view_dt)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bbs_post_view_daily_view_dt ON bbs_post_view_daily(view_dt);
+
+CREATE TABLE IF NOT EXISTS bbs_rollup_state (
+    nm VARCHAR(100) PRIMARY KEY,
+    last_id BIGINT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE bbs_post_view_daily IS '게시글 일별 조회수 집계';
+COMMENT ON TABLE bbs_rollup_state IS '집계 작업 진행 상태';
@@ -0,0 +1,24 @@
+-- ============================================
+-- 조회수 롤업 기준을 ID에서 (트랜잭션 ID, ID)로 변경 (기존 DB 마이그레이션)
+-- ID만 기준으로 하면 번호를 먼저 받고 늦게 커밋된 조회 기록이 이미 집계된 위치 뒤로 들어가
+-- 롤업에서 빠지고 결국 보존 기간 정리로 삭제될 수 있습니다.
+-- 롤업은 현재 스냅샷의 xmin 이전 트랜잭션이 기록한 것만 (ins_xid, id) 순서로 집계합니다.
+--
+-- 요구 사항: PostgreSQL 13 이상 (xid8, pg_current_xact_id)
+-- 실행: psql -U postgres -d common_db -f post_view_rollup_xid.sql
+-- 기존 기록은 ins_xid가 0이므로 기존 last_id 이후부터 ID 순서로 이어서 집계됩니다.
+-- ============================================
+
+BEGIN;
+
+-- 상수 기본값으로 추가해 테이블을 다시 쓰지 않고, 이후 기록부터 트랜잭션 ID 사용
+ALTER TABLE bbs_post_views ADD COLUMN IF NOT EXISTS ins_xid xid8 NOT NULL DEFAULT '0';
+ALTER TABLE bbs_post_views ALTER COLUMN ins_xid SET DEFAULT pg_current_xact_id();
+
+ALTER TABLE bbs_rollup_state ADD COLUMN IF NOT EXISTS last_xid xid8 NOT NULL DEFAULT '0';
+
+COMMIT;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bbs_post_views_ins_xid ON bbs_post_views(ins_xid, id);
+
+COMMENT ON COLUMN bbs_post_views.ins_xid IS '기록한 트랜잭션 ID (롤업 순서 기준)';
@@ -0,0 +1,36 @@
+-- ============================================
+-- 태그 유사도 기반 관련 게시글 (기존 DB 마이그레이션)
+-- - 게시글별 관련 게시글 상위 k건 테이블과 재계산 대기열 추가
+-- - 태그가 있는 기존 게시글을 모두 대기열에 넣어 다음 주기 작업에서 계산
+--
+-- 실행: psql -U postgres -d common_db -f related_posts.sql
+-- ============================================
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS bbs_post_related (
+    post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    related_post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, related_post_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bbs_post_related_post_score ON bbs_post_related(post_id, score DESC);
+CREATE INDEX IF NOT EXISTS idx_bbs_post_related_related ON bbs_post_related(related_post_id);
+
+CREATE TABLE IF NOT EXISTS bbs_post_related_queue (
+    post_id BIGINT PRIMARY KEY REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    crt_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE bbs_post_related IS '태그 유사도 기반 관련 게시글';
+COMMENT ON TABLE bbs_post_related_queue IS '관련 게시글 재계산 대기열';
+
+INSERT INTO bbs_post_related_queue (post_id)
+SELECT DISTINCT pt.post_id
+FROM bbs_post_tags pt
+JOIN bbs_posts p ON p.id = pt.post_id AND p.stts <> 'DELETED'
+ON CONFLICT (post_id) DO NOTHING;
+
+COMMIT;
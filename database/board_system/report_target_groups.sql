@@ -0,0 +1,9 @@
+-- ============================================
+-- 대상별 신고 집계 지원 (기존 DB 마이그레이션)
+-- - 상태별로 대상(target_type, target_id) 단위 집계를 인덱스 순서로 처리하기 위한 인덱스
+--
+-- 실행: psql -U postgres -d common_db -f report_target_groups.sql
+-- ============================================
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_bbs_reports_stts_target
+    ON bbs_reports(stts, target_type, target_id, crt_dt);
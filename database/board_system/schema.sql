@@ -10,6 +10,7 @@ BEGIN
     DROP VIEW IF EXISTS bbs_board_statistics CASCADE;
 
     -- 트리거 삭제
+    DROP TRIGGER IF EXISTS trigger_update_follow_statistics ON bbs_follows CASCADE;
     DROP TRIGGER IF EXISTS trigger_update_tag_usage_count ON bbs_post_tags CASCADE;
     DROP TRIGGER IF EXISTS trigger_update_attachment_statistics ON bbs_attachments CASCADE;
     DROP TRIGGER IF EXISTS trigger_update_comment_like_statistics ON bbs_comment_likes CASCADE;
@@ -22,6 +23,7 @@ BEGIN
     -- COMMON_USER 테이블은 기존 시스템에서 관리되므로 트리거 삭제 생략
 
     -- 함수 삭제
+    DROP FUNCTION IF EXISTS update_follow_statistics() CASCADE;
     DROP FUNCTION IF EXISTS update_tag_usage_count() CASCADE;
     DROP FUNCTION IF EXISTS update_attachment_statistics() CASCADE;
     DROP FUNCTION IF EXISTS update_like_statistics() CASCADE;
@@ -34,6 +36,14 @@ BEGIN
     -- current_user_id() 함수는 DDL 중간에 정의되므로 DROP 생략
 
     -- 테이블 삭제 (참조 관계 역순)
+    DROP TABLE IF EXISTS bbs_trending_tags CASCADE;
+    DROP TABLE IF EXISTS bbs_tag_usage_buckets CASCADE;
+    DROP TABLE IF EXISTS bbs_post_related_queue CASCADE;
+    DROP TABLE IF EXISTS bbs_post_related CASCADE;
+    DROP TABLE IF EXISTS bbs_user_follow_counts CASCADE;
+    DROP TABLE IF EXISTS bbs_notification_counters CASCADE;
+    DROP TABLE IF EXISTS bbs_rollup_state CASCADE;
+    DROP TABLE IF EXISTS bbs_post_view_daily CASCADE;
     DROP TABLE IF EXISTS bbs_file_thumbnails CASCADE;
     DROP TABLE IF EXISTS bbs_statistics CASCADE;
     DROP TABLE IF EXISTS bbs_admin_logs CASCADE;
@@ -89,11 +99,11 @@ CREATE TYPE report_reason AS ENUM ('SPAM', 'ABUSE', 'INAPPROPRIATE', 'COPYRIGHT'
 CREATE TYPE report_status AS ENUM ('PENDING', 'REVIEWED', 'RESOLVED', 'DISMISSED');
 
 -- 추가 ENUM 타입 정의 (테이블 생성 전에 미리 정의)
-CREATE TYPE notification_type AS ENUM ('NEW_COMMENT', 'NEW_LIKE', 'NEW_FOLLOW', 'POST_MENTION', 'COMMENT_MENTION', 'ADMIN_NOTICE');
+CREATE TYPE notification_type AS ENUM ('NEW_COMMENT', 'NEW_LIKE', 'NEW_FOLLOW', 'POST_MENTION', 'COMMENT_MENTION', 'ADMIN_NOTICE', 'NEW_POST');
 CREATE TYPE follow_type AS ENUM ('USER', 'BOARD');
 CREATE TYPE activity_type AS ENUM ('LOGIN', 'LOGOUT', 'POST_CREATE', 'POST_UPDATE', 'POST_DELETE', 'COMMENT_CREATE', 'COMMENT_DELETE', 'LIKE', 'BOOKMARK', 'REPORT');
 CREATE TYPE change_type AS ENUM ('CREATE', 'UPDATE', 'DELETE');
-CREATE TYPE admin_action_type AS ENUM ('USER_BAN', 'USER_UNBAN', 'POST_HIDE', 'POST_SHOW', 'COMMENT_HIDE', 'COMMENT_SHOW', 'REPORT_RESOLVE', 'BOARD_CREATE', 'BOARD_UPDATE', 'BOARD_DELETE');
+CREATE TYPE admin_action_type AS ENUM ('USER_BAN', 'USER_UNBAN', 'POST_HIDE', 'POST_SHOW', 'POST_MOVE', 'COMMENT_HIDE', 'COMMENT_SHOW', 'REPORT_RESOLVE', 'BOARD_CREATE', 'BOARD_UPDATE', 'BOARD_DELETE');
 
 -- 참고: 사용자 테이블은 기존 시스템에 존재하므로 별도 생성하지 않음
 
@@ -112,6 +122,7 @@ CREATE TABLE bbs_boards (
     max_file_size INT DEFAULT 10 CHECK (max_file_size > 0),
     sort_order INT DEFAULT 0,
     post_count INT DEFAULT 0,
+    follower_cnt INT NOT NULL DEFAULT 0, -- bbs_follows 트리거가 갱신
     -- 삭제 관련
     del_dt TIMESTAMP WITH TIME ZONE,
     del_by VARCHAR(100),
@@ -303,6 +314,8 @@ CREATE TABLE bbs_reports (
 CREATE INDEX idx_bbs_reports_reporter ON bbs_reports(reporter_id);
 CREATE INDEX idx_bbs_reports_target ON bbs_reports(target_type, target_id);
 CREATE INDEX idx_bbs_reports_stts_crt_dt ON bbs_reports(stts, crt_dt);
+-- 상태별 대상 집계 (대상별 신고 집계 화면)
+CREATE INDEX idx_bbs_reports_stts_target ON bbs_reports(stts, target_type, target_id, crt_dt);
 
 -- 트리거 함수: updated_at 자동 갱신
 CREATE OR REPLACE FUNCTION update_updated_at_column()
@@ -384,39 +397,7 @@ CREATE TRIGGER trigger_update_comment_statistics
     AFTER INSERT OR DELETE ON bbs_comments
     FOR EACH ROW EXECUTE FUNCTION update_comment_statistics();
 
--- 트리거 함수: 좋아요 통계 자동 갱신
-CREATE OR REPLACE FUNCTION update_like_statistics()
-RETURNS TRIGGER AS $$
-DECLARE
-    like_delta INT := 0;
-BEGIN
-    -- 좋아요 추가/삭제에 따른 증감 계산
-    IF TG_OP = 'INSERT' THEN
-        like_delta := CASE WHEN NEW.typ = 'LIKE' THEN 1 ELSE -1 END;
-    ELSIF TG_OP = 'DELETE' THEN
-        like_delta := CASE WHEN OLD.typ = 'LIKE' THEN -1 ELSE 1 END;
-    END IF;
-
-    -- 게시글 좋아요 수 갱신
-    IF TG_TABLE_NAME = 'bbs_post_likes' THEN
-        UPDATE bbs_posts SET lk_cnt = lk_cnt + like_delta WHERE id = COALESCE(NEW.post_id, OLD.post_id);
-    -- 댓글 좋아요 수 갱신
-    ELSIF TG_TABLE_NAME = 'bbs_comment_likes' THEN
-        UPDATE bbs_comments SET lk_cnt = lk_cnt + like_delta WHERE id = COALESCE(NEW.comment_id, OLD.comment_id);
-    END IF;
-
-    RETURN COALESCE(NEW, OLD);
-END;
-$$ LANGUAGE plpgsql;
-
--- 좋아요 통계 트리거
-CREATE TRIGGER trigger_update_post_like_statistics
-    AFTER INSERT OR DELETE ON bbs_post_likes
-    FOR EACH ROW EXECUTE FUNCTION update_like_statistics();
-
-CREATE TRIGGER trigger_update_comment_like_statistics
-    AFTER INSERT OR DELETE ON bbs_comment_likes
-    FOR EACH ROW EXECUTE FUNCTION update_like_statistics();
+-- 좋아요 수(lk_cnt)는 좋아요 토글 문장(INSERT/DELETE ... RETURNING)이 같은 문장 안에서 갱신 (트리거 없음)
 
 -- 트리거 함수: 첨부파일 통계 자동 갱신
 CREATE OR REPLACE FUNCTION update_attachment_statistics()
@@ -645,6 +626,15 @@ CREATE TABLE bbs_notifications (
 -- 알림 테이블 인덱스
 CREATE INDEX idx_bbs_notifications_user_crt_dt ON bbs_notifications(user_id, crt_dt);
 CREATE INDEX idx_bbs_notifications_user_is_read ON bbs_notifications(user_id, is_read);
+-- 알림 병합 대상 조회용 (읽지 않은 알림만)
+CREATE INDEX idx_bbs_notifications_coalesce ON bbs_notifications(user_id, typ, related_post_id, crt_dt DESC) WHERE is_read = FALSE;
+
+-- 사용자별 읽지 않은 알림 수 (알림 생성/읽음 처리 시 애플리케이션이 갱신)
+CREATE TABLE bbs_notification_counters (
+    user_id VARCHAR(100) PRIMARY KEY REFERENCES public.COMMON_USER(USER_ID) ON DELETE CASCADE,
+    unread_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
 
 -- 태그 테이블
 CREATE TABLE bbs_tags (
@@ -670,20 +660,87 @@ CREATE TABLE bbs_post_tags (
 CREATE INDEX idx_bbs_post_tags_post ON bbs_post_tags(post_id);
 CREATE INDEX idx_bbs_post_tags_tag ON bbs_post_tags(tag_id);
 
+-- 태그 시간 버킷별 사용 횟수 (태그 연결/해제 시 애플리케이션이 갱신, 급상승 태그 집계용)
+CREATE TABLE bbs_tag_usage_buckets (
+    tag_id BIGINT NOT NULL REFERENCES bbs_tags(id) ON DELETE CASCADE,
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    cnt INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag_id, bucket_start)
+);
+
+CREATE INDEX idx_bbs_tag_usage_buckets_bucket ON bbs_tag_usage_buckets(bucket_start);
+
+-- 기간별 급상승 태그 (주기 작업이 상위 k건을 갱신)
+CREATE TABLE bbs_trending_tags (
+    window_nm VARCHAR(10) NOT NULL,
+    tag_id BIGINT NOT NULL REFERENCES bbs_tags(id) ON DELETE CASCADE,
+    rnk INT NOT NULL,
+    score DOUBLE PRECISION NOT NULL,
+    cnt INT NOT NULL,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (window_nm, tag_id)
+);
+
+CREATE INDEX idx_bbs_trending_tags_window_rnk ON bbs_trending_tags(window_nm, rnk);
+
 -- 팔로우 테이블
 CREATE TABLE bbs_follows (
     id BIGSERIAL PRIMARY KEY,
     follower_id VARCHAR(100) NOT NULL REFERENCES public.COMMON_USER(USER_ID) ON DELETE CASCADE,
     following_id VARCHAR(100) NOT NULL, -- USER 타입일 때는 COMMON_USER.USER_ID, BOARD 타입일 때는 bbs_boards.id를 문자열로 저장
+    board_id BIGINT REFERENCES bbs_boards(id) ON DELETE CASCADE, -- BOARD 타입일 때만 저장 (형 변환 없이 조인)
     typ follow_type DEFAULT 'USER',
     crt_dt TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
 
-    UNIQUE(follower_id, following_id, typ)
+    CONSTRAINT uq_bbs_follows_follower_typ_following UNIQUE (follower_id, typ, following_id),
+    CONSTRAINT ck_bbs_follows_board_target CHECK ((typ = 'BOARD') = (board_id IS NOT NULL))
+);
+
+-- 팔로우 인덱스 (팔로워 기준 조회는 유니크 제약조건 인덱스 사용)
+CREATE INDEX idx_bbs_follows_board ON bbs_follows(board_id, id) WHERE board_id IS NOT NULL;
+CREATE INDEX idx_bbs_follows_following_user ON bbs_follows(following_id, crt_dt) WHERE typ = 'USER';
+
+-- 사용자별 팔로워 수 (bbs_follows 트리거가 갱신)
+CREATE TABLE bbs_user_follow_counts (
+    user_id VARCHAR(100) PRIMARY KEY REFERENCES public.COMMON_USER(USER_ID) ON DELETE CASCADE,
+    follower_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
--- 팔로우 인덱스
-CREATE INDEX idx_bbs_follows_follower ON bbs_follows(follower_id);
-CREATE INDEX idx_bbs_follows_following ON bbs_follows(following_id);
+-- 트리거 함수: 팔로워 수 자동 갱신
+CREATE OR REPLACE FUNCTION update_follow_statistics()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.typ = 'BOARD' THEN
+            UPDATE bbs_boards SET follower_cnt = follower_cnt + 1 WHERE id = NEW.board_id;
+        ELSE
+            INSERT INTO bbs_user_follow_counts (user_id, follower_cnt, upd_dt)
+            VALUES (NEW.following_id, 1, CURRENT_TIMESTAMP)
+            ON CONFLICT (user_id) DO UPDATE
+            SET follower_cnt = bbs_user_follow_counts.follower_cnt + 1,
+                upd_dt = EXCLUDED.upd_dt;
+        END IF;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF OLD.typ = 'BOARD' THEN
+            UPDATE bbs_boards SET follower_cnt = GREATEST(follower_cnt - 1, 0) WHERE id = OLD.board_id;
+        ELSE
+            UPDATE bbs_user_follow_counts
+            SET follower_cnt = GREATEST(follower_cnt - 1, 0),
+                upd_dt = CURRENT_TIMESTAMP
+            WHERE user_id = OLD.following_id;
+        END IF;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- 팔로우 통계 트리거
+CREATE TRIGGER trigger_update_follow_statistics
+    AFTER INSERT OR DELETE ON bbs_follows
+    FOR EACH ROW EXECUTE FUNCTION update_follow_statistics();
 
 -- 활동 로그 테이블
 CREATE TABLE bbs_activity_logs (
@@ -808,11 +865,13 @@ CREATE TABLE bbs_post_views (
     user_id VARCHAR(100) REFERENCES public.COMMON_USER(USER_ID) ON DELETE SET NULL,
     ip_addr INET NOT NULL,
     user_agent TEXT,
-    crt_dt TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    crt_dt TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
+    ins_xid xid8 NOT NULL DEFAULT pg_current_xact_id() -- 기록한 트랜잭션 ID (롤업 순서 기준)
 );
 
 -- 게시글 조회수 기록 인덱스
 CREATE INDEX idx_bbs_post_views_post_crt_dt ON bbs_post_views(post_id, crt_dt);
+CREATE INDEX idx_bbs_post_views_ins_xid ON bbs_post_views(ins_xid, id);
 CREATE INDEX idx_bbs_post_views_user_post_date ON bbs_post_views(user_id, post_id, date_trunc('day', crt_dt AT TIME ZONE 'UTC')) WHERE user_id IS NOT NULL;
 CREATE INDEX idx_bbs_post_views_ip_post_date ON bbs_post_views(ip_addr, post_id, date_trunc('day', crt_dt AT TIME ZONE 'UTC')) WHERE user_id IS NULL;
 
@@ -824,32 +883,56 @@ CREATE INDEX idx_bbs_post_views_ip_post_date ON bbs_post_views(ip_addr, post_id,
 CREATE UNIQUE INDEX idx_bbs_post_views_user_unique ON bbs_post_views(post_id, user_id, date_trunc('day', crt_dt AT TIME ZONE 'UTC')) WHERE user_id IS NOT NULL;
 CREATE UNIQUE INDEX idx_bbs_post_views_ip_unique ON bbs_post_views(post_id, ip_addr, date_trunc('day', crt_dt AT TIME ZONE 'UTC')) WHERE user_id IS NULL;
 
--- ENUM 타입들은 위쪽에서 이미 정의됨
+-- 게시글 일별 조회수 집계 테이블 (bbs_post_views를 스케줄러가 증분 롤업)
+CREATE TABLE bbs_post_view_daily (
+    post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    view_dt DATE NOT NULL, -- UTC 기준 조회일
+    view_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, view_dt)
+);
 
--- 트리거 함수: 태그 사용 카운트 자동 갱신
-CREATE OR REPLACE FUNCTION update_tag_usage_count()
-RETURNS TRIGGER AS $$
-BEGIN
-    IF TG_OP = 'INSERT' THEN
-        UPDATE tags SET usage_cnt = usage_cnt + 1 WHERE id = NEW.tag_id;
-        RETURN NEW;
-    ELSIF TG_OP = 'DELETE' THEN
-        UPDATE tags SET usage_cnt = usage_cnt - 1 WHERE id = OLD.tag_id;
-        RETURN OLD;
-    END IF;
-    RETURN NULL;
-END;
-$$ LANGUAGE plpgsql;
+CREATE INDEX idx_bbs_post_view_daily_view_dt ON bbs_post_view_daily(view_dt);
+
+-- 집계 작업 진행 상태 (원본 테이블에서 마지막으로 집계한 (트랜잭션 ID, ID) 위치)
+CREATE TABLE bbs_rollup_state (
+    nm VARCHAR(100) PRIMARY KEY,
+    last_id BIGINT NOT NULL DEFAULT 0,
+    last_xid xid8 NOT NULL DEFAULT '0',
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- 관련 게시글 (같은 게시판에서 태그 유사도 상위 k건, 주기 작업이 갱신)
+CREATE TABLE bbs_post_related (
+    post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    related_post_id BIGINT NOT NULL REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    score DOUBLE PRECISION NOT NULL,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (post_id, related_post_id)
+);
+
+CREATE INDEX idx_bbs_post_related_post_score ON bbs_post_related(post_id, score DESC);
+CREATE INDEX idx_bbs_post_related_related ON bbs_post_related(related_post_id);
+
+-- 관련 게시글 재계산 대기열 (태그/게시판이 바뀐 게시글)
+CREATE TABLE bbs_post_related_queue (
+    post_id BIGINT PRIMARY KEY REFERENCES bbs_posts(id) ON DELETE CASCADE,
+    crt_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+-- ENUM 타입들은 위쪽에서 이미 정의됨
 
--- 태그 사용 카운트 트리거
-CREATE TRIGGER trigger_update_tag_usage_count
-    AFTER INSERT OR DELETE ON bbs_post_tags
-    FOR EACH ROW EXECUTE FUNCTION update_tag_usage_count();
+-- 태그 사용 횟수(bbs_tags.usage_cnt)는 게시글 작성/수정 시 애플리케이션이 일괄 갱신
+-- (연쇄 삭제 등으로 어긋난 값은 주기 작업이 bbs_post_tags 기준으로 보정)
 
 -- 주석
 COMMENT ON TABLE bbs_notifications IS '사용자 알림 정보';
+COMMENT ON TABLE bbs_notification_counters IS '사용자별 읽지 않은 알림 수';
+COMMENT ON TABLE bbs_user_follow_counts IS '사용자별 팔로워 수';
 COMMENT ON TABLE bbs_tags IS '게시글 태그 정보';
 COMMENT ON TABLE bbs_post_tags IS '게시글-태그 매핑 정보';
+COMMENT ON TABLE bbs_tag_usage_buckets IS '태그 시간 버킷별 사용 횟수';
+COMMENT ON TABLE bbs_trending_tags IS '기간별 급상승 태그';
 COMMENT ON TABLE bbs_follows IS '사용자 팔로우 정보';
 COMMENT ON TABLE bbs_activity_logs IS '사용자 활동 로그';
 COMMENT ON TABLE bbs_post_history IS '게시글 수정 히스토리';
@@ -859,6 +942,10 @@ COMMENT ON TABLE bbs_admin_logs IS '관리자 작업 로그';
 COMMENT ON TABLE bbs_statistics IS '통계 데이터';
 COMMENT ON TABLE bbs_file_thumbnails IS '파일 썸네일 정보';
 COMMENT ON TABLE bbs_post_views IS '게시글 조회수 기록';
+COMMENT ON TABLE bbs_post_view_daily IS '게시글 일별 조회수 집계';
+COMMENT ON TABLE bbs_rollup_state IS '집계 작업 진행 상태';
+COMMENT ON TABLE bbs_post_related IS '태그 유사도 기반 관련 게시글';
+COMMENT ON TABLE bbs_post_related_queue IS '관련 게시글 재계산 대기열';
 
 -- COMMON_USER 테이블 코멘트는 기존 시스템에서 관리
 COMMENT ON TABLE bbs_boards IS '게시판 기본 정보';
@@ -893,6 +980,7 @@ COMMENT ON COLUMN bbs_boards.allow_image IS '이미지 허용 여부';
 COMMENT ON COLUMN bbs_boards.max_file_size IS '최대 파일 크기(MB)';
 COMMENT ON COLUMN bbs_boards.sort_order IS '정렬 순서';
 COMMENT ON COLUMN bbs_boards.post_count IS '게시글 수';
+COMMENT ON COLUMN bbs_boards.follower_cnt IS '팔로워 수';
 COMMENT ON COLUMN bbs_boards.crt_dt IS '생성일시';
 COMMENT ON COLUMN bbs_boards.upd_dt IS '수정일시';
 
@@ -1033,6 +1121,7 @@ COMMENT ON TABLE bbs_follows IS '사용자 팔로우 정보';
 COMMENT ON COLUMN bbs_follows.id IS '팔로우 일련번호';
 COMMENT ON COLUMN bbs_follows.follower_id IS '팔로워 ID';
 COMMENT ON COLUMN bbs_follows.following_id IS '팔로잉 ID';
+COMMENT ON COLUMN bbs_follows.board_id IS '팔로잉 게시판 ID (BOARD 유형만)';
 COMMENT ON COLUMN bbs_follows.typ IS '팔로우 유형 (USER, BOARD)';
 COMMENT ON COLUMN bbs_follows.crt_dt IS '생성일시';
 
@@ -1125,3 +1214,4 @@ COMMENT ON COLUMN bbs_post_views.user_id IS '사용자 ID (NULL 가능, 비로
 COMMENT ON COLUMN bbs_post_views.ip_addr IS 'IP 주소';
 COMMENT ON COLUMN bbs_post_views.user_agent IS '사용자 에이전트';
 COMMENT ON COLUMN bbs_post_views.crt_dt IS '조회 일시';
+COMMENT ON COLUMN bbs_post_views.ins_xid IS '기록한 트랜잭션 ID (롤업 순서 기준)';
@@ -0,0 +1,23 @@
+-- ============================================
+-- 태그 사용 횟수 애플리케이션 관리 전환 (기존 DB 마이그레이션)
+-- - 존재하지 않는 tags 테이블을 갱신하던 트리거 제거
+-- - usage_cnt를 실제 게시글-태그 연결 수로 재계산
+--
+-- 실행: psql -U postgres -d common_db -f tag_usage.sql
+-- ============================================
+
+BEGIN;
+
+DROP TRIGGER IF EXISTS trigger_update_tag_usage_count ON bbs_post_tags;
+DROP FUNCTION IF EXISTS update_tag_usage_count();
+
+UPDATE bbs_tags t
+SET usage_cnt = COALESCE(a.cnt, 0)
+FROM bbs_tags t2
+LEFT JOIN (
+    SELECT tag_id, COUNT(*) AS cnt FROM bbs_post_tags GROUP BY tag_id
+) a ON a.tag_id = t2.id
+WHERE t.id = t2.id
+  AND t.usage_cnt IS DISTINCT FROM COALESCE(a.cnt, 0);
+
+COMMIT;
@@ -0,0 +1,45 @@
+-- ============================================
+-- 급상승 태그 (기존 DB 마이그레이션)
+-- - 태그 시간 버킷별 사용 횟수와 기간별 급상승 태그 테이블 추가
+-- - 최근 7일 게시글-태그 연결로 버킷을 채움 (TRENDING_TAG_BUCKET_SECONDS 기본값 300초 기준)
+--
+-- 실행: psql -U postgres -d common_db -f trending_tags.sql
+-- ============================================
+
+BEGIN;
+
+-- 태그 시간 버킷별 사용 횟수 (태그 연결/해제 시 애플리케이션이 갱신, 급상승 태그 집계용)
+CREATE TABLE IF NOT EXISTS bbs_tag_usage_buckets (
+    tag_id BIGINT NOT NULL REFERENCES bbs_tags(id) ON DELETE CASCADE,
+    bucket_start TIMESTAMP WITH TIME ZONE NOT NULL,
+    cnt INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (tag_id, bucket_start)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bbs_tag_usage_buckets_bucket ON bbs_tag_usage_buckets(bucket_start);
+
+-- 기간별 급상승 태그 (주기 작업이 상위 k건을 갱신)
+CREATE TABLE IF NOT EXISTS bbs_trending_tags (
+    window_nm VARCHAR(10) NOT NULL,
+    tag_id BIGINT NOT NULL REFERENCES bbs_tags(id) ON DELETE CASCADE,
+    rnk INT NOT NULL,
+    score DOUBLE PRECISION NOT NULL,
+    cnt INT NOT NULL,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (window_nm, tag_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_bbs_trending_tags_window_rnk ON bbs_trending_tags(window_nm, rnk);
+
+COMMENT ON TABLE bbs_tag_usage_buckets IS '태그 시간 버킷별 사용 횟수';
+COMMENT ON TABLE bbs_trending_tags IS '기간별 급상승 태그';
+
+INSERT INTO bbs_tag_usage_buckets (tag_id, bucket_start, cnt)
+SELECT tag_id, to_timestamp(floor(extract(epoch FROM crt_dt) / 300) * 300), COUNT(*)
+FROM bbs_post_tags
+WHERE crt_dt >= CURRENT_TIMESTAMP - INTERVAL '7 days'
+GROUP BY 1, 2
+ON CONFLICT (tag_id, bucket_start) DO UPDATE
+SET cnt = EXCLUDED.cnt;
+
+COMMIT;
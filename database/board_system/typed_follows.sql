@@ -0,0 +1,122 @@
+-- ============================================
+-- 팔로우 대상 타입 분리 및 팔로워 수 카운터 추가 (기존 DB 마이그레이션)
+-- - BOARD 팔로우에 board_id(BIGINT) 컬럼을 채워 형 변환 없이 bbs_boards와 조인
+-- - 유니크 제약조건을 (follower_id, typ, following_id) 순서로 재생성
+-- - 게시판/사용자 팔로워 수를 트리거로 유지하고 기존 데이터로 초기화
+--
+-- 실행: psql -U postgres -d common_db -f typed_follows.sql
+-- ============================================
+
+BEGIN;
+
+LOCK TABLE bbs_follows IN SHARE ROW EXCLUSIVE MODE;
+
+-- 1. 게시판 팔로우 대상 컬럼 추가 및 기존 데이터 채우기
+ALTER TABLE bbs_follows ADD COLUMN IF NOT EXISTS board_id BIGINT;
+
+UPDATE bbs_follows f
+SET board_id = b.id
+FROM bbs_boards b
+WHERE f.typ = 'BOARD'
+  AND f.following_id ~ '^[0-9]+$'
+  AND b.id = f.following_id::BIGINT;
+
+-- 존재하지 않는 게시판을 가리키는 팔로우는 정리
+DELETE FROM bbs_follows WHERE typ = 'BOARD' AND board_id IS NULL;
+
+-- 게시판 ID 문자열 정규화 ("007" -> "7") 후 중복 제거
+-- 정규화 중 기존 유니크 제약조건에 걸리지 않도록 먼저 제거 (2단계에서 재생성)
+ALTER TABLE bbs_follows DROP CONSTRAINT IF EXISTS bbs_follows_follower_id_following_id_typ_key;
+ALTER TABLE bbs_follows DROP CONSTRAINT IF EXISTS uq_follows_follower_following_type;
+
+UPDATE bbs_follows SET following_id = board_id::TEXT
+WHERE board_id IS NOT NULL AND following_id <> board_id::TEXT;
+
+DELETE FROM bbs_follows f
+USING bbs_follows d
+WHERE f.follower_id = d.follower_id
+  AND f.typ = d.typ
+  AND f.following_id = d.following_id
+  AND f.id > d.id;
+
+ALTER TABLE bbs_follows
+    ADD CONSTRAINT fk_bbs_follows_board_id
+        FOREIGN KEY (board_id) REFERENCES bbs_boards(id) ON DELETE CASCADE,
+    ADD CONSTRAINT ck_bbs_follows_board_target
+        CHECK ((typ = 'BOARD') = (board_id IS NOT NULL));
+
+-- 2. 유니크 제약조건 재생성 (팔로워 + 유형 조회에 선두 컬럼 사용)
+ALTER TABLE bbs_follows
+    ADD CONSTRAINT uq_bbs_follows_follower_typ_following UNIQUE (follower_id, typ, following_id);
+
+-- 3. 인덱스 교체
+DROP INDEX IF EXISTS idx_bbs_follows_follower;
+DROP INDEX IF EXISTS idx_bbs_follows_following;
+CREATE INDEX IF NOT EXISTS idx_bbs_follows_board ON bbs_follows(board_id, id) WHERE board_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_bbs_follows_following_user ON bbs_follows(following_id, crt_dt) WHERE typ = 'USER';
+
+-- 4. 팔로워 수 카운터
+ALTER TABLE bbs_boards ADD COLUMN IF NOT EXISTS follower_cnt INT NOT NULL DEFAULT 0;
+
+CREATE TABLE IF NOT EXISTS bbs_user_follow_counts (
+    user_id VARCHAR(100) PRIMARY KEY REFERENCES public.COMMON_USER(USER_ID) ON DELETE CASCADE,
+    follower_cnt INT NOT NULL DEFAULT 0,
+    upd_dt TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+UPDATE bbs_boards b
+SET follower_cnt = (SELECT COUNT(*) FROM bbs_follows f WHERE f.board_id = b.id);
+
+INSERT INTO bbs_user_follow_counts (user_id, follower_cnt, upd_dt)
+SELECT f.following_id, COUNT(*), CURRENT_TIMESTAMP
+FROM bbs_follows f
+JOIN public.COMMON_USER u ON u.USER_ID = f.following_id
+WHERE f.typ = 'USER'
+GROUP BY f.following_id
+ON CONFLICT (user_id) DO UPDATE
+SET follower_cnt = EXCLUDED.follower_cnt,
+    upd_dt = EXCLUDED.upd_dt;
+
+-- 5. 팔로워 수 트리거
+CREATE OR REPLACE FUNCTION update_follow_statistics()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        IF NEW.typ = 'BOARD' THEN
+            UPDATE bbs_boards SET follower_cnt = follower_cnt + 1 WHERE id = NEW.board_id;
+        ELSE
+            INSERT INTO bbs_user_follow_counts (user_id, follower_cnt, upd_dt)
+            VALUES (NEW.following_id, 1, CURRENT_TIMESTAMP)
+            ON CONFLICT (user_id) DO UPDATE
+            SET follower_cnt = bbs_user_follow_counts.follower_cnt + 1,
+                upd_dt = EXCLUDED.upd_dt;
+        END IF;
+        RETURN NEW;
+    ELSIF TG_OP = 'DELETE' THEN
+        IF OLD.typ = 'BOARD' THEN
+            UPDATE bbs_boards SET follower_cnt = GREATEST(follower_cnt - 1, 0) WHERE id = OLD.board_id;
+        ELSE
+            UPDATE bbs_user_follow_counts
+            SET follower_cnt = GREATEST(follower_cnt - 1, 0),
+                upd_dt = CURRENT_TIMESTAMP
+            WHERE user_id = OLD.following_id;
+        END IF;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS trigger_update_follow_statistics ON bbs_follows;
+CREATE TRIGGER trigger_update_follow_statistics
+    AFTER INSERT OR DELETE ON bbs_follows
+    FOR EACH ROW EXECUTE FUNCTION update_follow_statistics();
+
+-- 코멘트
+COMMENT ON COLUMN bbs_follows.board_id IS '팔로잉 게시판 ID (BOARD 유형만)';
+COMMENT ON COLUMN bbs_boards.follower_cnt IS '팔로워 수';
+COMMENT ON TABLE bbs_user_follow_counts IS '사용자별 팔로워 수';
+
+COMMIT;
+
+ANALYZE bbs_follows;
@@ -0,0 +1,29 @@
+-- ============================================
+-- COMMON_CACHE_ENTRIES 공유 캐시 테이블 생성
+-- CACHE_BACKEND=postgres일 때 여러 워커가 공유하는 캐시 항목을 저장합니다.
+-- WAL을 쓰지 않는 UNLOGGED 테이블이며, DB 비정상 종료 후 비워져도 다음 조회에서 다시 채워질 뿐입니다.
+-- 만료된 항목 정리는 애플리케이션 스케줄러(app/core/cache.py)가 담당합니다.
+--
+-- 실행: psql -U postgres -d common_db -f cache.sql
+-- ============================================
+
+BEGIN;
+
+CREATE UNLOGGED TABLE IF NOT EXISTS COMMON_CACHE_ENTRIES (
+    CACHE_KEY VARCHAR(255) NOT NULL,
+    VAL BYTEA NOT NULL,
+    TAGS TEXT[] NOT NULL DEFAULT '{}',
+    EXPIRES_AT TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (CACHE_KEY)
+) WITH (FILLFACTOR = 70);
+
+CREATE INDEX IF NOT EXISTS idx_cache_entries_tags ON COMMON_CACHE_ENTRIES USING GIN (TAGS);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON COMMON_CACHE_ENTRIES(EXPIRES_AT);
+
+COMMENT ON TABLE COMMON_CACHE_ENTRIES IS '공유 캐시 항목';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.CACHE_KEY IS '네임스페이스:함수:인자 해시 키';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.VAL IS '직렬화된 값';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.TAGS IS '무효화 태그 (예: boards, board:5)';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.EXPIRES_AT IS '만료일시';
+
+COMMIT;
@@ -546,30 +546,38 @@ CREATE TABLE IF NOT EXISTS COMMON_AUDIT_LOG (
     CRT_BY VARCHAR(100) NULL,
     CRT_BY_NM VARCHAR(100) NULL,
     USE_YN BOOLEAN NOT NULL DEFAULT TRUE,
-    PRIMARY KEY (COMMON_AUDIT_LOG_SN),
-    CONSTRAINT uk_audit_log_id UNIQUE (AUDIT_LOG_ID),
+    PRIMARY KEY (COMMON_AUDIT_LOG_SN, CRT_DT),
+    CONSTRAINT uk_audit_log_id UNIQUE (AUDIT_LOG_ID, CRT_DT),
     CONSTRAINT fk_audit_log_user_id 
         FOREIGN KEY (USER_ID) 
         REFERENCES COMMON_USER(USER_ID) 
         ON DELETE SET NULL
         ON UPDATE CASCADE
-);
+) PARTITION BY RANGE (CRT_DT);
 
--- 인덱스 생성
-CREATE INDEX IF NOT EXISTS idx_audit_log_user_id ON COMMON_AUDIT_LOG(USER_ID);
+-- 인덱스 생성 (부모 테이블에 생성하면 모든 파티션에 자동 적용)
 CREATE INDEX IF NOT EXISTS idx_audit_log_user_crt_dt ON COMMON_AUDIT_LOG(USER_ID, CRT_DT);
 CREATE INDEX IF NOT EXISTS idx_audit_log_act_crt_dt ON COMMON_AUDIT_LOG(ACT_TYP, CRT_DT);
 CREATE INDEX IF NOT EXISTS idx_audit_log_rsrc ON COMMON_AUDIT_LOG(RSRC_TYP, RSRC_ID);
 CREATE INDEX IF NOT EXISTS idx_audit_log_crt_dt ON COMMON_AUDIT_LOG(CRT_DT);
-CREATE INDEX IF NOT EXISTS idx_audit_log_act_typ ON COMMON_AUDIT_LOG(ACT_TYP);
-CREATE INDEX IF NOT EXISTS idx_audit_log_rsrc_typ ON COMMON_AUDIT_LOG(RSRC_TYP);
-CREATE INDEX IF NOT EXISTS idx_audit_log_del_yn ON COMMON_AUDIT_LOG(DEL_YN);
 
--- 파티셔닝 (연도별) - PostgreSQL 10+ 지원
--- CREATE TABLE COMMON_AUDIT_LOG_2024 PARTITION OF COMMON_AUDIT_LOG
---     FOR VALUES FROM ('2024-01-01') TO ('2025-01-01');
--- CREATE TABLE COMMON_AUDIT_LOG_2025 PARTITION OF COMMON_AUDIT_LOG
---     FOR VALUES FROM ('2025-01-01') TO ('2026-01-01');
+-- 파티셔닝 (월별) - 이후 월 파티션은 애플리케이션 스케줄러가 미리 생성하고 보존 기간이 지나면 삭제
+-- 기존 단일 테이블 전환은 partition_audit_log.sql 참고
+DO $$
+DECLARE
+    month_start DATE := date_trunc('month', CURRENT_DATE)::DATE;
+BEGIN
+    FOR i IN 0..3 LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF common_audit_log FOR VALUES FROM (%L) TO (%L)',
+            'common_audit_log_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::DATE
+        );
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END $$;
+CREATE TABLE IF NOT EXISTS COMMON_AUDIT_LOG_DEFAULT PARTITION OF COMMON_AUDIT_LOG DEFAULT;
 
 -- 코멘트
 COMMENT ON TABLE COMMON_AUDIT_LOG IS '감사 로그';
@@ -728,6 +736,49 @@ COMMENT ON COLUMN COMMON_LOCALE.UPD_BY IS '수정자 ID';
 COMMENT ON COLUMN COMMON_LOCALE.UPD_BY_NM IS '수정자 이름';
 COMMENT ON COLUMN COMMON_LOCALE.USE_YN IS '사용여부';
 
+-- ============================================
+-- 11. COMMON_RATE_LIMIT_BUCKETS (요청 빈도 제한 버킷)
+-- ============================================
+-- UNLOGGED: WAL을 쓰지 않으며 비정상 종료 후 비워져도 버킷이 가득 찬 상태로 돌아갈 뿐입니다.
+CREATE UNLOGGED TABLE IF NOT EXISTS COMMON_RATE_LIMIT_BUCKETS (
+    BUCKET_KEY VARCHAR(255) NOT NULL,
+    TOKENS DOUBLE PRECISION NOT NULL,
+    UPD_DT TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (BUCKET_KEY)
+) WITH (FILLFACTOR = 70);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_upd_dt ON COMMON_RATE_LIMIT_BUCKETS(UPD_DT);
+
+-- 코멘트
+COMMENT ON TABLE COMMON_RATE_LIMIT_BUCKETS IS '요청 빈도 제한 토큰 버킷';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.BUCKET_KEY IS '정책:대상 키 (예: post_like:user:USER_ID, login:ip:IP)';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.TOKENS IS '마지막 갱신 시점의 남은 토큰 수';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.UPD_DT IS '마지막 갱신일시 (토큰 충전 기준)';
+
+-- ============================================
+-- 12. COMMON_CACHE_ENTRIES (공유 캐시)
+-- ============================================
+-- UNLOGGED: WAL을 쓰지 않으며 비정상 종료 후 비워져도 다음 조회에서 다시 채워질 뿐입니다.
+CREATE UNLOGGED TABLE IF NOT EXISTS COMMON_CACHE_ENTRIES (
+    CACHE_KEY VARCHAR(255) NOT NULL,
+    VAL BYTEA NOT NULL,
+    TAGS TEXT[] NOT NULL DEFAULT '{}',
+    EXPIRES_AT TIMESTAMPTZ NOT NULL,
+    PRIMARY KEY (CACHE_KEY)
+) WITH (FILLFACTOR = 70);
+
+-- 인덱스 생성
+CREATE INDEX IF NOT EXISTS idx_cache_entries_tags ON COMMON_CACHE_ENTRIES USING GIN (TAGS);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at ON COMMON_CACHE_ENTRIES(EXPIRES_AT);
+
+-- 코멘트
+COMMENT ON TABLE COMMON_CACHE_ENTRIES IS '공유 캐시 항목';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.CACHE_KEY IS '네임스페이스:함수:인자 해시 키';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.VAL IS '직렬화된 값';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.TAGS IS '무효화 태그 (예: boards, board:5)';
+COMMENT ON COLUMN COMMON_CACHE_ENTRIES.EXPIRES_AT IS '만료일시';
+
 -- ============================================
 -- 테이블 생성 완료
 -- ============================================
@@ -0,0 +1,125 @@
+-- ============================================
+-- COMMON_AUDIT_LOG 월별 파티션 전환 마이그레이션
+-- 기존 단일 테이블을 CRT_DT 기준 RANGE 파티션 테이블로 전환하고 데이터를 이관합니다.
+-- 이후 파티션 생성/보존 기간 관리는 애플리케이션 스케줄러(app/core/audit_partition.py)가 담당합니다.
+--
+-- 실행: psql -U postgres -d common_db -f partition_audit_log.sql
+-- 주의: 이관 중 COMMON_AUDIT_LOG에 대한 쓰기가 차단되므로 점검 시간에 실행하세요.
+-- ============================================
+
+BEGIN;
+
+-- 이미 파티션 테이블이면 중단
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM pg_class
+        WHERE oid = to_regclass('common_audit_log') AND relkind = 'p'
+    ) THEN
+        RAISE EXCEPTION 'common_audit_log는 이미 파티션 테이블입니다.';
+    END IF;
+END $$;
+
+LOCK TABLE COMMON_AUDIT_LOG IN ACCESS EXCLUSIVE MODE;
+
+-- 1. 기존 테이블 이름 변경 (제약조건/인덱스 이름 충돌 방지)
+ALTER TABLE COMMON_AUDIT_LOG RENAME TO COMMON_AUDIT_LOG_OLD;
+ALTER TABLE COMMON_AUDIT_LOG_OLD RENAME CONSTRAINT uk_audit_log_id TO uk_audit_log_id_old;
+ALTER TABLE COMMON_AUDIT_LOG_OLD RENAME CONSTRAINT fk_audit_log_user_id TO fk_audit_log_user_id_old;
+DROP INDEX IF EXISTS idx_audit_log_user_id;
+DROP INDEX IF EXISTS idx_audit_log_user_crt_dt;
+DROP INDEX IF EXISTS idx_audit_log_act_crt_dt;
+DROP INDEX IF EXISTS idx_audit_log_rsrc;
+DROP INDEX IF EXISTS idx_audit_log_crt_dt;
+DROP INDEX IF EXISTS idx_audit_log_act_typ;
+DROP INDEX IF EXISTS idx_audit_log_rsrc_typ;
+DROP INDEX IF EXISTS idx_audit_log_del_yn;
+
+-- 2. 파티션 테이블 생성 (파티션 키 CRT_DT는 PK/UNIQUE에 포함되어야 함)
+CREATE TABLE COMMON_AUDIT_LOG (
+    COMMON_AUDIT_LOG_SN BIGINT NOT NULL,
+    AUDIT_LOG_ID VARCHAR(100) NOT NULL,
+    USER_ID VARCHAR(100) NULL,
+    ACT_TYP VARCHAR(50) NOT NULL,
+    RSRC_TYP VARCHAR(50) NULL,
+    RSRC_ID VARCHAR(100) NULL,
+    OLD_VAL JSONB NULL,
+    NEW_VAL JSONB NULL,
+    IP_ADDR VARCHAR(45) NULL,
+    USER_AGENT TEXT NULL,
+    REQ_MTHD VARCHAR(10) NULL,
+    REQ_PATH VARCHAR(500) NULL,
+    STTS_CD INTEGER NULL,
+    ERR_MSG TEXT NULL,
+    DEL_DT TIMESTAMP NULL,
+    DEL_BY VARCHAR(100) NULL,
+    DEL_BY_NM VARCHAR(100) NULL,
+    DEL_YN BOOLEAN NOT NULL DEFAULT FALSE,
+    CRT_DT TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CRT_BY VARCHAR(100) NULL,
+    CRT_BY_NM VARCHAR(100) NULL,
+    USE_YN BOOLEAN NOT NULL DEFAULT TRUE,
+    PRIMARY KEY (COMMON_AUDIT_LOG_SN, CRT_DT),
+    CONSTRAINT uk_audit_log_id UNIQUE (AUDIT_LOG_ID, CRT_DT),
+    CONSTRAINT fk_audit_log_user_id
+        FOREIGN KEY (USER_ID)
+        REFERENCES COMMON_USER(USER_ID)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE
+) PARTITION BY RANGE (CRT_DT);
+
+-- 기존 시퀀스를 새 테이블로 이전
+ALTER SEQUENCE common_audit_log_common_audit_log_sn_seq OWNED BY COMMON_AUDIT_LOG.COMMON_AUDIT_LOG_SN;
+ALTER TABLE COMMON_AUDIT_LOG
+    ALTER COLUMN COMMON_AUDIT_LOG_SN SET DEFAULT nextval('common_audit_log_common_audit_log_sn_seq');
+
+-- 3. 인덱스 (부모 테이블에 생성하면 모든 파티션에 자동 적용)
+CREATE INDEX idx_audit_log_user_crt_dt ON COMMON_AUDIT_LOG(USER_ID, CRT_DT);
+CREATE INDEX idx_audit_log_act_crt_dt ON COMMON_AUDIT_LOG(ACT_TYP, CRT_DT);
+CREATE INDEX idx_audit_log_rsrc ON COMMON_AUDIT_LOG(RSRC_TYP, RSRC_ID);
+CREATE INDEX idx_audit_log_crt_dt ON COMMON_AUDIT_LOG(CRT_DT);
+
+-- 4. 기존 데이터 범위 + 3개월 뒤까지 월별 파티션 생성
+DO $$
+DECLARE
+    month_start DATE;
+    last_month DATE;
+BEGIN
+    SELECT date_trunc('month', COALESCE(MIN(CRT_DT), CURRENT_TIMESTAMP))::DATE
+      INTO month_start
+      FROM COMMON_AUDIT_LOG_OLD;
+    last_month := (date_trunc('month', CURRENT_DATE) + INTERVAL '3 months')::DATE;
+
+    WHILE month_start <= last_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF common_audit_log FOR VALUES FROM (%L) TO (%L)',
+            'common_audit_log_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::DATE
+        );
+        month_start := (month_start + INTERVAL '1 month')::DATE;
+    END LOOP;
+END $$;
+
+-- 스케줄러가 파티션을 만들지 못한 경우를 대비한 기본 파티션
+CREATE TABLE IF NOT EXISTS COMMON_AUDIT_LOG_DEFAULT PARTITION OF COMMON_AUDIT_LOG DEFAULT;
+
+-- 5. 데이터 이관
+INSERT INTO COMMON_AUDIT_LOG
+SELECT * FROM COMMON_AUDIT_LOG_OLD;
+
+DROP TABLE COMMON_AUDIT_LOG_OLD;
+
+-- 코멘트
+COMMENT ON TABLE COMMON_AUDIT_LOG IS '감사 로그 (CRT_DT 기준 월별 파티션)';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.COMMON_AUDIT_LOG_SN IS '일련번호';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.AUDIT_LOG_ID IS '로그 고유 식별자';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.USER_ID IS '사용자 ID (NULL 가능)';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.ACT_TYP IS '액션 타입 (LOGIN, LOGOUT, CREATE, UPDATE, DELETE, API_CALL)';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.RSRC_TYP IS '리소스 타입 (USER, FILE, ROLE 등)';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.RSRC_ID IS '리소스 ID';
+COMMENT ON COLUMN COMMON_AUDIT_LOG.CRT_DT IS '생성일시 (파티션 키)';
+
+COMMIT;
+
+ANALYZE COMMON_AUDIT_LOG;
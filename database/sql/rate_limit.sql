@@ -0,0 +1,26 @@
+-- ============================================
+-- COMMON_RATE_LIMIT_BUCKETS 요청 빈도 제한 버킷 테이블 생성
+-- RATE_LIMIT_BACKEND=postgres일 때 여러 워커가 공유하는 토큰 버킷을 저장합니다.
+-- WAL을 쓰지 않는 UNLOGGED 테이블이며, DB 비정상 종료 후 비워지면 모든 버킷이 가득 찬 상태로 돌아갑니다.
+-- 오래된 버킷 정리는 애플리케이션 스케줄러(app/core/rate_limit.py)가 담당합니다.
+--
+-- 실행: psql -U postgres -d common_db -f rate_limit.sql
+-- ============================================
+
+BEGIN;
+
+CREATE UNLOGGED TABLE IF NOT EXISTS COMMON_RATE_LIMIT_BUCKETS (
+    BUCKET_KEY VARCHAR(255) NOT NULL,
+    TOKENS DOUBLE PRECISION NOT NULL,
+    UPD_DT TIMESTAMPTZ NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    PRIMARY KEY (BUCKET_KEY)
+) WITH (FILLFACTOR = 70);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_buckets_upd_dt ON COMMON_RATE_LIMIT_BUCKETS(UPD_DT);
+
+COMMENT ON TABLE COMMON_RATE_LIMIT_BUCKETS IS '요청 빈도 제한 토큰 버킷';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.BUCKET_KEY IS '정책:대상 키 (예: post_like:user:USER_ID, login:ip:IP)';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.TOKENS IS '마지막 갱신 시점의 남은 토큰 수';
+COMMENT ON COLUMN COMMON_RATE_LIMIT_BUCKETS.UPD_DT IS '마지막 갱신일시 (토큰 충전 기준)';
+
+COMMIT;